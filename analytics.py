@@ -0,0 +1,291 @@
+# analytics.py
+
+# 할 일과 과거 펫 기록의 통계 모듈.
+# 일/주/월별 완료율, 연속 달성 일수, 주별 획득 경험치, 펫 종류별 평균 최종 레벨을 계산합니다.
+# 엔진이 할 일을 바꿀 때마다 TodoManager의 날짜별 요약 변화량(전체/완료 개수)을 받아 집계를 O(1)로 갱신하므로,
+# 통계를 볼 때 모든 날짜의 할 일 목록을 다시 훑지 않습니다.
+# 저장소 전체로 처음부터 다시 계산할 때는 할 일 하나당 (날짜 서수, 완료 여부) 두 열로 내보낸 데이터를 사용하며,
+# NumPy가 설치되어 있으면 벡터 연산으로, 없으면 파이썬 반복문으로 집계합니다.
+#
+# 실행: python analytics.py [--date YYYY-MM-DD]
+
+import datetime      # 날짜/주/월 계산.
+import argparse      # 명령줄 인자.
+import json          # 명령줄 출력.
+from array import array           # 열 형식 내보내기 (NumPy 없이도 작은 메모리).
+from collections import Counter   # NumPy가 없을 때의 집계.
+
+try:
+    import numpy as np # 대량 데이터 전체 재계산 (선택 사항).
+except ImportError:
+    np = None
+
+from config import EXP_PER_TODO_COMPLETE, STATS_RECENT_WEEKS
+
+_ONE_DAY = datetime.timedelta(days=1)
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal() # NumPy datetime64[D]의 기준일.
+
+def week_start(date):
+    """날짜가 속한 주의 월요일."""
+    return date - datetime.timedelta(days=date.weekday())
+
+def _rate(total, completed):
+    """완료율 (0.0 ~ 1.0). 할 일이 없으면 0.0."""
+    return completed / total if total else 0.0
+
+def todo_columns(daily_todos):
+    """
+    날짜별 할 일 데이터를 통계용 열 형식으로 내보냅니다.
+    Args:
+        daily_todos: (날짜, 할 일 리스트) 쌍들. (예: dict.items(), SQLiteStorage.load_all_todos())
+    Returns:
+        tuple: (할 일마다 날짜 서수(date.toordinal()) 배열, 할 일마다 완료 여부(0/1) 배열).
+    """
+    ordinals, completed = array('l'), array('b')
+    for date, todos in daily_todos:
+        ordinals.extend([date.toordinal()] * len(todos))
+        completed.extend([int(todo.completed) for todo in todos])
+    return ordinals, completed
+
+class TodoStats:
+    """
+    할 일/과거 펫 통계 집계 클래스.
+    - apply_day_delta: 날짜 하나의 전체/완료 개수 변화를 일/주/월 집계에 반영 (O(1), TodoManager.summary_listener로 연결).
+    - add_history/remove_history: 과거 펫 기록 하나를 종류별 집계에 반영 (O(1)).
+    - rebuild_days/rebuild_columns/rebuild_history: 처음부터 다시 집계.
+    - report: 화면/응답에 쓸 통계 딕셔너리.
+    주별 경험치는 주에 속한 날짜의 완료된 할 일 수 x EXP_PER_TODO_COMPLETE로 계산합니다.
+    """
+    def __init__(self):
+        self._days = {}    # 날짜 -> [전체, 완료].
+        self._weeks = {}   # 주의 월요일 -> [전체, 완료].
+        self._months = {}  # (연, 월) -> [전체, 완료].
+        self._totals = [0, 0] # 모든 날짜의 [전체, 완료].
+        self._species = {} # 펫 종류 -> [기록 수, 최종 레벨 합].
+        self._longest_streak = 0     # 가장 긴 연속 달성 일수 (캐시).
+        self._longest_streak_dirty = False # 달성한 날짜가 바뀌어 다시 계산해야 하는지.
+
+    # --- 할 일 집계 ---
+    @staticmethod
+    def _add(buckets, key, total_delta, completed_delta):
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = [0, 0]
+        bucket[0] += total_delta
+        bucket[1] += completed_delta
+        if bucket[0] <= 0:
+            del buckets[key]
+
+    def apply_day_delta(self, date, total_delta, completed_delta):
+        """
+        날짜의 할 일 전체/완료 개수 변화량을 반영합니다.
+        Args:
+            date (datetime.date): 할 일 날짜.
+            total_delta (int): 전체 개수 변화량.
+            completed_delta (int): 완료 개수 변화량.
+        """
+        was_active = self._days.get(date, (0, 0))[1] > 0
+        self._add(self._days, date, total_delta, completed_delta)
+        self._add(self._weeks, week_start(date), total_delta, completed_delta)
+        self._add(self._months, (date.year, date.month), total_delta, completed_delta)
+        self._totals[0] += total_delta
+        self._totals[1] += completed_delta
+        if was_active != (self._days.get(date, (0, 0))[1] > 0): # 달성한 날짜가 생기거나 없어짐.
+            self._longest_streak_dirty = True
+
+    def rebuild_days(self, day_summaries):
+        """
+        날짜별 요약으로 할 일 집계를 처음부터 다시 만듭니다.
+        Args:
+            day_summaries (dict): 날짜 -> (전체, 완료) (예: TodoManager.get_day_summaries()).
+        """
+        self._days.clear()
+        self._weeks.clear()
+        self._months.clear()
+        self._totals = [0, 0]
+        for date, (total, completed) in day_summaries.items():
+            if total:
+                self.apply_day_delta(date, total, completed)
+        self._longest_streak_dirty = True
+
+    def rebuild_columns(self, day_ordinals, completed):
+        """
+        열 형식 할 일 데이터(todo_columns 참고)로 할 일 집계를 처음부터 다시 만듭니다.
+        NumPy가 있으면 날짜/주/월별 개수를 벡터 연산(unique + bincount)으로 구합니다.
+        Args:
+            day_ordinals: 할 일마다 날짜 서수 (array, list 또는 NumPy 배열).
+            completed: 할 일마다 완료 여부 (0/1).
+        """
+        if np is None:
+            totals = Counter(day_ordinals)
+            completes = Counter(ordinal for ordinal, done in zip(day_ordinals, completed) if done)
+            self.rebuild_days({datetime.date.fromordinal(ordinal): (total, completes[ordinal])
+                               for ordinal, total in totals.items()})
+            return
+
+        ordinals = np.asarray(day_ordinals, dtype=np.int64)
+        flags = np.asarray(completed, dtype=np.int64)
+        days, inverse = np.unique(ordinals, return_inverse=True)
+        day_totals = np.bincount(inverse, minlength=len(days))
+        day_completes = np.bincount(inverse, weights=flags, minlength=len(days)).astype(np.int64)
+        # 주: 서수 1(0001-01-01)이 월요일이므로 (서수 - 1) % 7이 요일.
+        weeks = days - (days - 1) % 7
+        # 월: 1970-01 기준 개월 수.
+        months = (days - _EPOCH_ORDINAL).astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+
+        def grouped(keys):
+            unique_keys, key_inverse = np.unique(keys, return_inverse=True)
+            return (unique_keys.tolist(), np.bincount(key_inverse, weights=day_totals).astype(np.int64).tolist(),
+                    np.bincount(key_inverse, weights=day_completes).astype(np.int64).tolist())
+
+        from_ordinal = datetime.date.fromordinal
+        self._days = {from_ordinal(day): [total, done]
+                      for day, total, done in zip(days.tolist(), day_totals.tolist(), day_completes.tolist())}
+        self._weeks = {from_ordinal(week): [total, done] for week, total, done in zip(*grouped(weeks))}
+        self._months = {(1970 + month // 12, month % 12 + 1): [total, done]
+                        for month, total, done in zip(*grouped(months))}
+        self._totals = [int(day_totals.sum()), int(day_completes.sum())]
+        self._longest_streak_dirty = True
+
+    # --- 과거 펫 집계 ---
+    def add_history(self, record):
+        """과거 펫 기록 하나를 종류별 집계에 더합니다."""
+        self._add(self._species, record['species'], 1, record['level'])
+
+    def remove_history(self, record):
+        """과거 펫 기록 하나를 종류별 집계에서 뺍니다."""
+        self._add(self._species, record['species'], -1, -record['level'])
+
+    def rebuild_history(self, historical_pets):
+        """과거 펫 기록 리스트로 종류별 집계를 처음부터 다시 만듭니다."""
+        self._species.clear()
+        for record in historical_pets:
+            self.add_history(record)
+
+    # --- 조회 ---
+    def day_summary(self, date):
+        """날짜의 (전체, 완료, 완료율)."""
+        total, completed = self._days.get(date, (0, 0))
+        return total, completed, _rate(total, completed)
+
+    def week_summary(self, date):
+        """날짜가 속한 주(월~일)의 (전체, 완료, 완료율)."""
+        total, completed = self._weeks.get(week_start(date), (0, 0))
+        return total, completed, _rate(total, completed)
+
+    def month_summary(self, year, month):
+        """한 달의 (전체, 완료, 완료율)."""
+        total, completed = self._months.get((year, month), (0, 0))
+        return total, completed, _rate(total, completed)
+
+    def week_exp(self, date):
+        """날짜가 속한 주에 할 일 완료로 얻은 경험치."""
+        return self._weeks.get(week_start(date), (0, 0))[1] * EXP_PER_TODO_COMPLETE
+
+    def current_streak(self, today):
+        """
+        today까지 이어지는 연속 달성 일수 (할 일을 하나 이상 완료한 날이 연속된 일수).
+        오늘 아직 완료한 할 일이 없으면 어제까지의 연속 일수를 셉니다.
+        """
+        date = today if self._days.get(today, (0, 0))[1] else today - _ONE_DAY
+        streak = 0
+        while self._days.get(date, (0, 0))[1]:
+            streak += 1
+            date -= _ONE_DAY
+        return streak
+
+    def longest_streak(self):
+        """가장 긴 연속 달성 일수. 달성한 날짜가 바뀐 뒤 처음 조회할 때만 다시 계산합니다."""
+        if self._longest_streak_dirty:
+            longest = run = 0
+            previous = None
+            for ordinal in sorted(date.toordinal() for date, (_, completed) in self._days.items() if completed):
+                run = run + 1 if previous == ordinal - 1 else 1
+                longest = max(longest, run)
+                previous = ordinal
+            self._longest_streak = longest
+            self._longest_streak_dirty = False
+        return self._longest_streak
+
+    def species_levels(self):
+        """펫 종류 -> (기록 수, 평균 최종 레벨)."""
+        return {species: (count, level_sum / count) for species, (count, level_sum) in self._species.items()}
+
+    def report(self, today=None, weeks=STATS_RECENT_WEEKS):
+        """
+        통계 화면/응답용 딕셔너리를 만듭니다.
+        Args:
+            today (datetime.date, optional): 기준 날짜. 기본값은 오늘.
+            weeks (int): 주별 추이에 포함할 최근 주 수 (이번 주 포함).
+        Returns:
+            dict: 'today', 'week', 'month', 'overall' (각각 total, completed, rate),
+                  'current_streak', 'longest_streak',
+                  'weekly' (오래된 주부터 {'start', 'total', 'completed', 'rate', 'exp'} 리스트),
+                  'species' (종류 -> {'count', 'average_level'}).
+        """
+        today = today if today else datetime.date.today()
+        summary = lambda total, completed, rate: {'total': total, 'completed': completed, 'rate': rate}
+        this_week = week_start(today)
+        weekly = []
+        for offset in range(weeks - 1, -1, -1):
+            start = this_week - datetime.timedelta(weeks=offset)
+            total, completed, rate = self.week_summary(start)
+            weekly.append({'start': start, 'total': total, 'completed': completed, 'rate': rate,
+                           'exp': completed * EXP_PER_TODO_COMPLETE})
+        return {
+            'date': today,
+            'today': summary(*self.day_summary(today)),
+            'week': summary(*self.week_summary(today)),
+            'month': summary(*self.month_summary(today.year, today.month)),
+            'overall': summary(self._totals[0], self._totals[1], _rate(*self._totals)),
+            'current_streak': self.current_streak(today),
+            'longest_streak': self.longest_streak(),
+            'weekly': weekly,
+            'species': {species: {'count': count, 'average_level': average}
+                        for species, (count, average) in sorted(self.species_levels().items())},
+        }
+
+def jsonable(value):
+    """report 결과의 날짜를 ISO 문자열로 바꿔 JSON으로 보낼 수 있게 합니다."""
+    if isinstance(value, dict):
+        return {key: jsonable(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [jsonable(item) for item in value]
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+def compute_stats(storage, today=None):
+    """
+    저장소의 모든 데이터로 통계를 처음부터 계산합니다. (화면 없이 사용하는 함수)
+    할 일은 열 형식으로 내보내 rebuild_columns로 집계합니다.
+    Args:
+        storage: data_manager.create_storage()가 만든 저장소.
+        today (datetime.date, optional): 기준 날짜. 기본값은 오늘.
+    Returns:
+        dict: TodoStats.report 결과.
+    """
+    _, daily_todos, _, historical_pets = storage.load()
+    stats = TodoStats()
+    if hasattr(storage, 'load_todo_columns'): # SQLite 저장소는 모든 날짜를 열 형식으로 바로 조회.
+        stats.rebuild_columns(*storage.load_todo_columns())
+    else:
+        stats.rebuild_columns(*todo_columns(daily_todos.items()))
+    stats.rebuild_history(historical_pets)
+    return stats.report(today)
+
+def main():
+    import sys
+    import data_manager # 명령줄에서만 필요.
+    from instrumentation import configure_logging
+    parser = argparse.ArgumentParser(description="Pet-Do-List 통계")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, default=None, help="기준 날짜 (YYYY-MM-DD)")
+    args = parser.parse_args()
+    configure_logging(stream=sys.stderr) # 표준 출력은 통계 JSON 전용.
+    storage = data_manager.create_storage()
+    print(json.dumps(jsonable(compute_stats(storage, args.date)), ensure_ascii=False, indent=2))
+    if hasattr(storage, 'close'):
+        storage.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_analytics.py
+
+# 통계 모듈(analytics.TodoStats) 벤치마크.
+# 여러 해 분량의 합성 할 일을 열 형식(날짜 서수, 완료 여부)으로 만들어 전체 재계산 시간을
+# NumPy 벡터 연산과 파이썬 반복문으로 각각 재고 결과가 같은지 확인합니다.
+# 할 일 하나가 바뀔 때의 증분 갱신(apply_day_delta)과 통계 조회(report) 시간도 잽니다.
+#
+# 실행: python benchmarks/bench_analytics.py [--years 10] [--todos-per-day 500]
+
+import os
+import sys
+import argparse
+import datetime
+import random
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import analytics
+
+def generate_columns(years, todos_per_day, seed=0):
+    """합성 열 형식 할 일 데이터 (날짜 서수 배열, 완료 여부 배열)를 만듭니다. 가끔 할 일이 없는 날도 있습니다."""
+    rng = random.Random(seed)
+    start = datetime.date.today().toordinal() - 365 * years
+    ordinals, completed = array('l'), array('b')
+    for day in range(365 * years):
+        if rng.random() < 0.1:
+            continue
+        count = rng.randint(todos_per_day // 2, todos_per_day * 3 // 2)
+        ordinals.extend([start + day] * count)
+        completed.extend([rng.random() < 0.7 for _ in range(count)])
+    return ordinals, completed
+
+def time_rebuild(columns, use_numpy, repeat=3):
+    """rebuild_columns의 가장 빠른 시간(초)과 결과 통계를 반환합니다."""
+    numpy_module = analytics.np
+    analytics.np = numpy_module if use_numpy else None
+    try:
+        best = float('inf')
+        for _ in range(repeat):
+            stats = analytics.TodoStats()
+            start_time = time.perf_counter()
+            stats.rebuild_columns(*columns)
+            best = min(best, time.perf_counter() - start_time)
+    finally:
+        analytics.np = numpy_module
+    return best, stats
+
+def main():
+    parser = argparse.ArgumentParser(description="통계 모듈 벤치마크")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--todos-per-day", type=int, default=500)
+    args = parser.parse_args()
+
+    columns = generate_columns(args.years, args.todos_per_day)
+    today = datetime.date.today()
+    print(f"할 일 {len(columns[0]):,}개 ({args.years}년), NumPy: {'있음' if analytics.np is not None else '없음'}")
+
+    python_seconds, python_stats = time_rebuild(columns, use_numpy=False)
+    print(f"전체 재계산 (파이썬)  {python_seconds * 1000:9.1f}ms")
+    if analytics.np is not None:
+        numpy_seconds, numpy_stats = time_rebuild(columns, use_numpy=True)
+        if numpy_stats.report(today) != python_stats.report(today):
+            raise SystemExit("NumPy 재계산 결과가 파이썬 재계산과 다릅니다.")
+        print(f"전체 재계산 (NumPy)   {numpy_seconds * 1000:9.1f}ms ({python_seconds / numpy_seconds:.1f}배)")
+
+    # 증분 갱신: 할 일 추가, 완료, 삭제를 임의의 날짜에 반영.
+    rng = random.Random(1)
+    stats = python_stats
+    dates = [today - datetime.timedelta(days=rng.randrange(365 * args.years)) for _ in range(10000)]
+    start_time = time.perf_counter()
+    for date in dates:
+        stats.apply_day_delta(date, 1, 0)
+        stats.apply_day_delta(date, 0, 1)
+        stats.apply_day_delta(date, -1, -1)
+    update_seconds = time.perf_counter() - start_time
+    print(f"증분 갱신 {update_seconds / (len(dates) * 3) * 1e6:.2f}µs/변경")
+
+    start_time = time.perf_counter()
+    report = stats.report(today)
+    first_report_seconds = time.perf_counter() - start_time # 최장 연속 일수 다시 계산 포함.
+    start_time = time.perf_counter()
+    for _ in range(100):
+        stats.report(today)
+    report_seconds = (time.perf_counter() - start_time) / 100
+    print(f"통계 조회 {report_seconds * 1000:.3f}ms (변경 후 첫 조회 {first_report_seconds * 1000:.2f}ms), "
+          f"전체 완료율 {report['overall']['rate']:.1%}, 최장 연속 {report['longest_streak']}일")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_command_pipeline.py
+
+# CommandPipeline 그룹 커밋 벤치마크.
+# 여러 생산자가 할 일 추가/완료 명령을 최대한 빠르게 제출하고, 초당 처리량, 그룹(배치) 크기,
+# 명령 지연 시간 백분위를 출력합니다. 데이터는 임시 폴더의 저널 저장소에 기록되며,
+# 명령 결과는 그룹의 저널 레코드가 fsync된 뒤에 전달되므로 지연 시간에 디스크 기록 시간이 포함됩니다.
+#
+# 실행: python benchmarks/bench_command_pipeline.py [--commands 50000] [--producers 4] [--window-ms 5]
+
+import os
+import sys
+import asyncio
+import argparse
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import data_manager
+import pet_engine
+from command_pipeline import CommandPipeline
+
+import harness
+
+async def _produce(pipeline, producer_index, count, max_in_flight):
+    """
+    할 일 추가, 완료, 삭제 명령을 차례로 제출합니다. (결과는 max_in_flight개까지 겹쳐서 기다림)
+    완료/삭제할 할 일은 미리 한 번에 추가해 둔 할 일들의 id로 지정합니다.
+    """
+    todo_ids = await pipeline.execute('add_todos', [f"p{producer_index}-pre-{i}" for i in range(count // 3)])
+    in_flight = []
+    for i, todo_id in enumerate(todo_ids):
+        in_flight.append(await pipeline.submit('add_todo', f"p{producer_index}-{i}"))
+        in_flight.append(await pipeline.submit('complete_todo', todo_id))
+        in_flight.append(await pipeline.submit('remove_todo', todo_id))
+        if len(in_flight) >= max_in_flight:
+            await asyncio.gather(*in_flight)
+            in_flight = []
+    await asyncio.gather(*in_flight)
+
+async def run_benchmark(commands, producers, window_ms, queue_depth, max_in_flight):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = data_manager.JournalStorage(os.path.join(temp_dir, "bench.pkl"),
+                                              os.path.join(temp_dir, "bench.journal"))
+        engine = pet_engine.PetDoListEngine()
+        pipeline = CommandPipeline(engine, storage, commit_window_ms=window_ms, max_queue_depth=queue_depth)
+        await pipeline.start()
+        with harness.quiet(): # 모듈 로그 출력은 측정에서 제외.
+            await pipeline.execute('create_pet', "벤치", "사람")
+            start_time = time.perf_counter()
+            await asyncio.gather(*(_produce(pipeline, p, commands // producers, max_in_flight)
+                                   for p in range(producers)))
+            elapsed = time.perf_counter() - start_time
+            await pipeline.stop()
+        return elapsed, pipeline.get_stats()
+
+def main():
+    parser = argparse.ArgumentParser(description="CommandPipeline 그룹 커밋 벤치마크")
+    parser.add_argument("--commands", type=int, default=50000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--window-ms", type=float, default=5)
+    parser.add_argument("--queue-depth", type=int, default=10000)
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    args = parser.parse_args()
+
+    elapsed, stats = asyncio.run(run_benchmark(args.commands, args.producers, args.window_ms,
+                                               args.queue_depth, args.max_in_flight))
+    submitted = stats['commands'] - 1 - args.producers # create_pet과 미리 추가하는 add_todos 제외.
+    print(f"명령 {submitted}개 / {elapsed:.2f}초 = {submitted / elapsed:,.0f} 명령/초")
+    print(f"기록 {stats['commits']}회, 평균 배치 {stats['average_batch_size']:.1f}개, 최대 배치 {stats['max_batch_size']}개, "
+          f"기록 한 번 평균 {stats['average_write_seconds'] * 1000:.2f}ms (fsync 포함)")
+    print(f"지연 시간 p50 {stats['latency_p50_seconds'] * 1000:.2f}ms, p95 {stats['latency_p95_seconds'] * 1000:.2f}ms, "
+          f"p99 {stats['latency_p99_seconds'] * 1000:.2f}ms, 최대 {stats['latency_max_seconds'] * 1000:.2f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_data_exchange.py
+
+# 데이터 내보내기/가져오기(data_exchange) 처리량 벤치마크.
+# 수백만 개의 합성 할 일을 제너레이터로 만들어 JSON Lines / CSV로 내보내고 다시 읽는 속도(레코드/초, MB/초)와
+# 읽는 동안의 최대 메모리(tracemalloc)를 재고, 읽은 레코드를 엔진에 합치는(import_records) 속도도 잽니다.
+#
+# 실행: python benchmarks/bench_data_exchange.py [--todos 2000000] [--import-todos 500000]
+
+import os
+import sys
+import argparse
+import datetime
+import random
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import config
+import data_exchange
+import pet_engine
+from pet_manager import Pet
+from todo_manager import TodoItem
+
+# 매일 반복되는 할 일 내용 예시.
+_TEXTS = ["운동하기 30분", "영어 공부", "독서", "산책", "코딩 연습", "일기 쓰기", "청소", "장보기, 우유 \"2개\""]
+
+def generate_todo_rows(todo_count, todos_per_day=80, seed=0):
+    """합성 (날짜, TodoItem) 쌍들을 날짜 순으로 하나씩 만듭니다. (메모리에 모아 두지 않음)"""
+    rng = random.Random(seed)
+    start_date = datetime.date.today() - datetime.timedelta(days=todo_count // todos_per_day)
+    for todo_id in range(1, todo_count + 1):
+        date = start_date + datetime.timedelta(days=(todo_id - 1) // todos_per_day)
+        text = rng.choice(_TEXTS) if rng.random() < 0.8 else f"메모 {rng.randrange(10 ** 6)}"
+        yield date, TodoItem(todo_id, text, rng.random() < 0.7)
+
+def generate_records(todo_count):
+    """펫, 간식, 과거 펫 기록과 todo_count개의 할 일 레코드를 만듭니다."""
+    pet = Pet(name="벤치", species=config.PET_SPECIES_LIST[0])
+    history = [{'species': pet.species, 'level': 3, 'start_date': datetime.date(2020, 1, 1) + datetime.timedelta(weeks=i),
+                'end_date': datetime.date(2020, 1, 8) + datetime.timedelta(weeks=i)} for i in range(100)]
+    return data_exchange.iter_records(pet, generate_todo_rows(todo_count), dict(config.INITIAL_SNACK_COUNTS), history)
+
+def measure_read_peak(path, limit=None):
+    """파일을 끝까지 읽는 동안의 최대 메모리(바이트). 추적 중에는 느려지므로 시간은 따로 잽니다."""
+    tracemalloc.start()
+    for _ in islice(data_exchange.read_file(path), limit):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터 내보내기/가져오기 처리량 벤치마크")
+    parser.add_argument("--todos", type=int, default=2000000)
+    parser.add_argument("--import-todos", type=int, default=500000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"할 일 {args.todos:,}개")
+        for file_format in ('jsonl', 'csv'):
+            path = os.path.join(temp_dir, f"export.{file_format}")
+            start_time = time.perf_counter()
+            count = data_exchange.export_file(generate_records(args.todos), path)
+            export_seconds = time.perf_counter() - start_time
+            size_mb = os.path.getsize(path) / 2 ** 20
+
+            start_time = time.perf_counter()
+            read_count = sum(1 for _ in data_exchange.read_file(path))
+            read_seconds = time.perf_counter() - start_time
+
+            small_peak = measure_read_peak(path, limit=count // 100) # 1%만 읽었을 때와 비교.
+            full_peak = measure_read_peak(path)
+            print(f"[{file_format:5}] {size_mb:7.1f}MB | 내보내기 {count / export_seconds:10,.0f}레코드/초 "
+                  f"({size_mb / export_seconds:5.1f}MB/초) | 읽기 {read_count / read_seconds:10,.0f}레코드/초 "
+                  f"({size_mb / read_seconds:5.1f}MB/초) | 읽기 최대 메모리 1%: {small_peak / 1024:6.0f}KB, "
+                  f"전체: {full_peak / 1024:6.0f}KB")
+
+            # 가져오기: 빈 엔진에 합치기(모두 추가)와 같은 파일을 한 번 더 합치기(모두 짝지어짐).
+            import_path = os.path.join(temp_dir, f"import.{file_format}")
+            data_exchange.export_file(generate_records(args.import_todos), import_path)
+            engine = pet_engine.PetDoListEngine()
+            persisted = []
+            engine.subscribe(pet_engine.EVENT_PERSIST, lambda changes: persisted.append(len(changes)))
+            for label in ("새로 추가", "다시 합치기"):
+                persisted.clear()
+                start_time = time.perf_counter()
+                stats = engine.import_records(data_exchange.read_file(import_path))
+                import_seconds = time.perf_counter() - start_time
+                print(f"        가져오기 ({label}) {args.import_todos / import_seconds:10,.0f}할 일/초 "
+                      f"(추가 {stats['todos_added']:,}, 짝지어짐 {stats['todos_matched']:,}, 기록 이벤트 {len(persisted):,}회)")
+
+if __name__ == "__main__":
+    main()
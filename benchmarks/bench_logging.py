@@ -0,0 +1,67 @@
+# benchmarks/bench_logging.py
+
+# 로그 출력 방식(instrumentation.configure_logging) 벤치마크.
+# 한 줄 쓰는 데 시간이 걸리는 출력(느린 파이프/파일 흉내)에 로그를 남길 때, 호출한 스레드가 기다리는 시간을
+# 동기 출력과 비동기(큐 + 백그라운드 스레드) 출력으로 각각 잽니다.
+# 꺼진 레벨(DEBUG)과 꺼진 모듈의 로그 호출 비용, 반복 메시지 제한의 효과도 잽니다.
+#
+# 실행: python benchmarks/bench_logging.py [--messages 2000] [--write-delay-ms 0.2]
+
+import os
+import sys
+import io
+import argparse
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+from instrumentation import get_logger, configure_logging, shutdown_logging
+
+class SlowStream(io.TextIOBase):
+    """쓰기마다 delay초가 걸리는 출력 스트림. 쓴 줄 수만 셉니다."""
+    def __init__(self, delay):
+        self.delay = delay
+        self.lines = 0
+
+    def write(self, text):
+        time.sleep(self.delay)
+        self.lines += text.count("\n")
+        return len(text)
+
+def time_logging(messages, delay, level="DEBUG", rate_limit_seconds=0, **options):
+    """
+    서로 다른 내용의 로그 messages개를 남기는 동안 호출한 스레드가 걸린 시간(초), 출력이 끝날 때까지의 시간(초),
+    실제로 출력된 줄 수를 반환합니다.
+    """
+    stream = SlowStream(delay)
+    configure_logging(level, stream=stream, rate_limit_seconds=rate_limit_seconds, **options)
+    log = get_logger("bench")
+    start_time = time.perf_counter()
+    for index in range(messages):
+        log.debug("이미지 로드 시도 경로: %s", f"resources/pets/cat_level{index}.png")
+    caller_seconds = time.perf_counter() - start_time
+    shutdown_logging() # 큐에 남은 로그 출력 대기.
+    return caller_seconds, time.perf_counter() - start_time, stream.lines
+
+def main():
+    parser = argparse.ArgumentParser(description="로그 출력 방식 벤치마크")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--write-delay-ms", type=float, default=0.2, help="출력 한 번에 걸리는 시간 (밀리초)")
+    args = parser.parse_args()
+    delay = args.write_delay_ms / 1000
+
+    print(f"로그 {args.messages}개, 출력 한 번 {args.write_delay_ms}ms")
+    cases = [
+        ("동기 출력", dict(asynchronous=False)),
+        ("비동기 출력", dict(asynchronous=True)),
+        ("비동기 + 반복 제한(10초에 5개)", dict(asynchronous=True, rate_limit_seconds=10.0, rate_limit_burst=5)),
+        ("꺼진 레벨 (INFO)", dict(asynchronous=True, level="INFO")),
+        ("꺼진 모듈", dict(asynchronous=True, disabled_modules=("bench",))),
+    ]
+    for name, options in cases:
+        caller_seconds, total_seconds, lines = time_logging(args.messages, delay, **options)
+        print(f"{name:<32} 호출 스레드 {caller_seconds / args.messages * 1e6:9.2f}µs/회  "
+              f"출력 완료까지 {total_seconds * 1000:9.1f}ms  출력 {lines}줄")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_snapshot_format.py
+
+# 스냅샷 본문 형식 벤치마크.
+# 같은 합성 데이터(datasets.generate_dataset)를 세 가지 방식으로 만들고 읽어 시간과 크기를 비교합니다.
+#   pickle (TodoItem)  펫과 TodoItem 리스트를 그대로 pickle. (도메인 객체 직렬화)
+#   pickle (열 형식)   형식 버전 2: 펫 객체 + 날짜별 열 형식 할 일을 pickle.
+#   이진 (버전 3)      snapshot_format의 스키마 기반 이진 형식. (현재 저장 형식)
+# 읽기 시간은 TodoItem 리스트까지 만드는 시간이며, 본문만 재고 파일 입출력은 포함하지 않습니다.
+#
+# 실행: python benchmarks/bench_snapshot_format.py [--years 10] [--todos-per-day 8] [--history 520] [--repeat 5]
+
+import os
+import sys
+import argparse
+import pickle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import data_manager
+import snapshot_format
+
+import datasets
+import harness
+
+def pickle_objects_codec(pet, daily_todos, snack_counts, historical_pets, next_todo_id):
+    """도메인 객체를 그대로 pickle하는 (인코더, 디코더)."""
+    data = {'pet': pet, 'daily_todos': daily_todos, 'snack_counts': snack_counts,
+            'historical_pets': historical_pets, 'next_todo_id': next_todo_id}
+    return lambda: pickle.dumps(data), pickle.loads
+
+def pickle_columns_codec(pet, daily_todos, snack_counts, historical_pets, next_todo_id):
+    """형식 버전 2 (열 형식 pickle)의 (인코더, 디코더)."""
+    def encode():
+        return pickle.dumps({'pet': pet, 'daily_todo_columns': data_manager._pack_daily_todos(daily_todos),
+                             'snack_counts': snack_counts, 'historical_pets': historical_pets,
+                             'next_todo_id': next_todo_id})
+    def decode(payload):
+        data = pickle.loads(payload)
+        data['daily_todos'] = data_manager._unpack_daily_todos(data.pop('daily_todo_columns'))
+        return data
+    return encode, decode
+
+def binary_codec(pet, daily_todos, snack_counts, historical_pets, next_todo_id):
+    """형식 버전 3 (이진 형식)의 (인코더, 디코더)."""
+    return (lambda: snapshot_format.encode(pet, daily_todos, snack_counts, historical_pets, next_todo_id),
+            snapshot_format.decode)
+
+CODECS = [
+    ("pickle (TodoItem)", pickle_objects_codec),
+    ("pickle (열 형식)", pickle_columns_codec),
+    ("이진 (버전 3)", binary_codec),
+]
+
+def main():
+    parser = argparse.ArgumentParser(description="스냅샷 본문 형식 벤치마크")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--todos-per-day", type=int, default=8)
+    parser.add_argument("--history", type=int, default=520)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pet, daily_todos, snack_counts, historical_pets = datasets.generate_dataset(
+        args.years, args.history, args.todos_per_day)
+    next_todo_id = data_manager._max_todo_id(daily_todos) + 1
+    todo_count = sum(len(todos) for todos in daily_todos.values())
+    print(f"할 일 {todo_count:,}개 ({args.years}년), 과거 펫 기록 {args.history}개")
+
+    baseline = None
+    for name, make_codec in CODECS:
+        encode, decode = make_codec(pet, daily_todos, snack_counts, historical_pets, next_todo_id)
+        payload = encode()
+        decoded = decode(payload)
+        if decoded['daily_todos'] != daily_todos or decoded['historical_pets'] != historical_pets:
+            raise SystemExit(f"{name}: 읽은 데이터가 원본과 다릅니다.")
+        encode_time = harness.measure_time(encode, repeat=args.repeat)['median']
+        decode_time = harness.measure_time(lambda: decode(payload), repeat=args.repeat)['median']
+        if baseline is None:
+            baseline = (encode_time, decode_time, len(payload))
+        print(f"{name:<18} 쓰기 {encode_time * 1000:8.1f}ms ({encode_time / baseline[0]:4.0%})  "
+              f"읽기 {decode_time * 1000:8.1f}ms ({decode_time / baseline[1]:4.0%})  "
+              f"크기 {len(payload) / 2 ** 20:7.2f}MB ({len(payload) / baseline[2]:4.0%})")
+
+if __name__ == "__main__":
+    main()
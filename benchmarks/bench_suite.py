@@ -0,0 +1,222 @@
+# benchmarks/bench_suite.py
+
+# 저장/불러오기, 핵심 로직, GUI 갱신 벤치마크 모음.
+# datasets.py의 합성 데이터(N년 분량의 날짜별 할 일, M개의 과거 펫 기록)로 각 항목의 시간과 최대 메모리를 재고,
+# 결과를 JSON 파일로 저장합니다. 이전 결과 파일을 주면 항목별 중앙값을 비교해 느려진 항목을 표시합니다.
+# GUI 묶음은 Tk 화면이 필요하며, 화면이 없는 서버에서는 --xvfb로 가상 디스플레이(Xvfb)를 띄워 실행합니다.
+# 측정 중에는 모듈 로그를 끄므로 로그 출력 속도는 결과에 포함되지 않습니다.
+#
+# 실행: python benchmarks/bench_suite.py [--years 5] [--todos-per-day 8] [--history 520] [--repeat 5]
+#                                         [--suite persistence domain gui] [--xvfb]
+#                                         [--output results.json] [--compare baseline.json] [--threshold 0.1]
+
+import os
+import sys
+import argparse
+import datetime
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR) # 저장소 루트의 모듈 사용.
+
+import config
+import data_manager
+import pet_engine
+from sqlite_storage import SQLiteStorage
+from todo_manager import TodoManager
+
+import datasets
+import harness
+
+SUITES = ("persistence", "domain", "gui")
+OPERATION_COUNT = 1000 # 핵심 로직 항목에서 한 번에 처리하는 할 일 수.
+
+def copy_daily_todos(daily_todos):
+    """할 일 항목까지 복사한 날짜별 할 일 데이터. (항목을 바꾸는 측정마다 같은 입력으로 시작)"""
+    return {date: [todo.copy() for todo in todos] for date, todos in daily_todos.items()}
+
+# === 저장/불러오기 ===
+def bench_persistence(results, dataset, repeat):
+    pet, daily_todos, snack_counts, historical_pets = dataset
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_file = os.path.join(temp_dir, "data.pkl")
+        save = lambda: data_manager.save_data(pet, daily_todos, snack_counts, historical_pets, file_name=data_file)
+        results.add("persistence", "save_data", harness.measure_time(save, repeat=repeat),
+                    harness.measure_peak_memory(save), file_bytes=os.path.getsize(data_file))
+        load = lambda: data_manager.load_data(data_file)
+        results.add("persistence", "load_data", harness.measure_time(load, repeat=repeat),
+                    harness.measure_peak_memory(load))
+
+        # 저널: 변경 레코드 하나 덧붙이기(fsync 포함)와, 압축 직전만큼 쌓인 저널을 재생하며 불러오기.
+        storage = data_manager.JournalStorage(data_file, os.path.join(temp_dir, "data.journal"))
+        storage.load()
+        today = max(daily_todos)
+        next_id = max(todo.id for todo in daily_todos[today]) + 1
+        changes = [[('todo_add', today, "저널 벤치", next_id + i), ('todo_update', today, next_id + i, {'completed': True})]
+                   for i in range(config.JOURNAL_COMPACT_THRESHOLD - 1)]
+        pending = iter(changes)
+        results.add("persistence", "journal_append",
+                    harness.measure_time(lambda: storage.append(next(pending)), repeat=1, number=len(changes)))
+        results.add("persistence", "journal_load_replay", harness.measure_time(storage.load, repeat=repeat),
+                    harness.measure_peak_memory(storage.load), journal_records=len(changes))
+
+        # SQLite: 전체 저장과 시작 시 불러오기 (오늘 할 일 + 달력 요약).
+        sqlite_storage = SQLiteStorage(os.path.join(temp_dir, "data.db"), os.path.join(temp_dir, "none.pkl"),
+                                       os.path.join(temp_dir, "none.journal"))
+        sqlite_save = lambda: sqlite_storage.save(pet, daily_todos, snack_counts, historical_pets)
+        results.add("persistence", "sqlite_save", harness.measure_time(sqlite_save, repeat=repeat))
+        sqlite_load = lambda: (sqlite_storage.load(), sqlite_storage.load_day_summaries())
+        results.add("persistence", "sqlite_load", harness.measure_time(sqlite_load, repeat=repeat),
+                    harness.measure_peak_memory(sqlite_load))
+        sqlite_storage.close()
+
+# === 핵심 로직 ===
+def bench_domain(results, dataset, repeat):
+    _, daily_todos, snack_counts, _ = dataset
+    today = max(daily_todos)
+
+    def new_manager():
+        todo_manager = TodoManager(copy_daily_todos(daily_todos), dict(snack_counts))
+        todo_manager.set_current_date(today)
+        return todo_manager
+
+    def manager_with_new_todos():
+        todo_manager = new_manager()
+        todo_ids = [todo.id for todo in todo_manager.add_todos([f"벤치 {i}" for i in range(OPERATION_COUNT)])]
+        return todo_manager, todo_ids
+
+    results.add("domain", "todo_manager_init",
+                harness.measure_time(lambda todos: TodoManager(todos, dict(snack_counts)),
+                                     setup=lambda: copy_daily_todos(daily_todos), repeat=repeat))
+    results.add("domain", "add_todo", harness.measure_time(
+        lambda todo_manager: [todo_manager.add_todo(f"벤치 {i}") for i in range(OPERATION_COUNT)],
+        setup=new_manager, repeat=repeat), operations=OPERATION_COUNT)
+    results.add("domain", "complete_todos", harness.measure_time(
+        lambda state: [state[0].complete_todos([todo_id]) for todo_id in state[1]],
+        setup=manager_with_new_todos, repeat=repeat), operations=OPERATION_COUNT)
+    results.add("domain", "remove_todos", harness.measure_time(
+        lambda state: [state[0].remove_todos([todo_id]) for todo_id in state[1]],
+        setup=manager_with_new_todos, repeat=repeat), operations=OPERATION_COUNT)
+    results.add("domain", "pet_add_exp", harness.measure_time(
+        lambda pet: [pet.add_exp(config.EXP_PER_TODO_COMPLETE) for _ in range(OPERATION_COUNT)],
+        setup=datasets.generate_pet, repeat=repeat), operations=OPERATION_COUNT)
+
+    # 엔진을 거친 할 일 완료 (경험치, 간식, 변경 기록 이벤트 포함).
+    def new_engine():
+        engine = pet_engine.PetDoListEngine()
+        engine.load_state(datasets.generate_pet(), copy_daily_todos(daily_todos), dict(snack_counts), [])
+        engine.subscribe(pet_engine.EVENT_PERSIST, lambda changes: None)
+        engine.go_to_date(today)
+        return engine, engine.add_todos([f"벤치 {i}" for i in range(OPERATION_COUNT)])
+    results.add("domain", "engine_complete_todo", harness.measure_time(
+        lambda state: [state[0].complete_todo(todo_id) for todo_id in state[1]],
+        setup=new_engine, repeat=repeat), operations=OPERATION_COUNT)
+
+# === GUI ===
+def bench_gui(results, dataset, repeat, use_xvfb):
+    try:
+        import tkinter as tk
+        import gui
+        import main as app_main # PetDoListGUI가 호출하는 앱 로직 메서드 (pygame 등 앱 의존성 필요).
+    except ImportError as e:
+        results.skip("gui", f"GUI 모듈을 불러올 수 없습니다: {e}")
+        return
+    with harness.virtual_display(use_xvfb) as display:
+        if display is None:
+            results.skip("gui", "디스플레이가 없습니다 (--xvfb와 Xvfb 설치 필요)")
+            return
+        try:
+            root = tk.Tk()
+        except tk.TclError as e:
+            results.skip("gui", f"Tk를 시작할 수 없습니다: {e}")
+            return
+        try:
+            _bench_gui_widgets(results, dataset, repeat, root, tk, gui, app_main)
+        finally:
+            root.destroy()
+
+def _bench_gui_widgets(results, dataset, repeat, root, tk, gui, app_main):
+    pet, daily_todos, snack_counts, historical_pets = dataset
+    today = max(daily_todos)
+    # 저장소/효과음/타이머 없이 엔진만 연결한 앱 로직. (__init__을 거치지 않으므로 창 설정도 하지 않음)
+    engine = pet_engine.PetDoListEngine()
+    engine.load_state(pet, copy_daily_todos(daily_todos), dict(snack_counts), list(historical_pets))
+    app = app_main.PetDoListApp.__new__(app_main.PetDoListApp)
+    app.master, app.engine = root, engine
+    root.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
+    view = gui.PetDoListGUI(root, app)
+    engine.subscribe(pet_engine.EVENT_CHANGED, lambda parts: view.update_gui_with_pet_data(parts))
+    engine.go_to_date(today)
+    root.update()
+
+    def refresh(parts=None):
+        view.update_gui_with_pet_data(parts)
+        root.update_idletasks() # 위젯 다시 그리기까지 포함.
+
+    results.add("gui", "update_gui_full", harness.measure_time(refresh, repeat=repeat, number=10))
+    todo_ids = engine.todo_manager.get_current_date_todo_ids()
+    results.add("gui", "update_gui_todo_row", harness.measure_time(
+        lambda: refresh({(pet_engine.PART_TODO, todo_ids[0])}), repeat=repeat, number=10))
+    dates = iter([today - datetime.timedelta(days=i) for i in range(1, repeat * 10 + 1)])
+    results.add("gui", "change_date", harness.measure_time(
+        lambda: (engine.go_to_date(next(dates)), root.update_idletasks()), repeat=repeat, number=10))
+
+    image_filename = f"{pet.species}_level{pet.level}.png"
+    def clear_image_cache():
+        view.pet_image_cache.clear()
+        view._prewarmed_images.clear()
+    results.add("gui", "load_pet_image_cold", harness.measure_time(
+        lambda _: view.load_pet_image(image_filename), setup=clear_image_cache, repeat=repeat))
+    results.add("gui", "load_pet_image_warm", harness.measure_time(
+        lambda: view.load_pet_image(image_filename), repeat=repeat, number=100))
+
+    # 기록 다이얼로그는 닫힐 때까지 기다리므로, 생성 후 처음 한가해질 때 닫습니다.
+    def open_history_dialog():
+        root.after_idle(lambda: [child.destroy() for child in root.winfo_children() if isinstance(child, tk.Toplevel)])
+        gui.HistoricalPetViewerDialog(root, app.historical_pets, view.load_pet_image, app)
+    try:
+        results.add("gui", "history_dialog", harness.measure_time(open_history_dialog, repeat=repeat),
+                    history_records=len(historical_pets))
+    except tk.TclError as e:
+        results.skip("gui.history_dialog", f"다이얼로그를 열 수 없습니다: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Pet-Do-List 벤치마크 모음")
+    parser.add_argument("--years", type=int, default=5, help="날짜별 할 일 기간 (년)")
+    parser.add_argument("--todos-per-day", type=int, default=8, help="하루 평균 할 일 수")
+    parser.add_argument("--history", type=int, default=520, help="과거 펫 기록 수")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 측정 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES), help="실행할 묶음")
+    parser.add_argument("--xvfb", action="store_true", help="디스플레이가 없으면 Xvfb 가상 디스플레이를 띄움")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument("--threshold", type=float, default=0.1, help="성능 저하로 판단할 중앙값 증가 비율")
+    args = parser.parse_args()
+
+    os.chdir(REPO_DIR) # 리소스 경로(config.RESOURCES_PATH)가 저장소 기준 상대 경로.
+    parameters = {'years': args.years, 'todos_per_day': args.todos_per_day, 'history': args.history,
+                  'repeat': args.repeat, 'seed': args.seed}
+    results = harness.BenchmarkResults(parameters)
+    with harness.quiet():
+        dataset = datasets.generate_dataset(args.years, args.history, args.todos_per_day, args.seed)
+        todo_count = sum(len(todos) for todos in dataset[1].values())
+        print(f"할 일 {todo_count:,}개 ({args.years}년), 과거 펫 기록 {args.history:,}개", file=sys.stderr)
+        if "persistence" in args.suite:
+            bench_persistence(results, dataset, args.repeat)
+        if "domain" in args.suite:
+            bench_domain(results, dataset, args.repeat)
+        if "gui" in args.suite:
+            bench_gui(results, dataset, args.repeat, args.xvfb)
+
+    if args.output:
+        results.write(args.output)
+        print(f"결과를 '{args.output}'에 저장했습니다.")
+    if args.compare:
+        rows, regressions = harness.compare_results(harness.load_results(args.compare), results.to_dict(), args.threshold)
+        harness.print_comparison(rows, regressions)
+        if regressions:
+            raise SystemExit(f"느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# benchmarks/bench_todo_memory.py
+
+# 할 일 레코드 표현 메모리/스냅샷 크기 벤치마크.
+# 여러 해 분량의 합성 할 일 데이터를 이전 형식({'id', 'text', 'completed'} 딕셔너리)과
+# TodoItem(__slots__ + 인터닝된 내용)으로 각각 만들어 메모리 사용량(tracemalloc)을 비교하고,
+# 이전 형식 스냅샷(딕셔너리 리스트 pickle)과 현재 열 형식 스냅샷의 크기와 불러오기 시간을 비교합니다.
+#
+# 실행: python benchmarks/bench_todo_memory.py [--years 5] [--todos-per-day 8] [--unique-ratio 0.2]
+
+import os
+import sys
+import argparse
+import datetime
+import gc
+import pickle
+import random
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import data_manager
+from todo_manager import TodoItem
+
+# 매일 반복되는 할 일 내용 예시.
+_ROUTINE_TEXTS = [f"{task} {minutes}분" for task in ("운동하기", "영어 공부", "독서", "산책", "명상", "코딩 연습", "일기 쓰기", "청소")
+                  for minutes in (10, 20, 30, 60)]
+
+def generate_rows(years, todos_per_day, unique_ratio, seed=0):
+    """
+    합성 할 일 행 (날짜, id, 내용, 완료 여부)을 만듭니다.
+    내용은 unique_ratio 비율만 그날 고유한 문장이고 나머지는 반복 할 일입니다.
+    """
+    rng = random.Random(seed)
+    start_date = datetime.date.today() - datetime.timedelta(days=365 * years)
+    rows = []
+    todo_id = 1
+    for day in range(365 * years):
+        date = start_date + datetime.timedelta(days=day)
+        for _ in range(rng.randint(todos_per_day // 2, todos_per_day * 3 // 2)):
+            if rng.random() < unique_ratio:
+                text = f"{date.isoformat()} 메모 {rng.randrange(10 ** 6)}"
+            else:
+                text = rng.choice(_ROUTINE_TEXTS)
+            rows.append((date, todo_id, text, rng.random() < 0.7))
+            todo_id += 1
+    return rows
+
+def build_legacy(rows):
+    daily_todos = {}
+    for date, todo_id, text, completed in rows:
+        daily_todos.setdefault(date, []).append({'id': todo_id, 'text': text, 'completed': completed})
+    return daily_todos
+
+def build_compact(rows):
+    daily_todos = {}
+    for date, todo_id, text, completed in rows:
+        daily_todos.setdefault(date, []).append(TodoItem(todo_id, text, completed))
+    return daily_todos
+
+def measure_memory(build, rows):
+    """
+    build로 만든 데이터가 차지하는 메모리(바이트, 내용 문자열 포함)와 결과를 반환합니다.
+    불러온 데이터처럼 내용 문자열을 측정 구간 안에서 새로 만들고, 입력 행은 버린 뒤 남은 메모리만 셉니다.
+    """
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    fresh_rows = [(date, todo_id, "".join(list(text)), completed) for date, todo_id, text, completed in rows]
+    result = build(fresh_rows)
+    del fresh_rows
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return used, result
+
+def measure_load(load, repeat=3):
+    """load()로 스냅샷 본문을 날짜별 할 일로 불러오는 데 걸린 최소 시간(초)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="할 일 레코드 표현 메모리/스냅샷 크기 벤치마크")
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--todos-per-day", type=int, default=8)
+    parser.add_argument("--unique-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    rows = generate_rows(args.years, args.todos_per_day, args.unique_ratio)
+    legacy_memory, legacy = measure_memory(build_legacy, rows)
+    compact_memory, compact = measure_memory(build_compact, rows)
+
+    legacy_payload = pickle.dumps({'daily_todos': legacy})
+    compact_payload = pickle.dumps({'daily_todo_columns': data_manager._pack_daily_todos(compact)})
+    legacy_load = measure_load(lambda: pickle.loads(legacy_payload))
+    compact_load = measure_load(
+        lambda: data_manager._unpack_daily_todos(pickle.loads(compact_payload)['daily_todo_columns']))
+
+    print(f"할 일 {len(rows):,}개 ({args.years}년, {len(legacy):,}일)")
+    print(f"메모리      딕셔너리 {legacy_memory / 2 ** 20:8.2f}MB | TodoItem {compact_memory / 2 ** 20:8.2f}MB "
+          f"({compact_memory / legacy_memory:.0%})")
+    print(f"스냅샷 크기 딕셔너리 {len(legacy_payload) / 2 ** 20:8.2f}MB | 열 형식   {len(compact_payload) / 2 ** 20:8.2f}MB "
+          f"({len(compact_payload) / len(legacy_payload):.0%})")
+    print(f"불러오기    딕셔너리 {legacy_load * 1000:8.1f}ms | 열 형식   {compact_load * 1000:8.1f}ms "
+          f"(TodoItem 변환 포함)")
+
+if __name__ == "__main__":
+    main()
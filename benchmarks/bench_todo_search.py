@@ -0,0 +1,115 @@
+# benchmarks/bench_todo_search.py
+
+# 할 일 검색 색인(todo_search.TodoSearchIndex) 벤치마크.
+# 여러 해 분량의 합성 할 일로 색인 생성 시간과 메모리(tracemalloc), 검색어별 검색 시간(p50/p99)을 재고,
+# 모든 할 일을 훑는 단순 검색과 결과가 같은지 확인합니다. 할 일 추가/수정/삭제 시 색인 갱신 시간도 잽니다.
+#
+# 실행: python benchmarks/bench_todo_search.py [--years 10] [--todos-per-day 80] [--repeat 50]
+
+import os
+import sys
+import argparse
+import gc
+import datetime
+import heapq
+import random
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+from todo_manager import TodoItem
+from todo_search import TodoSearchIndex, normalize
+
+# 할 일 내용을 만드는 단어들 (한국어/영어 섞음).
+_WORDS = ["운동하기", "영어", "공부", "독서", "산책", "명상", "코딩", "연습", "일기", "쓰기", "청소", "장보기",
+          "회의", "보고서", "작성", "병원", "예약", "친구", "만나기", "빨래", "설거지", "자료", "조사", "발표",
+          "준비", "study", "review", "email", "call", "mom"]
+
+# 자주 나오는 단어, 드문 조합, 한 글자, 띄어쓰기 안의 일부, 결과 없음 등.
+_QUERIES = ["운동", "영어 공부", "보고서 작성", "#12345", "친구", "산", "mom call", "설거", "자료 조사 발표",
+            "#9", "기", "zz", "병원 예약 mom"]
+
+def generate_daily_todos(years, todos_per_day, seed=0):
+    """합성 날짜별 할 일 데이터 {날짜: TodoItem 리스트}를 만듭니다."""
+    rng = random.Random(seed)
+    start_date = datetime.date.today() - datetime.timedelta(days=365 * years)
+    daily_todos = {}
+    todo_id = 0
+    for day in range(365 * years):
+        todos = []
+        for _ in range(rng.randint(todos_per_day // 2, todos_per_day * 3 // 2)):
+            todo_id += 1
+            text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 3)))
+            if rng.random() < 0.3:
+                text += f" #{rng.randrange(100000)}"
+            todos.append(TodoItem(todo_id, text))
+        daily_todos[start_date + datetime.timedelta(days=day)] = todos
+    return daily_todos
+
+def brute_force_search(daily_todos, query, limit):
+    """모든 할 일을 훑어 검색합니다. (비교 기준)"""
+    words = normalize(query).split()
+    hits = ((date, todo.id) for date, todos in daily_todos.items() for todo in todos
+            if all(word in normalize(todo.text) for word in words))
+    return heapq.nlargest(limit, hits)
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def main():
+    parser = argparse.ArgumentParser(description="할 일 검색 색인 벤치마크")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--todos-per-day", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    daily_todos = generate_daily_todos(args.years, args.todos_per_day)
+    todo_count = sum(len(todos) for todos in daily_todos.values())
+
+    start_time = time.perf_counter()
+    index = TodoSearchIndex()
+    index.build(daily_todos.items())
+    build_seconds = time.perf_counter() - start_time
+
+    tracemalloc.start() # 메모리는 따로 한 번 더 만들어 측정. (추적 중에는 생성이 느려짐)
+    index = TodoSearchIndex()
+    index.build(daily_todos.items())
+    index_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"할 일 {todo_count:,}개 ({args.years}년): 색인 생성 {build_seconds:.2f}초, 메모리 {index_memory / 2 ** 20:.1f}MB")
+
+    gc.collect() # 색인 생성 중 쌓인 객체의 가비지 수집이 검색 측정에 끼지 않도록.
+    index.search(_QUERIES[0], args.limit) # 첫 검색의 메모리 준비 시간 제외.
+    print(f"{'검색어':<16}{'결과':>6}{'p50(ms)':>10}{'p99(ms)':>10}{'단순 검색(ms)':>16}")
+    for query in _QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            start_time = time.perf_counter()
+            results = index.search(query, args.limit)
+            timings.append(time.perf_counter() - start_time)
+        timings.sort()
+        start_time = time.perf_counter()
+        expected = brute_force_search(daily_todos, query, args.limit)
+        brute_force_seconds = time.perf_counter() - start_time
+        if [(date, todo_id) for date, todo_id, _ in results] != expected:
+            raise SystemExit(f"검색 결과가 단순 검색과 다릅니다: {query!r}")
+        print(f"{query:<16}{len(results):>6}{percentile(timings, 0.5) * 1000:>10.3f}"
+              f"{percentile(timings, 0.99) * 1000:>10.3f}{brute_force_seconds * 1000:>16.1f}")
+
+    # 색인 갱신 (엔진이 변경 기록마다 호출하는 apply_change).
+    today = max(daily_todos)
+    next_id = todo_count + 1
+    updates = 10000
+    start_time = time.perf_counter()
+    for i in range(updates):
+        todo_id = next_id + i
+        index.apply_change(('todo_add', today, "새 할 일 보고서 작성", todo_id))
+        index.apply_change(('todo_update', today, todo_id, {'text': "수정한 할 일 영어 공부"}))
+        index.apply_change(('todo_delete', today, todo_id))
+    update_seconds = time.perf_counter() - start_time
+    print(f"색인 갱신 (추가+수정+삭제) {update_seconds / updates * 1e6:.1f}µs/할 일")
+
+if __name__ == "__main__":
+    main()
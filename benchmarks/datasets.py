@@ -0,0 +1,78 @@
+# benchmarks/datasets.py
+
+# 벤치마크용 합성 데이터 생성 모듈.
+# 같은 시드로 언제나 같은 데이터를 만들어, 커밋 사이의 측정 결과를 같은 입력으로 비교할 수 있게 합니다.
+
+import os
+import sys
+import datetime
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import config
+from pet_manager import Pet
+from todo_manager import TodoItem
+
+# 매일 반복되는 할 일 내용 예시.
+ROUTINE_TEXTS = [f"{task} {minutes}분" for task in ("운동하기", "영어 공부", "독서", "산책", "명상", "코딩 연습", "일기 쓰기", "청소")
+                 for minutes in (10, 20, 30, 60)]
+
+# 데이터 기준일. (오늘 날짜에 따라 생성 결과가 달라지지 않도록 고정)
+BASE_DATE = datetime.date(2025, 1, 1)
+
+def generate_daily_todos(years, todos_per_day=8, completed_ratio=0.7, unique_ratio=0.2, seed=0, end_date=BASE_DATE):
+    """
+    years년 분량의 날짜별 할 일 데이터를 만듭니다.
+    Args:
+        years (int): 기간 (년). end_date 전날까지 365 * years일.
+        todos_per_day (int): 하루 평균 할 일 수 (0.5배 ~ 1.5배 사이에서 무작위).
+        completed_ratio (float): 완료된 할 일 비율.
+        unique_ratio (float): 그날 고유한 내용의 비율 (나머지는 반복 할 일).
+    Returns:
+        dict: 날짜 -> TodoItem 리스트 (id는 1부터 날짜 순).
+    """
+    rng = random.Random(seed)
+    start_date = end_date - datetime.timedelta(days=365 * years)
+    daily_todos = {}
+    todo_id = 1
+    for day in range(365 * years):
+        date = start_date + datetime.timedelta(days=day)
+        todos = []
+        for _ in range(rng.randint(todos_per_day // 2, todos_per_day * 3 // 2)):
+            if rng.random() < unique_ratio:
+                text = f"{date.isoformat()} 메모 {rng.randrange(10 ** 6)}"
+            else:
+                text = rng.choice(ROUTINE_TEXTS)
+            todos.append(TodoItem(todo_id, text, rng.random() < completed_ratio))
+            todo_id += 1
+        if todos:
+            daily_todos[date] = todos
+    return daily_todos
+
+def generate_historical_pets(count, seed=0, end_date=BASE_DATE):
+    """
+    일주일 단위로 이어지는 과거 펫 기록 count개를 만듭니다. (오래된 기록부터)
+    Returns:
+        list: {'species', 'level', 'start_date', 'end_date'} 딕셔너리 리스트.
+    """
+    rng = random.Random(seed)
+    start_date = end_date - datetime.timedelta(weeks=count)
+    return [{'species': rng.choice(config.PET_SPECIES_LIST),
+             'level': rng.randint(config.INITIAL_PET_LEVEL, config.MAX_PET_LEVEL),
+             'start_date': start_date + datetime.timedelta(weeks=index),
+             'end_date': start_date + datetime.timedelta(weeks=index + 1)}
+            for index in range(count)]
+
+def generate_pet(level=config.INITIAL_PET_LEVEL, species=None):
+    """벤치마크용 펫을 만듭니다."""
+    return Pet(name="벤치", species=species or config.PET_SPECIES_LIST[0], level=level, last_reset_date=BASE_DATE)
+
+def generate_dataset(years, history, todos_per_day=8, seed=0):
+    """
+    저장/불러오기에 쓰는 전체 데이터 (save_data 인자 순서)를 만듭니다.
+    Returns:
+        tuple: (pet, daily_todos, snack_counts, historical_pets).
+    """
+    return (generate_pet(), generate_daily_todos(years, todos_per_day, seed=seed),
+            dict(config.INITIAL_SNACK_COUNTS), generate_historical_pets(history, seed=seed))
@@ -0,0 +1,204 @@
+# benchmarks/harness.py
+
+# 벤치마크 측정/결과 기록 도구 모듈.
+# - measure_time: 준비(setup)를 제외한 호출 시간을 여러 번 재어 최소/중앙값/평균/최대를 구합니다. (측정 중 GC 끔)
+# - measure_peak_memory: 호출 중 최대 메모리 사용량(tracemalloc).
+# - BenchmarkResults: 측정 결과와 실행 환경(커밋, 파이썬, 플랫폼, 매개변수)을 JSON 파일로 기록.
+# - compare_results: 이전 결과 파일과 중앙값을 비교해 느려진 항목을 찾습니다.
+# - quiet: 측정 중 모듈 로그 끄기.
+# - virtual_display: 화면이 없는 환경에서 Xvfb 가상 디스플레이를 띄워 Tk 벤치마크를 실행.
+
+import os
+import sys
+import contextlib
+import datetime
+import gc
+import json
+import logging
+import platform
+import shutil
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+RESULTS_FORMAT_VERSION = 1 # 결과 JSON 형식 버전.
+
+def measure_time(func, setup=None, repeat=5, number=1):
+    """
+    func의 호출 시간을 잽니다.
+    Args:
+        func (callable): 측정할 함수. setup이 있으면 setup의 반환값을 인자로 받습니다.
+        setup (callable, optional): 매 반복 전에 호출하는 준비 함수 (측정에서 제외). 예: 새 데이터 만들기.
+        repeat (int): 반복 횟수 (통계를 낼 표본 수).
+        number (int): 표본 하나에서 func를 연속 호출하는 횟수. 결과는 호출 1회당 시간입니다.
+    Returns:
+        dict: 'min', 'median', 'mean', 'max' (초/회), 'repeat', 'number'.
+    """
+    samples = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable() # GC 시점에 따라 결과가 흔들리지 않도록. (timeit과 같은 방식)
+        try:
+            start_time = time.perf_counter()
+            for _ in range(number):
+                func(argument) if setup is not None else func()
+            samples.append((time.perf_counter() - start_time) / number)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return {'min': min(samples), 'median': statistics.median(samples), 'mean': statistics.fmean(samples),
+            'max': max(samples), 'repeat': repeat, 'number': number}
+
+def measure_peak_memory(func, setup=None):
+    """
+    func를 한 번 호출하는 동안의 최대 추가 메모리 사용량(바이트)을 잽니다. (setup은 측정에서 제외)
+    추적 중에는 실행이 느려지므로 시간 측정과 따로 호출합니다.
+    """
+    argument = setup() if setup is not None else None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        func(argument) if setup is not None else func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+@contextlib.contextmanager
+def quiet():
+    """측정 중 모듈 로그를 끕니다. (로그 출력 속도가 결과에 섞이지 않도록)"""
+    logging.disable(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+def _git_revision(repo_dir):
+    """저장소의 현재 커밋과 수정 중인 파일이 있는지 여부. git이 없으면 (None, None)."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo_dir, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=repo_dir,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+class BenchmarkResults:
+    """
+    벤치마크 결과 모음 클래스.
+    항목 이름은 "묶음.이름" (예: "persistence.save_data")이며, 결과 파일에는 실행 환경 정보가 함께 기록됩니다.
+    """
+    def __init__(self, parameters=None):
+        repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        commit, dirty = _git_revision(repo_dir)
+        self.environment = {
+            'commit': commit, 'dirty': dirty,
+            'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'platform': platform.platform(), 'machine': platform.machine(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        }
+        self.parameters = dict(parameters or {}) # 데이터 크기 등 실행 매개변수.
+        self.benchmarks = {} # 항목 이름 -> 결과 딕셔너리.
+        self.skipped = {}    # 묶음 이름 -> 건너뛴 이유.
+
+    def add(self, suite, name, timing, memory_bytes=None, **extra):
+        """
+        측정 결과 하나를 기록하고 한 줄로 출력합니다.
+        Args:
+            timing (dict): measure_time 결과.
+            memory_bytes (int, optional): measure_peak_memory 결과.
+            extra: 항목별 추가 정보 (예: 처리한 할 일 수, 파일 크기).
+        """
+        key = f"{suite}.{name}"
+        self.benchmarks[key] = {'time': timing, 'memory_bytes': memory_bytes, **extra}
+        memory_text = f"  최대 메모리 {memory_bytes / 2 ** 20:8.2f}MB" if memory_bytes is not None else ""
+        print(f"{key:<44} 중앙값 {timing['median'] * 1000:10.3f}ms  최소 {timing['min'] * 1000:10.3f}ms{memory_text}",
+              file=sys.stderr)
+
+    def skip(self, suite, reason):
+        """실행할 수 없는 묶음을 이유와 함께 기록합니다."""
+        self.skipped[suite] = reason
+        print(f"{suite}: 건너뜀 ({reason})", file=sys.stderr)
+
+    def to_dict(self):
+        return {'format_version': RESULTS_FORMAT_VERSION, 'environment': self.environment,
+                'parameters': self.parameters, 'benchmarks': self.benchmarks, 'skipped': self.skipped}
+
+    def write(self, path):
+        """결과를 JSON 파일로 저장합니다."""
+        with open(path, "w", encoding="utf-8") as result_file:
+            json.dump(self.to_dict(), result_file, ensure_ascii=False, indent=2)
+
+def load_results(path):
+    """write로 저장한 결과 파일을 불러옵니다."""
+    with open(path, "r", encoding="utf-8") as result_file:
+        return json.load(result_file)
+
+def compare_results(baseline, current, threshold=0.1):
+    """
+    두 결과의 항목별 중앙값 시간을 비교합니다.
+    Args:
+        baseline (dict): 기준 결과 (load_results 또는 BenchmarkResults.to_dict).
+        current (dict): 새 결과.
+        threshold (float): 이 비율보다 더 느려지면 성능 저하로 판단 (0.1 = 10%).
+    Returns:
+        list: (항목 이름, 기준 중앙값, 새 중앙값, 비율) 튜플 리스트. 양쪽에 모두 있는 항목만, 이름 순.
+        list: 그중 성능 저하 항목 이름 리스트.
+    """
+    if baseline.get('parameters') != current.get('parameters'):
+        print("경고: 두 결과의 실행 매개변수(데이터 크기 등)가 다릅니다.", file=sys.stderr)
+    rows, regressions = [], []
+    for key in sorted(baseline['benchmarks'].keys() & current['benchmarks'].keys()):
+        old_median = baseline['benchmarks'][key]['time']['median']
+        new_median = current['benchmarks'][key]['time']['median']
+        ratio = new_median / old_median if old_median else float('inf')
+        rows.append((key, old_median, new_median, ratio))
+        if ratio > 1 + threshold:
+            regressions.append(key)
+    return rows, regressions
+
+def print_comparison(rows, regressions):
+    """compare_results 결과를 표로 출력합니다."""
+    print(f"{'항목':<44}{'기준(ms)':>12}{'현재(ms)':>12}{'비율':>8}")
+    for key, old_median, new_median, ratio in rows:
+        mark = "  <- 느려짐" if key in regressions else ""
+        print(f"{key:<44}{old_median * 1000:>12.3f}{new_median * 1000:>12.3f}{ratio:>8.2f}{mark}")
+
+@contextlib.contextmanager
+def virtual_display(enabled=True):
+    """
+    Tk를 띄울 디스플레이를 준비합니다.
+    DISPLAY가 이미 있으면 그대로 쓰고, 없고 enabled면 Xvfb를 빈 디스플레이 번호로 띄워 DISPLAY를 설정합니다.
+    Yields:
+        str or None: 사용할 DISPLAY 값. 디스플레이를 준비할 수 없으면 None.
+    """
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        yield os.environ.get("DISPLAY", "native")
+        return
+    xvfb_path = shutil.which("Xvfb") if enabled else None
+    if xvfb_path is None:
+        yield None
+        return
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen([xvfb_path, "-displayfd", str(write_fd), "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                               pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as display_pipe:
+        display_number = display_pipe.readline().strip() # Xvfb가 준비되면 디스플레이 번호를 씀.
+    if not display_number:
+        process.terminate()
+        process.wait()
+        yield None
+        return
+    os.environ["DISPLAY"] = f":{display_number}"
+    try:
+        yield os.environ["DISPLAY"]
+    finally:
+        del os.environ["DISPLAY"]
+        process.terminate()
+        process.wait()
@@ -0,0 +1,221 @@
+# command_pipeline.py
+
+# PetDoListEngine 앞에 놓이는 asyncio 명령 파이프라인 모듈.
+# 여러 곳(GUI, 스케줄러, 스크립트 소켓 등)에서 제출한 명령을 하나의 큐로 받아 순서대로 엔진에 즉시 적용하고,
+# 짧은 시간 창(COMMAND_COMMIT_WINDOW_MS) 동안 모인 명령들의 변경을 저장소에 한 번에 기록(그룹 커밋)합니다.
+# 명령의 결과는 해당 명령이 포함된 그룹이 디스크에 기록(저널 fsync)된 뒤에 전달됩니다.
+
+import asyncio     # 명령 큐와 실행 루프.
+import functools   # 엔진을 받는 함수 명령.
+import time        # 명령 지연 시간 측정.
+from collections import deque # 최근 지연 시간/배치 크기 기록.
+
+import pet_engine  # 엔진 이벤트 이름.
+from config import COMMAND_COMMIT_WINDOW_MS, COMMAND_QUEUE_DEPTH # 그룹 커밋 시간 창, 큐 깊이.
+
+# 파이프라인으로 실행할 수 있는 엔진 메서드.
+COMMANDS = frozenset({
+    'create_pet', 'add_todo', 'complete_todo', 'remove_todo', 'give_snack', 'change_date',
+    'add_todos', 'complete_todos', 'remove_todos', 'copy_todos', 'move_todos', 'edit_todo',
+    'rebirth', 'delete_history_record', 'check_and_reward_full_gauges', 'go_to_date', 'search_todos',
+})
+
+STATS_HISTORY_SIZE = 100000 # 통계용으로 보관할 최근 명령 지연 시간/배치 크기 개수.
+
+def percentile(values, fraction):
+    """
+    정렬된 값 리스트에서 백분위 값을 반환합니다. (최근접 순위 방식)
+    Args:
+        values (list): 오름차순으로 정렬된 값들.
+        fraction (float): 0.0 ~ 1.0 (예: 0.99).
+    Returns:
+        float: 백분위 값. 값이 없으면 0.0.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))]
+
+class CommandPipeline:
+    """
+    엔진 명령을 순서대로 실행하고 그룹 커밋하는 asyncio 파이프라인 클래스.
+    - submit: 명령을 큐에 넣고 (큐가 가득 차면 기다림) 결과 Future를 반환.
+    - execute: 명령을 제출하고 기록이 끝날 때까지 기다려 결과를 반환.
+    - submit_threadsafe: 다른 스레드(Tk, HTTP 요청 스레드 등)에서 명령을 제출.
+    명령은 엔진 메서드 이름 또는 엔진을 첫 인자로 받는 함수이며, 함수 명령은 여러 메서드 호출과 상태 조회를
+    다른 명령과 섞이지 않게 한 번에 실행할 때 씁니다. (pet_service의 요청 처리)
+    한 번에 하나의 기록만 진행되며, 기록하는 동안 다음 그룹의 명령은 계속 메모리에 적용됩니다.
+    """
+    def __init__(self, engine, storage, commit_window_ms=COMMAND_COMMIT_WINDOW_MS,
+                 max_queue_depth=COMMAND_QUEUE_DEPTH):
+        self.engine = engine                       # 명령을 적용할 PetDoListEngine.
+        self.storage = storage                     # load/append/save 인터페이스를 가진 저장소.
+        self.commit_window = commit_window_ms / 1000.0 # 그룹 커밋 시간 창 (초).
+        self.max_queue_depth = max_queue_depth
+
+        self._queue = None   # asyncio.Queue (start 시 실행 중인 루프에서 생성).
+        self._loop = None
+        self._runner = None  # 명령 실행 태스크.
+        self._pending_changes = []       # 현재 그룹에서 엔진이 낸 변경들.
+        self._full_save_requested = False # 현재 그룹에서 전체 저장 요청 여부.
+
+        # 통계.
+        self.commands_committed = 0
+        self.commits = 0
+        self.batch_sizes = deque(maxlen=STATS_HISTORY_SIZE)
+        self.latencies = deque(maxlen=STATS_HISTORY_SIZE) # 제출부터 기록 완료까지 (초).
+        self.write_seconds = 0.0 # 저장소 기록(fsync 포함)에 걸린 시간 합계 (초).
+
+        engine.subscribe(pet_engine.EVENT_PERSIST, self._on_persist)
+        engine.subscribe(pet_engine.EVENT_FULL_SAVE, self._on_full_save)
+
+    def _on_persist(self, changes):
+        self._pending_changes.extend(changes)
+
+    def _on_full_save(self):
+        self._full_save_requested = True
+
+    # --- 시작/종료 ---
+    async def start(self):
+        """실행 중인 이벤트 루프에서 명령 실행 태스크를 시작합니다."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_depth)
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """대기 중인 명령을 모두 실행/기록한 뒤 실행 태스크를 종료합니다."""
+        await self._queue.put(None) # 종료 표시.
+        await self._runner
+        self._runner = None
+        if self._full_save_requested: # 마지막 그룹의 저널 기록이 실패했거나 압축이 필요하면 스냅샷으로 기록.
+            self._full_save_requested = False
+            await asyncio.to_thread(self.storage.save, *self.engine.capture_snapshot())
+
+    # --- 제출 ---
+    async def submit(self, command, *args):
+        """
+        명령을 큐에 넣습니다. 큐가 가득 차 있으면 자리가 날 때까지 기다립니다 (배압).
+        Args:
+            command (str or callable): COMMANDS에 있는 엔진 메서드 이름, 또는 command(engine, *args) 함수.
+            *args: 메서드 인자.
+        Returns:
+            asyncio.Future: 명령이 기록된 뒤 메서드의 반환값(또는 예외)으로 완료되는 Future.
+        Raises:
+            ValueError: 알 수 없는 명령일 경우.
+        """
+        if callable(command):
+            function = functools.partial(command, self.engine)
+        elif command in COMMANDS:
+            function = getattr(self.engine, command)
+        else:
+            raise ValueError(f"알 수 없는 명령입니다: {command}")
+        future = self._loop.create_future()
+        await self._queue.put((function, args, future, time.perf_counter()))
+        return future
+
+    async def execute(self, command, *args):
+        """명령을 제출하고 기록될 때까지 기다려 결과를 반환합니다."""
+        return await (await self.submit(command, *args))
+
+    def submit_threadsafe(self, command, *args):
+        """
+        다른 스레드에서 명령을 제출합니다.
+        Returns:
+            concurrent.futures.Future: 명령 결과 (기록 완료 후).
+        """
+        return asyncio.run_coroutine_threadsafe(self.execute(command, *args), self._loop)
+
+    # --- 실행 ---
+    async def _run(self):
+        """큐에서 명령을 꺼내 즉시 적용하고, 시간 창마다 모인 그룹을 기록합니다."""
+        commit_task = None
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [self._apply(item)]
+            deadline = self._loop.time() + self.commit_window
+            while True:
+                while not self._queue.empty(): # 이미 도착한 명령은 기다리지 않고 적용.
+                    item = self._queue.get_nowait()
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(self._apply(item))
+                remaining = deadline - self._loop.time()
+                if stopping or remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(self._apply(item))
+
+            # 그룹의 변경과 (필요 시) 스냅샷 복사본을 루프 스레드에서 만든 뒤, 이전 기록이 끝나면 기록 시작.
+            changes, self._pending_changes = self._pending_changes, []
+            snapshot = None
+            if self._full_save_requested or self.storage.needs_compaction(additional_records=1 if changes else 0):
+                snapshot = self.engine.capture_snapshot()
+            self._full_save_requested = False
+            if commit_task is not None:
+                await commit_task
+            commit_task = asyncio.create_task(self._commit(batch, changes, snapshot))
+        if commit_task is not None:
+            await commit_task
+
+    def _apply(self, item):
+        """명령 하나를 엔진에 적용하고 (future, 제출 시각, 결과, 예외)를 반환합니다."""
+        function, args, future, submitted_at = item
+        try:
+            return future, submitted_at, function(*args), None
+        except Exception as e:
+            return future, submitted_at, None, e
+
+    async def _commit(self, batch, changes, snapshot):
+        """그룹의 변경을 한 번에 기록하고, 기록이 디스크에 반영된 뒤 그룹에 속한 명령들의 결과를 전달합니다."""
+        if changes or snapshot is not None:
+            write_started = time.perf_counter()
+            await asyncio.to_thread(self._write, changes, snapshot) # 저널 append는 fsync까지 마친 뒤 반환.
+            self.write_seconds += time.perf_counter() - write_started
+        now = time.perf_counter()
+        for future, submitted_at, result, error in batch:
+            self.latencies.append(now - submitted_at)
+            if future.cancelled():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        self.commits += 1
+        self.commands_committed += len(batch)
+        self.batch_sizes.append(len(batch))
+
+    def _write(self, changes, snapshot):
+        """저장소에 기록합니다. (백그라운드 스레드에서 호출)"""
+        if changes and self.storage.append(changes) and snapshot is None:
+            self._full_save_requested = True # 저널 기록 실패 또는 압축 필요 시 다음 그룹에서 스냅샷 기록.
+        if snapshot is not None:
+            self.storage.save(*snapshot)
+
+    def get_stats(self):
+        """
+        그룹 커밋 통계를 반환합니다.
+        Returns:
+            dict: 기록된 명령 수, 기록 횟수, 배치 크기(평균/최대), 기록 한 번의 평균 시간(초), 명령 지연 시간 백분위(초).
+        """
+        batch_sizes = list(self.batch_sizes)
+        latencies = sorted(self.latencies)
+        return {
+            'commands': self.commands_committed,
+            'commits': self.commits,
+            'average_batch_size': sum(batch_sizes) / len(batch_sizes) if batch_sizes else 0.0,
+            'max_batch_size': max(batch_sizes, default=0),
+            'average_write_seconds': self.write_seconds / self.commits if self.commits else 0.0,
+            'latency_p50_seconds': percentile(latencies, 0.50),
+            'latency_p95_seconds': percentile(latencies, 0.95),
+            'latency_p99_seconds': percentile(latencies, 0.99),
+            'latency_max_seconds': latencies[-1] if latencies else 0.0,
+        }
@@ -4,8 +4,26 @@ import datetime
 # --- [1] 애플리케이션 기본 설정 ---
 APP_TITLE = "Pet-Do-List: 환생 펫 투두리스트"  # 애플리케이션 창의 제목. (main.py)
 DATA_FILE_NAME = "pet_do_list_data.pkl"     # 데이터 저장 파일명. (data_manager.py)
+JOURNAL_FILE_NAME = "pet_do_list_data.journal" # 변경 기록(저널) 파일명. (data_manager.py)
+JOURNAL_COMPACT_THRESHOLD = 200             # 저널 레코드가 이 개수 이상 쌓이면 스냅샷으로 압축. (data_manager.py)
+SNAPSHOT_GENERATIONS = 3                    # 손상 대비로 보관할 이전 스냅샷 세대 수 (.1 ~ .N). (data_manager.py)
+STORAGE_BACKEND = "journal"                 # 저장소 종류: "journal"(이진 스냅샷 + pickle 저널) 또는 "sqlite". (data_manager.py)
+SQLITE_DB_FILE_NAME = "pet_do_list_data.db" # SQLite 저장소 데이터베이스 파일명. (sqlite_storage.py)
+SAVE_INTERVAL_MS = 1000                     # 저장 요청을 모아 한 번에 기록하는 간격 (밀리초). (save_scheduler.py)
+COMMAND_COMMIT_WINDOW_MS = 5                # 명령들을 모아 한 번의 기록(그룹 커밋)으로 묶는 시간 창 (밀리초). (command_pipeline.py)
+COMMAND_QUEUE_DEPTH = 10000                 # 대기 가능한 최대 명령 수 (가득 차면 제출하는 쪽이 기다림). (command_pipeline.py)
+EXCHANGE_BATCH_SIZE = 1000                  # 내보내기/가져오기 시 한 번에 읽거나 저장소에 기록할 레코드 수. (data_exchange.py, pet_engine.py, sqlite_storage.py)
 INITIAL_PET_NAME = "새 친구"                 # 펫 이름 미입력 시 기본값. (main.py, pet_manager.py)
 
+# 다중 사용자 서비스 설정. (pet_service.py)
+SERVICE_DATA_DIR = "users/"                 # 사용자별 데이터 파일을 저장할 폴더.
+SERVICE_SHARD_COUNT = 16                    # 사용자 데이터를 나눠 담을 하위 폴더(샤드) 개수.
+SERVICE_HOT_USER_LIMIT = 128                # 메모리에 유지할 최대 사용자 수 (초과 시 가장 오래 사용하지 않은 사용자부터 내림).
+SERVICE_HOST = "127.0.0.1"                  # HTTP API 주소 (로컬 전용).
+SERVICE_PORT = 8765                         # HTTP API 포트.
+SERVICE_MAX_DELTA_DAYS = 36500              # 한 번에 이동할 수 있는 최대 날짜 수.
+SERVICE_SEARCH_RETRY_AFTER_SECONDS = 1      # 검색 색인을 만드는 중일 때 다시 요청하라고 알리는 시간 (초, Retry-After).
+
 
 # --- [2] 펫 성장 관련 설정 ---
 PET_SPECIES_LIST = ["사람", "나무"]            # 선택 가능한 펫 종류 목록. (main.py, pet_manager.py, gui.py)
@@ -31,6 +49,12 @@ MAX_PET_HAPPINESS = 100                       # 펫의 최대 행복도. (pet_ma
 MAX_PET_FULLNESS = 100                        # 펫의 최대 포만감. (pet_manager.py)
 
 
+TODO_DAY_CACHE_SIZE = 31                      # 저장소에서 불러온 날짜별 할 일 목록을 메모리에 유지할 최대 일수. (todo_manager.py)
+SEARCH_RESULT_LIMIT = 50                      # 할 일 검색 결과 최대 개수. (todo_search.py)
+SEARCH_INDEX_POLL_MS = 200                    # 검색 색인을 만드는 동안 검색 창이 다시 확인하는 간격 (밀리초). (gui.py)
+STATS_RECENT_WEEKS = 8                        # 통계의 주별 추이(완료율, 경험치)에 표시할 최근 주 수. (analytics.py, gui.py)
+
+
 # --- [3] 간식 및 효과 설정 ---
 SNACK_PER_TODO_COMPLETE = 1                   # 할 일 완료 시 지급되는 간식 개수. (todo_manager.py)
 # 시작 시 주어지는 간식 개수. (todo_manager.py)
@@ -49,6 +73,7 @@ SNACK_EFFECTS = {
 WEEKLY_RESET_DAY = 2    # 펫이 환생할 요일 (월:0, 화:1, 수:2, ... 일:6). (main.py)
 RESET_TIME_HOUR = 3     # 환생 처리 시간 (새벽 3시). (main.py)
 PET_RESET_INTERVAL_DAYS = 7 # 펫 환생 주기 (7일). (main.py)
+REBIRTH_TIMER_MAX_DELAY_MS = 60 * 60 * 1000 # 환생 타이머의 최대 대기 시간 (절전/시계 변경 대비 재확인 간격, 밀리초). (rebirth_scheduler.py)
 
 
 # --- [5] 환경 변수 또는 경로 설정 (미사용) ---
@@ -77,6 +102,13 @@ RESOURCES_PATH = "resources/"          # 모든 리소스 파일의 기본 폴
 PET_IMAGES_SUBFOLDER = "pet_images/"   # 펫 이미지 하위 폴더.
 ITEM_IMAGES_SUBFOLDER = "item_images/" # 아이템/간식 이미지 하위 폴더.
 ETC_SUBFOLDER = "etc/"                 # 기타 이미지 하위 폴더.
+
+# 펫 이미지 캐시 설정. (gui.py, image_cache.py)
+IMAGE_CACHE_MAX_ENTRIES = 64                 # 캐시에 보관할 최대 이미지 개수.
+IMAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024     # 캐시에 보관할 디코딩된 이미지의 최대 총 크기 (바이트).
+IMAGE_PREWARM_LEVEL_RANGE = 1                # 현재 레벨 기준 ±몇 레벨의 이미지를 미리 디코딩할지.
+SPRITE_CACHE_SUBFOLDER = "sprite_cache/"     # 미리 리사이즈된 펫 이미지 폴더. (sprite_cache.py)
+SPRITE_SIZES = [(300, 300), (60, 60)]        # 미리 만들어 둘 크기 (메인 화면, 기록 썸네일). (sprite_cache.py)
 SOUNDS_SUBFOLDER = "sounds"            # 사운드 파일 하위 폴더. (main.py)
 
 # 효과음 파일 이름 정의. (main.py)
@@ -95,5 +127,20 @@ SFX_VOLUME_SNACK_GIVE = 0.1
 SFX_VOLUME_PET_LEVEL_UP = 0.1
 SFX_VOLUME_PET_REBIRTH = 0.1
 
+# 오디오 초기화 설정. (main.py)
+FAST_STARTUP = True          # True면 저장된 상태로 화면을 먼저 그리고 오디오는 백그라운드에서 초기화.
+AUDIO_READY_POLL_MS = 50     # 오디오 초기화 완료 확인 간격 (밀리초).
+PENDING_SOUND_LIMIT = 3      # 오디오 준비 전에 대기시킬 효과음 최대 개수 (초과분은 버림).
+
 # --- [8] 개발/디버깅 설정 ---
-DEBUG_MODE = True # 디버그 모드 활성화 여부. (print문 출력 등)
\ No newline at end of file
+DEBUG_MODE = True # 디버그 모드 활성화 여부. (DEBUG 레벨 로그 출력)
+LOG_LEVEL = "DEBUG" if DEBUG_MODE else "INFO" # 출력할 최소 로그 레벨. (instrumentation.py)
+LOG_FORMAT = "text"                         # 로그 출력 형식: "text" 또는 "json"(레코드마다 JSON 한 줄). (instrumentation.py)
+TRACE_ENABLED = False                       # 구간 시간 측정(트레이스) 기록 여부. (instrumentation.py)
+TRACE_FILE_NAME = "pet_do_list_trace.json"  # 앱 종료 시 트레이스를 저장할 파일 (Chrome 트레이스 형식). (main.py)
+TRACE_MAX_EVENTS = 100000                   # 메모리에 보관할 최근 트레이스 이벤트 수. (instrumentation.py)
+LOG_ASYNC = True                            # 로그를 큐에 넣고 백그라운드 스레드에서 출력 (출력이 느려도 호출한 스레드가 기다리지 않음). (instrumentation.py)
+LOG_RATE_LIMIT_SECONDS = 10.0               # 같은 DEBUG/INFO 메시지 반복 제한 구간 (초). 0이면 제한하지 않음. (instrumentation.py)
+LOG_RATE_LIMIT_BURST = 5                    # 구간마다 같은 메시지를 출력할 최대 횟수 (초과분은 생략 개수만 다음 출력에 표시). (instrumentation.py)
+LOG_MODULE_LEVELS = {}                      # 모듈별 로그 레벨. 예: {"gui": "INFO", "todo_manager": "WARNING"}. (instrumentation.py)
+LOG_DISABLED_MODULES = ()                   # 로그를 완전히 끌 모듈 이름들. 예: ("todo_manager",). (instrumentation.py)
\ No newline at end of file
@@ -0,0 +1,271 @@
+# data_exchange.py
+
+# 전체 데이터(펫, 간식, 과거 펫 기록, 날짜별 할 일)를 JSON Lines / CSV 파일로 내보내고 가져오는 모듈.
+# pickle 스냅샷과 달리 신뢰할 수 없는 파일을 읽어도 안전하며, 레코드를 제너레이터로 하나씩 처리하므로
+# 할 일이 수백만 개여도 메모리 사용량이 일정합니다. 가져오기는 기존 데이터에 합칩니다 (PetDoListEngine.import_records).
+#
+# 레코드 (한 줄/한 행에 하나, 'type'으로 구분. 날짜는 YYYY-MM-DD 문자열):
+#   {'type': 'meta', 'format': 'pet-do-list', 'version': 1}   (JSON Lines 첫 줄)
+#   {'type': 'pet', 'name', 'species', 'level', 'exp', 'happiness', 'fullness', 'last_reset_date', 'rewarded_for_full_gauges'}
+#   {'type': 'snack', 'name', 'count'}
+#   {'type': 'history', 'species', 'level', 'start_date', 'end_date'}
+#   {'type': 'todo', 'date', 'id', 'text', 'completed'}
+#
+# 실행: python data_exchange.py export <파일.jsonl|파일.csv>
+#       python data_exchange.py import <파일.jsonl|파일.csv>
+
+import os          # 파일 확장자 확인.
+import csv         # CSV 읽기/쓰기.
+import json        # JSON Lines 읽기/쓰기.
+import datetime    # 날짜 문자열 변환.
+import argparse    # 명령줄 인자.
+
+import data_manager # 설정된 저장소.
+import pet_engine   # 가져오기 (기존 데이터에 합치기).
+from instrumentation import configure_logging # 명령줄 실행 시 로그 설정.
+
+EXCHANGE_FORMAT = "pet-do-list"
+EXCHANGE_FORMAT_VERSION = 1
+
+# CSV 열 (레코드 종류마다 필요한 열만 채우고 나머지는 비움).
+CSV_FIELDS = ('type', 'date', 'id', 'text', 'completed', 'name', 'species', 'level', 'exp', 'happiness', 'fullness',
+              'last_reset_date', 'rewarded_for_full_gauges', 'count', 'start_date', 'end_date')
+_CSV_FIELD_POSITIONS = {field: position for position, field in enumerate(CSV_FIELDS)}
+
+# 레코드 종류별 필드와 값 변환 함수 (파일의 문자열/JSON 값 -> 파이썬 값).
+_DATE = datetime.date.fromisoformat
+_RECORD_FIELDS = {
+    'pet': {'name': str, 'species': str, 'level': int, 'exp': int, 'happiness': int, 'fullness': int,
+            'last_reset_date': _DATE, 'rewarded_for_full_gauges': None},
+    'snack': {'name': str, 'count': int},
+    'history': {'species': str, 'level': int, 'start_date': _DATE, 'end_date': _DATE},
+    'todo': {'date': _DATE, 'id': int, 'text': str, 'completed': None},
+}
+
+def _parse_bool(value):
+    """JSON의 true/false 또는 CSV의 1/0, true/false 문자열을 bool로 변환합니다."""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes')
+    return bool(value)
+
+# --- 레코드 만들기 ---
+def iter_records(pet, todo_rows, snack_counts, historical_pets):
+    """
+    데이터를 내보낼 레코드들을 순서대로 만듭니다. (메타, 펫, 간식, 과거 펫 기록, 할 일)
+    Args:
+        pet (Pet or None): 펫 객체.
+        todo_rows (iterable): (날짜, TodoItem) 쌍들. 날짜 순이면 가져올 때 날짜별로 한 번에 합쳐집니다.
+        snack_counts (dict): 간식 이름 -> 개수.
+        historical_pets (list): 과거 펫 기록 딕셔너리들.
+    Yields:
+        dict: 레코드 (날짜는 datetime.date).
+    """
+    yield {'type': 'meta', 'format': EXCHANGE_FORMAT, 'version': EXCHANGE_FORMAT_VERSION}
+    if pet is not None:
+        yield {'type': 'pet', 'name': pet.name, 'species': pet.species, 'level': pet.level, 'exp': pet.exp,
+               'happiness': pet.happiness, 'fullness': pet.fullness, 'last_reset_date': pet.last_reset_date,
+               'rewarded_for_full_gauges': pet.has_been_rewarded_for_full_gauges}
+    for name, count in snack_counts.items():
+        yield {'type': 'snack', 'name': name, 'count': count}
+    for record in historical_pets:
+        yield {'type': 'history', 'species': record['species'], 'level': record['level'],
+               'start_date': record['start_date'], 'end_date': record['end_date']}
+    for date, todo in todo_rows:
+        yield {'type': 'todo', 'date': date, 'id': todo.id, 'text': todo.text, 'completed': todo.completed}
+
+def iter_storage_records(storage):
+    """
+    저장소의 전체 데이터를 레코드로 내보냅니다.
+    할 일을 나눠 읽을 수 있는 저장소(SQLiteStorage.iter_todos)는 할 일 전체를 메모리에 올리지 않습니다.
+    """
+    pet, daily_todos, snack_counts, historical_pets = storage.load()
+    if hasattr(storage, 'iter_todos'):
+        todo_rows = storage.iter_todos()
+    else:
+        todo_rows = ((date, todo) for date in sorted(daily_todos) for todo in daily_todos[date])
+    return iter_records(pet, todo_rows, snack_counts, historical_pets)
+
+def decode_record(raw):
+    """
+    파일에서 읽은 레코드(값이 문자열이거나 JSON 값)를 파이썬 값으로 변환합니다.
+    Returns:
+        dict: 변환된 레코드. 알 수 없는 종류는 'type'만 남깁니다.
+    Raises:
+        ValueError: 필드가 없거나 값을 변환할 수 없는 경우.
+    """
+    kind = raw.get('type')
+    fields = _RECORD_FIELDS.get(kind)
+    if fields is None:
+        return {'type': kind}
+    record = {'type': kind}
+    for field, convert in fields.items():
+        value = raw.get(field)
+        if field == 'id' and value in (None, ''): # 할 일 id는 없어도 됨 (가져올 때 새로 부여).
+            record[field] = None
+            continue
+        if value is None or (value == '' and convert is not str):
+            raise ValueError(f"'{kind}' 레코드에 '{field}' 값이 없습니다: {raw}")
+        record[field] = _parse_bool(value) if convert is None else convert(value)
+    return record
+
+def _encode_value(value):
+    """레코드 값을 파일에 쓸 수 있는 값으로 변환합니다. (날짜 -> 문자열)"""
+    return value.isoformat() if isinstance(value, datetime.date) else value
+
+# --- JSON Lines ---
+def write_jsonl(records, file):
+    """
+    레코드들을 JSON Lines 형식으로 씁니다.
+    Args:
+        records (iterable): 레코드 딕셔너리들.
+        file: 텍스트 모드로 열린 파일.
+    Returns:
+        int: 쓴 레코드 수.
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_encode_value)
+    count = 0
+    for record in records:
+        file.write(encoder.encode(record))
+        file.write('\n')
+        count += 1
+    return count
+
+def read_jsonl(file):
+    """
+    JSON Lines 파일에서 레코드를 하나씩 읽습니다.
+    Yields:
+        dict: decode_record로 변환된 레코드.
+    Raises:
+        ValueError: 올바른 JSON이 아니거나 다른 형식의 파일인 경우.
+    """
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except ValueError:
+            raise ValueError(f"{line_number}번째 줄이 올바른 JSON이 아닙니다.")
+        if not isinstance(raw, dict):
+            raise ValueError(f"{line_number}번째 줄이 JSON 객체가 아닙니다.")
+        if raw.get('type') == 'meta' and raw.get('format') != EXCHANGE_FORMAT:
+            raise ValueError(f"Pet-Do-List 내보내기 파일이 아닙니다: {raw.get('format')}")
+        yield decode_record(raw)
+
+# --- CSV ---
+def write_csv(records, file):
+    """
+    레코드들을 CSV 형식으로 씁니다. (첫 행은 CSV_FIELDS 머리글, 메타 레코드는 쓰지 않음)
+    Args:
+        records (iterable): 레코드 딕셔너리들.
+        file: newline=''로 열린 텍스트 모드 파일.
+    Returns:
+        int: 쓴 레코드 수 (머리글 제외).
+    """
+    writer = csv.writer(file)
+    writer.writerow(CSV_FIELDS)
+    count = 0
+    for record in records:
+        if record['type'] == 'meta':
+            continue
+        row = [''] * len(CSV_FIELDS)
+        for field, value in record.items():
+            if isinstance(value, bool):
+                value = int(value)
+            row[_CSV_FIELD_POSITIONS[field]] = _encode_value(value)
+        writer.writerow(row)
+        count += 1
+    return count
+
+def read_csv(file):
+    """
+    CSV 파일에서 레코드를 하나씩 읽습니다.
+    Yields:
+        dict: decode_record로 변환된 레코드.
+    Raises:
+        ValueError: 머리글에 'type' 열이 없는 경우.
+    """
+    reader = csv.DictReader(file)
+    if reader.fieldnames is None or 'type' not in reader.fieldnames:
+        raise ValueError("CSV 머리글에 'type' 열이 없습니다.")
+    for raw in reader:
+        yield decode_record(raw)
+
+# --- 파일 ---
+def _file_format(path, file_format=None):
+    """파일 형식('jsonl' 또는 'csv')을 정합니다. 지정하지 않으면 확장자로 판단합니다."""
+    if file_format is None:
+        file_format = 'csv' if os.path.splitext(path)[1].lower() == '.csv' else 'jsonl'
+    if file_format not in ('jsonl', 'csv'):
+        raise ValueError(f"알 수 없는 파일 형식입니다: {file_format}")
+    return file_format
+
+def export_file(records, path, file_format=None):
+    """
+    레코드들을 파일로 내보냅니다.
+    Args:
+        records (iterable): 레코드 딕셔너리들 (예: iter_storage_records(storage)).
+        path (str): 파일 경로.
+        file_format (str, optional): 'jsonl' 또는 'csv'. 없으면 확장자로 판단.
+    Returns:
+        int: 쓴 레코드 수.
+    """
+    if _file_format(path, file_format) == 'csv':
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            return write_csv(records, f)
+    with open(path, 'w', encoding='utf-8') as f:
+        return write_jsonl(records, f)
+
+def read_file(path, file_format=None):
+    """
+    파일에서 레코드를 하나씩 읽습니다. (제너레이터, 다 읽으면 파일을 닫음)
+    Args:
+        path (str): 파일 경로.
+        file_format (str, optional): 'jsonl' 또는 'csv'. 없으면 확장자로 판단.
+    Yields:
+        dict: 변환된 레코드.
+    """
+    if _file_format(path, file_format) == 'csv':
+        with open(path, encoding='utf-8', newline='') as f:
+            yield from read_csv(f)
+    else:
+        with open(path, encoding='utf-8') as f:
+            yield from read_jsonl(f)
+
+def import_file(storage, path, file_format=None):
+    """
+    파일의 데이터를 저장소의 기존 데이터에 합칩니다. (앱이 실행 중이지 않을 때 사용)
+    Args:
+        storage: load/append/save 인터페이스를 가진 저장소.
+        path (str): 가져올 파일 경로.
+    Returns:
+        dict: PetDoListEngine.import_records의 결과 개수.
+    """
+    engine = pet_engine.PetDoListEngine(day_loader=getattr(storage, 'load_day', None))
+    # 가져오는 동안에는 변경을 저널에만 이어 쓰고, 스냅샷은 엔진이 전체 저장을 요청할 때(새 펫 생성, 가져오기 완료) 기록.
+    engine.subscribe(pet_engine.EVENT_PERSIST, storage.append)
+    engine.subscribe(pet_engine.EVENT_FULL_SAVE, lambda: storage.save(*engine.capture_snapshot()))
+    loaded_data = storage.load()
+    day_summaries = storage.load_day_summaries() if hasattr(storage, 'load_day_summaries') else None
+    engine.load_state(*loaded_data, next_todo_id=storage.next_todo_id(), day_summaries=day_summaries)
+    return engine.import_records(read_file(path, file_format))
+
+def main():
+    parser = argparse.ArgumentParser(description="Pet-Do-List 데이터 내보내기/가져오기 (JSON Lines, CSV)")
+    parser.add_argument("command", choices=("export", "import"))
+    parser.add_argument("path", help="파일 경로 (.jsonl 또는 .csv)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default=None, help="파일 형식 (기본: 확장자로 판단)")
+    args = parser.parse_args()
+    configure_logging()
+
+    storage = data_manager.create_storage()
+    if args.command == "export":
+        count = export_file(iter_storage_records(storage), args.path, args.format)
+        print(f"레코드 {count}개를 '{args.path}'(으)로 내보냈습니다.")
+    else:
+        stats = import_file(storage, args.path, args.format)
+        print(f"'{args.path}'에서 가져왔습니다: {stats}")
+    if hasattr(storage, 'close'):
+        storage.close()
+
+if __name__ == "__main__":
+    main()
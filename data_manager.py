@@ -1,13 +1,107 @@
 # data_manager.py
 
 # 애플리케이션 데이터를 파일에 저장하고 불러오는 모듈.
-import pickle     # 객체 직렬화/역직렬화.
+import pickle     # 저널 레코드 직렬화 (기본 자료형만), 이전 형식(버전 2 이하) 스냅샷 읽기.
 import os         # 파일 시스템 접근 (경로, 존재 여부 확인).
 import datetime   # datetime 객체 처리 (이전 데이터 호환성).
+import struct     # 스냅샷 헤더 패킹.
+import zlib       # 스냅샷 체크섬(CRC32) 계산.
+import bisect     # 저널 재생 시 날짜 안에서 할 일 id 위치 찾기.
+from array import array # 스냅샷의 날짜별 할 일 id 열.
 
-from config import DATA_FILE_NAME # 데이터 파일명 임포트.
+from config import DATA_FILE_NAME, JOURNAL_FILE_NAME, JOURNAL_COMPACT_THRESHOLD # 데이터/저널 파일명, 압축 기준 임포트.
+from config import SNAPSHOT_GENERATIONS, STORAGE_BACKEND # 보관할 이전 스냅샷 개수, 저장소 종류.
+from todo_manager import TodoItem # 할 일 레코드.
+import snapshot_format # 스냅샷 본문 이진 형식 (버전 3).
+from instrumentation import get_logger, traced # 진단 로그, 저장/불러오기 시간 측정.
 
-def save_data(pet_data, daily_todos, snack_counts, historical_pets):
+log = get_logger("data_manager")
+
+# 스냅샷 파일 헤더: 매직, 형식 버전, 반영된 저널 번호, 본문 길이, 본문 CRC32.
+# 형식 버전별 본문:
+#   0  헤더 없는 pickle 딕셔너리 (할 일은 딕셔너리 리스트, 오래된 파일은 'todo_list' 필드).
+#   1  pickle 딕셔너리 (할 일은 딕셔너리 리스트).
+#   2  pickle 딕셔너리 (할 일은 'daily_todo_columns' 날짜별 열 형식).
+#   3  snapshot_format의 이진 형식. (현재 저장 형식)
+# 불러올 때는 파일 버전의 본문을 읽은 뒤 _MIGRATIONS로 한 버전씩 현재 형식까지 변환합니다.
+SNAPSHOT_MAGIC = b'PDLS'
+SNAPSHOT_FORMAT_VERSION = snapshot_format.FORMAT_VERSION
+_SNAPSHOT_HEADER = struct.Struct('<4sBQQI')
+
+def _generation_file_names(file_name, generations=SNAPSHOT_GENERATIONS):
+    """최신 스냅샷부터 가장 오래된 세대까지의 파일명 리스트를 반환합니다. (예: data.pkl, data.pkl.1, ...)"""
+    return [file_name] + [f"{file_name}.{i}" for i in range(1, generations + 1)]
+
+def _fsync_directory(file_name):
+    """파일 이름 변경이 디스크에 반영되도록 상위 디렉터리를 fsync합니다. (지원하는 OS에서만)"""
+    if not hasattr(os, 'O_DIRECTORY'): # Windows 등은 디렉터리 fsync 미지원.
+        return
+    dir_fd = os.open(os.path.dirname(os.path.abspath(file_name)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+def _write_snapshot_file(file_name, payload, journal_seq, generations=SNAPSHOT_GENERATIONS,
+                         version=SNAPSHOT_FORMAT_VERSION):
+    """
+    스냅샷 본문을 임시 파일에 쓰고 fsync한 뒤, 기존 세대들을 한 칸씩 밀어내고 원자적으로 교체합니다.
+    쓰기 도중 비정상 종료되어도 기존 스냅샷 파일은 손상되지 않습니다.
+    """
+    header = _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, version, journal_seq,
+                                   len(payload), zlib.crc32(payload))
+    temp_file_name = file_name + ".tmp"
+    with open(temp_file_name, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno()) # 내용이 디스크에 기록될 때까지 대기.
+
+    # 세대 회전: data.pkl.(N-1) -> data.pkl.N, ..., data.pkl -> data.pkl.1
+    names = _generation_file_names(file_name, generations)
+    for older, newer in zip(reversed(names[1:]), reversed(names[:-1])):
+        if os.path.exists(newer):
+            os.replace(newer, older)
+    os.replace(temp_file_name, file_name) # 원자적 교체.
+    _fsync_directory(file_name)
+
+def _read_snapshot_header(file_name):
+    """
+    스냅샷 헤더만 읽어 반환합니다.
+    Returns:
+        tuple or None: (version, journal_seq, payload_length, crc32). 헤더가 없는(이전 형식) 파일이면 None.
+    """
+    with open(file_name, 'rb') as f:
+        raw_header = f.read(_SNAPSHOT_HEADER.size)
+    if len(raw_header) < _SNAPSHOT_HEADER.size or not raw_header.startswith(SNAPSHOT_MAGIC):
+        return None
+    return _SNAPSHOT_HEADER.unpack(raw_header)[1:]
+
+def _read_snapshot_payload(file_name):
+    """
+    스냅샷 파일의 본문을 체크섬 검증 후 반환합니다. 헤더가 없는 이전 형식 파일은 전체를 본문으로 취급합니다.
+    Returns:
+        tuple: (형식 버전, 반영된 저널 번호, 본문 bytes). 헤더가 없는 파일은 (0, None, 본문).
+    Raises:
+        ValueError: 본문 길이나 체크섬이 헤더와 일치하지 않을 경우 (파일 손상).
+    """
+    with open(file_name, 'rb') as f:
+        content = f.read()
+    if not content.startswith(SNAPSHOT_MAGIC): # 헤더 도입 이전의 순수 pickle 파일.
+        return 0, None, content
+    _, version, journal_seq, payload_length, crc = _SNAPSHOT_HEADER.unpack_from(content)
+    if version > SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 형식 버전입니다: {version}")
+    payload = content[_SNAPSHOT_HEADER.size:]
+    if len(payload) != payload_length:
+        raise ValueError(f"스냅샷 길이 불일치 (헤더 {payload_length}, 실제 {len(payload)})")
+    if zlib.crc32(payload) != crc:
+        raise ValueError("스냅샷 체크섬 불일치")
+    return version, journal_seq, payload
+
+@traced("storage.save_data", "storage")
+def save_data(pet_data, daily_todos, snack_counts, historical_pets, file_name=DATA_FILE_NAME, journal_seq=0,
+              next_todo_id=None):
     """
     애플리케이션의 모든 데이터를 파일에 저장.
     Args:
@@ -15,54 +109,470 @@ def save_data(pet_data, daily_todos, snack_counts, historical_pets):
         daily_todos (dict): 날짜별 할 일 목록.
         snack_counts (dict): 간식 개수.
         historical_pets (list): 과거 펫 기록.
+        file_name (str): 저장할 파일명.
+        journal_seq (int): 이 스냅샷에 반영된 마지막 저널 레코드 번호.
+        next_todo_id (int): 다음에 부여할 할 일 id. None이면 저장된 할 일의 최대 id + 1.
+    Returns:
+        bool: 저장 성공 여부.
     """
-    data_to_save = {
-        'pet': pet_data,
-        'daily_todos': daily_todos,
-        'snack_counts': snack_counts,
-        'historical_pets': historical_pets # 과거 펫 기록 포함.
-    }
+    if next_todo_id is None:
+        next_todo_id = _max_todo_id(daily_todos) + 1
     try:
-        with open(DATA_FILE_NAME, 'wb') as f: # 이진 쓰기 모드.
-            pickle.dump(data_to_save, f)      # 데이터 직렬화 및 저장.
-        print(f"데이터가 '{DATA_FILE_NAME}'에 성공적으로 저장되었습니다.")
+        payload = snapshot_format.encode(pet_data, daily_todos, snack_counts, historical_pets, next_todo_id)
+        _write_snapshot_file(file_name, payload, journal_seq) # 임시 파일 + fsync + 원자적 교체. (저널 번호는 헤더에)
+        log.info("데이터가 '%s'에 성공적으로 저장되었습니다.", file_name)
+        return True
     except Exception as e:
-        print(f"데이터 저장 중 오류 발생: {e}")
+        log.error("데이터 저장 중 오류 발생: %s", e)
+        return False
+
+def _pack_daily_todos(daily_todos):
+    """
+    날짜별 TodoItem 리스트를 형식 버전 2 스냅샷의 열 형식으로 바꿉니다. (현재는 형식 비교 벤치마크에서만 사용)
+    날짜마다 (id 배열, 내용 튜플, 완료 비트마스크)이며, 인터닝된 같은 내용 문자열은 pickle에 한 번만 기록됩니다.
+    """
+    columns = {}
+    for date, todos in daily_todos.items():
+        completed_mask = 0
+        for position, todo in enumerate(todos):
+            if todo.completed:
+                completed_mask |= 1 << position
+        columns[date] = (array('q', [todo.id for todo in todos]), tuple(todo.text for todo in todos), completed_mask)
+    return columns
+
+def _unpack_daily_todos(columns):
+    """_pack_daily_todos의 열 형식을 날짜별 TodoItem 리스트로 되돌립니다."""
+    return {date: [TodoItem(todo_id, text, completed_mask >> position & 1)
+                   for position, (todo_id, text) in enumerate(zip(ids, texts))]
+            for date, (ids, texts, completed_mask) in columns.items()}
+
+def _max_todo_id(daily_todos):
+    """날짜별 할 일 목록에서 가장 큰 할 일 id를 반환합니다. (할 일이 없으면 0)"""
+    return max((todo.id for todos in daily_todos.values() for todo in todos), default=0)
+
+def _convert_legacy_todos(loaded_data):
+    """
+    딕셔너리 형식(이전 버전)의 할 일을 TodoItem으로 바꾸고, id가 없으면 id를 부여한 뒤 'next_todo_id'를 맞춥니다.
+    날짜 순, 목록 순으로 부여하므로 같은 파일은 항상 같은 id를 받습니다. (저널 재생과 일치)
+    """
+    daily_todos = loaded_data['daily_todos']
+    next_todo_id = max([loaded_data.get('next_todo_id', 1)] +
+                       [todo.get('id', 0) + 1 for todos in daily_todos.values() for todo in todos])
+    assigned = 0
+    for date in sorted(daily_todos):
+        converted = []
+        for todo in daily_todos[date]:
+            if 'id' not in todo:
+                assigned += 1
+                next_todo_id += 1
+            converted.append(TodoItem.from_dict(todo, next_todo_id - 1))
+        daily_todos[date] = converted
+    loaded_data['next_todo_id'] = next_todo_id
+    if assigned:
+        log.info("id가 없는 이전 형식의 할 일 %d개에 id를 부여했습니다.", assigned)
+
+def _decode_payload(version, payload):
+    """
+    형식 버전에 맞게 본문을 읽어, 그 버전의 데이터 딕셔너리를 반환합니다. (마이그레이션 전)
+    Raises:
+        ValueError: 지원하지 않는 형식 버전이거나 본문이 손상된 경우.
+    """
+    if version == snapshot_format.FORMAT_VERSION:
+        return snapshot_format.decode(payload)
+    if version > snapshot_format.FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 형식 버전입니다: {version}")
+    loaded_data = pickle.loads(payload) # 버전 2 이하: pickle 딕셔너리.
+    if not isinstance(loaded_data, dict):
+        raise ValueError("저장된 파일의 형식이 올바르지 않습니다.")
+    if version == 2:
+        loaded_data['daily_todos'] = _unpack_daily_todos(loaded_data.pop('daily_todo_columns'))
+    return loaded_data
+
+def _migrate_v0_to_v1(loaded_data):
+    """헤더 없는 파일: 'todo_list' 필드를 오늘 날짜의 할 일로 옮기고, 없는 필드를 기본값으로 채웁니다."""
+    if 'todo_list' in loaded_data: # 날짜별 할 일 도입 이전의 'todo_list' 필드.
+        loaded_data['daily_todos'] = {datetime.date.today(): loaded_data.pop('todo_list')}
+        log.info("이전 형식의 할 일 데이터를 현재 날짜로 변환하여 로드했습니다.")
+    loaded_data.setdefault('daily_todos', {})
+    loaded_data.setdefault('historical_pets', [])
+    loaded_data.setdefault('snack_counts', {})
+    loaded_data.setdefault('journal_seq', 0) # 저널 도입 이전 파일은 0번부터 재생.
+
+def _migrate_v1_to_v2(loaded_data):
+    """딕셔너리 형식 할 일을 TodoItem으로 바꾸고, id가 없는 할 일에 id를 부여합니다."""
+    _convert_legacy_todos(loaded_data)
+
+# 형식 버전 -> 다음 버전으로 변환하는 함수. (버전 2 -> 3은 저장 방식만 바뀌어 데이터 변환 없음)
+_MIGRATIONS = {
+    0: _migrate_v0_to_v1,
+    1: _migrate_v1_to_v2,
+}
+
+def _read_data_file(file_name):
+    """
+    저장된 데이터 파일을 읽어 호환성 처리가 끝난 딕셔너리로 반환.
+    최신 스냅샷이 손상되었으면 이전 세대 중 가장 최근의 유효한 스냅샷을 사용합니다.
+    Returns:
+        dict or None: 데이터 딕셔너리. 유효한 파일이 하나도 없는 경우 None.
+    """
+    loaded_data = None
+    for candidate in _generation_file_names(file_name):
+        if not os.path.exists(candidate):
+            continue
+        try:
+            version, journal_seq, payload = _read_snapshot_payload(candidate) # 체크섬 검증.
+            data = _decode_payload(version, payload)
+            if journal_seq is not None:
+                data['journal_seq'] = journal_seq
+            for from_version in range(version, SNAPSHOT_FORMAT_VERSION): # 현재 형식까지 한 버전씩 변환.
+                migration = _MIGRATIONS.get(from_version)
+                if migration is not None:
+                    migration(data)
+        except Exception as e:
+            log.warning("데이터 불러오기 중 오류 발생 또는 파일 손상 (%s): %s", candidate, e)
+            continue
+        loaded_data = data
+        if candidate != file_name:
+            log.warning("최신 데이터 파일이 손상되어 이전 세대 '%s'에서 복구합니다.", candidate)
+        log.info("데이터를 '%s'에서 성공적으로 불러왔습니다.", candidate)
+        break
+    if loaded_data is None:
+        log.info("'%s'의 유효한 데이터 파일이 존재하지 않아 초기 데이터를 반환합니다.", file_name)
+        return None
+
+    # 모든 필수 키 존재 여부 확인.
+    if 'pet' not in loaded_data:
+        log.warning("저장된 파일의 형식이 올바르지 않아 초기 데이터를 반환합니다.")
+        return None
+    return loaded_data
 
-def load_data():
+@traced("storage.load_data", "storage")
+def load_data(file_name=DATA_FILE_NAME):
     """
     저장된 데이터 파일을 불러옴. 파일 없거나 오류 발생 시 초기값 반환.
     Returns:
         tuple: (pet_data, daily_todos, snack_counts, historical_pets)
     """
-    if os.path.exists(DATA_FILE_NAME):
+    loaded_data = _read_data_file(file_name)
+    if loaded_data is None:
+        return None, {}, {}, [] # 파일이 없거나 손상된 경우 초기값 반환.
+    return loaded_data['pet'], loaded_data['daily_todos'], loaded_data['snack_counts'], loaded_data['historical_pets']
+
+
+# === 변경 기록(저널) ===
+# 저널 레코드는 (번호, [변경, ...]) 형태로 파일 끝에 덧붙여집니다.
+# 하나의 사용자 동작에서 발생한 변경들은 하나의 레코드로 묶여 한 번에 기록됩니다.
+# 파일은 매직과 저널 형식 버전으로 시작합니다. 형식 버전별 레코드:
+#   1  헤더 없는 파일. 'pet' 변경에 Pet 객체를 그대로 pickle. (읽을 때 필드 딕셔너리로 변환)
+#   2  변경에는 기본 자료형과 datetime.date만 담고, 'pet'은 PET_SCHEMA 필드 딕셔너리. (현재 형식)
+#      읽을 때 그 밖의 클래스는 불러오지 않으므로 클래스 구조가 바뀌어도 저널을 읽을 수 있습니다.
+# 변경(change)의 종류:
+#   ('pet', dict)                   현재 펫 전체 (snapshot_format.pet_to_fields 필드, 데이터 크기와 무관하게 일정).
+#                                   엔진이 내는 변경에는 Pet 객체이며, 저널에 기록할 때 필드 딕셔너리로 바뀝니다.
+#   ('snacks', dict)                간식 개수 딕셔너리 전체.
+#   ('todo_add', date, text, id)    해당 날짜의 할 일 목록 끝에 id를 가진 할 일 추가.
+#   ('todo_update', date, id, dict) 해당 날짜의 id 할 일의 필드 변경 (예: {'completed': True}, {'text': ...}).
+#   ('todo_delete', date, id)       해당 날짜의 id 할 일 삭제.
+#   ('todo_move', date, id, target) id 할 일을 target 날짜로 이동 (id 순서 유지).
+#   아래는 할 일 id 도입 이전 저널의 재생용입니다. (새로 기록하지 않음)
+#   ('todo_add', date, text)        id 없이 추가 (다음 id를 부여).
+#   ('todo_complete', date, index)  해당 날짜의 index번째 할 일 완료 처리.
+#   ('todo_remove', date, index)    해당 날짜의 index번째 할 일 삭제.
+#   ('todos_reset',)                모든 날짜의 할 일 삭제 (환생 시).
+#   ('history_add', record)         과거 펫 기록 추가.
+#   ('history_delete', index)       index번째 과거 펫 기록 삭제.
+
+def apply_change(data, change):
+    """
+    변경 하나를 데이터 딕셔너리에 적용합니다. (저널 재생에 사용)
+    Args:
+        data (dict): 'pet', 'daily_todos', 'snack_counts', 'historical_pets' 키를 가진 딕셔너리.
+        change (tuple): 변경 종류와 인자로 이루어진 튜플.
+    Raises:
+        ValueError: 알 수 없는 변경 종류일 경우.
+    """
+    kind = change[0]
+    if kind == 'pet':
+        pet = change[1]
+        data['pet'] = snapshot_format.pet_from_fields(pet) if isinstance(pet, dict) else pet
+    elif kind == 'snacks':
+        data['snack_counts'] = dict(change[1])
+    elif kind == 'todo_add':
+        date, text = change[1], change[2]
+        todo_id = change[3] if len(change) > 3 else data.get('next_todo_id', 1)
+        data['daily_todos'].setdefault(date, []).append(TodoItem(todo_id, text))
+        data['next_todo_id'] = max(data.get('next_todo_id', 1), todo_id + 1)
+    elif kind == 'todo_update':
+        _, date, todo_id, fields = change
+        data['daily_todos'][date][_todo_position(data['daily_todos'][date], todo_id)].update(fields)
+    elif kind == 'todo_delete':
+        _, date, todo_id = change
+        _pop_todo(data, date, _todo_position(data['daily_todos'][date], todo_id))
+    elif kind == 'todo_move':
+        _, date, todo_id, target_date = change
+        todo = _pop_todo(data, date, _todo_position(data['daily_todos'][date], todo_id))
+        target_todos = data['daily_todos'].setdefault(target_date, [])
+        target_todos.append(todo)
+        target_todos.sort(key=lambda item: item.id) # 날짜 안의 할 일은 id(생성) 순서.
+    elif kind == 'todo_complete':
+        _, date, index = change
+        data['daily_todos'][date][index].completed = True
+    elif kind == 'todo_remove':
+        _, date, index = change
+        _pop_todo(data, date, index)
+    elif kind == 'todos_reset':
+        data['daily_todos'] = {}
+    elif kind == 'history_add':
+        data['historical_pets'].append(change[1])
+    elif kind == 'history_delete':
+        data['historical_pets'].pop(change[1])
+    else:
+        raise ValueError(f"알 수 없는 변경 종류입니다: {kind}")
+
+def _todo_position(day_todos, todo_id):
+    """날짜의 할 일 리스트에서 id 할 일의 위치를 찾습니다. (리스트가 id 순서이므로 이진 탐색)"""
+    position = bisect.bisect_left(day_todos, todo_id, key=lambda todo: todo.id)
+    if position == len(day_todos) or day_todos[position].id != todo_id:
+        raise KeyError(f"할 일 id {todo_id}가 해당 날짜에 없습니다.")
+    return position
+
+def _pop_todo(data, date, position):
+    """날짜의 position번째 할 일을 꺼냅니다. 할 일이 없어진 날짜는 보관하지 않습니다."""
+    day_todos = data['daily_todos'][date]
+    todo = day_todos.pop(position)
+    if not day_todos:
+        del data['daily_todos'][date]
+    return todo
+
+JOURNAL_MAGIC = b'PDLJ'
+JOURNAL_FORMAT_VERSION = 2
+_JOURNAL_HEADER = struct.Struct('<4sB') # 매직, 저널 형식 버전.
+
+class _ForbiddenJournalObject(Exception):
+    """형식 버전 2 저널 레코드에 허용되지 않는 객체가 있음. (잘린 레코드와 구별해 잘라내지 않음)"""
+
+class _JournalUnpickler(pickle.Unpickler):
+    """형식 버전 2 저널 레코드를 읽는 Unpickler. 기본 자료형 외에는 datetime.date만 허용합니다."""
+    def find_class(self, module, name):
+        if (module, name) == ('datetime', 'date'):
+            return datetime.date
+        raise _ForbiddenJournalObject(f"저널에 허용되지 않는 객체입니다: {module}.{name}")
+
+def _encode_change(change):
+    """변경을 저널에 기록할 형태로 바꿉니다. (Pet 객체 -> PET_SCHEMA 필드 딕셔너리)"""
+    if change[0] == 'pet' and change[1] is not None and not isinstance(change[1], dict):
+        return ('pet', snapshot_format.pet_to_fields(change[1]))
+    return change
+
+def _write_journal(journal_file_name, records):
+    """레코드들을 현재 형식의 새 저널 파일로 기록하고 fsync한 뒤 원자적으로 교체합니다."""
+    temp_file_name = journal_file_name + ".tmp"
+    with open(temp_file_name, 'wb') as f:
+        f.write(_JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_FORMAT_VERSION))
+        for record in records:
+            pickle.dump(record, f)
+        f.flush()
+        os.fsync(f.fileno()) # 남길 레코드가 기록된 뒤에 교체.
+    os.replace(temp_file_name, journal_file_name)
+    _fsync_directory(journal_file_name)
+
+def _read_journal(journal_file_name):
+    """
+    저널 파일의 레코드를 순서대로 읽어 반환합니다. (형식 버전 1 파일의 Pet은 필드 딕셔너리로 변환)
+    비정상 종료로 끝부분이 잘린 레코드가 있으면 그 앞까지만 유효한 것으로 보고 파일을 잘라냅니다.
+    Returns:
+        list: (번호, [변경, ...]) 레코드 리스트.
+    Raises:
+        ValueError: 지원하지 않는 저널 형식 버전이거나, 허용되지 않는 객체가 담긴 레코드가 있을 경우.
+    """
+    records = []
+    if not os.path.exists(journal_file_name):
+        return records
+    valid_end = 0 # 마지막으로 온전히 읽은 레코드의 끝 위치.
+    with open(journal_file_name, 'rb') as f:
+        header = f.read(_JOURNAL_HEADER.size)
+        if len(header) == _JOURNAL_HEADER.size and header.startswith(JOURNAL_MAGIC):
+            version = _JOURNAL_HEADER.unpack(header)[1]
+            if version > JOURNAL_FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 저널 형식 버전입니다: {version}")
+            unpickler_class, valid_end = _JournalUnpickler, _JOURNAL_HEADER.size
+        elif JOURNAL_MAGIC.startswith(header[:len(JOURNAL_MAGIC)]): # 비어 있거나 헤더를 쓰다 잘린 파일.
+            unpickler_class = None
+        else: # 헤더 도입 이전(형식 버전 1) 파일.
+            f.seek(0)
+            unpickler_class = pickle.Unpickler
+        while unpickler_class is not None:
+            try:
+                seq, changes = unpickler_class(f).load()
+                records.append((seq, [_encode_change(change) for change in changes]))
+                valid_end = f.tell()
+            except EOFError: # 정상적인 파일 끝.
+                break
+            except _ForbiddenJournalObject as e:
+                raise ValueError(str(e)) from e
+            except Exception as e: # 잘리거나 손상된 레코드.
+                log.warning("저널 '%s'의 손상된 끝부분을 무시합니다: %s", journal_file_name, e)
+                break
+        file_size = f.seek(0, os.SEEK_END)
+    if valid_end < file_size: # 손상된 끝부분 제거 (이후 레코드가 그 뒤에 붙지 않도록).
+        with open(journal_file_name, 'r+b') as f:
+            f.truncate(valid_end)
+    return records
+
+
+class JournalStorage:
+    """
+    스냅샷 파일과 추가 전용(append-only) 저널 파일로 데이터를 관리하는 저장소 클래스.
+    사용자 동작마다 작은 변경 레코드만 저널에 덧붙이므로 기록 비용이 전체 기록 기간과 무관하며,
+    레코드가 일정 개수 이상 쌓이면 전체 데이터를 스냅샷으로 압축(compaction)합니다.
+    """
+    def __init__(self, data_file_name=DATA_FILE_NAME, journal_file_name=JOURNAL_FILE_NAME,
+                 compact_threshold=JOURNAL_COMPACT_THRESHOLD):
+        self.data_file_name = data_file_name       # 스냅샷 파일명.
+        self.journal_file_name = journal_file_name # 저널 파일명.
+        self.compact_threshold = compact_threshold # 압축이 필요한 미반영 레코드 수.
+        self.last_seq = 0     # 마지막으로 기록된 저널 레코드 번호.
+        self.snapshot_seq = 0 # 스냅샷에 반영된 마지막 저널 레코드 번호.
+        self._next_todo_id = 1 # 불러온 데이터의 다음 할 일 id.
+
+    @traced("storage.journal.load", "storage")
+    def load(self):
+        """
+        스냅샷을 불러온 뒤, 스냅샷 이후의 저널 레코드를 재생하여 최신 상태를 복원합니다.
+        재생할 수 없는 레코드가 있으면 그 앞 레코드까지의 상태를 사용하고, 저널을 그 레코드 앞에서 잘라냅니다.
+        (레코드는 전부 반영되거나 전혀 반영되지 않으며, 이후 기록이 같은 번호로 그 뒤에 붙지 않음)
+        Returns:
+            tuple: (pet_data, daily_todos, snack_counts, historical_pets)
+        """
+        records = _read_journal(self.journal_file_name)
+        data, failed_index = self._replay(records)
+        if failed_index is not None:
+            # 실패한 레코드의 앞부분 변경이 이미 적용되었으므로, 스냅샷부터 그 앞 레코드까지 다시 재생.
+            records = records[:failed_index]
+            data, _ = self._replay(records)
+            _write_journal(self.journal_file_name, records)
+        replayed = sum(1 for seq, _ in records if seq > self.snapshot_seq)
+        if replayed:
+            log.info("저널 '%s'에서 변경 기록 %d개를 재생했습니다.", self.journal_file_name, replayed)
+        self._next_todo_id = data['next_todo_id']
+
+        return data['pet'], data['daily_todos'], data['snack_counts'], data['historical_pets']
+
+    def _replay(self, records):
+        """
+        스냅샷을 읽고 그 이후의 저널 레코드를 차례로 적용합니다. (snapshot_seq, last_seq 설정)
+        Returns:
+            tuple: (데이터 딕셔너리, 적용하지 못한 레코드의 위치 또는 None).
+        """
+        data = _read_data_file(self.data_file_name)
+        if data is None:
+            data = {'pet': None, 'daily_todos': {}, 'snack_counts': {}, 'historical_pets': [], 'journal_seq': 0,
+                    'next_todo_id': 1}
+        self.snapshot_seq = data['journal_seq']
+        self.last_seq = self.snapshot_seq
+        for index, (seq, changes) in enumerate(records):
+            if seq <= self.snapshot_seq: # 이미 스냅샷에 반영된 레코드.
+                continue
+            try:
+                for change in changes:
+                    apply_change(data, change)
+            except Exception as e: # 스냅샷과 맞지 않는 레코드부터는 재생 중단.
+                log.warning("저널 레코드 %d 재생 중 오류 발생, 이 레코드부터 저널에서 제거합니다: %s", seq, e)
+                return data, index
+            self.last_seq = seq
+        return data, None
+
+    @traced("storage.journal.append", "storage")
+    def append(self, changes):
+        """
+        하나의 사용자 동작에서 발생한 변경들을 저널에 하나의 레코드로 덧붙입니다.
+        레코드가 디스크에 기록될 때까지(fsync) 기다린 뒤 반환하므로, 반환 후에는 전원이 꺼져도 변경이 남습니다.
+        Args:
+            changes (list): 변경 튜플 리스트.
+        Returns:
+            bool: 스냅샷 압축이 필요한지 여부.
+        """
+        seq = self.last_seq + 1
         try:
-            with open(DATA_FILE_NAME, 'rb') as f: # 이진 읽기 모드.
-                loaded_data = pickle.load(f)      # 데이터 역직렬화.
-            print(f"데이터를 '{DATA_FILE_NAME}'에서 성공적으로 불러왔습니다.")
-            
-            # 이전 데이터 형식과의 호환성 처리.
-            if 'todo_list' in loaded_data: # 이전 버전의 'todo_list' 필드 처리.
-                today = datetime.date.today()
-                loaded_data['daily_todos'] = {today: loaded_data['todo_list']}
-                del loaded_data['todo_list'] 
-                print("이전 형식의 할 일 데이터를 현재 날짜로 변환하여 로드했습니다.")
-            if 'daily_todos' not in loaded_data:    # 'daily_todos' 필드 부재 시 초기화.
-                loaded_data['daily_todos'] = {}
-            if 'historical_pets' not in loaded_data: # 'historical_pets' 필드 부재 시 초기화.
-                loaded_data['historical_pets'] = [] 
-            if 'snack_counts' not in loaded_data:   # 'snack_counts' 필드 부재 시 초기화.
-                loaded_data['snack_counts'] = {}
-
-            # 모든 필수 키 존재 여부 확인 후 반환.
-            if all(key in loaded_data for key in ['pet', 'daily_todos', 'snack_counts', 'historical_pets']):
-                return loaded_data['pet'], loaded_data['daily_todos'], loaded_data['snack_counts'], loaded_data['historical_pets']
-            else:
-                print("저장된 파일의 형식이 올바르지 않아 초기 데이터를 반환합니다.")
-                return None, {}, {}, [] 
+            with open(self.journal_file_name, 'ab') as f: # 이진 추가 모드.
+                created = f.tell() == 0
+                if created: # 새 저널 파일은 형식 헤더로 시작.
+                    f.write(_JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_FORMAT_VERSION))
+                pickle.dump((seq, [_encode_change(change) for change in changes]), f)
+                f.flush()
+                os.fsync(f.fileno()) # 내용이 디스크에 기록될 때까지 대기.
+            if created: # 새로 만든 저널 파일의 디렉터리 항목도 기록.
+                _fsync_directory(self.journal_file_name)
         except Exception as e:
-            print(f"데이터 불러오기 중 오류 발생 또는 파일 손상: {e}")
-            return None, {}, {}, [] 
-    else:
-        print(f"'{DATA_FILE_NAME}' 파일이 존재하지 않아 초기 데이터를 반환합니다.")
-        return None, {}, {}, [] # 파일이 없을 경우 초기값 반환.
\ No newline at end of file
+            log.error("저널 기록 중 오류 발생: %s", e)
+            return True # 저널 기록 실패 시 전체 저장으로 대체.
+        self.last_seq = seq
+        return self.needs_compaction()
+
+    def next_todo_id(self):
+        """마지막으로 불러온 데이터 기준으로 다음에 부여할 할 일 id를 반환합니다."""
+        return self._next_todo_id
+
+    def needs_compaction(self, additional_records=0):
+        """스냅샷에 반영되지 않은 저널 레코드(additional_records개를 더 기록한다고 가정)가 압축 기준 이상인지 반환합니다."""
+        return self.last_seq + additional_records - self.snapshot_seq >= self.compact_threshold
+
+    @traced("storage.journal.save", "storage")
+    def save(self, pet_data, daily_todos, snack_counts, historical_pets, next_todo_id=None):
+        """
+        전체 데이터를 스냅샷으로 저장하고, 스냅샷에 반영된 저널 레코드를 정리합니다.
+        Args:
+            next_todo_id (int): 다음에 부여할 할 일 id (삭제된 할 일의 id가 다시 쓰이지 않도록 함께 저장).
+        Returns:
+            bool: 저장 성공 여부.
+        """
+        seq = self.last_seq
+        if not save_data(pet_data, daily_todos, snack_counts, historical_pets,
+                         file_name=self.data_file_name, journal_seq=seq, next_todo_id=next_todo_id):
+            return False
+        self.snapshot_seq = seq
+        self._trim_journal(self._oldest_generation_seq())
+        return True
+
+    def _oldest_generation_seq(self):
+        """
+        보관 중인 스냅샷 세대 중 가장 오래된 것의 저널 번호를 반환합니다.
+        이전 세대로 복구되더라도 그 이후의 저널을 재생할 수 있도록 그만큼의 저널은 남겨 둡니다.
+        """
+        oldest_seq = self.snapshot_seq
+        for name in _generation_file_names(self.data_file_name)[1:]:
+            try:
+                header = _read_snapshot_header(name)
+            except OSError: # 존재하지 않는 세대.
+                continue
+            if header is None: # 저널 번호를 알 수 없는 이전 형식 파일.
+                return 0
+            oldest_seq = min(oldest_seq, header[1])
+        return oldest_seq
+
+    def _trim_journal(self, upto_seq):
+        """upto_seq 이하 번호의 저널 레코드를 제거합니다. (스냅샷 이후 레코드는 유지)"""
+        remaining = [record for record in _read_journal(self.journal_file_name) if record[0] > upto_seq]
+        if not remaining:
+            if os.path.exists(self.journal_file_name):
+                os.remove(self.journal_file_name)
+            return
+        _write_journal(self.journal_file_name, remaining)
+
+
+def create_storage(backend=STORAGE_BACKEND):
+    """
+    설정된 종류의 저장소 객체를 생성합니다.
+    Args:
+        backend (str): "journal" 또는 "sqlite".
+    Returns:
+        JournalStorage or SQLiteStorage: load/append/save 인터페이스를 가진 저장소.
+    Raises:
+        ValueError: 알 수 없는 저장소 종류일 경우.
+    """
+    if backend == "journal":
+        return JournalStorage()
+    if backend == "sqlite":
+        from sqlite_storage import SQLiteStorage # sqlite_storage가 이 모듈을 임포트하므로 지연 임포트.
+        return SQLiteStorage()
+    raise ValueError(f"알 수 없는 저장소 종류입니다: {backend}")
@@ -5,12 +5,40 @@
 
 import tkinter as tk      # Tkinter GUI 라이브러리.
 from tkinter import ttk   # Tkinter의 테마 위젯 (예: Progressbar).
-from tkinter import messagebox # 메시지 박스 팝업.
+from tkinter import messagebox, simpledialog # 메시지 박스 팝업, 할 일 수정 입력창.
 from PIL import Image, ImageTk # Pillow 라이브러리: 이미지 처리 및 Tkinter에 표시.
 import os                 # 파일 시스템 경로 처리.
 import datetime           # 날짜/시간 객체.
+import calendar           # 달력 다이얼로그의 주 단위 날짜 배치.
+import threading          # 이미지 미리 로드용 백그라운드 스레드.
 
 import config             # 애플리케이션 설정 값 임포트.
+from image_cache import ImageCache # 크기 제한 LRU 이미지 캐시.
+from instrumentation import get_logger, span, traced # 진단 로그, 화면 갱신/이미지 로드 시간 측정.
+import sprite_cache       # 미리 리사이즈된 펫 이미지 캐시.
+# update_gui_with_pet_data에 전달하는 변경 부분 이름 (엔진의 changed 이벤트와 같은 값).
+from pet_engine import PART_PET, PART_SNACKS, PART_DATE, PART_TODOS, PART_TODO
+
+log = get_logger("gui")
+
+@traced("gui.decode_pet_image", "image")
+def _decode_pet_image(image_filename, size):
+    """
+    펫 이미지 파일을 열어 지정 크기로 리사이즈한 PIL 이미지를 반환합니다.
+    스프라이트 캐시(sprite_cache.py로 생성)에 해당 크기가 있으면 리사이즈 없이 그 파일을 사용합니다.
+    Tkinter 객체를 만들지 않으므로 백그라운드 스레드에서도 호출할 수 있습니다.
+    Raises:
+        FileNotFoundError: 이미지 파일이 없을 경우.
+    """
+    sprite_path = sprite_cache.get_sprite_path(image_filename, size)
+    if sprite_path: # 미리 리사이즈된 스프라이트 사용.
+        sprite_image = Image.open(sprite_path)
+        sprite_image.load() # 파일 내용을 읽고 파일 닫기.
+        return sprite_image
+    full_path = os.path.join(config.RESOURCES_PATH, config.PET_IMAGES_SUBFOLDER, image_filename)
+    log.debug("이미지 로드 시도 경로: %s", full_path)
+    with Image.open(full_path) as original_image:
+        return original_image.resize(size, Image.Resampling.LANCZOS) # 고품질 리사이징.
 
 # === 펫 종류 선택 모달 다이얼로그 클래스 ===
 # 펫을 생성하거나 환생할 때 사용자에게 펫 종류를 선택하도록 하는 팝업 창
@@ -64,7 +92,12 @@ class PetSpeciesSelectionDialog(tk.Toplevel):
 # === 과거 펫 기록 보기 다이얼로그 클래스 ===
 # 사용자가 성장시켰던 과거 펫들의 기록을 보여주는 팝업 창
 # 각 기록에 대한 이미지와 정보, 삭제 버튼을 포함
+# 기록이 많아도 빠르게 열리도록, 화면에 보이는 행의 위젯만 만들고 스크롤 시 재사용(가상화 목록)
 class HistoricalPetViewerDialog(tk.Toplevel):
+    ROW_HEIGHT = 100         # 기록 한 행의 높이 (픽셀). 모든 행의 높이가 같아야 보이는 구간을 계산할 수 있음.
+    ROW_PADDING = 5          # 행 사이 간격.
+    THUMBNAIL_SIZE = (60, 60) # 기록 이미지 크기.
+
     def __init__(self, parent, historical_pets, pet_image_loader_func, app_logic, title="펫 기록 보기"): 
         super().__init__(parent)
         self.transient(parent)
@@ -72,6 +105,7 @@ class HistoricalPetViewerDialog(tk.Toplevel):
         self.title(title)
         self.pet_image_loader_func = pet_image_loader_func # 펫 이미지 로딩 함수.
         self.app_logic = app_logic                         # main.py의 앱 로직 인스턴스.
+        self.row_slots = []                                # 재사용되는 행 위젯 묶음들.
 
         # 다이얼로그 창 크기 및 위치 조정.
         dialog_width = 500
@@ -88,27 +122,36 @@ class HistoricalPetViewerDialog(tk.Toplevel):
 
         # 스크롤 가능한 영역 (Canvas와 Scrollbar 조합).
         self.canvas = tk.Canvas(self, borderwidth=0, background=config.BG_COLOR)
-        self.record_frame = tk.Frame(self.canvas, background=config.BG_COLOR) # 기록 엔트리들이 배치될 프레임.
-        self.vsb = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview) # 수직 스크롤바.
+        self.vsb = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar) # 수직 스크롤바.
         self.canvas.configure(yscrollcommand=self.vsb.set) # Canvas에 스크롤바 연결.
 
         self.vsb.pack(side="right", fill="y")         # 스크롤바 배치.
         self.canvas.pack(side="left", fill="both", expand=True) # Canvas 배치.
-        self.canvas.create_window((4,4), window=self.record_frame, anchor="nw", # Canvas 내에 record_frame 배치.
-                                  tags="self.record_frame")
+
+        # 기록이 없을 때 표시할 안내 문구.
+        self.empty_label_id = self.canvas.create_text(
+            dialog_width // 2, 40, text="아직 저장된 펫 기록이 없습니다.",
+            font=(config.MAIN_FONT_FAMILY, 12), fill="gray", state="hidden")
 
         # 스크롤 기능 바인딩.
-        self.record_frame.bind("<Configure>", self.on_frame_configure) # record_frame 크기 변경 시 스크롤 영역 업데이트.
-        self.canvas.bind('<Enter>', self._bound_to_mousewheel)         # 마우스 오버 시 휠 이벤트 바인딩.
-        self.canvas.bind('<Leave>', self._unbound_to_mousewheel)       # 마우스 이탈 시 휠 이벤트 언바인딩.
+        self.canvas.bind("<Configure>", self._on_canvas_configure) # 창 크기 변경 시 보이는 행 다시 배치.
+        self.canvas.bind('<Enter>', self._bound_to_mousewheel)     # 마우스 오버 시 휠 이벤트 바인딩.
+        self.canvas.bind('<Leave>', self._unbound_to_mousewheel)   # 마우스 이탈 시 휠 이벤트 언바인딩.
 
-        self._build_records_display() # 기록 화면 빌드.
+        self._refresh_rows() # 기록 화면 표시.
 
         self.wait_window(self) # 다이얼로그가 닫힐 때까지 대기.
 
-    def on_frame_configure(self, event):
-        # Canvas의 스크롤 영역을 record_frame의 크기에 맞춰 조정.
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def _on_canvas_configure(self, event):
+        # Canvas 크기가 바뀌면 행 너비와 보이는 행 구간을 다시 계산.
+        for slot in self.row_slots:
+            self.canvas.itemconfigure(slot['window_id'], width=event.width - 2 * self.ROW_PADDING)
+        self._layout_visible_rows()
+
+    def _on_scrollbar(self, *args):
+        # 스크롤바 조작 시 Canvas를 스크롤하고 보이는 행을 다시 배치.
+        self.canvas.yview(*args)
+        self._layout_visible_rows()
 
     def _bound_to_mousewheel(self, event):
         # Canvas에서 마우스 휠 이벤트를 처리하도록 바인딩.
@@ -121,59 +164,330 @@ class HistoricalPetViewerDialog(tk.Toplevel):
     def _on_mousewheel(self, event):
         # 마우스 휠 움직임에 따라 Canvas 스크롤.
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        self._layout_visible_rows()
+
+    def _refresh_rows(self):
+        # 기록 개수에 맞춰 스크롤 영역을 갱신하고 보이는 행들을 다시 채움 (기록 추가/삭제 후 호출).
+        record_count = len(self.app_logic.historical_pets) # 앱 로직에서 최신 기록 개수 가져오기.
+        total_height = record_count * self.ROW_HEIGHT + self.ROW_PADDING
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), total_height),
+                              yscrollincrement=self.ROW_HEIGHT // 4)
+        self.canvas.itemconfigure(self.empty_label_id, state="normal" if record_count == 0 else "hidden")
+        self._layout_visible_rows() # 배정된 기록이 바뀐 행만 내용을 다시 채움.
+
+    def _layout_visible_rows(self):
+        # 현재 스크롤 위치에서 보이는 행 구간을 계산하고, 재사용 행 위젯들을 그 위치에 배치.
+        historical_pets = self.app_logic.historical_pets
+        record_count = len(historical_pets)
+        viewport_height = max(self.canvas.winfo_height(), self.ROW_HEIGHT)
+        first_row = max(0, int(self.canvas.canvasy(0)) // self.ROW_HEIGHT)
+        visible_count = viewport_height // self.ROW_HEIGHT + 2 # 부분적으로 보이는 위/아래 행 포함.
+
+        while len(self.row_slots) < min(visible_count, record_count): # 필요한 만큼만 행 위젯 생성.
+            self.row_slots.append(self._create_row_slot())
+
+        for slot_index, slot in enumerate(self.row_slots):
+            row = first_row + slot_index
+            if row >= record_count: # 표시할 기록이 없는 행은 숨김.
+                self.canvas.itemconfigure(slot['window_id'], state="hidden")
+                slot['record'] = None
+                continue
+            record_index = record_count - 1 - row # 최신 기록부터 역순으로 표시.
+            record = historical_pets[record_index]
+            self.canvas.coords(slot['window_id'], self.ROW_PADDING, row * self.ROW_HEIGHT + self.ROW_PADDING)
+            self.canvas.itemconfigure(slot['window_id'], state="normal")
+            slot['record_index'] = record_index
+            if slot['record'] is not record: # 다른 기록이 배정된 경우에만 내용 갱신.
+                self._fill_row_slot(slot, record)
+
+    def _create_row_slot(self):
+        # 재사용할 기록 행 위젯 묶음(프레임, 이미지, 정보, 삭제 버튼)을 하나 생성.
+        entry_frame = tk.Frame(self.canvas, bd=2, relief=tk.GROOVE, padx=10, pady=10, bg="white",
+                               height=self.ROW_HEIGHT - self.ROW_PADDING)
+        entry_frame.pack_propagate(False) # 내용과 관계없이 고정 높이 유지.
+
+        img_label = tk.Label(entry_frame, bg="white") # 이미지 라벨.
+        img_label.pack(side=tk.LEFT, padx=10)
 
-    def _build_records_display(self):
-        # 과거 펫 기록들을 불러와 화면에 표시.
-        for widget in self.record_frame.winfo_children(): # 기존 위젯 모두 제거.
-            widget.destroy()
-
-        historical_pets = self.app_logic.historical_pets # 앱 로직에서 최신 기록 리스트 가져오기.
-        if not historical_pets: # 기록이 없을 경우.
-            tk.Label(self.record_frame, text="아직 저장된 펫 기록이 없습니다.", font=(config.MAIN_FONT_FAMILY, 12), fg="gray", bg=config.BG_COLOR).pack(pady=20)
-        else: # 기록이 있을 경우, 최신 기록부터 역순으로 표시.
-            for i in range(len(historical_pets) -1, -1, -1):
-                record = historical_pets[i]
-                self._create_record_entry(record, i) # 각 기록 엔트리 생성.
-        
-        self.on_frame_configure(None) # 스크롤 영역 갱신.
+        info_label = tk.Label(entry_frame, justify=tk.LEFT, font=(config.MAIN_FONT_FAMILY, 10), bg="white")
+        info_label.pack(side=tk.LEFT, padx=10, fill=tk.BOTH, expand=True)
 
-    def _create_record_entry(self, record, index): 
-        # 단일 과거 펫 기록 엔트리 위젯 생성.
-        entry_frame = tk.Frame(self.record_frame, bd=2, relief=tk.GROOVE, padx=10, pady=10, bg="white")
-        entry_frame.pack(fill=tk.X, padx=5, pady=5)
+        slot = {'frame': entry_frame, 'image_label': img_label, 'info_label': info_label,
+                'record': None, 'record_index': None}
 
-        image_size = (60, 60) 
-        image_filename = f"{record['species']}_level{record['level']}.png"
-        pet_img = self.pet_image_loader_func(image_filename, size=image_size) # 펫 이미지 로드.
+        # 기록 삭제 버튼 (행이 재사용되므로 클릭 시점에 배정된 기록 인덱스를 사용).
+        delete_button = tk.Button(entry_frame, text="삭제", 
+                                  command=lambda: self._delete_record(slot['record_index']), 
+                                  font=(config.MAIN_FONT_FAMILY, 9), bg="red", fg="white")
+        delete_button.pack(side=tk.RIGHT, padx=5, pady=5) 
 
-        img_label = tk.Label(entry_frame, image=pet_img, bg="white") # 이미지 라벨.
-        img_label.image = pet_img # 참조 유지.
-        img_label.pack(side=tk.LEFT, padx=10)
+        slot['window_id'] = self.canvas.create_window(
+            self.ROW_PADDING, 0, window=entry_frame, anchor="nw",
+            width=max(self.canvas.winfo_width() - 2 * self.ROW_PADDING, 1))
+        return slot
+
+    def _fill_row_slot(self, slot, record):
+        # 행 위젯에 기록 내용(이미지, 기간, 종류, 레벨)을 채움.
+        image_filename = f"{record['species']}_level{record['level']}.png"
+        pet_img = self.pet_image_loader_func(image_filename, size=self.THUMBNAIL_SIZE) # 펫 이미지 로드 (캐시 사용).
+        slot['image_label'].config(image=pet_img if pet_img else '')
+        slot['image_label'].image = pet_img # 참조 유지.
 
         info_text = ( # 기록 정보 텍스트 생성.
             f"기간: {record['start_date'].strftime('%Y/%m/%d')} ~ {record['end_date'].strftime('%Y/%m/%d')}\n"
             f"펫 종류: {record['species']}\n"
             f"최종 레벨: Lv. {record['level']}"
         )
-        info_label = tk.Label(entry_frame, text=info_text, justify=tk.LEFT, font=(config.MAIN_FONT_FAMILY, 10), bg="white")
-        info_label.pack(side=tk.LEFT, padx=10, fill=tk.BOTH, expand=True)
-
-
-        # 기록 삭제 버튼.
-        delete_button = tk.Button(entry_frame, text="삭제", 
-                                  command=lambda idx=index: self._delete_record(idx), 
-                                  font=(config.MAIN_FONT_FAMILY, 9), bg="red", fg="white")
-        delete_button.pack(side=tk.RIGHT, padx=5, pady=5) 
+        slot['info_label'].config(text=info_text)
+        slot['record'] = record
 
     def _delete_record(self, index):
         # 기록 삭제 버튼 클릭 시 호출.
+        if index is None:
+            return
         if messagebox.askyesno("기록 삭제", "정말 이 펫의 기록을 삭제하시겠습니까?", parent=self): # 사용자 확인.
             if self.app_logic.delete_historical_pet_record(index): # app_logic을 통해 기록 삭제.
-                self._build_records_display() # 화면 갱신.
+                self._refresh_rows() # 보이는 행만 다시 채움.
             else:
                 messagebox.showerror("오류", "기록 삭제에 실패했습니다.", parent=self)
 
 
+# === 할 일 검색 다이얼로그 클래스 ===
+# 모든 날짜의 할 일을 검색하여 최근 날짜 순으로 보여주는 팝업 창
+# 입력할 때마다 결과를 갱신하고, 결과를 더블클릭(또는 Enter)하면 해당 날짜로 이동하여 그 할 일을 선택
+class TodoSearchDialog(tk.Toplevel):
+    def __init__(self, parent, app_logic, on_select, initial_query="", title="할 일 검색"):
+        super().__init__(parent)
+        self.transient(parent)
+        self.grab_set()
+        self.title(title)
+        self.app_logic = app_logic # main.py의 앱 로직 인스턴스.
+        self.on_select = on_select # 결과 선택 시 호출할 함수 (날짜, 할 일 id).
+        self.results = []          # 표시 중인 (날짜, 할 일 id, 내용) 결과들.
+        self._retry_id = None      # 검색 색인 준비를 기다리는 after() 콜백 ID.
+
+        # 다이얼로그 창 크기 및 위치 조정.
+        dialog_width = 450
+        dialog_height = 400
+        parent_x, parent_y = parent.winfo_x(), parent.winfo_y()
+        parent_width, parent_height = parent.winfo_width(), parent.winfo_height()
+        x = parent_x + (parent_width // 2) - (dialog_width // 2)
+        y = parent_y + (parent_height // 2) - (dialog_height // 2)
+        self.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+
+        # 검색어 입력 엔트리.
+        self.query_entry = tk.Entry(self, font=(config.MAIN_FONT_FAMILY, config.BODY_FONT_SIZE), bd=2, relief=tk.GROOVE)
+        self.query_entry.insert(0, initial_query)
+        self.query_entry.pack(fill=tk.X, padx=10, pady=10)
+        self.query_entry.bind("<KeyRelease>", lambda event: self._refresh_results()) # 입력할 때마다 검색.
+        self.query_entry.bind("<Return>", lambda event: self._select_result(0))      # Enter: 첫 결과로 이동.
+
+        # 결과 개수 안내 라벨.
+        self.status_label = tk.Label(self, text="", font=(config.MAIN_FONT_FAMILY, 10), fg="gray")
+        self.status_label.pack(anchor=tk.W, padx=10)
+
+        # 검색 결과 리스트박스.
+        result_frame = tk.Frame(self)
+        result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.result_listbox = tk.Listbox(result_frame, font=(config.MAIN_FONT_FAMILY, config.BODY_FONT_SIZE), bd=2, relief=tk.GROOVE)
+        result_scrollbar = tk.Scrollbar(result_frame, orient="vertical", command=self.result_listbox.yview)
+        self.result_listbox.config(yscrollcommand=result_scrollbar.set)
+        result_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.result_listbox.pack(fill=tk.BOTH, expand=True)
+        self.result_listbox.bind("<Double-Button-1>", lambda event: self._select_result())
+        self.result_listbox.bind("<Return>", lambda event: self._select_result())
+
+        self._refresh_results()
+        self.query_entry.focus_set()
+
+        self.wait_window(self) # 다이얼로그가 닫힐 때까지 대기.
+
+    def _refresh_results(self):
+        # 현재 검색어로 결과 목록을 다시 채움. (검색 색인을 만드는 중이면 잠시 뒤 다시 검색)
+        query = self.query_entry.get()
+        results = self.app_logic.search_todos_logic(query) if query.strip() else []
+        if results is None:
+            self.status_label.config(text="검색 색인을 준비하는 중입니다...")
+            if self._retry_id is None:
+                self._retry_id = self.after(config.SEARCH_INDEX_POLL_MS, self._retry_refresh)
+            return
+        self.results = results
+        self.result_listbox.delete(0, tk.END)
+        for date, _, text in self.results:
+            self.result_listbox.insert(tk.END, f"{date.strftime('%Y-%m-%d')}  {text}")
+        if not query.strip():
+            self.status_label.config(text="검색어를 입력해주세요.")
+        elif not self.results:
+            self.status_label.config(text="검색 결과가 없습니다.")
+        else:
+            self.status_label.config(text=f"검색 결과 {len(self.results)}개 (최근 날짜 순)")
+
+    def _retry_refresh(self):
+        # 검색 색인 준비를 기다린 뒤 다시 검색.
+        self._retry_id = None
+        self._refresh_results()
+
+    def destroy(self):
+        # 기다리던 재검색을 취소하고 다이얼로그를 닫음.
+        if self._retry_id is not None:
+            self.after_cancel(self._retry_id)
+            self._retry_id = None
+        super().destroy()
+
+    def _select_result(self, index=None):
+        # 선택된(또는 index번째) 결과의 날짜로 이동하고 다이얼로그를 닫음.
+        if index is None:
+            selection = self.result_listbox.curselection()
+            if not selection:
+                return
+            index = selection[0]
+        if index >= len(self.results):
+            return
+        date, todo_id, _ = self.results[index]
+        self.destroy()
+        self.on_select(date, todo_id)
+
+
+# === 달력 다이얼로그 클래스 ===
+# 한 달의 날짜별 할 일 요약(완료/전체 개수)을 격자로 보여주는 팝업 창
+# TodoManager가 유지하는 날짜별 요약만 읽으므로 할 일 목록을 불러오지 않으며, 날짜를 누르면 그 날짜로 이동
+class CalendarDialog(tk.Toplevel):
+    WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+    WEEK_ROWS = 6 # 한 달을 표시하는 최대 주 수.
+
+    def __init__(self, parent, todo_manager, on_select, title="달력"):
+        super().__init__(parent)
+        self.transient(parent)
+        self.grab_set()
+        self.title(title)
+        self.todo_manager = todo_manager # 날짜별 요약을 제공하는 TodoManager.
+        self.on_select = on_select       # 날짜 선택 시 호출할 함수 (날짜).
+        current_date = todo_manager.get_current_date()
+        self.year, self.month = current_date.year, current_date.month # 표시 중인 달.
+        self.day_buttons = []            # 재사용되는 날짜 버튼들 (WEEK_ROWS x 7).
+
+        self.resizable(False, False)
+
+        # 달 이동 버튼과 현재 달 라벨.
+        header_frame = tk.Frame(self)
+        header_frame.pack(fill=tk.X, padx=10, pady=10)
+        tk.Button(header_frame, text="◀", command=lambda: self._change_month(-1), font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white").pack(side=tk.LEFT)
+        tk.Button(header_frame, text="▶", command=lambda: self._change_month(1), font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white").pack(side=tk.RIGHT)
+        self.month_label = tk.Label(header_frame, text="", font=(config.MAIN_FONT_FAMILY, config.HEADING_FONT_SIZE_MEDIUM, "bold"))
+        self.month_label.pack(side=tk.LEFT, expand=True)
+
+        # 요일 머리글과 날짜 버튼 격자.
+        grid_frame = tk.Frame(self)
+        grid_frame.pack(padx=10, pady=(0, 10))
+        for column, weekday_name in enumerate(self.WEEKDAY_NAMES):
+            tk.Label(grid_frame, text=weekday_name, font=(config.MAIN_FONT_FAMILY, 10, "bold")).grid(row=0, column=column)
+        for index in range(self.WEEK_ROWS * 7):
+            button = tk.Button(grid_frame, width=6, height=2, font=(config.MAIN_FONT_FAMILY, 9))
+            button.grid(row=1 + index // 7, column=index % 7, padx=1, pady=1)
+            self.day_buttons.append(button)
+
+        # 색상 안내.
+        tk.Label(self, text="완료/전체  (진한 색: 남은 할 일 있음, 연한 색: 모두 완료)", font=(config.MAIN_FONT_FAMILY, 9), fg="gray").pack(pady=(0, 10))
+
+        self._refresh_days()
+
+        self.wait_window(self) # 다이얼로그가 닫힐 때까지 대기.
+
+    def _change_month(self, delta_months):
+        # 표시할 달을 delta_months만큼 이동.
+        month_index = self.year * 12 + (self.month - 1) + delta_months
+        self.year, self.month = divmod(month_index, 12)
+        self.month += 1
+        self._refresh_days()
+
+    def _refresh_days(self):
+        # 표시 중인 달의 요약으로 날짜 버튼들을 다시 설정.
+        self.month_label.config(text=f"{self.year}년 {self.month}월")
+        summaries = self.todo_manager.get_month_summaries(self.year, self.month)
+        current_date = self.todo_manager.get_current_date()
+        dates = [date for week in calendar.Calendar().monthdatescalendar(self.year, self.month) for date in week]
+        for index, button in enumerate(self.day_buttons):
+            date = dates[index] if index < len(dates) else None
+            if date is None or date.month != self.month: # 다른 달의 날짜는 비워 둠.
+                button.config(text="", state=tk.DISABLED, bg="lightgray", relief=tk.FLAT, command="")
+                continue
+            total, completed, pending = summaries.get(date, (0, 0, 0))
+            if not total:
+                text, bg, fg = f"{date.day}", "white", "black"
+            elif pending:
+                text, bg, fg = f"{date.day}\n{completed}/{total}", config.ACCENT_COLOR, "white"
+            else:
+                text, bg, fg = f"{date.day}\n{completed}/{total}", config.PRIMARY_COLOR, config.SECONDARY_TEXT_COLOR
+            button.config(text=text, state=tk.NORMAL, bg=bg, fg=fg,
+                          relief=tk.SUNKEN if date == current_date else tk.RAISED, # 현재 표시 날짜 강조.
+                          command=lambda d=date: self._select_date(d))
+
+    def _select_date(self, date):
+        # 날짜 버튼 클릭 시 호출.
+        self.destroy()
+        self.on_select(date)
+
+
+# === 통계 다이얼로그 ===
+# 완료율, 연속 달성 일수, 주별 경험치, 펫 종류별 평균 레벨을 보여주는 다이얼로그
+class StatsDialog(tk.Toplevel):
+    CHART_WIDTH = 420  # 주별 경험치 막대 그래프 너비.
+    CHART_HEIGHT = 160 # 주별 경험치 막대 그래프 높이.
+
+    def __init__(self, parent, report, title="통계"):
+        super().__init__(parent)
+        self.transient(parent)
+        self.grab_set()
+        self.title(title)
+        self.resizable(False, False)
+        heading_font = (config.MAIN_FONT_FAMILY, config.HEADING_FONT_SIZE_MEDIUM, "bold")
+        body_font = (config.MAIN_FONT_FAMILY, config.BODY_FONT_SIZE)
+
+        # 기간별 완료율 표.
+        tk.Label(self, text=f"할 일 완료율 ({report['date']} 기준)", font=heading_font).pack(anchor=tk.W, padx=10, pady=(10, 5))
+        table_frame = tk.Frame(self)
+        table_frame.pack(fill=tk.X, padx=20)
+        for row, (label, key) in enumerate([("오늘", 'today'), ("이번 주", 'week'), ("이번 달", 'month'), ("전체", 'overall')]):
+            summary = report[key]
+            tk.Label(table_frame, text=label, font=body_font, width=8, anchor=tk.W).grid(row=row, column=0, sticky=tk.W)
+            tk.Label(table_frame, text=f"{summary['completed']}/{summary['total']}", font=body_font, width=10, anchor=tk.E).grid(row=row, column=1)
+            tk.Label(table_frame, text=f"{summary['rate'] * 100:.0f}%", font=body_font, width=6, anchor=tk.E).grid(row=row, column=2)
+
+        # 연속 달성 일수.
+        tk.Label(self, text=f"연속 달성: {report['current_streak']}일 (최장 {report['longest_streak']}일)", font=body_font).pack(anchor=tk.W, padx=20, pady=(10, 0))
+
+        # 주별 획득 경험치 막대 그래프 (오래된 주부터).
+        tk.Label(self, text="주별 획득 경험치", font=heading_font).pack(anchor=tk.W, padx=10, pady=(15, 5))
+        chart = tk.Canvas(self, width=self.CHART_WIDTH, height=self.CHART_HEIGHT, bg="white", highlightthickness=0)
+        chart.pack(padx=10)
+        self._draw_weekly_chart(chart, report['weekly'])
+
+        # 펫 종류별 평균 최종 레벨.
+        tk.Label(self, text="펫 종류별 평균 최종 레벨", font=heading_font).pack(anchor=tk.W, padx=10, pady=(15, 5))
+        if report['species']:
+            for species, summary in report['species'].items():
+                tk.Label(self, text=f"{species}: {summary['count']}마리, 평균 레벨 {summary['average_level']:.1f}", font=body_font).pack(anchor=tk.W, padx=20)
+        else:
+            tk.Label(self, text="아직 과거 펫 기록이 없습니다.", font=body_font, fg="gray").pack(anchor=tk.W, padx=20)
+
+        tk.Button(self, text="닫기", command=self.destroy, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white").pack(pady=10)
+
+        self.wait_window(self) # 다이얼로그가 닫힐 때까지 대기.
+
+    def _draw_weekly_chart(self, chart, weekly):
+        # 주마다 막대 하나 (위: 경험치, 아래: 주 시작일).
+        max_exp = max((week['exp'] for week in weekly), default=0) or 1
+        slot_width = self.CHART_WIDTH / max(len(weekly), 1)
+        bar_bottom, bar_top = self.CHART_HEIGHT - 20, 20
+        for index, week in enumerate(weekly):
+            left = index * slot_width + slot_width * 0.2
+            right = (index + 1) * slot_width - slot_width * 0.2
+            top = bar_bottom - (bar_bottom - bar_top) * week['exp'] / max_exp
+            chart.create_rectangle(left, top, right, bar_bottom, fill=config.ACCENT_COLOR, outline="")
+            chart.create_text((left + right) / 2, top - 8, text=str(week['exp']), font=(config.MAIN_FONT_FAMILY, 8))
+            chart.create_text((left + right) / 2, bar_bottom + 10, text=week['start'].strftime("%m/%d"), font=(config.MAIN_FONT_FAMILY, 8), fill="gray")
+
+
 # === 주 애플리케이션 GUI 클래스 ===
 # Pet-Do-List 앱의 메인 GUI를 생성하고 관리하는 클래스
 class PetDoListGUI:
@@ -181,7 +495,17 @@ class PetDoListGUI:
         self.master = master     # Tkinter 루트(메인) 창.
         self.app_logic = app_logic # 메인 앱 로직(main.py) 인스턴스.
         
-        self.pet_image_cache = {} # 펫 이미지 캐시 (성능 최적화).
+        self.pet_image_cache = ImageCache() # 펫 이미지 LRU 캐시 (개수/바이트 크기 제한).
+        self._error_images = {}             # 크기별 에러 이미지 (캐시 제거 대상 아님).
+        self._prewarmed_images = {}         # 백그라운드에서 미리 디코딩된 PIL 이미지 (캐시 키 -> 이미지).
+        self._prewarm_in_progress = set()   # 미리 디코딩 중인 캐시 키.
+        self._prewarm_lock = threading.Lock()
+
+        # 마지막으로 화면에 그린 상태 (변경된 위젯만 갱신하기 위해 사용).
+        self._rendered_widget_options = {}       # (위젯, 옵션) -> 마지막 설정 값.
+        self._rendered_pet_image_filename = None # 현재 표시 중인 펫 이미지 파일명.
+        self._rendered_todo_rows = None          # 리스트박스에 표시된 (id, 문자열, 완료 여부) 행들. None이면 전체 다시 그리기.
+        self._todo_row_positions = {}            # 표시된 할 일 id -> 리스트박스 행 위치.
         
         self._create_widgets() # 모든 GUI 위젯 생성.
         self._setup_layout()   # 생성된 위젯들을 화면에 배치.
@@ -231,13 +555,22 @@ class PetDoListGUI:
         self.current_date_label = tk.Label(self.date_nav_frame, text="----년 --월 --일", font=(config.MAIN_FONT_FAMILY, config.HEADING_FONT_SIZE_MEDIUM, "bold"), bg=config.BG_COLOR, fg=config.SECONDARY_TEXT_COLOR)
         self.prev_day_button = tk.Button(self.date_nav_frame, text="◀ 이전 날짜", command=lambda: self.app_logic.change_date_logic(-1), font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white")
         self.next_day_button = tk.Button(self.date_nav_frame, text="다음 날짜 ▶", command=lambda: self.app_logic.change_date_logic(1), font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white")
+
+        # 모든 날짜의 할 일 검색 입력 엔트리와 버튼.
+        self.search_frame = tk.Frame(self.right_panel, bg=config.BG_COLOR)
+        self.search_entry = tk.Entry(self.search_frame, font=(config.MAIN_FONT_FAMILY, config.BODY_FONT_SIZE), bd=2, relief=tk.GROOVE)
+        self.search_entry.bind("<Return>", lambda event: self.show_todo_search()) # Enter로 검색.
+        self.search_button = tk.Button(self.search_frame, text="검색", command=self.show_todo_search, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white")
+        self.calendar_button = tk.Button(self.search_frame, text="달력", command=self.show_calendar, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white")
+        self.stats_button = tk.Button(self.search_frame, text="통계", command=self.show_stats, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE), bg=config.PRIMARY_COLOR, fg="white")
         
         # "오늘 할 일" 라벨.
         self.todo_label = tk.Label(self.right_panel, text="오늘 할 일", font=(config.MAIN_FONT_FAMILY, config.HEADING_FONT_SIZE_LARGE, "bold"), bg=config.BG_COLOR, fg=config.SECONDARY_TEXT_COLOR)
         # 할 일 목록을 표시할 리스트박스.
-        self.todo_listbox = tk.Listbox(self.right_panel, height=10, font=(config.MAIN_FONT_FAMILY, config.BODY_FONT_SIZE), selectmode=tk.SINGLE, bd=2, relief=tk.GROOVE)
+        self.todo_listbox = tk.Listbox(self.right_panel, height=10, font=(config.MAIN_FONT_FAMILY, config.BODY_FONT_SIZE), selectmode=tk.EXTENDED, bd=2, relief=tk.GROOVE)
         self.todo_scrollbar = tk.Scrollbar(self.right_panel, orient="vertical", command=self.todo_listbox.yview) # 리스트박스 스크롤바.
         self.todo_listbox.config(yscrollcommand=self.todo_scrollbar.set)
+        self.todo_listbox.bind("<Double-Button-1>", lambda event: self.edit_selected_todo()) # 더블클릭으로 할 일 수정.
         
         # 새 할 일 입력 엔트리.
         self.todo_entry = tk.Entry(self.right_panel, font=(config.MAIN_FONT_FAMILY, config.BODY_FONT_SIZE), bd=2, relief=tk.GROOVE)
@@ -245,6 +578,7 @@ class PetDoListGUI:
         self.add_todo_button = tk.Button(self.right_panel, text="할 일 추가", command=self.add_todo_from_entry, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE, "bold"), bg=config.PRIMARY_COLOR, fg="white")
         self.complete_todo_button = tk.Button(self.right_panel, text="할 일 완료", command=self.complete_selected_todo, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE, "bold"), bg=config.PRIMARY_COLOR, fg="white")
         self.remove_todo_button = tk.Button(self.right_panel, text="할 일 삭제", command=self.remove_selected_todo, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE, "bold"), bg="red", fg="white")
+        self.postpone_todo_button = tk.Button(self.right_panel, text="내일로 미루기", command=self.postpone_selected_todos, font=(config.MAIN_FONT_FAMILY, config.BUTTON_FONT_SIZE, "bold"), bg=config.PRIMARY_COLOR, fg="white")
 
         # 간식 인벤토리 라벨.
         self.snack_inventory_label = tk.Label(self.right_panel, text="간식 인벤토리", font=(config.MAIN_FONT_FAMILY, config.HEADING_FONT_SIZE_LARGE, "bold"), bg=config.BG_COLOR, fg=config.SECONDARY_TEXT_COLOR)
@@ -293,6 +627,12 @@ class PetDoListGUI:
         self.current_date_label.pack(side=tk.LEFT, expand=True) # 현재 날짜 라벨.
         self.next_day_button.pack(side=tk.RIGHT, padx=5)   # 다음 날짜 버튼.
 
+        self.search_frame.pack(fill=tk.X, pady=(0, 5))     # 할 일 검색 프레임 배치.
+        self.stats_button.pack(side=tk.RIGHT, padx=5)      # 통계 버튼.
+        self.calendar_button.pack(side=tk.RIGHT, padx=5)   # 달력 버튼.
+        self.search_button.pack(side=tk.RIGHT, padx=5)     # 검색 버튼.
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5) # 검색어 엔트리.
+
         self.todo_label.pack(pady=10)                     # 할 일 라벨.
         self.todo_scrollbar.pack(side=tk.RIGHT, fill=tk.Y) # 할 일 리스트 스크롤바.
         self.todo_listbox.pack(fill=tk.BOTH, expand=True, pady=5) # 할 일 리스트박스.
@@ -305,13 +645,16 @@ class PetDoListGUI:
         self.add_todo_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
         self.complete_todo_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
         self.remove_todo_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+        self.postpone_todo_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
         
         self.snack_inventory_label.pack(pady=(20, 10)) # 간식 인벤토리 라벨.
         self.snack_list_label.pack(pady=5)             # 간식 목록 라벨.
 
+    @traced("gui.load_pet_image", "image")
     def load_pet_image(self, image_filename, size=(300, 300)):
         """
         펫 이미지를 로드하고 캐싱하여 반환합니다. 이미 로드된 이미지는 캐시에서 가져옴.
+        백그라운드에서 미리 디코딩해 둔 이미지가 있으면 디코딩/리사이즈 없이 사용합니다.
         Args:
             image_filename (str): 이미지 파일명.
             size (tuple): 이미지 리사이즈 크기 (너비, 높이).
@@ -319,45 +662,120 @@ class PetDoListGUI:
             ImageTk.PhotoImage: 로드된/캐시된 이미지 객체.
         """
         image_path_key = f"{image_filename}_{size[0]}x{size[1]}" # 캐시 키 생성 (파일명 + 크기).
-        
-        if image_path_key not in self.pet_image_cache: # 캐시에 없는 이미지일 경우.
-            full_path = ""
+        cached_image = self.pet_image_cache.get(image_path_key)
+        if cached_image is not None: # 캐시에 있는 이미지일 경우.
+            return cached_image
+
+        full_path = os.path.join(config.RESOURCES_PATH, config.PET_IMAGES_SUBFOLDER, image_filename)
+        try:
+            with self._prewarm_lock:
+                resized_image = self._prewarmed_images.pop(image_path_key, None) # 미리 디코딩된 이미지.
+            if resized_image is None:
+                resized_image = _decode_pet_image(image_filename, size)
+            photo_image = ImageTk.PhotoImage(resized_image)
+            self.pet_image_cache.put(image_path_key, photo_image, size[0] * size[1] * 4) # RGBA 기준 크기로 캐시.
+            return photo_image
+        except FileNotFoundError: # 이미지 파일을 찾을 수 없을 경우.
+            log.warning("이미지 파일 '%s'을 찾을 수 없습니다.", full_path)
+            return self._get_error_image(size) # 에러 이미지 반환.
+        except Exception as e: # 이미지 로드 중 기타 예외 발생.
+            log.error("이미지 로드 중 오류 발생 (%s): %s", full_path, e)
+            return None # 이미지 로드 실패 시 None 반환.
+
+    def _get_error_image(self, size):
+        """이미지 파일이 없을 때 표시할 에러 이미지를 크기별로 한 번만 만들어 반환합니다."""
+        if size not in self._error_images: # 에러 이미지도 캐시 (LRU 제거 대상 아님).
+            error_image_path = os.path.join(config.RESOURCES_PATH, "no_image.png") # 기본 에러 이미지 경로.
+            try: # 에러 이미지 로드 시도.
+                with Image.open(error_image_path) as error_img_orig:
+                    error_img_resized = error_img_orig.resize(size, Image.Resampling.LANCZOS)
+                self._error_images[size] = ImageTk.PhotoImage(error_img_resized)
+            except FileNotFoundError: # 에러 이미지조차 없는 경우 투명한 빈 이미지 생성.
+                log.warning("기본 에러 이미지 파일 '%s'도 찾을 수 없습니다. 빈 이미지로 처리합니다.", error_image_path)
+                empty_img = Image.new('RGBA', size, (0, 0, 0, 0)) # 투명한 이미지.
+                self._error_images[size] = ImageTk.PhotoImage(empty_img)
+            except Exception as e: # 에러 이미지 로드 중 다른 예외 발생.
+                log.error("에러 이미지 로드 중 오류 발생: %s. 빈 이미지로 처리합니다.", e)
+                empty_img = Image.new('RGBA', size, (0, 0, 0, 0))
+                self._error_images[size] = ImageTk.PhotoImage(empty_img)
+        return self._error_images[size]
+
+    def prewarm_pet_images(self, species, level, size=(300, 300)):
+        """
+        현재 펫 종류의 현재 레벨 주변(±IMAGE_PREWARM_LEVEL_RANGE) 이미지를 백그라운드 스레드에서 미리 디코딩합니다.
+        레벨업 시 load_pet_image가 파일 디코딩/리사이즈를 기다리지 않도록 하기 위함입니다.
+        (PhotoImage 생성은 Tk 스레드에서만 가능하므로 load_pet_image 호출 시 수행)
+        """
+        targets = []
+        low = max(config.INITIAL_PET_LEVEL, level - config.IMAGE_PREWARM_LEVEL_RANGE)
+        high = min(config.MAX_PET_LEVEL, level + config.IMAGE_PREWARM_LEVEL_RANGE)
+        with self._prewarm_lock:
+            for target_level in range(low, high + 1):
+                image_filename = f"{species}_level{target_level}.png"
+                image_path_key = f"{image_filename}_{size[0]}x{size[1]}"
+                if (image_path_key in self.pet_image_cache or image_path_key in self._prewarmed_images
+                        or image_path_key in self._prewarm_in_progress):
+                    continue
+                self._prewarm_in_progress.add(image_path_key)
+                targets.append((image_path_key, image_filename))
+        if targets:
+            threading.Thread(target=self._prewarm_worker, args=(targets, size), daemon=True).start()
+
+    def _prewarm_worker(self, targets, size):
+        """백그라운드 스레드에서 이미지들을 디코딩/리사이즈하여 보관합니다."""
+        for image_path_key, image_filename in targets:
             try:
-                # 이미지 파일의 전체 경로 생성 및 이미지 로드, 리사이즈.
-                full_path = os.path.join(config.RESOURCES_PATH, config.PET_IMAGES_SUBFOLDER, image_filename)
-                print(f"DEBUG: 이미지 로드 시도 경로: {full_path}") # 디버그 출력.
-                original_image = Image.open(full_path)
-                resized_image = original_image.resize(size, Image.Resampling.LANCZOS) # 고품질 리사이징.
-                self.pet_image_cache[image_path_key] = ImageTk.PhotoImage(resized_image) # 캐시에 저장.
-            except FileNotFoundError: # 이미지 파일을 찾을 수 없을 경우.
-                print(f"이미지 파일 '{full_path}'을 찾을 수 없습니다.")
-                if 'error_image' not in self.pet_image_cache: # 에러 이미지도 캐시.
-                    error_image_path = os.path.join(config.RESOURCES_PATH, "no_image.png") # 기본 에러 이미지 경로.
-                    try: # 에러 이미지 로드 시도.
-                        error_img_orig = Image.open(error_image_path)
-                        error_img_resized = error_img_orig.resize(size, Image.Resampling.LANCZOS)
-                        self.pet_image_cache['error_image'] = ImageTk.PhotoImage(error_img_resized)
-                    except FileNotFoundError: # 에러 이미지조차 없는 경우 투명한 빈 이미지 생성.
-                        print(f"기본 에러 이미지 파일 '{error_image_path}'도 찾을 수 없습니다. 빈 이미지로 처리합니다.")
-                        empty_img = Image.new('RGBA', size, (0, 0, 0, 0)) # 투명한 이미지.
-                        self.pet_image_cache['error_image'] = ImageTk.PhotoImage(empty_img)
-                    except Exception as e: # 에러 이미지 로드 중 다른 예외 발생.
-                        print(f"에러 이미지 로드 중 오류 발생: {e}. 빈 이미지로 처리합니다.")
-                        empty_img = Image.new('RGBA', size, (0, 0, 0, 0))
-                        self.pet_image_cache['error_image'] = ImageTk.PhotoImage(empty_img)
-                return self.pet_image_cache['error_image'] # 에러 이미지 반환.
-            except Exception as e: # 이미지 로드 중 기타 예외 발생.
-                print(f"이미지 로드 중 오류 발생 ({full_path}): {e}")
-                return None # 이미지 로드 실패 시 None 반환.
-        return self.pet_image_cache[image_path_key] # 캐시된 이미지 반환.
-
-    def update_gui_with_pet_data(self):
-        """main.py의 펫 데이터를 기반으로 GUI를 업데이트합니다."""
-
+                resized_image = _decode_pet_image(image_filename, size)
+            except Exception as e: # 파일이 없으면 실제 표시 시점에 에러 이미지로 처리됨.
+                log.warning("이미지 미리 로드 중 오류 발생 (%s): %s", image_filename, e)
+                resized_image = None
+            with self._prewarm_lock:
+                self._prewarm_in_progress.discard(image_path_key)
+                if resized_image is not None:
+                    self._prewarmed_images[image_path_key] = resized_image
+
+    @traced("gui.update_gui_with_pet_data", "gui")
+    def update_gui_with_pet_data(self, changes=None):
+        """
+        main.py의 펫 데이터를 기반으로 GUI를 업데이트합니다.
+        변경된 부분이 주어지면 해당 위젯만 갱신하고, 없으면 모든 위젯을 처음부터 다시 그립니다.
+        Args:
+            changes (set, optional): 변경된 부분들. PART_PET, PART_SNACKS, PART_DATE,
+                                     PART_TODOS(할 일 목록 전체) 또는 (PART_TODO, todo_id)(할 일 하나).
+        """
+        if changes is None: # 전체 다시 그리기.
+            changes = {PART_PET, PART_SNACKS, PART_DATE, PART_TODOS}
+            self._rendered_todo_rows = None
+
+        if PART_PET in changes:
+            self._update_pet_widgets()
+        if PART_DATE in changes:
+            # 현재 표시 날짜 업데이트.
+            current_display_date = self.app_logic.todo_manager.get_current_date()
+            self._set_widget_option(self.current_date_label, 'text', current_display_date.strftime("%Y년 %m월 %d일"))
+        if PART_TODOS in changes:
+            with span("gui.update_todo_rows", "gui"):
+                self._update_todo_rows()
+        else:
+            for change in changes:
+                if isinstance(change, tuple) and change[0] == PART_TODO:
+                    self._update_todo_row(change[1])
+        if PART_SNACKS in changes:
+            self._update_snack_widgets()
+
+    def _set_widget_option(self, widget, option, value):
+        """위젯 옵션 값이 마지막으로 설정한 값과 다를 때만 변경합니다. (불필요한 다시 그리기 방지)"""
+        key = (str(widget), option)
+        if self._rendered_widget_options.get(key) != value:
+            widget[option] = value
+            self._rendered_widget_options[key] = value
+
+    def _update_pet_widgets(self):
+        """펫 이름, 종류/레벨, 경험치, 이미지, 게이지를 갱신합니다."""
         pet = self.app_logic.pet # 현재 펫 객체 가져오기.
         if pet: # 펫 데이터가 존재할 경우.
-            self.pet_name_label.config(text=f"이름: {pet.name}")
-            self.pet_species_level_label.config(text=f"종류: {pet.species} / Lv. {pet.level}")
+            self._set_widget_option(self.pet_name_label, 'text', f"이름: {pet.name}")
+            self._set_widget_option(self.pet_species_level_label, 'text', f"종류: {pet.species} / Lv. {pet.level}")
             
             # 펫 경험치 표시 업데이트.
             if pet.level >= config.MAX_PET_LEVEL: # 최대 레벨일 경우.
@@ -366,45 +784,99 @@ class PetDoListGUI:
                 required_exp = pet.get_required_exp_for_level_up()
                 exp_display_text = f"EXP: {pet.exp}/{required_exp}"
             
-            self.exp_label.config(text=exp_display_text) 
+            self._set_widget_option(self.exp_label, 'text', exp_display_text)
 
-            # 펫 이미지 업데이트.
+            # 펫 이미지 업데이트 (종류나 레벨이 바뀐 경우에만).
             image_filename = f"{pet.species}_level{pet.level}.png" 
-            pet_image = self.load_pet_image(image_filename) 
+            if self._rendered_pet_image_filename != image_filename:
+                pet_image = self.load_pet_image(image_filename) 
 
-            if pet_image:
-                self.pet_photo_label.config(image=pet_image)
-                self.pet_photo_label.image = pet_image # GC 방지용 참조.
-            else:
-                self.pet_photo_label.config(image='') # 이미지 없을 경우 공백.
+                if pet_image:
+                    self.pet_photo_label.config(image=pet_image)
+                    self.pet_photo_label.image = pet_image # GC 방지용 참조.
+                else:
+                    self.pet_photo_label.config(image='') # 이미지 없을 경우 공백.
+                self._rendered_pet_image_filename = image_filename
+                self.prewarm_pet_images(pet.species, pet.level) # 다음 레벨 이미지 등을 미리 디코딩.
 
             # 행복도, 포만감 게이지 업데이트.
-            self.happiness_bar['value'] = pet.happiness
-            self.happiness_bar['maximum'] = pet.max_happiness
-            self.fullness_bar['value'] = pet.fullness
-            self.fullness_bar['maximum'] = pet.max_fullness
+            self._set_widget_option(self.happiness_bar, 'maximum', pet.max_happiness)
+            self._set_widget_option(self.happiness_bar, 'value', pet.happiness)
+            self._set_widget_option(self.fullness_bar, 'maximum', pet.max_fullness)
+            self._set_widget_option(self.fullness_bar, 'value', pet.fullness)
         else: # 펫 데이터가 없을 경우 (초기 상태).
-            self.pet_name_label.config(text="이름: ---")
-            self.pet_species_level_label.config(text="종류: --- / Lv. --")
-            self.exp_label.config(text="EXP: --/--") 
+            self._set_widget_option(self.pet_name_label, 'text', "이름: ---")
+            self._set_widget_option(self.pet_species_level_label, 'text', "종류: --- / Lv. --")
+            self._set_widget_option(self.exp_label, 'text', "EXP: --/--")
             self.pet_photo_label.config(image='') 
-            self.happiness_bar['value'] = 0
-            self.fullness_bar['value'] = 0
-
-        # 현재 표시 날짜 업데이트.
-        current_display_date = self.app_logic.todo_manager.get_current_date()
-        self.current_date_label.config(text=current_display_date.strftime("%Y년 %m월 %d일"))
-        
-        # 할 일 목록 업데이트.
-        self.todo_listbox.delete(0, tk.END) # 기존 목록 모두 삭제.
+            self._rendered_pet_image_filename = None
+            self._set_widget_option(self.happiness_bar, 'value', 0)
+            self._set_widget_option(self.fullness_bar, 'value', 0)
+
+    @staticmethod
+    def _make_todo_row(todo):
+        """할 일 하나를 리스트박스 행 (id, 표시 문자열, 완료 여부)로 변환합니다."""
+        display_text = f"[{'✅' if todo.completed else '☐'}] {todo.text}" # 완료 여부에 따른 체크 표시.
+        return todo.id, display_text, todo.completed
+
+    def _insert_todo_row(self, index, row):
+        """리스트박스의 index 위치에 할 일 행을 삽입합니다."""
+        _, display_text, completed = row
+        self.todo_listbox.insert(index, display_text)
+        if completed: # 완료된 할 일은 회색으로 표시.
+            self.todo_listbox.itemconfig(index, {'fg': 'gray'})
+
+    def _update_todo_rows(self):
+        """
+        할 일 목록을 현재 표시된 행들과 비교하여 달라진 구간만 삭제/삽입합니다.
+        (앞뒤로 같은 행들은 그대로 두므로 추가/삭제 한 건은 한두 행만 갱신)
+        """
         todos = self.app_logic.todo_manager.get_current_date_todos() # 현재 날짜 할 일 가져오기.
-        for i, todo in enumerate(todos): # 각 할 일 목록에 추가.
-            display_text = f"[{'✅' if todo['completed'] else '☐'}] {todo['text']}" # 완료 여부에 따른 체크 표시.
-            self.todo_listbox.insert(tk.END, display_text)
-            if todo['completed']: # 완료된 할 일은 회색으로 표시.
-                self.todo_listbox.itemconfig(tk.END, {'fg': 'gray'}) 
+        new_rows = [self._make_todo_row(todo) for todo in todos]
+        old_rows = self._rendered_todo_rows
 
-        # 간식 인벤토리 업데이트.
+        if old_rows is None: # 전체 다시 그리기.
+            self.todo_listbox.delete(0, tk.END) # 기존 목록 모두 삭제.
+            for i, row in enumerate(new_rows):
+                self._insert_todo_row(i, row)
+        else:
+            # 앞쪽과 뒤쪽의 공통 구간을 찾아 가운데 달라진 구간만 교체.
+            common_limit = min(len(old_rows), len(new_rows))
+            prefix = 0
+            while prefix < common_limit and old_rows[prefix] == new_rows[prefix]:
+                prefix += 1
+            suffix = 0
+            while suffix < common_limit - prefix and old_rows[-1 - suffix] == new_rows[-1 - suffix]:
+                suffix += 1
+            old_end = len(old_rows) - suffix
+            new_end = len(new_rows) - suffix
+            if old_end > prefix:
+                self.todo_listbox.delete(prefix, old_end - 1)
+            for i in range(prefix, new_end):
+                self._insert_todo_row(i, new_rows[i])
+        self._rendered_todo_rows = new_rows
+        self._todo_row_positions = {row[0]: i for i, row in enumerate(new_rows)}
+
+    def _update_todo_row(self, todo_id):
+        """할 일 하나(todo_id)의 행만 갱신합니다. 현재 화면에 없는 할 일이면 무시합니다."""
+        if self._rendered_todo_rows is None:
+            self._update_todo_rows()
+            return
+        index = self._todo_row_positions.get(todo_id)
+        todo = self.app_logic.todo_manager.get_todo(todo_id)
+        if index is None or todo is None:
+            return
+        row = self._make_todo_row(todo)
+        if row != self._rendered_todo_rows[index]:
+            was_selected = self.todo_listbox.selection_includes(index)
+            self.todo_listbox.delete(index)
+            self._insert_todo_row(index, row)
+            if was_selected: # 갱신된 행의 선택 상태 유지.
+                self.todo_listbox.selection_set(index)
+            self._rendered_todo_rows[index] = row
+
+    def _update_snack_widgets(self):
+        """간식 인벤토리 라벨을 갱신합니다."""
         snack_counts = self.app_logic.todo_manager.get_current_snack_counts() # 현재 간식 개수 가져오기.
         snack_text_parts = []
         for snack_name, count in snack_counts.items():
@@ -414,7 +886,7 @@ class PetDoListGUI:
         snack_text = ", ".join(snack_text_parts) # 간식 목록 문자열 생성.
         if not snack_text: # 간식이 하나도 없을 경우.
             snack_text = "보유 간식이 없습니다."
-        self.snack_list_label.config(text=snack_text) # 간식 라벨 업데이트.
+        self._set_widget_option(self.snack_list_label, 'text', snack_text) # 간식 라벨 업데이트.
         
     def add_todo_from_entry(self):
         """엔트리에 입력된 할 일을 추가합니다."""
@@ -424,25 +896,68 @@ class PetDoListGUI:
         else:
             messagebox.showerror("입력 오류", "할 일 내용을 입력해주세요.", parent=self.master)
 
+    def _selected_todo_ids(self):
+        """리스트박스에서 선택된 행들의 할 일 id 리스트를 반환합니다."""
+        rows = self._rendered_todo_rows or []
+        return [rows[index][0] for index in self.todo_listbox.curselection() if index < len(rows)]
+
     def complete_selected_todo(self):
-        """선택된 할 일을 완료 처리합니다."""
-        selected_indices = self.todo_listbox.curselection() # 리스트박스에서 선택된 인덱스.
-        if selected_indices:
-            index = selected_indices[0]
-            self.app_logic.complete_todo_logic(index) # app_logic을 통해 할 일 완료 처리.
+        """선택된 할 일들을 한 번에 완료 처리합니다. (Shift/Ctrl로 여러 개 선택 가능)"""
+        selected_ids = self._selected_todo_ids() # 선택된 할 일 id들.
+        if selected_ids:
+            self.app_logic.complete_todos_logic(selected_ids) # app_logic을 통해 할 일 일괄 완료 처리.
         else:
             messagebox.showinfo("선택 오류", "완료할 할 일을 선택해주세요.", parent=self.master)
 
     def remove_selected_todo(self):
-        """선택된 할 일을 삭제 처리합니다."""
-        selected_indices = self.todo_listbox.curselection() # 리스트박스에서 선택된 인덱스.
-        if selected_indices:
-            index = selected_indices[0]
-            if messagebox.askyesno("삭제 확인", "선택된 할 일을 삭제하시겠습니까?", parent=self.master): # 사용자 확인.
-                self.app_logic.remove_todo_logic(index) # app_logic을 통해 할 일 삭제 처리.
+        """선택된 할 일들을 한 번에 삭제 처리합니다. (삭제 확인은 app_logic에서)"""
+        selected_ids = self._selected_todo_ids() # 선택된 할 일 id들.
+        if selected_ids:
+            self.app_logic.remove_todos_logic(selected_ids) # app_logic을 통해 할 일 일괄 삭제 처리.
         else:
             messagebox.showinfo("선택 오류", "삭제할 할 일을 선택해주세요.", parent=self.master)
 
+    def postpone_selected_todos(self):
+        """선택된 할 일들을 다음 날짜로 옮깁니다."""
+        selected_ids = self._selected_todo_ids() # 선택된 할 일 id들.
+        if selected_ids:
+            self.app_logic.move_todos_logic(selected_ids, 1) # app_logic을 통해 할 일 일괄 이동.
+        else:
+            messagebox.showinfo("선택 오류", "미룰 할 일을 선택해주세요.", parent=self.master)
+
+    def edit_selected_todo(self):
+        """선택된 할 일 하나의 내용을 입력창으로 수정합니다. (리스트박스 더블클릭)"""
+        selected_ids = self._selected_todo_ids()
+        if len(selected_ids) != 1:
+            return
+        todo = self.app_logic.todo_manager.get_todo(selected_ids[0])
+        new_text = simpledialog.askstring("할 일 수정", "할 일 내용을 수정해주세요:", initialvalue=todo.text, parent=self.master)
+        if new_text is not None and new_text.strip() != todo.text: # 취소하거나 바뀌지 않았으면 무시.
+            self.app_logic.edit_todo_logic(selected_ids[0], new_text)
+
+    def show_todo_search(self):
+        """할 일 검색 다이얼로그를 표시합니다. 검색 엔트리의 내용이 초기 검색어가 됩니다."""
+        TodoSearchDialog(self.master, self.app_logic, self.go_to_todo, initial_query=self.search_entry.get())
+
+    def show_calendar(self):
+        """달력 다이얼로그를 표시합니다. 날짜를 고르면 그 날짜로 이동합니다."""
+        CalendarDialog(self.master, self.app_logic.todo_manager, self.app_logic.go_to_date_logic)
+
+    def show_stats(self):
+        """통계 다이얼로그를 표시합니다."""
+        report = self.app_logic.get_stats_logic()
+        if report is not None:
+            StatsDialog(self.master, report)
+
+    def go_to_todo(self, date, todo_id):
+        """지정한 날짜로 이동한 뒤 해당 할 일 행을 선택하고 보이게 합니다."""
+        self.app_logic.go_to_date_logic(date)
+        index = self._todo_row_positions.get(todo_id)
+        if index is not None:
+            self.todo_listbox.selection_clear(0, tk.END)
+            self.todo_listbox.selection_set(index)
+            self.todo_listbox.see(index)
+
     def show_pet_species_selection(self, species_list, dialog_title="펫 종류 선택"):
         """펫 종류 선택 다이얼로그를 표시하고 결과를 반환합니다."""
         dialog = PetSpeciesSelectionDialog(self.master, species_list, dialog_title)
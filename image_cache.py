@@ -0,0 +1,83 @@
+# image_cache.py
+
+# 크기가 제한된 LRU(가장 오래전에 사용된 항목부터 제거) 이미지 캐시 모듈.
+# 항목 개수와 디코딩된 이미지의 바이트 크기 두 가지 기준으로 용량을 제한하고, 적중/실패 통계를 제공합니다.
+
+from collections import OrderedDict # 사용 순서를 유지하는 딕셔너리.
+
+from config import IMAGE_CACHE_MAX_ENTRIES, IMAGE_CACHE_MAX_BYTES # 캐시 용량 설정.
+
+class ImageCache:
+    """
+    항목 개수와 바이트 크기로 제한되는 LRU 캐시 클래스.
+    가장 최근에 사용된 항목이 끝쪽에 위치하며, 용량을 넘으면 앞쪽(오래된) 항목부터 제거합니다.
+    """
+    def __init__(self, max_entries=IMAGE_CACHE_MAX_ENTRIES, max_bytes=IMAGE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries # 최대 항목 개수.
+        self.max_bytes = max_bytes     # 최대 총 바이트 크기 (디코딩된 이미지 기준).
+        self._entries = OrderedDict()  # key -> (value, size_bytes)
+        self.total_bytes = 0           # 현재 보관 중인 총 바이트 크기.
+
+        # 통계.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        캐시에서 값을 가져옵니다. 적중 시 해당 항목을 최근 사용으로 갱신합니다.
+        Returns:
+            object or None: 캐시된 값 또는 없을 경우 None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, size_bytes):
+        """
+        값을 캐시에 저장하고, 용량을 넘으면 오래된 항목부터 제거합니다.
+        Args:
+            key (hashable): 캐시 키.
+            value (object): 저장할 값.
+            size_bytes (int): 값의 크기 (예: 너비 * 높이 * 4).
+        """
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size_bytes)
+        self.total_bytes += size_bytes
+        # 방금 넣은 항목 하나는 용량을 넘더라도 유지.
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        """모든 항목을 제거합니다. (통계는 유지)"""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def get_stats(self):
+        """
+        캐시 통계를 반환합니다.
+        Returns:
+            dict: 적중/실패/제거 횟수, 적중률, 현재 항목 수와 바이트 크기.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+        }
@@ -0,0 +1,271 @@
+# instrumentation.py
+
+# 진단 로그와 시간 측정(트레이스) 모듈.
+# - 로그: 모듈마다 get_logger("모듈 이름")로 표준 logging 로거(pet_do_list.<모듈>)를 받아 레벨별로 기록합니다.
+#   메시지는 log.debug("할 일 추가 (%s): %s", date, text)처럼 인자를 따로 넘겨, 꺼진 레벨은 문자열을 만들지 않습니다.
+#   레벨은 config.LOG_LEVEL (DEBUG_MODE면 DEBUG)이며 configure_logging()을 호출한 프로그램에서만 출력됩니다.
+#   기본 설정(LOG_ASYNC)에서는 레코드를 큐에 넣기만 하고, 메시지 조립과 출력은 백그라운드 스레드가 합니다.
+#   같은 DEBUG/INFO 메시지가 짧은 시간에 반복되면 일부만 출력하고(LOG_RATE_LIMIT_*), 모듈별로 레벨을 바꾸거나 끌 수 있습니다.
+# - 트레이스: span("이름")으로 감싼 구간의 시작 시각과 걸린 시간을 모아 Chrome 트레이스 JSON
+#   (chrome://tracing, https://ui.perfetto.dev 에서 열기)으로 내보냅니다. 꺼져 있으면 아무것도 기록하지 않습니다.
+
+import os          # 프로세스 id (트레이스).
+import sys         # 로그 출력 스트림.
+import json        # 트레이스 파일, JSON 로그 형식.
+import time        # 구간 시간 측정.
+import logging     # 레벨별 로그.
+import threading   # 스레드 id, 이벤트 목록 보호.
+import functools   # traced 데코레이터.
+import queue       # 비동기 로그 큐.
+import atexit      # 종료 시 남은 로그 출력.
+import logging.handlers # QueueHandler, QueueListener.
+from collections import deque # 최근 트레이스 이벤트만 보관.
+
+from config import LOG_LEVEL, LOG_FORMAT, TRACE_ENABLED, TRACE_MAX_EVENTS
+from config import LOG_ASYNC, LOG_RATE_LIMIT_SECONDS, LOG_RATE_LIMIT_BURST, LOG_MODULE_LEVELS, LOG_DISABLED_MODULES
+
+ROOT_LOGGER_NAME = "pet_do_list" # 모든 모듈 로거의 상위 로거 이름.
+
+def get_logger(module_name):
+    """
+    모듈 로거를 반환합니다.
+    Args:
+        module_name (str): 모듈 이름 (예: "todo_manager"). 로거 이름은 "pet_do_list.todo_manager".
+    """
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{module_name}")
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드 하나를 JSON 한 줄로 만듭니다. (시각, 레벨, 모듈, 메시지, extra={'fields': {...}}의 필드)"""
+    def format(self, record):
+        entry = {'time': self.formatTime(record, "%Y-%m-%dT%H:%M:%S"), 'level': record.levelname,
+                 'module': record.name.rpartition('.')[2], 'message': record.getMessage()}
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text: # 비동기 출력에서는 큐에 넣을 때 미리 만든 문자열.
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class RateLimitFilter(logging.Filter):
+    """
+    같은 메시지(로거 이름 + 인자를 채우기 전 메시지 틀)가 interval초 구간마다 burst번을 넘으면 걸러냅니다.
+    예를 들어 이미지마다 찍히는 "이미지 로드 시도 경로: %s"는 경로가 달라도 같은 메시지로 셉니다.
+    다음 구간에 처음 통과하는 레코드의 메시지 끝에 생략된 개수를 덧붙입니다.
+    WARNING 이상은 반복되더라도 (예: 저장 오류) 놓치지 않도록 걸러내지 않고, DEBUG/INFO만 제한합니다.
+    """
+    def __init__(self, interval=LOG_RATE_LIMIT_SECONDS, burst=LOG_RATE_LIMIT_BURST):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self._windows = {} # (로거 이름, 메시지 틀) -> [구간 시작 시각, 구간 내 출력 수, 생략 수].
+        self._lock = threading.Lock() # 여러 스레드에서 로그를 남김.
+
+    def filter(self, record):
+        if self.interval <= 0 or record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval: # 새 구간 시작.
+                suppressed = window[2] if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                return True
+            else:
+                window[2] += 1
+                return False
+        if suppressed and isinstance(record.args, tuple):
+            record.msg = f"{record.msg} (같은 메시지 %d개 생략)"
+            record.args = record.args + (suppressed,)
+        return True
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    레코드를 메시지 조립 없이 큐에 넣는 핸들러. (같은 프로세스 안의 큐이므로 인자를 그대로 넘겨도 됨)
+    메시지 조립과 출력은 QueueListener 스레드의 실제 핸들러가 합니다.
+    """
+    def prepare(self, record):
+        if record.exc_info and not record.exc_text: # 트레이스백은 지금 문자열로 만들어 둠.
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+_listener = None # 실행 중인 비동기 로그 출력 스레드 (QueueListener).
+
+def shutdown_logging():
+    """비동기 로그 출력 스레드를 멈추고 큐에 남은 로그를 모두 출력합니다. (프로그램 종료 시 자동 호출)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(shutdown_logging)
+
+def _apply_module_settings(module_levels, disabled_modules):
+    """모듈 로거의 레벨과 사용 여부를 설정합니다. 이전 설정은 먼저 되돌립니다."""
+    for name, logger in list(logging.Logger.manager.loggerDict.items()):
+        if name.startswith(ROOT_LOGGER_NAME + ".") and isinstance(logger, logging.Logger):
+            logger.setLevel(logging.NOTSET)
+            logger.disabled = False
+    for module_name, module_level in module_levels.items():
+        get_logger(module_name).setLevel(module_level)
+    for module_name in disabled_modules:
+        get_logger(module_name).disabled = True # 레벨 확인 단계에서 바로 걸러짐.
+
+def configure_logging(level=LOG_LEVEL, log_format=LOG_FORMAT, stream=None, asynchronous=LOG_ASYNC,
+                      module_levels=LOG_MODULE_LEVELS, disabled_modules=LOG_DISABLED_MODULES,
+                      rate_limit_seconds=LOG_RATE_LIMIT_SECONDS, rate_limit_burst=LOG_RATE_LIMIT_BURST):
+    """
+    앱/명령줄 프로그램 시작 시 로그 레벨과 출력 형식을 설정합니다. 여러 번 호출하면 마지막 설정으로 바뀝니다.
+    Args:
+        level (str): "DEBUG", "INFO", "WARNING", "ERROR".
+        log_format (str): "text" 또는 "json".
+        stream: 출력 스트림. 기본값은 표준 출력.
+        asynchronous (bool): True면 로그를 큐에 넣고 백그라운드 스레드에서 조립/출력합니다.
+        module_levels (dict): 모듈 이름 -> 그 모듈에만 적용할 레벨.
+        disabled_modules (iterable): 로그를 끌 모듈 이름들.
+        rate_limit_seconds (float): 같은 DEBUG/INFO 메시지 반복 제한 구간 (초). 0이면 제한하지 않음.
+        rate_limit_burst (int): 구간마다 같은 메시지를 출력할 최대 횟수.
+    """
+    shutdown_logging() # 이전 설정의 출력 스레드가 남은 로그를 모두 출력한 뒤 교체.
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    stream_handler = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    if log_format == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s", "%H:%M:%S"))
+    if asynchronous:
+        global _listener
+        log_queue = queue.SimpleQueue() # 크기 제한 없음 (넣을 때 기다리지 않음).
+        handler = _LazyQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+    else:
+        handler = stream_handler
+    handler.addFilter(RateLimitFilter(rate_limit_seconds, rate_limit_burst)) # 큐에 넣기 전에 걸러냄.
+    root_logger.addHandler(handler)
+    root_logger.setLevel(level)
+    root_logger.propagate = False # 다른 라이브러리의 루트 로거 설정과 섞이지 않도록.
+    _apply_module_settings(module_levels, disabled_modules)
+
+# === 트레이스 ===
+class _NullSpan:
+    """트레이스가 꺼져 있을 때 span()이 반환하는 아무 일도 하지 않는 구간."""
+    __slots__ = ()
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    """시작 시각을 기억했다가 끝날 때 Chrome 트레이스 '완료(X)' 이벤트 하나를 기록하는 구간."""
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer, self.name, self.category, self.args = tracer, name, category, args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer._record({'name': self.name, 'cat': self.category, 'ph': 'X',
+                             'ts': (self.start - self.tracer.origin) * 1e6, 'dur': (end - self.start) * 1e6,
+                             'pid': os.getpid(), 'tid': threading.get_ident(), 'args': self.args})
+        return False
+
+class Tracer:
+    """
+    구간(span) 시간을 모으는 클래스. 최근 max_events개의 이벤트만 보관합니다.
+    - span(이름, 분류, **인자): with 문으로 감싼 구간을 기록. 꺼져 있으면 기록하지 않음.
+    - instant(이름, **인자): 한 시점의 이벤트를 기록.
+    - export_chrome_trace(경로): 모은 이벤트를 Chrome 트레이스 JSON 파일로 저장.
+    """
+    def __init__(self, enabled=False, max_events=TRACE_MAX_EVENTS):
+        self.enabled = enabled
+        self.origin = time.perf_counter() # 트레이스 시각(ts)의 기준.
+        self._events = deque(maxlen=max_events)
+        self._lock = threading.Lock()     # 백그라운드 저장/이미지 스레드에서도 기록.
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+
+    def _record(self, event):
+        with self._lock:
+            self._events.append(event)
+
+    def span(self, name, category="app", **args):
+        """
+        구간 하나를 기록하는 컨텍스트 관리자를 반환합니다.
+        Args:
+            name (str): 구간 이름 (예: "storage.save").
+            category (str): 분류 (트레이스 화면에서 구분).
+            args: 구간과 함께 기록할 값들 (예: 파일명).
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def instant(self, name, category="app", **args):
+        """한 시점의 이벤트를 기록합니다."""
+        if self.enabled:
+            self._record({'name': name, 'cat': category, 'ph': 'i', 's': 't',
+                          'ts': (time.perf_counter() - self.origin) * 1e6,
+                          'pid': os.getpid(), 'tid': threading.get_ident(), 'args': args})
+
+    def events(self):
+        """보관 중인 이벤트의 복사본 리스트."""
+        with self._lock:
+            return list(self._events)
+
+    def export_chrome_trace(self, path):
+        """
+        모은 이벤트를 Chrome 트레이스 JSON 파일로 저장합니다.
+        Returns:
+            int: 저장한 이벤트 수.
+        """
+        events = self.events()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+                     'args': {'name': thread_names.get(tid, str(tid))}}
+                    for tid in {event['tid'] for event in events}]
+        with open(path, 'w', encoding='utf-8') as trace_file:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, trace_file,
+                      ensure_ascii=False, default=str)
+        return len(events)
+
+tracer = Tracer(enabled=TRACE_ENABLED) # 앱 전체에서 함께 쓰는 트레이서.
+
+def span(name, category="app", **args):
+    """공용 트레이서의 구간. (Tracer.span 참고)"""
+    if not tracer.enabled:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args)
+
+def traced(name, category="app"):
+    """함수 호출 전체를 공용 트레이서의 구간으로 기록하는 데코레이터."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
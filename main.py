@@ -1,27 +1,34 @@
 # main.py
 
-# 애플리케이션의 메인 진입점(Entry Point)이자 핵심 로직을 담당하는 파일입니다.
-# GUI 생성 및 관리, 데이터 로드/저장, 펫 상태 및 할 일 관리, 사운드 재생 등
-# 앱의 전반적인 흐름을 제어하고 각 모듈들을 연결하는 역할을 합니다.
+# 애플리케이션의 메인 진입점(Entry Point)입니다.
+# GUI 생성 및 관리, 데이터 로드/저장, 사운드 재생, 다이얼로그 표시 등을 담당하며,
+# 펫 상태와 할 일 규칙은 pet_engine.PetDoListEngine에 맡기고 그 이벤트를 구독해 화면과 저장에 반영합니다.
 
 import tkinter as tk            # Tkinter GUI 라이브러리.
 from tkinter import simpledialog, messagebox # 사용자 입력 다이얼로그, 알림창.
 import datetime                 # 날짜/시간 객체.
 import os                       # 파일 시스템 경로 처리 (사운드 파일 경로 등).
+import threading                # 오디오 초기화용 백그라운드 스레드.
+import time                     # 시작 소요 시간 측정.
 import pygame.mixer as mixer    # 배경 음악(BGM) 및 효과음 재생 모듈 (playsound 대체).
 
 import config                   # 애플리케이션 설정 값.
-from pet_manager import Pet     # 펫 관리 로직 클래스.
-from todo_manager import TodoManager # 할 일 관리 로직 클래스.
+import pet_engine               # Tkinter 없이 동작하는 핵심 로직 (펫, 할 일, 보상, 환생).
 import data_manager             # 데이터 저장/로드 모듈.
 from gui import PetDoListGUI    # GUI 인터페이스 클래스.
+from save_scheduler import SaveScheduler # 저장 요청 병합/백그라운드 저장 스케줄러.
+from rebirth_scheduler import RebirthScheduler, TkRebirthTimer # 환생 시각 타이머.
+from instrumentation import get_logger, configure_logging, tracer, traced # 진단 로그, 트레이스.
+
+log = get_logger("main")
 
 class PetDoListApp:
     """
     Pet-Do-List 애플리케이션의 메인 클래스.
-    GUI, 펫 데이터, 할 일 데이터를 통합 관리하고 앱의 전체적인 동작을 제어합니다.
+    PetDoListEngine의 이벤트를 구독하여 GUI, 저장, 효과음, 알림창을 연결하고 앱의 전체적인 동작을 제어합니다.
     """
     def __init__(self, master):
+        self.startup_start_time = time.perf_counter() # 시작 시간 측정 기준.
         self.master = master    # Tkinter 루트(메인) 창 객체.
         # 메인 창 설정.
         master.title(config.APP_TITLE)
@@ -31,33 +38,101 @@ class PetDoListApp:
         # 창 닫기 버튼 클릭 시 on_closing 메서드 호출.
         master.protocol("WM_DELETE_WINDOW", self.on_closing) 
 
-        self.pet = None             # 현재 펫 객체.
-        self.todo_manager = None    # 할 일 관리자 객체.
-        self.historical_pets = []   # 과거 펫 기록 리스트.
         self.sfx_sounds = {}        # 로드된 효과음 객체들을 저장할 딕셔너리.
+        self.audio_ready = threading.Event() # 믹서 초기화 및 효과음 로드 완료 여부.
+        self.audio_thread = None    # 오디오 초기화 스레드 (빠른 시작 모드).
+        self.pending_sounds = []    # 오디오 준비 전에 요청된 효과음 키 (최대 PENDING_SOUND_LIMIT개).
+        self.first_paint_seconds = None  # 시작부터 첫 화면 표시까지 걸린 시간.
+        self.audio_ready_seconds = None  # 시작부터 오디오 준비까지 걸린 시간.
+        self.storage = data_manager.create_storage() # 설정된 저장소 (저널 또는 SQLite).
+        # 핵심 로직 엔진 (저장소가 날짜별 불러오기를 지원하면 필요한 날짜만 불러오고, 검색 색인은 저장소 전체로 생성).
+        self.engine = pet_engine.PetDoListEngine(
+            day_loader=self._load_day_from_storage if hasattr(self.storage, 'load_day') else None,
+            all_todos_loader=self._load_all_todos_from_storage if hasattr(self.storage, 'load_all_todos') else None)
+        self.save_scheduler = SaveScheduler(master, self.storage, self.engine.capture_snapshot) # 저장 요청 병합 스케줄러.
 
         self.gui = PetDoListGUI(master, self) # GUI 객체 생성 (main 앱 로직 전달).
+        self._subscribe_engine_events() # 엔진 이벤트를 GUI/저장/효과음에 연결.
+        self.rebirth_scheduler = RebirthScheduler() # 다음 환생 시각 큐.
+        self.rebirth_timer = TkRebirthTimer(master, self.rebirth_scheduler, self._on_rebirth_due) # 환생 시각에 맞춘 타이머.
         
         self._pre_gui_setup() # GUI 생성 전 초기 데이터 로드 및 설정.
 
+        if not config.FAST_STARTUP: # 일반 시작 모드: 첫 화면 전에 오디오를 초기화.
+            self._init_audio()
+
+        self.gui.update_gui_with_pet_data() # GUI 화면 초기 데이터로 업데이트.
+        # 첫 화면이 그려진 뒤 시간 기록 (빠른 시작 모드면 이때 오디오를 백그라운드에서 초기화).
+        master.after_idle(self._on_first_paint)
+
+    def _on_first_paint(self):
+        """
+        첫 화면이 그려진 뒤 호출되어 시작 시간을 기록하고, 검색 색인 생성과 (빠른 시작 모드면) 오디오 초기화를
+        백그라운드에서 시작합니다.
+        """
+        self.first_paint_seconds = time.perf_counter() - self.startup_start_time
+        log.info("첫 화면 표시까지 %.0fms 소요.", self.first_paint_seconds * 1000)
+        self._start_search_index_build()
+        if self.audio_ready.is_set(): # 일반 시작 모드 (이미 초기화됨).
+            self._on_audio_ready()
+            return
+        self.audio_thread = threading.Thread(target=self._init_audio, daemon=True)
+        self.audio_thread.start()
+        self.master.after(config.AUDIO_READY_POLL_MS, self._poll_audio_ready)
+
+    def _start_search_index_build(self):
+        """검색 색인을 백그라운드에서 미리 만들기 시작합니다. (첫 검색 때 Tk 스레드에서 만들지 않도록)"""
+        if hasattr(self.storage, 'load_all_todos'):
+            if self.save_scheduler.has_pending_todo_changes(): # 백그라운드 로더가 읽을 저장소에 남은 변경을 먼저 기록.
+                self.save_scheduler.flush()
+            self.engine.start_search_index_build(self.storage.load_all_todos)
+        else:
+            self.engine.start_search_index_build()
+
+    def _poll_audio_ready(self):
+        """오디오 초기화 완료를 주기적으로 확인합니다. (Tk 스레드에서 실행)"""
+        if self.audio_ready.is_set():
+            self._on_audio_ready()
+        else:
+            self.master.after(config.AUDIO_READY_POLL_MS, self._poll_audio_ready)
+
+    def _on_audio_ready(self):
+        """오디오 준비 완료 시 시간을 기록하고, 대기 중이던 효과음을 재생합니다."""
+        self.audio_ready_seconds = time.perf_counter() - self.startup_start_time
+        log.info("오디오 준비까지 %.0fms 소요 (첫 화면 표시 %.0fms).",
+                 self.audio_ready_seconds * 1000, self.first_paint_seconds * 1000)
+        pending_sounds, self.pending_sounds = self.pending_sounds, []
+        for sound_key in pending_sounds:
+            self.play_sound(sound_key)
+
+    def _init_audio(self):
+        """
+        pygame 믹서를 초기화하고 BGM 재생 및 효과음 로드를 수행합니다.
+        빠른 시작 모드에서는 백그라운드 스레드에서 호출됩니다.
+        """
+        try:
+            mixer.init() # pygame 믹서 초기화 (모든 사운드 재생 전 필수).
+        except Exception as e:
+            log.error("오디오 믹서 초기화 중 오류 발생: %s", e)
+            self.audio_ready.set() # 효과음 없이 동작 (play_sound가 대기하지 않도록).
+            return
+
         # --- BGM 초기화 및 재생 로직 ---
-        mixer.init() # pygame 믹서 초기화 (모든 사운드 재생 전 필수).
         bgm_path = os.path.join(config.RESOURCES_PATH, config.SOUNDS_SUBFOLDER, config.BGM_FILE)
         if os.path.exists(bgm_path):
             try:
                 mixer.music.load(bgm_path)        # BGM 파일 로드.
                 mixer.music.set_volume(config.BGM_VOLUME) # BGM 볼륨 설정.
                 mixer.music.play(loops=-1)        # BGM 무한 반복 재생.
-                print(f"BGM '{config.BGM_FILE}' 재생 시작.")
+                log.info("BGM '%s' 재생 시작.", config.BGM_FILE)
             except Exception as e:
-                print(f"BGM 재생 중 오류 발생: {e}")
+                log.error("BGM 재생 중 오류 발생: %s", e)
         else:
-            print(f"BGM 파일 '{bgm_path}'을 찾을 수 없어 재생할 수 없습니다. config.BGM_FILE과 파일 경로를 확인해주세요.")
+            log.warning("BGM 파일 '%s'을 찾을 수 없어 재생할 수 없습니다. config.BGM_FILE과 파일 경로를 확인해주세요.", bgm_path)
 
         # 모든 효과음 파일 로드 및 볼륨 설정.
         self._load_sound_effects()
-
-        self.gui.update_gui_with_pet_data() # GUI 화면 초기 데이터로 업데이트.
+        self.audio_ready.set()
 
     def _load_sound_effects(self):
         """
@@ -78,114 +153,157 @@ class PetDoListApp:
                     sound_obj = mixer.Sound(sound_path) # 효과음 파일 로드.
                     sound_obj.set_volume(volume)         # 효과음 볼륨 설정.
                     self.sfx_sounds[key] = sound_obj     # 딕셔너리에 저장.
-                    print(f"효과음 '{filename}' 로드 완료. 볼륨: {volume}")
+                    log.debug("효과음 '%s' 로드 완료. 볼륨: %s", filename, volume)
                 except Exception as e:
-                    print(f"효과음 '{filename}' 로드 중 오류 발생: {e}")
+                    log.error("효과음 '%s' 로드 중 오류 발생: %s", filename, e)
             else:
-                print(f"효과음 파일 '{sound_path}'을 찾을 수 없어 로드할 수 없습니다.")
+                log.warning("효과음 파일 '%s'을 찾을 수 없어 로드할 수 없습니다.", sound_path)
+
+    # --- 엔진 상태 (GUI는 app_logic.pet 등으로 접근) ---
+    @property
+    def pet(self):
+        """현재 펫 객체."""
+        return self.engine.pet
+
+    @property
+    def todo_manager(self):
+        """할 일 관리자 객체."""
+        return self.engine.todo_manager
+
+    @property
+    def historical_pets(self):
+        """과거 펫 기록 리스트."""
+        return self.engine.historical_pets
+
+    def _subscribe_engine_events(self):
+        """엔진 이벤트를 GUI 갱신, 저장, 효과음, 알림창에 연결합니다."""
+        self.engine.subscribe(pet_engine.EVENT_CHANGED, self._on_engine_changed)
+        self.engine.subscribe(pet_engine.EVENT_PERSIST, self._on_engine_persist)
+        self.engine.subscribe(pet_engine.EVENT_FULL_SAVE, self.save_all_data)
+        self.engine.subscribe(pet_engine.EVENT_NOTICE, self._on_engine_notice)
+        self.engine.subscribe(pet_engine.EVENT_TODO_COMPLETED, lambda **_: self.play_sound("todo_complete"))
+        self.engine.subscribe(pet_engine.EVENT_LEVEL_UP, self._on_engine_level_up)
+        self.engine.subscribe(pet_engine.EVENT_FULL_GAUGE_REWARD, self._on_engine_full_gauge_reward)
+        self.engine.subscribe(pet_engine.EVENT_SNACK_GIVEN, lambda **_: self.play_sound("snack_give"))
+        self.engine.subscribe(pet_engine.EVENT_REBIRTH, self._on_engine_rebirth)
+
+    def _on_engine_changed(self, parts):
+        """변경된 부분만 GUI에 반영합니다."""
+        self.gui.update_gui_with_pet_data(parts)
+
+    def _on_engine_persist(self, changes):
+        """엔진의 변경 기록을 저장 스케줄러에 넘깁니다."""
+        self.persist_changes(*changes)
+
+    def _on_engine_notice(self, level, title, message):
+        """엔진 알림을 메시지 박스로 표시합니다."""
+        if level == 'error':
+            messagebox.showerror(title, message, parent=self.master)
+        else:
+            messagebox.showinfo(title, message, parent=self.master)
+
+    def _on_engine_level_up(self, level):
+        self.play_sound("pet_level_up") # 레벨업 효과음 재생.
+        messagebox.showinfo("레벨업!", f"'{self.pet.name}'이(가) 레벨 {level}로 성장했습니다!", parent=self.master)
+
+    def _on_engine_full_gauge_reward(self, snack_name):
+        messagebox.showinfo("특별 보상!", f"'{self.pet.name}'(이)가 행복하고 포만감이 가득찼습니다!\n축하합니다! {snack_name} 1개를 획득했습니다!",
+                            parent=self.master)
+        self.play_sound("pet_level_up") # 레벨업 효과음 재생 (보상 알림).
+
+    def _on_engine_rebirth(self, record):
+        messagebox.showinfo("펫 환생 완료!", f"'{self.pet.name}' ({self.pet.species})으로 새롭게 태어났습니다! 환영해주세요!", parent=self.master)
 
     def _pre_gui_setup(self):
         """
         GUI 위젯 생성 전에 필요한 데이터를 로드하고 펫을 초기화하며,
         주간 환생 로직을 체크합니다.
         """
-        loaded_pet, loaded_daily_todos, loaded_snack_counts, loaded_historical_pets = data_manager.load_data() 
-
-        if loaded_pet and loaded_daily_todos is not None and loaded_snack_counts and loaded_historical_pets is not None:
-            # 기존 데이터가 존재하면 로드합니다.
-            self.pet = loaded_pet
-            self.todo_manager = TodoManager(initial_daily_todos=loaded_daily_todos, initial_snack_counts=loaded_snack_counts)
-            self.historical_pets = loaded_historical_pets 
-            print("기존 데이터를 성공적으로 로드했습니다.")
-        else:
+        loaded_data = self.storage.load() # (SQLite는 이때 이전 pickle 데이터를 옮겨 옴)
+        day_summaries = self.storage.load_day_summaries() if hasattr(self.storage, 'load_day_summaries') else None
+        if not self.engine.load_state(*loaded_data, next_todo_id=self.storage.next_todo_id(),
+                                      day_summaries=day_summaries):
             # 데이터가 없거나 로드에 실패하면 새로운 펫과 데이터를 생성합니다.
-            print("새로운 데이터를 초기화합니다.")
-            self.create_initial_pet_and_data_via_dialog() 
+            log.info("새로운 데이터를 초기화합니다.")
+            self.create_initial_pet_and_data_via_dialog()
 
         self.check_weekly_reset() # 주간 환생 조건 체크.
 
+    def _load_day_from_storage(self, date):
+        """
+        저장소에서 해당 날짜의 할 일을 불러옵니다.
+        그 날짜에 아직 기록되지 않은 변경이 있을 때만 먼저 저장합니다. (대부분은 Tk 스레드에서 기다리지 않음)
+        """
+        if self.save_scheduler.has_pending_todo_changes(date):
+            self.save_scheduler.flush()
+        return self.storage.load_day(date)
+
+    def _load_all_todos_from_storage(self):
+        """저장소에서 모든 날짜의 할 일을 불러옵니다. 아직 기록되지 않은 할 일 변경이 있으면 먼저 저장합니다."""
+        if self.save_scheduler.has_pending_todo_changes():
+            self.save_scheduler.flush()
+        return self.storage.load_all_todos()
+
     def create_initial_pet_and_data_via_dialog(self):
         """
         사용자에게 펫 이름과 종류를 입력받아 새로운 펫 객체를 생성하고 데이터를 초기화합니다.
         """
         pet_name = simpledialog.askstring("펫 이름", "새로운 펫의 이름을 지어주세요:", parent=self.master)
-        if not pet_name or pet_name.strip() == "":
-            pet_name = config.INITIAL_PET_NAME # 이름 미입력 시 기본값 사용.
-        
+
         selected_species = self.gui.show_pet_species_selection(config.PET_SPECIES_LIST, "새 펫 종류 선택") # 펫 종류 선택 다이얼로그 표시.
 
-        if selected_species is None: 
+        if selected_species is None:
             selected_species = config.PET_SPECIES_LIST[0] # 선택 취소 시 기본 펫 종류 사용.
             messagebox.showinfo("알림", f"펫 종류를 선택하지 않아 '{selected_species}' 펫으로 시작합니다.", parent=self.master)
 
-        self.pet = Pet(name=pet_name, species=selected_species) # 새로운 펫 객체 생성.
-        self.todo_manager = TodoManager() # 새로운 할 일 관리자 객체 생성.
+        self.engine.create_pet(pet_name, selected_species) # 펫 생성 및 기준 스냅샷 저장 예약.
         messagebox.showinfo("펫 생성", f"'{self.pet.name}' ({self.pet.species}) 펫과 함께 Pet-Do-List를 시작합니다!", parent=self.master)
-        print(f"새로운 펫 '{self.pet.name}' ({self.pet.species}) 생성 완료!")
 
     def check_weekly_reset(self):
         """
         매주 지정된 요일/시간에 펫의 환생 조건을 확인하고 필요 시 환생을 진행합니다.
-        """
-        today = datetime.date.today()
-        if self.pet: 
-            days_since_reset = (today - self.pet.last_reset_date).days # 마지막 리셋일로부터 지난 일수.
-            is_reset_day_and_time = (today.weekday() == config.WEEKLY_RESET_DAY and 
-                                     datetime.datetime.now().hour >= config.RESET_TIME_HOUR)
-
-            if today != self.pet.last_reset_date and is_reset_day_and_time: # 오늘 날짜가 마지막 리셋일과 다르고, 
-                                                                            #환생 요일/시간 조건 충족 시.
-                if days_since_reset >= config.PET_RESET_INTERVAL_DAYS or self.pet.last_reset_date.weekday() != config.WEEKLY_RESET_DAY: 
-                        # 환생 주기 또는 요일 조건 충족 시.
-                        print("펫 환생 조건 충족!")
-                        if messagebox.askyesno("펫 환생 알림", 
-                                               f"이번 주 ({self.pet.last_reset_date} ~ {today})의 여정이 끝났습니다!\n새로운 펫으로 환생하시겠어요?",
-                                               parent=self.master):
-                            self.perform_rebirth_via_dialog() # 사용자 동의 시 환생 진행.
-                        else:
-                            messagebox.showinfo("알림", "이번 주 펫과 계속 여정을 함께합니다!", parent=self.master)
-
-    def _record_current_pet_history(self):
-        """
-        현재 펫의 최종 상태(종류, 레벨, 기간)를 과거 펫 기록 리스트에 추가합니다.
-        """
-        if self.pet:
-            end_date = datetime.date.today()
-            start_date = self.pet.last_reset_date
-            
-            pet_record = {
-                'species': self.pet.species,
-                'level': self.pet.level,
-                'start_date': start_date,
-                'end_date': end_date
-            }
-            self.historical_pets.append(pet_record) # 기록 추가.
-            print(f"과거 펫 기록 추가: {pet_record}")
+        시작 시와 환생 타이머가 만기될 때 호출되며, 확인 후 다음 환생 시각으로 타이머를 다시 예약합니다.
+        """
+        postponed = False # 사용자가 환생을 미뤘는지 여부.
+        if self.engine.is_rebirth_due():
+            log.info("펫 환생 조건 충족!")
+            if messagebox.askyesno("펫 환생 알림",
+                                   f"이번 주 ({self.pet.last_reset_date} ~ {datetime.date.today()})의 여정이 끝났습니다!\n새로운 펫으로 환생하시겠어요?",
+                                   parent=self.master):
+                self.perform_rebirth_via_dialog() # 사용자 동의 시 환생 진행.
+            else:
+                messagebox.showinfo("알림", "이번 주 펫과 계속 여정을 함께합니다!", parent=self.master)
+                postponed = True
+        # 미뤘다면 다음 주 환생 시각, 아니면 마지막 리셋일 기준 환생 시각으로 예약.
+        self._schedule_next_rebirth(after=datetime.datetime.now() if postponed else None)
+
+    def _schedule_next_rebirth(self, after=None):
+        """현재 펫의 다음 환생 시각을 환생 타이머에 예약합니다."""
+        next_time = self.engine.next_rebirth_time(after)
+        if next_time is None:
+            return
+        self.rebirth_scheduler.schedule('pet', next_time)
+        self.rebirth_timer.reschedule()
+        log.info("다음 환생 확인 시각: %s", next_time)
+
+    def _on_rebirth_due(self, key):
+        """환생 시각이 되면 (앱이 켜져 있는 동안에도) 환생 여부를 확인합니다."""
+        self.check_weekly_reset()
 
     def perform_rebirth_via_dialog(self):
         """
         펫을 환생시키는 전체 과정을 담당합니다.
-        현재 펫 기록 저장, 새 펫 이름/종류 입력받기, 펫 상태 초기화 등을 수행합니다.
+        새 펫 이름/종류를 입력받아 엔진에 넘기면, 엔진이 현재 펫 기록 저장과 상태 초기화를 수행합니다.
         """
-        print("펫 환생을 시작합니다!")
-        self._record_current_pet_history() # 현재 펫 기록 저장.
-
         new_pet_name = simpledialog.askstring("펫 환생!", f"이전 펫 '{self.pet.name}'이 환생했습니다! 새로운 펫의 이름을 지어주세요:", parent=self.master)
-        if not new_pet_name or new_pet_name.strip() == "":
-            new_pet_name = config.INITIAL_PET_NAME # 이름 미입력 시 기본값 사용.
-        
+
         selected_new_species = self.gui.show_pet_species_selection(config.PET_SPECIES_LIST, "새로운 펫 종류 선택") # 새 펫 종류 선택 다이얼로그.
 
-        if selected_new_species is None: 
+        if selected_new_species is None:
             selected_new_species = config.PET_SPECIES_LIST[0] # 선택 취소 시 기본 펫 종류 사용.
             messagebox.showinfo("알림", f"펫 종류를 선택하지 않아 '{selected_new_species}' 펫으로 다시 태어납니다.", parent=self.master)
-            
-        self.pet.name = new_pet_name # 새 펫 이름 적용.
-        self.pet.reset_for_rebirth(new_species=selected_new_species) # 펫 객체 리셋.
-        self.todo_manager = TodoManager() # 할 일 관리자 초기화 (모든 할 일 삭제).
-        messagebox.showinfo("펫 환생 완료!", f"'{self.pet.name}' ({self.pet.species})으로 새롭게 태어났습니다! 환영해주세요!", parent=self.master)
-        self.gui.update_gui_with_pet_data() # GUI 업데이트.
-        self.save_all_data() # 데이터 저장.
+
+        self.engine.rebirth(new_pet_name, selected_new_species) # 기록 저장, 펫/할 일 초기화, GUI 갱신, 저장.
         self.play_sound("pet_rebirth") # 환생 효과음 재생.
 
     def on_closing(self):
@@ -193,62 +311,71 @@ class PetDoListApp:
         애플리케이션 종료 시 호출되는 콜백 함수.
         모든 데이터 저장 및 Tkinter, Pygame 리소스 해제를 담당합니다.
         """
-        self.save_all_data()    # 데이터 저장.
-        mixer.music.stop()       # BGM 정지.
-        mixer.quit()             # Pygame 믹서 종료 (리소스 해제).
+        self.save_all_data()    # 데이터 저장 예약.
+        self.save_scheduler.flush() # 예약된 저장을 즉시 수행 (최종 저장 보장).
+        stats = self.save_scheduler.get_stats()
+        log.info("저장 요청 %d회 중 실제 저장 %d회 수행 (평균 %.1fms, 최대 %.1fms).",
+                 stats['saves_requested'], stats['saves_performed'],
+                 stats['average_write_seconds'] * 1000, stats['max_write_seconds'] * 1000)
+        image_stats = self.gui.pet_image_cache.get_stats()
+        log.info("이미지 캐시: 적중 %d회, 실패 %d회, 제거 %d회, 보관 %d개 (%dKB).",
+                 image_stats['hits'], image_stats['misses'], image_stats['evictions'],
+                 image_stats['entries'], image_stats['bytes'] // 1024)
+        if self.audio_thread is not None:
+            self.audio_thread.join() # 오디오 초기화 도중이면 완료를 기다린 뒤 해제.
+        if mixer.get_init():
+            mixer.music.stop()       # BGM 정지.
+            mixer.quit()             # Pygame 믹서 종료 (리소스 해제).
+        self.rebirth_timer.cancel() # 환생 타이머 해제.
+        if tracer.enabled: # 이번 실행에서 모은 구간 시간을 Chrome 트레이스 파일로 저장.
+            event_count = tracer.export_chrome_trace(config.TRACE_FILE_NAME)
+            log.info("트레이스 이벤트 %d개를 '%s'에 저장했습니다.", event_count, config.TRACE_FILE_NAME)
         self.master.destroy()    # Tkinter 메인 창 파괴 (앱 종료).
 
     def save_all_data(self):
         """
-        현재 펫, 할 일, 간식, 과거 펫 기록 데이터를 파일에 저장합니다.
+        현재 펫, 할 일, 간식, 과거 펫 기록 데이터의 전체 저장을 예약합니다.
+        실제 저장은 SaveScheduler가 백그라운드에서 수행합니다.
         """
         if self.pet and self.todo_manager: # 펫과 할 일 관리자 객체가 존재할 때만 저장.
-            data_manager.save_data(self.pet, self.todo_manager.get_daily_todos_data(), self.todo_manager.get_current_snack_counts(), self.historical_pets)
-            print("애플리케이션 종료 전 데이터 저장 완료.")
+            self.save_scheduler.request_full_save()
+            log.debug("전체 데이터 저장 예약 완료.")
         else:
-            print("저장할 데이터가 없어 저장을 건너뛰는 작업을 수행하고 있어요.")
+            log.debug("저장할 데이터가 없어 저장을 건너뛰는 작업을 수행하고 있어요.")
+
+    def persist_changes(self, *changes):
+        """
+        사용자 동작 하나에서 발생한 변경들을 저널에 기록합니다.
+        저널이 충분히 쌓이면 전체 데이터를 스냅샷으로 저장(압축)합니다.
+        Args:
+            *changes (tuple): data_manager.apply_change 형식의 변경 튜플들.
+        """
+        if not (self.pet and self.todo_manager): # 펫과 할 일 관리자 객체가 존재할 때만 기록.
+            return
+        self.save_scheduler.request_changes(changes) # 저널 기록 및 필요 시 압축은 스케줄러가 모아서 수행.
 
+    @traced("app.play_sound", "audio")
     def play_sound(self, sound_key):
         """
         사전 로드된 효과음 객체를 재생합니다.
         Args:
             sound_key (str): _load_sound_effects에서 정의된 사운드 키 (예: "todo_complete").
+        오디오가 아직 준비되지 않았으면 최대 PENDING_SOUND_LIMIT개까지 대기시켰다가 준비 후 재생하고, 넘치는 요청은 버립니다.
         """
+        if not self.audio_ready.is_set():
+            if len(self.pending_sounds) < config.PENDING_SOUND_LIMIT:
+                self.pending_sounds.append(sound_key)
+            return
         sound_obj = self.sfx_sounds.get(sound_key) # 해당 키의 효과음 객체 가져오기.
         if sound_obj:
             try:
                 sound_obj.play() # 효과음 재생.
             except Exception as e:
-                print(f"효과음 '{sound_key}' 재생 중 오류 발생: {e}")
+                log.error("효과음 '%s' 재생 중 오류 발생: %s", sound_key, e)
         else:
-            print(f"효과음 키 '{sound_key}'에 해당하는 사운드 객체를 찾을 수 없습니다.")
-            
-    def _check_and_reward_full_gauges(self):
-        """
-        펫의 행복도와 포만감 게이지가 모두 최대일 경우 고급 간식을 지급합니다.
-        게이지가 최대가 아닐 경우 보상 상태 플래그를 리셋합니다.
-        """
-        if not self.pet:
-            return
+            log.warning("효과음 키 '%s'에 해당하는 사운드 객체를 찾을 수 없습니다.", sound_key)
 
-        is_full_happiness = (self.pet.happiness >= self.pet.max_happiness)
-        is_full_fullness = (self.pet.fullness >= self.pet.max_fullness)
-
-        if is_full_happiness and is_full_fullness: # 행복도와 포만감이 모두 최대일 경우.
-            if not self.pet.has_been_rewarded_for_full_gauges: # 아직 보상을 받지 않았을 경우.
-                self.todo_manager.add_snack("고급 간식", 1) # 고급 간식 1개 추가.
-                self.pet.has_been_rewarded_for_full_gauges = True # 보상 완료 플래그 설정.
-                
-                messagebox.showinfo("특별 보상!", f"'{self.pet.name}'(이)가 행복하고 포만감이 가득찼습니다!\n축하합니다! 고급 간식 1개를 획득했습니다!", 
-                                    parent=self.master)
-                self.play_sound("pet_level_up") # 레벨업 효과음 재생 (보상 알림).
-                self.gui.update_gui_with_pet_data() # GUI 업데이트.
-                self.save_all_data() # 데이터 저장.
-                print("고급 간식 1개 지급!")
-        else:
-            self.pet.has_been_rewarded_for_full_gauges = False # 게이지 만점 아닐 시 보상 플래그 리셋.
-                
-    # --- GUI 이벤트 핸들러 (PetDoListGUI에서 호출될 실제 로직) ---
+    # --- GUI 이벤트 핸들러 (PetDoListGUI에서 호출, 실제 규칙은 PetDoListEngine이 처리) ---
     def add_todo_logic(self, todo_text):
         """
         새로운 할 일을 추가하는 로직.
@@ -257,62 +384,76 @@ class PetDoListApp:
         Returns:
             bool: 할 일 추가 성공 여부.
         """
-        if self.todo_manager.add_todo(todo_text): 
-            self.gui.update_gui_with_pet_data() # GUI 업데이트.
-            self.save_all_data() # 데이터 저장.
-            self._check_and_reward_full_gauges() # 만점 게이지 보상 체크.
-            return True
-        return False
+        return self.engine.add_todo(todo_text) is not None
 
-    def complete_todo_logic(self, index):
+    def complete_todo_logic(self, todo_id):
         """
         선택된 할 일을 완료 처리하는 로직.
         Args:
-            index (int): 완료할 할 일의 인덱스.
+            todo_id (int): 완료할 할 일의 id.
         Returns:
             bool: 할 일 완료 성공 여부.
         """
-        if 0 <= index < len(self.todo_manager.get_current_date_todos()): # 유효한 인덱스인지 확인.
-            if self.todo_manager.get_current_date_todos()[index]['completed']: 
-                messagebox.showinfo("알림", "이미 완료된 할 일입니다.", parent=self.master)
-                return False
-
-            snack_reward_count = self.todo_manager.complete_todo(index) # 할 일 완료 처리 및 간식 보상 개수 반환.
-            if snack_reward_count > 0: # 보상된 간식이 있다면.
-                leveled_up = self.pet.add_exp(amount=config.EXP_PER_TODO_COMPLETE) # 펫 경험치 추가.
-                
-                self.play_sound("todo_complete") # 할 일 완료 효과음 재생.
-
-                if leveled_up: # 레벨업 했을 경우.
-                    self.play_sound("pet_level_up") # 레벨업 효과음 재생.
-                    messagebox.showinfo("레벨업!", f"'{self.pet.name}'이(가) 레벨 {self.pet.level}로 성장했습니다!", parent=self.master)
-
-                self.gui.update_gui_with_pet_data() # GUI 업데이트.
-                self.save_all_data() # 데이터 저장.
-                self._check_and_reward_full_gauges() # 만점 게이지 보상 체크.
-                return True
-        messagebox.showerror("오류", "할 일 완료 처리에 실패했습니다.", parent=self.master) # 오류 메시지.
-        return False
-            
-    def remove_todo_logic(self, index):
+        return self.complete_todos_logic([todo_id]) > 0
+
+    def complete_todos_logic(self, todo_ids):
+        """
+        선택된 여러 할 일을 한 번에 완료 처리하는 로직. (간식/경험치 합산 지급, 화면 갱신과 저장은 한 번)
+        Args:
+            todo_ids (list): 완료할 할 일의 id들.
+        Returns:
+            int: 새로 완료된 할 일 개수.
+        """
+        return self.engine.complete_todos(todo_ids)
+
+    def edit_todo_logic(self, todo_id, new_text):
+        """
+        할 일의 내용을 수정하는 로직.
+        Args:
+            todo_id (int): 수정할 할 일의 id.
+            new_text (str): 새 내용.
+        Returns:
+            bool: 수정 성공 여부.
+        """
+        return self.engine.edit_todo(todo_id, new_text)
+
+    def remove_todo_logic(self, todo_id):
         """
         선택된 할 일을 삭제 처리하는 로직.
         Args:
-            index (int): 삭제할 할 일의 인덱스.
+            todo_id (int): 삭제할 할 일의 id.
         Returns:
             bool: 할 일 삭제 성공 여부.
         """
-        if 0 <= index < len(self.todo_manager.get_current_date_todos()): # 유효한 인덱스인지 확인.
-            if messagebox.askyesno("삭제 확인", "선택된 할 일을 삭제하시겠습니까?", parent=self.master): # 사용자 확인.
-                self.todo_manager.remove_todo(index) # 할 일 삭제 처리.
-                self.gui.update_gui_with_pet_data() # GUI 업데이트.
-                self.save_all_data() # 데이터 저장.
-                self._check_and_reward_full_gauges() # 만점 게이지 보상 체크.
-                return True
-            return False # 사용자 취소 시.
-        messagebox.showerror("오류", "할 일 삭제 처리에 실패했습니다.", parent=self.master) # 오류 메시지.
-        return False
+        return self.remove_todos_logic([todo_id]) > 0
+
+    def remove_todos_logic(self, todo_ids):
+        """
+        선택된 여러 할 일을 사용자 확인 후 한 번에 삭제하는 로직.
+        Args:
+            todo_ids (list): 삭제할 할 일의 id들.
+        Returns:
+            int: 삭제된 할 일 개수.
+        """
+        if not todo_ids or any(self.todo_manager.get_todo(todo_id) is None for todo_id in todo_ids): # 유효한 id인지 확인.
+            messagebox.showerror("오류", "할 일 삭제 처리에 실패했습니다.", parent=self.master) # 오류 메시지.
+            return 0
+        message = "선택된 할 일을 삭제하시겠습니까?" if len(todo_ids) == 1 else f"선택된 할 일 {len(todo_ids)}개를 삭제하시겠습니까?"
+        if messagebox.askyesno("삭제 확인", message, parent=self.master): # 사용자 확인.
+            return self.engine.remove_todos(todo_ids)
+        return 0 # 사용자 취소 시.
 
+    def move_todos_logic(self, todo_ids, delta_days):
+        """
+        선택된 여러 할 일을 현재 날짜로부터 delta_days일 떨어진 날짜로 옮기는 로직. (예: 1이면 내일로 미루기)
+        Args:
+            todo_ids (list): 옮길 할 일의 id들.
+            delta_days (int): 옮길 날짜까지의 일수.
+        Returns:
+            int: 옮겨진 할 일 개수.
+        """
+        target_date = self.todo_manager.get_current_date() + datetime.timedelta(days=delta_days)
+        return self.engine.move_todos(todo_ids, target_date)
 
     def give_snack_to_pet(self, snack_name):
         """
@@ -322,22 +463,7 @@ class PetDoListApp:
         Returns:
             bool: 간식 주기 성공 여부.
         """
-        # 펫이 이미 행복도/포만감 만점일 경우 간식 주기 방지.
-        if self.pet.happiness >= self.pet.max_happiness and self.pet.fullness >= self.pet.max_fullness:
-            messagebox.showinfo("알림", f"'{self.pet.name}'(이)는 이미 행복하고 배불러서 더 이상 간식을 먹을 수 없어요! 조금 쉬게 해주세요 :)", parent=self.master)
-            return False 
-
-        effect = self.todo_manager.use_snack(snack_name) # 간식 사용 및 효과 반환.
-        if effect: # 간식이 사용되었고 효과가 있다면.
-            self.pet.give_snack(effect) # 펫에게 간식 효과 적용.
-            self.play_sound("snack_give") # 간식 효과음 재생.
-            self.gui.update_gui_with_pet_data() # GUI 업데이트.
-            self.save_all_data() # 데이터 저장.
-            self._check_and_reward_full_gauges() # 만점 게이지 보상 체크.
-            return True
-        else:
-            messagebox.showinfo("알림", f"'{snack_name}' 간식이 없거나 부족합니다.", parent=self.master)
-            return False
+        return self.engine.give_snack(snack_name)
 
     def change_date_logic(self, delta_days):
         """
@@ -347,15 +473,37 @@ class PetDoListApp:
         Returns:
             bool: 날짜 변경 성공 여부 (항상 True).
         """
-        current_display_date = self.todo_manager.get_current_date()
-        new_display_date = current_display_date + datetime.timedelta(days=delta_days) # 새 표시 날짜 계산.
-        self.todo_manager.set_current_date(new_display_date) # 할 일 관리자의 현재 날짜 설정.
-        self.gui.update_gui_with_pet_data() # GUI 업데이트.
-        print(f"날짜 변경: {current_display_date} -> {new_display_date}")
-        self._check_and_reward_full_gauges() # 만점 게이지 보상 체크 (날짜 변경 시 상태 확인).
-        return True 
-        
-    def delete_historical_pet_record(self, index): 
+        return self.engine.change_date(delta_days)
+
+    def search_todos_logic(self, query):
+        """
+        모든 날짜의 할 일을 검색하는 로직.
+        Args:
+            query (str): 검색어.
+        Returns:
+            list or None: (날짜, 할 일 id, 내용) 튜플 리스트. 최근 날짜 순. 검색 색인을 만드는 중이면 None.
+        """
+        return self.engine.search_todos(query)
+
+    def go_to_date_logic(self, date):
+        """
+        표시 날짜를 지정한 날짜로 바꾸는 로직. (검색 결과, 달력에서 이동)
+        Args:
+            date (datetime.date): 이동할 날짜.
+        Returns:
+            bool: 날짜 변경 성공 여부 (항상 True).
+        """
+        return self.engine.go_to_date(date)
+
+    def get_stats_logic(self):
+        """
+        통계 창에 표시할 통계를 가져오는 로직.
+        Returns:
+            dict or None: analytics.TodoStats.report 결과. 펫이 없으면 None.
+        """
+        return self.engine.get_stats()
+
+    def delete_historical_pet_record(self, index):
         """
         과거 펫 기록을 삭제하는 로직.
         Args:
@@ -363,15 +511,11 @@ class PetDoListApp:
         Returns:
             bool: 기록 삭제 성공 여부.
         """
-        if 0 <= index < len(self.historical_pets): # 유효한 인덱스인지 확인.
-            deleted_record = self.historical_pets.pop(index) # 리스트에서 기록 삭제.
-            print(f"과거 펫 기록 삭제됨: {deleted_record}")
-            self.save_all_data() # 데이터 저장.
-            return True
-        return False
+        return self.engine.delete_history_record(index)
 
 # --- 애플리케이션 실행 ---
 if __name__ == "__main__":
+    configure_logging()  # 로그 레벨/형식 설정 (config.LOG_LEVEL, LOG_FORMAT).
     root = tk.Tk()       # Tkinter 루트 창 생성.
     app = PetDoListApp(root) # PetDoListApp 인스턴스 생성.
     root.mainloop()      # Tkinter 이벤트 루프 시작 (앱 실행).
\ No newline at end of file
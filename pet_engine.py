@@ -0,0 +1,635 @@
+# pet_engine.py
+
+# Tkinter 없이 동작하는 Pet-Do-List 핵심 로직(엔진) 모듈.
+# 펫, 할 일 관리자, 과거 펫 기록을 소유하고 할 일 완료, 경험치 획득, 간식 보상, 환생 등의 규칙을 처리합니다.
+# 다이얼로그를 직접 띄우지 않고 이벤트를 발생시키며, GUI(main.py)나 일괄 처리/서버 코드가 이벤트를 구독합니다.
+
+import datetime # 날짜 객체 처리.
+import copy     # 저장용 상태 복사본 생성.
+
+import config                        # 애플리케이션 설정 값.
+from pet_manager import Pet          # 펫 관리 로직 클래스.
+from todo_manager import TodoManager # 할 일 관리 로직 클래스.
+from todo_search import TodoSearchIndex, BackgroundIndexBuild # 모든 날짜의 할 일 검색 색인, 백그라운드 생성.
+from analytics import TodoStats         # 할 일/과거 펫 통계 집계.
+from instrumentation import get_logger, traced # 진단 로그, 사용자 동작 시간 측정.
+
+log = get_logger("pet_engine")
+
+# === 이벤트 이름 ===
+EVENT_CHANGED = "changed"                     # 화면에 반영할 상태 변경. kwargs: parts (set 또는 None=전체).
+EVENT_PERSIST = "persist"                     # 저장소에 기록할 변경. kwargs: changes (data_manager.apply_change 형식 리스트).
+EVENT_FULL_SAVE = "full_save"                 # 전체 데이터 저장 필요.
+EVENT_NOTICE = "notice"                       # 사용자 알림. kwargs: level ('info'/'error'), title, message.
+EVENT_TODO_COMPLETED = "todo_completed"       # 할 일 완료. kwargs: todo_ids, snack_count.
+EVENT_LEVEL_UP = "level_up"                   # 펫 레벨업. kwargs: level.
+EVENT_FULL_GAUGE_REWARD = "full_gauge_reward" # 게이지 만점 보상 지급. kwargs: snack_name.
+EVENT_SNACK_GIVEN = "snack_given"             # 펫에게 간식을 줌. kwargs: snack_name.
+EVENT_REBIRTH = "rebirth"                     # 펫 환생 완료. kwargs: record (이전 펫 기록).
+
+# === EVENT_CHANGED의 변경 부분 이름 ===
+PART_PET = "pet"       # 펫 이름/레벨/경험치/이미지/게이지.
+PART_SNACKS = "snacks" # 간식 인벤토리.
+PART_DATE = "date"     # 현재 표시 날짜.
+PART_TODOS = "todos"   # 현재 날짜의 할 일 목록 전체 (추가/삭제 등 행 수 변경).
+PART_TODO = "todo"     # (PART_TODO, todo_id) 형태로 할 일 하나 변경.
+
+def next_rebirth_instant(last_reset_date, after=None):
+    """
+    마지막 리셋일 이후 처음으로 환생 조건을 만족하는 시각을 계산합니다.
+    환생 요일(WEEKLY_RESET_DAY)의 RESET_TIME_HOUR시이며, 마지막 리셋일도 환생 요일이었다면
+    PET_RESET_INTERVAL_DAYS일 이상 지나야 합니다.
+    Args:
+        last_reset_date (datetime.date): 펫의 마지막 리셋(환생) 날짜.
+        after (datetime.datetime, optional): 이 시각 이후의 환생 시각을 구합니다 (사용자가 환생을 미룬 경우).
+    Returns:
+        datetime.datetime: 환생 시각.
+    """
+    reset_date = last_reset_date + datetime.timedelta(days=1)
+    while not (reset_date.weekday() == config.WEEKLY_RESET_DAY and
+               ((reset_date - last_reset_date).days >= config.PET_RESET_INTERVAL_DAYS or
+                last_reset_date.weekday() != config.WEEKLY_RESET_DAY)):
+        reset_date += datetime.timedelta(days=1)
+    reset_time = datetime.datetime.combine(reset_date, datetime.time(config.RESET_TIME_HOUR))
+    if after is not None and reset_time <= after: # 이후의 환생 요일 중 after보다 늦은 첫 시각 (주 단위로 건너뜀).
+        weeks = (after - reset_time).days // 7 + 1
+        reset_time += datetime.timedelta(weeks=weeks)
+    return reset_time
+
+class PetDoListEngine:
+    """
+    화면 없이 동작하는 Pet-Do-List 핵심 로직 클래스.
+    모든 사용자 동작은 메서드로 제공되며, 결과는 반환값과 이벤트(subscribe로 구독)로 전달됩니다.
+    """
+    def __init__(self, day_loader=None, all_todos_loader=None):
+        self.pet = None             # 현재 펫 객체.
+        self.todo_manager = None    # 할 일 관리자 객체.
+        self.historical_pets = []   # 과거 펫 기록 리스트.
+        self.day_loader = day_loader # TodoManager에 전달할 날짜별 할 일 로더 (없으면 모든 날짜가 메모리에 있음).
+        # 검색 색인을 만들 때 모든 날짜의 (날짜, 할 일 리스트) 쌍을 반환하는 함수. (없으면 TodoManager의 데이터 사용)
+        self.all_todos_loader = all_todos_loader
+        self.search_index = None    # 할 일 검색 색인 (처음 검색할 때 또는 start_search_index_build로 생성).
+        self._index_build = None    # 백그라운드에서 만드는 중인 검색 색인 (BackgroundIndexBuild).
+        self.stats = TodoStats()    # 할 일/과거 펫 통계 (할 일 관리자의 요약 변화로 갱신).
+        self._subscribers = {}      # 이벤트 이름 -> 콜백 리스트.
+
+    # --- 이벤트 ---
+    def subscribe(self, event, callback):
+        """
+        이벤트를 구독합니다. 콜백은 이벤트별 키워드 인자로 호출됩니다.
+        Args:
+            event (str): EVENT_* 이벤트 이름.
+            callback (callable): 이벤트 발생 시 호출할 함수.
+        """
+        self._subscribers.setdefault(event, []).append(callback)
+
+    def _emit(self, event, **kwargs):
+        """구독자들에게 이벤트를 순서대로 전달합니다."""
+        for callback in self._subscribers.get(event, ()):
+            callback(**kwargs)
+
+    def _notify(self, level, title, message):
+        """사용자 알림 이벤트를 발생시킵니다."""
+        self._emit(EVENT_NOTICE, level=level, title=title, message=message)
+
+    def _persist(self, *changes):
+        """저장소에 기록할 변경 이벤트를 발생시킵니다."""
+        if self.pet and self.todo_manager: # 펫과 할 일 관리자 객체가 존재할 때만 기록.
+            if self.search_index is not None: # 같은 변경 기록으로 검색 색인도 갱신.
+                for change in changes:
+                    self.search_index.apply_change(change)
+            elif self._index_build is not None: # 만드는 중이면 완성된 뒤 반영.
+                self._index_build.record(changes)
+            self._emit(EVENT_PERSIST, changes=list(changes))
+
+    def _pet_state_changes(self):
+        """현재 펫 상태와 간식 개수의 복사본을 담은 변경 튜플들을 반환합니다."""
+        return ('pet', copy.copy(self.pet)), ('snacks', dict(self.todo_manager.get_current_snack_counts()))
+
+    # --- 상태 생성/불러오기 ---
+    def _create_todo_manager(self, daily_todos=None, snack_counts=None, next_todo_id=None, day_summaries=None):
+        """날짜별 할 일 로더가 연결된 TodoManager를 생성하고, 그 요약으로 통계를 다시 집계해 연결합니다."""
+        todo_manager = TodoManager(initial_daily_todos=daily_todos, initial_snack_counts=snack_counts,
+                                   day_loader=self.day_loader, next_todo_id=next_todo_id, day_summaries=day_summaries)
+        self.stats.rebuild_days(todo_manager.get_day_summaries())
+        todo_manager.summary_listener = self.stats.apply_day_delta # 이후 변경은 O(1)로 반영.
+        return todo_manager
+
+    @traced("engine.load_state", "engine")
+    def load_state(self, pet, daily_todos, snack_counts, historical_pets, next_todo_id=None, day_summaries=None):
+        """
+        저장소에서 불러온 데이터로 상태를 설정합니다.
+        Args:
+            next_todo_id (int, optional): 다음에 부여할 할 일 id (저장소의 next_todo_id()).
+                                          없으면 불러온 할 일의 최대 id + 1.
+            day_summaries (dict, optional): 날짜 -> (전체, 완료 개수) (저장소의 load_day_summaries()).
+                                            날짜별 로더를 쓸 때 메모리에 없는 날짜도 달력에 표시하기 위해 필요.
+        Returns:
+            bool: 유효한 기존 데이터였는지 여부. False면 create_pet으로 새 펫을 만들어야 합니다.
+        """
+        if pet and daily_todos is not None and snack_counts and historical_pets is not None:
+            self.pet = pet
+            self.todo_manager = self._create_todo_manager(daily_todos, snack_counts, next_todo_id, day_summaries)
+            self.historical_pets = historical_pets
+            self.stats.rebuild_history(historical_pets)
+            self._reset_search_index() # 새 데이터 기준으로 다시 생성.
+            log.info("기존 데이터를 성공적으로 로드했습니다.")
+            return True
+        return False
+
+    def create_pet(self, name, species):
+        """
+        새로운 펫과 빈 할 일/간식 데이터를 만들고 전체 저장을 요청합니다.
+        Args:
+            name (str): 펫 이름. 비어 있으면 기본 이름 사용.
+            species (str): 펫 종류.
+        """
+        if not name or name.strip() == "":
+            name = config.INITIAL_PET_NAME # 이름 미입력 시 기본값 사용.
+        self.pet = Pet(name=name, species=species) # 새로운 펫 객체 생성.
+        self.todo_manager = self._create_todo_manager() # 새로운 할 일 관리자 객체 생성.
+        self._reset_search_index()
+        log.info("새로운 펫 '%s' (%s) 생성 완료!", self.pet.name, self.pet.species)
+        self._emit(EVENT_FULL_SAVE) # 이후 변경 기록이 이어질 기준 스냅샷 저장.
+
+    def capture_snapshot(self):
+        """
+        저장에 사용할 전체 데이터의 일관된 복사본을 만듭니다.
+        복사 이후의 변경이 저장 중인 데이터에 섞이지 않도록 할 일 항목까지 복사합니다.
+        Returns:
+            tuple: (pet, daily_todos, snack_counts, historical_pets, next_todo_id) 복사본.
+        """
+        daily_todos = {date: [todo.copy() for todo in todos]
+                       for date, todos in self.todo_manager.get_daily_todos_data().items()}
+        return (copy.copy(self.pet), daily_todos,
+                dict(self.todo_manager.get_current_snack_counts()), list(self.historical_pets),
+                self.todo_manager.next_todo_id)
+
+    # --- 환생 ---
+    def next_rebirth_time(self, after=None):
+        """
+        현재 펫이 다음에 환생할 시각을 반환합니다. (next_rebirth_instant 참고)
+        Returns:
+            datetime.datetime or None: 환생 시각. 펫이 없으면 None.
+        """
+        if not self.pet:
+            return None
+        return next_rebirth_instant(self.pet.last_reset_date, after)
+
+    def is_rebirth_due(self, now=None):
+        """
+        환생 시각이 지나 펫이 환생할 시기인지 확인합니다.
+        앱이 꺼져 있어 환생 요일을 놓친 경우에도 다음 실행 시 바로 환생 시기로 판단합니다.
+        Args:
+            now (datetime.datetime, optional): 기준 시각. 기본값은 현재 시각.
+        Returns:
+            bool: 환생 조건 충족 여부.
+        """
+        if not self.pet:
+            return False
+        now = now if now else datetime.datetime.now()
+        return now >= self.next_rebirth_time()
+
+    def _record_current_pet_history(self):
+        """
+        현재 펫의 최종 상태(종류, 레벨, 기간)를 과거 펫 기록 리스트에 추가합니다.
+        Returns:
+            dict or None: 추가된 기록.
+        """
+        if not self.pet:
+            return None
+        pet_record = {
+            'species': self.pet.species,
+            'level': self.pet.level,
+            'start_date': self.pet.last_reset_date,
+            'end_date': datetime.date.today()
+        }
+        self.historical_pets.append(pet_record) # 기록 추가.
+        self.stats.add_history(pet_record)
+        log.info("과거 펫 기록 추가: %s", pet_record)
+        return pet_record
+
+    @traced("engine.rebirth", "engine")
+    def rebirth(self, new_name, new_species):
+        """
+        현재 펫을 기록에 남기고 새 이름/종류로 환생시킵니다. 할 일과 간식은 초기화됩니다.
+        Args:
+            new_name (str): 새 펫 이름. 비어 있으면 기본 이름 사용.
+            new_species (str): 새 펫 종류.
+        Returns:
+            dict or None: 기록된 이전 펫 정보.
+        """
+        log.info("펫 환생을 시작합니다!")
+        record = self._record_current_pet_history() # 현재 펫 기록 저장.
+        if not new_name or new_name.strip() == "":
+            new_name = config.INITIAL_PET_NAME # 이름 미입력 시 기본값 사용.
+        self.pet.name = new_name # 새 펫 이름 적용.
+        self.pet.reset_for_rebirth(new_species=new_species) # 펫 객체 리셋.
+        # 할 일 관리자 초기화 (모든 할 일 삭제, 간식 초기화). 이전 할 일의 id는 다시 쓰지 않음.
+        self.todo_manager = self._create_todo_manager(next_todo_id=self.todo_manager.next_todo_id)
+        # 기록 추가, 할 일 삭제, 새 펫/간식을 하나의 레코드로 기록 (중간에 종료되어도 일부만 반영되지 않음).
+        self._persist(('history_add', dict(record)), ('todos_reset',), *self._pet_state_changes())
+        self._emit(EVENT_REBIRTH, record=record)
+        self._emit(EVENT_CHANGED, parts=None) # 전체 화면 갱신.
+        self._emit(EVENT_FULL_SAVE) # 데이터 저장.
+        return record
+
+    # --- 보상 ---
+    def check_and_reward_full_gauges(self):
+        """
+        펫의 행복도와 포만감 게이지가 모두 최대일 경우 고급 간식을 지급합니다.
+        게이지가 최대가 아닐 경우 보상 상태 플래그를 리셋합니다.
+        Returns:
+            bool: 보상 지급 여부.
+        """
+        if not self.pet:
+            return False
+
+        is_full_happiness = (self.pet.happiness >= self.pet.max_happiness)
+        is_full_fullness = (self.pet.fullness >= self.pet.max_fullness)
+
+        if is_full_happiness and is_full_fullness: # 행복도와 포만감이 모두 최대일 경우.
+            if not self.pet.has_been_rewarded_for_full_gauges: # 아직 보상을 받지 않았을 경우.
+                self.todo_manager.add_snack("고급 간식", 1) # 고급 간식 1개 추가.
+                self.pet.has_been_rewarded_for_full_gauges = True # 보상 완료 플래그 설정.
+                self._emit(EVENT_FULL_GAUGE_REWARD, snack_name="고급 간식")
+                self._emit(EVENT_CHANGED, parts={PART_PET, PART_SNACKS}) # 펫/간식 표시만 갱신.
+                self._persist(*self._pet_state_changes()) # 변경 기록 저장.
+                log.info("고급 간식 1개 지급!")
+                return True
+        else:
+            self.pet.has_been_rewarded_for_full_gauges = False # 게이지 만점 아닐 시 보상 플래그 리셋.
+        return False
+
+    # --- 사용자 동작 ---
+    # 할 일은 변하지 않는 id로 지정합니다. (TodoManager.get_current_date_todos의 'id')
+    def add_todo(self, todo_text):
+        """
+        새로운 할 일을 추가합니다.
+        Returns:
+            int or None: 추가된 할 일의 id. 실패 시 None.
+        """
+        added = self.add_todos([todo_text])
+        return added[0] if added else None
+
+    @traced("engine.add_todos", "engine")
+    def add_todos(self, todo_texts):
+        """
+        여러 할 일을 한 번에 현재 날짜에 추가합니다. (화면 갱신과 변경 기록은 한 번)
+        Returns:
+            list: 추가된 할 일 id 리스트. 내용이 비어 있는 항목이 있으면 아무것도 추가하지 않고 빈 리스트.
+        """
+        added = self.todo_manager.add_todos(todo_texts)
+        if not added:
+            return []
+        date = self.todo_manager.get_current_date()
+        self._emit(EVENT_CHANGED, parts={PART_TODOS}) # 할 일 목록만 갱신.
+        self._persist(*[('todo_add', date, todo.text, todo.id) for todo in added]) # 변경 기록 저장.
+        self.check_and_reward_full_gauges() # 만점 게이지 보상 체크.
+        return [todo.id for todo in added]
+
+    def complete_todo(self, todo_id):
+        """
+        할 일을 완료 처리하고 간식과 경험치를 지급합니다.
+        Returns:
+            bool: 할 일 완료 성공 여부.
+        """
+        return self.complete_todos([todo_id]) > 0
+
+    @traced("engine.complete_todos", "engine")
+    def complete_todos(self, todo_ids):
+        """
+        여러 할 일을 한 번에 완료 처리하고, 간식과 경험치를 합산해서 한 번에 지급합니다.
+        (여러 레벨이 한꺼번에 오르는 경우도 Pet.add_exp가 처리)
+        Returns:
+            int: 새로 완료된 할 일 개수.
+        """
+        completed_ids = self.todo_manager.complete_todos(todo_ids)
+        if completed_ids is None: # 없는 id.
+            self._notify('error', "오류", "할 일 완료 처리에 실패했습니다.")
+            return 0
+        if not completed_ids:
+            self._notify('info', "알림", "이미 완료된 할 일입니다.")
+            return 0
+
+        leveled_up = self.pet.add_exp(amount=config.EXP_PER_TODO_COMPLETE * len(completed_ids)) # 펫 경험치 합산 추가.
+        self._emit(EVENT_TODO_COMPLETED, todo_ids=completed_ids,
+                   snack_count=config.SNACK_PER_TODO_COMPLETE * len(completed_ids))
+        if leveled_up: # 레벨업 했을 경우.
+            self._emit(EVENT_LEVEL_UP, level=self.pet.level)
+
+        # 완료된 할 일 행과 펫/간식만 갱신.
+        self._emit(EVENT_CHANGED, parts={PART_PET, PART_SNACKS, *[(PART_TODO, todo_id) for todo_id in completed_ids]})
+        self._persist(*[('todo_update', self.todo_manager.get_todo_date(todo_id), todo_id, {'completed': True})
+                        for todo_id in completed_ids],
+                      *self._pet_state_changes()) # 변경 기록 저장.
+        self.check_and_reward_full_gauges() # 만점 게이지 보상 체크.
+        return len(completed_ids)
+
+    @traced("engine.edit_todo", "engine")
+    def edit_todo(self, todo_id, new_text):
+        """
+        할 일의 내용을 수정합니다.
+        Returns:
+            bool: 수정 성공 여부.
+        """
+        todo = self.todo_manager.edit_todo(todo_id, new_text)
+        if todo is None:
+            self._notify('error', "오류", "할 일 수정에 실패했습니다.")
+            return False
+        self._emit(EVENT_CHANGED, parts={(PART_TODO, todo_id)}) # 수정된 행만 갱신.
+        self._persist(('todo_update', self.todo_manager.get_todo_date(todo_id), todo_id, {'text': todo.text}))
+        return True
+
+    def remove_todo(self, todo_id):
+        """
+        할 일을 삭제합니다.
+        Returns:
+            bool: 할 일 삭제 성공 여부.
+        """
+        return self.remove_todos([todo_id]) > 0
+
+    @traced("engine.remove_todos", "engine")
+    def remove_todos(self, todo_ids):
+        """
+        여러 할 일을 한 번에 삭제합니다.
+        Returns:
+            int: 삭제된 할 일 개수.
+        """
+        dates = {todo_id: self.todo_manager.get_todo_date(todo_id) for todo_id in todo_ids}
+        removed = self.todo_manager.remove_todos(todo_ids)
+        if not removed: # 없는 id 또는 선택 없음.
+            self._notify('error', "오류", "할 일 삭제 처리에 실패했습니다.")
+            return 0
+        self._emit(EVENT_CHANGED, parts={PART_TODOS}) # 할 일 목록만 갱신.
+        self._persist(*[('todo_delete', dates[todo.id], todo.id) for todo in removed]) # 변경 기록 저장.
+        self.check_and_reward_full_gauges() # 만점 게이지 보상 체크.
+        return len(removed)
+
+    @traced("engine.copy_todos", "engine")
+    def copy_todos(self, todo_ids, target_date):
+        """
+        여러 할 일을 target_date로 복사합니다. (완료 상태 유지, 새 id)
+        Returns:
+            list: 복사로 만들어진 할 일 id 리스트.
+        """
+        copied = self.todo_manager.copy_todos(todo_ids, target_date)
+        if not copied:
+            self._notify('error', "오류", "할 일 복사에 실패했습니다.")
+            return []
+        if target_date == self.todo_manager.get_current_date():
+            self._emit(EVENT_CHANGED, parts={PART_TODOS})
+        changes = [('todo_add', target_date, todo.text, todo.id) for todo in copied]
+        changes += [('todo_update', target_date, todo.id, {'completed': True}) for todo in copied if todo.completed]
+        self._persist(*changes) # 변경 기록 저장.
+        return [todo.id for todo in copied]
+
+    @traced("engine.move_todos", "engine")
+    def move_todos(self, todo_ids, target_date):
+        """
+        여러 할 일을 target_date로 옮깁니다. (id와 완료 상태 유지)
+        Returns:
+            int: 옮겨진 할 일 개수.
+        """
+        moved = self.todo_manager.move_todos(todo_ids, target_date)
+        if not moved:
+            self._notify('error', "오류", "할 일 이동에 실패했습니다.")
+            return 0
+        self._emit(EVENT_CHANGED, parts={PART_TODOS}) # 할 일 목록만 갱신.
+        self._persist(*[('todo_move', date, todo.id, target_date) for date, todo in moved]) # 변경 기록 저장.
+        return len(moved)
+
+    @traced("engine.give_snack", "engine")
+    def give_snack(self, snack_name):
+        """
+        펫에게 간식을 줍니다.
+        Returns:
+            bool: 간식 주기 성공 여부.
+        """
+        # 펫이 이미 행복도/포만감 만점일 경우 간식 주기 방지.
+        if self.pet.happiness >= self.pet.max_happiness and self.pet.fullness >= self.pet.max_fullness:
+            self._notify('info', "알림", f"'{self.pet.name}'(이)는 이미 행복하고 배불러서 더 이상 간식을 먹을 수 없어요! 조금 쉬게 해주세요 :)")
+            return False
+
+        effect = self.todo_manager.use_snack(snack_name) # 간식 사용 및 효과 반환.
+        if effect: # 간식이 사용되었고 효과가 있다면.
+            self.pet.give_snack(effect) # 펫에게 간식 효과 적용.
+            self._emit(EVENT_SNACK_GIVEN, snack_name=snack_name)
+            self._emit(EVENT_CHANGED, parts={PART_PET, PART_SNACKS}) # 펫/간식 표시만 갱신.
+            self._persist(*self._pet_state_changes()) # 변경 기록 저장.
+            self.check_and_reward_full_gauges() # 만점 게이지 보상 체크.
+            return True
+        self._notify('info', "알림", f"'{snack_name}' 간식이 없거나 부족합니다.")
+        return False
+
+    def change_date(self, delta_days):
+        """
+        표시 날짜를 delta_days일 만큼 이동합니다.
+        Returns:
+            bool: 날짜 변경 성공 여부 (항상 True).
+        """
+        current_display_date = self.todo_manager.get_current_date()
+        return self.go_to_date(current_display_date + datetime.timedelta(days=delta_days)) # 새 표시 날짜로 이동.
+
+    @traced("engine.go_to_date", "engine")
+    def go_to_date(self, date):
+        """
+        표시 날짜를 지정한 날짜로 바꿉니다. (검색 결과 등에서 바로 이동)
+        Returns:
+            bool: 날짜 변경 성공 여부 (항상 True).
+        """
+        current_display_date = self.todo_manager.get_current_date()
+        self.todo_manager.set_current_date(date) # 할 일 관리자의 현재 날짜 설정.
+        self._emit(EVENT_CHANGED, parts={PART_DATE, PART_TODOS}) # 날짜와 할 일 목록만 갱신.
+        log.debug("날짜 변경: %s -> %s", current_display_date, date)
+        self.check_and_reward_full_gauges() # 만점 게이지 보상 체크 (날짜 변경 시 상태 확인).
+        return True
+
+    # --- 검색 ---
+    def _reset_search_index(self):
+        """검색 색인(만드는 중인 것 포함)을 버립니다. 다음 검색 때 새로 만듭니다."""
+        self.search_index = None
+        self._index_build = None
+
+    def start_search_index_build(self, loader=None):
+        """
+        검색 색인을 백그라운드 스레드에서 만들기 시작합니다. (시작 직후 호출하면 첫 검색이 기다리지 않음)
+        만드는 동안의 할 일 변경은 모아 두었다가 완성된 색인에 반영합니다.
+        Args:
+            loader (callable, optional): 다른 스레드에서 호출해도 되는, 모든 날짜의 (날짜, 할 일 리스트) 쌍을
+                                         반환하는 함수. 없으면 지금 TodoManager에 있는 데이터의 복사본으로 만듭니다.
+        """
+        if not self.todo_manager or self.search_index is not None or self._index_build is not None:
+            return
+        if loader is None:
+            loader = self.todo_manager.get_daily_todos_data().items() # (날짜별 리스트는 새로 만든 복사본)
+        self._index_build = BackgroundIndexBuild(loader)
+
+    def _ensure_search_index(self):
+        """
+        검색 색인이 없으면 모든 날짜의 할 일로 새로 만듭니다.
+        Returns:
+            TodoSearchIndex or None: 색인. 백그라운드에서 아직 만드는 중이면 None.
+        """
+        if self.search_index is None and self._index_build is not None:
+            if not self._index_build.done():
+                return None
+            build, self._index_build = self._index_build, None
+            try:
+                self.search_index = build.finish()
+            except Exception as e: # 실패하면 아래에서 직접 만듦.
+                log.warning("검색 색인 백그라운드 생성 중 오류 발생: %s", e)
+        if self.search_index is None:
+            if self.all_todos_loader is not None:
+                daily_todos = self.all_todos_loader()
+            else:
+                daily_todos = self.todo_manager.get_daily_todos_data().items()
+            self.search_index = TodoSearchIndex()
+            self.search_index.build(daily_todos)
+        return self.search_index
+
+    @traced("engine.search_todos", "engine")
+    def search_todos(self, query, limit=config.SEARCH_RESULT_LIMIT):
+        """
+        모든 날짜의 할 일에서 검색어의 모든 단어를 포함하는 할 일을 찾습니다.
+        첫 검색 때 (또는 start_search_index_build로 미리) 색인을 만들고, 이후에는 할 일 변경마다 색인을 갱신합니다.
+        Args:
+            query (str): 검색어.
+            limit (int): 최대 결과 개수.
+        Returns:
+            list or None: (날짜, 할 일 id, 내용) 튜플 리스트. 최근 날짜 순.
+                          색인을 백그라운드에서 아직 만드는 중이면 None (잠시 후 다시 검색).
+        """
+        if not self.todo_manager:
+            return []
+        search_index = self._ensure_search_index()
+        return search_index.search(query, limit) if search_index is not None else None
+
+    # --- 통계 ---
+    @traced("engine.get_stats", "engine")
+    def get_stats(self, today=None):
+        """
+        할 일 완료율, 연속 달성 일수, 주별 경험치, 펫 종류별 평균 레벨 통계를 반환합니다. (analytics.TodoStats.report 참고)
+        Args:
+            today (datetime.date, optional): 기준 날짜. 기본값은 오늘.
+        Returns:
+            dict or None: 통계 딕셔너리. 펫이 없으면 None.
+        """
+        if not self.todo_manager:
+            return None
+        return self.stats.report(today)
+
+    def delete_history_record(self, index):
+        """
+        index번째 과거 펫 기록을 삭제합니다.
+        Returns:
+            bool: 기록 삭제 성공 여부.
+        """
+        if 0 <= index < len(self.historical_pets): # 유효한 인덱스인지 확인.
+            deleted_record = self.historical_pets.pop(index) # 리스트에서 기록 삭제.
+            self.stats.remove_history(deleted_record)
+            log.info("과거 펫 기록 삭제됨: %s", deleted_record)
+            self._persist(('history_delete', index)) # 변경 기록 저장.
+            return True
+        return False
+
+    # --- 가져오기 ---
+    @traced("engine.import_records", "engine")
+    def import_records(self, records, batch_size=config.EXCHANGE_BATCH_SIZE):
+        """
+        내보낸 데이터 레코드(data_exchange 형식)를 현재 데이터에 합칩니다. 레코드는 하나씩 처리되므로 메모리 사용량이 일정합니다.
+        합치는 규칙 (같은 파일을 여러 번 가져와도 결과가 같음):
+        - 펫: 현재 펫이 없을 때만 가져온 펫으로 시작.
+        - 간식: 종류별로 더 많은 개수를 유지.
+        - 과거 펫 기록: 같은 기록(종류, 레벨, 기간)이 없을 때만 추가.
+        - 할 일: 같은 날짜의 같은 내용 할 일과 하나씩 짝지어 완료 상태만 합치고, 짝이 없으면 새 id로 추가.
+        변경은 batch_size개씩 모아 기록 이벤트로 내보내고, 끝나면 전체 저장을 요청합니다.
+        Args:
+            records (iterable): 'type' 키('pet', 'snack', 'history', 'todo')를 가진 레코드 딕셔너리들. (그 밖의 종류는 무시)
+        Returns:
+            dict: 가져온 결과 개수 (pet_created, snacks_updated, history_added, todos_added, todos_completed, todos_matched).
+        Raises:
+            ValueError: 현재 펫이 없는데 펫 레코드가 없거나 다른 레코드보다 늦게 나온 경우.
+        """
+        stats = {'pet_created': False, 'snacks_updated': 0, 'history_added': 0,
+                 'todos_added': 0, 'todos_completed': 0, 'todos_matched': 0}
+        history_keys = {(record['species'], record['level'], record['start_date'], record['end_date'])
+                        for record in self.historical_pets}
+        changes = []
+        dirty_dates = set() # 아직 기록 이벤트로 내보내지 않은 변경이 있는 날짜.
+        day_date, day_entries = None, [] # 연속으로 나온 같은 날짜의 할 일들 (한 번에 합침).
+
+        def flush_changes():
+            if changes:
+                self._persist(*changes)
+                changes.clear()
+                dirty_dates.clear()
+
+        def merge_day():
+            if not day_entries:
+                return
+            # 날짜별 로더 사용 시, 아직 기록되지 않은 변경이 있는 날짜를 저장소에서 다시 불러오지 않도록 먼저 기록.
+            if self.day_loader is not None and day_date in dirty_dates and day_date not in self.todo_manager.daily_todos:
+                flush_changes()
+            added, completed, matched = self.todo_manager.merge_todos(day_date, day_entries)
+            for todo in added:
+                changes.append(('todo_add', day_date, todo.text, todo.id))
+                if todo.completed:
+                    changes.append(('todo_update', day_date, todo.id, {'completed': True}))
+            changes.extend(('todo_update', day_date, todo.id, {'completed': True}) for todo in completed)
+            if added or completed:
+                dirty_dates.add(day_date)
+            stats['todos_added'] += len(added)
+            stats['todos_completed'] += len(completed)
+            stats['todos_matched'] += matched
+            day_entries.clear()
+            if len(changes) >= batch_size:
+                flush_changes()
+
+        for record in records:
+            kind = record['type']
+            if kind in ('snack', 'history', 'todo') and self.pet is None:
+                raise ValueError("가져올 데이터에 펫 정보가 없습니다.")
+            if kind == 'todo':
+                if record['date'] != day_date:
+                    merge_day()
+                    day_date = record['date']
+                day_entries.append((record['text'], record['completed']))
+                if len(day_entries) >= batch_size:
+                    merge_day()
+                continue
+            merge_day()
+            if kind == 'pet':
+                if self.pet is None: # 현재 펫이 없으면 가져온 펫으로 시작.
+                    pet = Pet(name=record['name'], species=record['species'], level=record['level'], exp=record['exp'],
+                              happiness=record['happiness'], fullness=record['fullness'],
+                              last_reset_date=record['last_reset_date'])
+                    pet.has_been_rewarded_for_full_gauges = record['rewarded_for_full_gauges']
+                    self.pet = pet
+                    self.todo_manager = self._create_todo_manager()
+                    self._reset_search_index()
+                    self._emit(EVENT_FULL_SAVE) # 이후 변경 기록이 이어질 기준 스냅샷 저장.
+                    stats['pet_created'] = True
+            elif kind == 'snack':
+                snack_counts = self.todo_manager.get_current_snack_counts()
+                if record['count'] > snack_counts.get(record['name'], 0):
+                    snack_counts[record['name']] = record['count']
+                    changes.append(('snacks', dict(snack_counts)))
+                    stats['snacks_updated'] += 1
+            elif kind == 'history':
+                key = (record['species'], record['level'], record['start_date'], record['end_date'])
+                if key not in history_keys:
+                    history_keys.add(key)
+                    history_record = {'species': key[0], 'level': key[1], 'start_date': key[2], 'end_date': key[3]}
+                    self.historical_pets.append(history_record)
+                    self.stats.add_history(history_record)
+                    changes.append(('history_add', dict(history_record)))
+                    stats['history_added'] += 1
+        if self.pet is None:
+            raise ValueError("가져올 데이터에 펫 정보가 없습니다.")
+        merge_day()
+        flush_changes()
+        log.info("데이터 가져오기 완료: %s", stats)
+        self._emit(EVENT_CHANGED, parts=None) # 전체 화면 갱신.
+        self._emit(EVENT_FULL_SAVE) # 많은 변경을 스냅샷으로 정리.
+        return stats
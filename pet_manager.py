@@ -16,6 +16,9 @@ from config import (
     INITIAL_PET_FULLNESS, MAX_PET_FULLNESS,
     PET_RESET_INTERVAL_DAYS, WEEKLY_RESET_DAY, RESET_TIME_HOUR
 )
+from instrumentation import get_logger # 레벨별 진단 로그.
+
+log = get_logger("pet_manager")
 
 class Pet:
     """
@@ -62,7 +65,7 @@ class Pet:
         self.happiness = min(self.max_happiness, self.happiness + snack_effect.get('happiness', 0)) 
         # 포만감 증가 (최대 포만도를 초과하지 않도록 min 사용).
         self.fullness = min(self.max_fullness, self.fullness + snack_effect.get('fullness', 0))   
-        print(f"{self.name}이가 간식을 먹고 행복해했어요! 행복도: {self.happiness}, 포만감: {self.fullness}")
+        log.debug("%s이가 간식을 먹고 행복해했어요! 행복도: %d, 포만감: %d", self.name, self.happiness, self.fullness)
         self.has_been_rewarded_for_full_gauges = False # 간식으로 상태 변경 시 만점 보상 상태 플래그 리셋.
 
     def add_exp(self, amount=EXP_PER_TODO_COMPLETE): 
@@ -74,7 +77,7 @@ class Pet:
             bool: 레벨업 성공 여부.
         """
         self.exp += amount # 경험치 증가.
-        print(f"{self.name}이가 경험치를 {amount} 얻었어요! 현재 경험치: {self.exp}/{self.get_required_exp_for_level_up()}")
+        log.debug("%s이가 경험치를 %d 얻었어요! 현재 경험치: %d/%d", self.name, amount, self.exp, self.get_required_exp_for_level_up())
 
         leveled_up = False
         # 최대 레벨 미만이고 현재 경험치가 다음 레벨업 필요 경험치보다 많거나 같을 때 레벨업 반복.
@@ -85,7 +88,7 @@ class Pet:
                 self.exp = 0 
             leveled_up = True # 레벨업이 발생했음을 표시.
             self.image_path = self._get_image_path(self.species, self.level) # 레벨업에 따른 이미지 경로 갱신.
-            print(f"{self.name}이가 레벨업! 현재 레벨: {self.level}")
+            log.info("%s이가 레벨업! 현재 레벨: %d", self.name, self.level)
             
         return leveled_up # 레벨업 발생 여부 반환.
 
@@ -105,4 +108,4 @@ class Pet:
         self.last_reset_date = datetime.date.today() # 리셋 날짜를 오늘로 갱신.
         self.image_path = self._get_image_path(self.species, self.level) # 새 펫 종류와 레벨에 따른 이미지 경로 갱신.
         self.has_been_rewarded_for_full_gauges = False # 환생 시 만점 보상 플래그 초기화.
-        print(f"{self.name}이가 새로운 모습으로 태어났어요!")
\ No newline at end of file
+        log.info("%s이가 새로운 모습으로 태어났어요!", self.name)
\ No newline at end of file
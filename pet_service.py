@@ -0,0 +1,540 @@
+# pet_service.py
+
+# 여러 사용자의 펫을 하나의 프로세스에서 관리하는 서비스 모듈.
+# 사용자마다 PetDoListEngine(Pet, TodoManager 그대로 사용)과 전용 저장소(스냅샷 + 저널)를 두고,
+# 데이터 파일은 사용자 ID 해시로 SERVICE_SHARD_COUNT개의 하위 폴더에 나눠 저장합니다.
+# 최근 사용한 사용자만 메모리에 유지하며(LRU), 로컬 HTTP API(JSON)로 동작을 제공합니다.
+#
+# 실행: python pet_service.py [--host 127.0.0.1] [--port 8765]
+#   GET    /users/<id>                       상태 조회 (?date=YYYY-MM-DD 로 해당 날짜의 할 일, 현재 날짜는 그대로)
+#   GET    /users/<id>/search?q=<검색어>     모든 날짜의 할 일 검색 (result: 최근 날짜 순 결과,
+#                                            색인을 만드는 중이면 503 + Retry-After)
+#   GET    /users/<id>/calendar?month=YYYY-MM 한 달의 날짜별 할 일 요약 (result: {날짜: 전체/완료/남은 개수})
+#   GET    /users/<id>/stats                 완료율, 연속 달성, 주별 경험치, 종류별 평균 레벨 통계 (?date=YYYY-MM-DD 기준일)
+#   POST   /users/<id>/pet                   {"name", "species"} 펫 생성
+#   POST   /users/<id>/todos                 {"text"} 할 일 추가 (result: 새 할 일 id)
+#   POST   /users/<id>/todos/<todo_id>       {"text"} 할 일 내용 수정
+#   POST   /users/<id>/todos/<todo_id>/complete 할 일 완료
+#   DELETE /users/<id>/todos/<todo_id>       할 일 삭제
+#   POST   /users/<id>/snacks                {"name"} 간식 주기
+#   POST   /users/<id>/date                  {"delta_days"} 표시 날짜 이동
+#   POST   /users/<id>/rebirth               {"name", "species"} 환생
+#   DELETE /users/<id>/history/<index>       과거 펫 기록 삭제
+
+import os          # 사용자별 파일 경로 처리.
+import re          # 사용자 ID 검사.
+import json        # HTTP 요청/응답 본문.
+import zlib        # 사용자 ID -> 샤드 번호 (crc32).
+import datetime    # 날짜 문자열 변환.
+import threading   # 사용자/캐시 잠금, 파이프라인 실행 스레드.
+import asyncio     # 명령 파이프라인 실행 루프.
+import argparse    # 명령줄 인자.
+from collections import OrderedDict # 최근 사용 순서를 유지하는 사용자 캐시.
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler # 로컬 HTTP API.
+from urllib.parse import urlsplit, parse_qs # 요청 경로/쿼리 분석.
+
+import config       # 서비스 설정 값.
+import data_manager # 사용자별 스냅샷 + 저널 저장소.
+import pet_engine   # 사용자별 핵심 로직.
+import analytics    # 통계 응답의 날짜 변환.
+from command_pipeline import CommandPipeline # 사용자별 명령 실행 + 그룹 커밋.
+from rebirth_scheduler import RebirthScheduler, run_rebirth_timer # 사용자별 환생 시각 타이머.
+from instrumentation import get_logger, configure_logging # 요청 처리 오류 로그, 서비스 실행 시 로그 설정.
+
+log = get_logger("pet_service")
+
+_USER_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$") # 파일명으로 안전한 사용자 ID.
+
+# 응답에 담아 돌려줄 엔진 이벤트 (알림, 보상 등).
+_REPORTED_EVENTS = (pet_engine.EVENT_NOTICE, pet_engine.EVENT_TODO_COMPLETED, pet_engine.EVENT_LEVEL_UP,
+                    pet_engine.EVENT_FULL_GAUGE_REWARD, pet_engine.EVENT_SNACK_GIVEN, pet_engine.EVENT_REBIRTH)
+
+class ServiceError(Exception):
+    """클라이언트에 HTTP 상태 코드와 함께 전달할 오류. (retry_after초가 있으면 Retry-After 헤더로 전달)"""
+    def __init__(self, status, message, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+def shard_for_user(user_id, shard_count=config.SERVICE_SHARD_COUNT):
+    """
+    사용자 ID가 속한 샤드 번호를 반환합니다. (프로세스가 바뀌어도 같은 값이 나오도록 crc32 사용)
+    Returns:
+        int: 0 이상 shard_count 미만의 샤드 번호.
+    """
+    return zlib.crc32(user_id.encode('utf-8')) % shard_count
+
+class UserSession:
+    """
+    메모리에 올라온 한 사용자의 상태.
+    엔진 명령은 사용자별 CommandPipeline으로 실행되어, 같은 사용자에게 동시에 들어온 요청들의 변경이
+    하나의 저널 레코드로 그룹 커밋되고, 저널이 충분히 쌓이면 스냅샷으로 압축됩니다.
+    만들 때는 디스크를 읽지 않으며, 첫 동작 전에 세션 잠금 안에서 ensure_loaded로 데이터를 불러옵니다.
+    """
+    def __init__(self, user_id, data_dir=config.SERVICE_DATA_DIR, shard_count=config.SERVICE_SHARD_COUNT):
+        self.user_id = user_id
+        self.shard_dir = os.path.join(data_dir, f"{shard_for_user(user_id, shard_count):02x}")
+        self.storage = data_manager.JournalStorage(os.path.join(self.shard_dir, f"{user_id}.pkl"),
+                                                   os.path.join(self.shard_dir, f"{user_id}.journal"))
+        self.engine = pet_engine.PetDoListEngine()
+        self.pipeline = CommandPipeline(self.engine, self.storage) # 엔진 명령 실행 + 그룹 커밋.
+        self.lock = threading.Lock() # 불러오기/닫기 보호 (명령 순서는 파이프라인 큐가 보장).
+        self.active = 0              # 현재 이 세션을 사용 중인 요청 수 (사용 중이면 캐시에서 내리지 않음).
+        self.events = []             # 현재 명령 동안 발생한 엔진 이벤트.
+        self.pending_events = []     # 요청 밖에서 발생해 다음 응답에 담을 이벤트 (환생 알림).
+        self.rebirth_time = None     # 환생 타이머에 예약된 시각.
+        self.rebirth_after = None    # 환생 알림을 보낸 시각 (이후의 환생 시각으로 다시 예약).
+        self.loaded = False          # 디스크에서 데이터를 불러왔는지 여부.
+        self.previous = None         # 같은 사용자의 닫히는 중인 이전 세션 (닫힌 뒤에 불러옴).
+        self.closed = threading.Event() # close 완료 여부.
+
+        for event in _REPORTED_EVENTS:
+            self.engine.subscribe(event, lambda event=event, **kwargs: self.events.append(dict(kwargs, event=event)))
+
+    def ensure_loaded(self, loop):
+        """
+        아직 불러오지 않았다면 스냅샷과 저널에서 사용자 데이터를 불러오고 파이프라인을 시작합니다.
+        (세션 잠금을 잡은 상태에서 호출)
+        Args:
+            loop (asyncio.AbstractEventLoop): 파이프라인을 실행할 (다른 스레드에서 실행 중인) 이벤트 루프.
+        """
+        if self.loaded:
+            return
+        if self.previous is not None: # 이전 세션의 마지막 기록이 끝난 뒤에 읽음.
+            self.previous.closed.wait()
+            self.previous = None
+        os.makedirs(self.shard_dir, exist_ok=True)
+        self.engine.load_state(*self.storage.load(), next_todo_id=self.storage.next_todo_id())
+        # 검색 색인은 백그라운드 스레드에서 만듦. (첫 검색이 공유 루프에서 색인을 만들며 다른 사용자를 막지 않도록)
+        self.engine.start_search_index_build()
+        asyncio.run_coroutine_threadsafe(self.pipeline.start(), loop).result()
+        self.loaded = True
+
+    def close(self, loop):
+        """파이프라인에 남은 명령과 기록을 모두 마치고 멈춥니다. (세션 잠금을 잡은 상태에서 호출)"""
+        try:
+            if self.loaded:
+                asyncio.run_coroutine_threadsafe(self.pipeline.stop(), loop).result()
+                self.loaded = False
+        finally:
+            self.closed.set()
+
+    def save(self):
+        """사용자의 전체 데이터를 스냅샷으로 저장합니다. (close 이후 호출)"""
+        if self.engine.pet and self.engine.todo_manager:
+            self.storage.save(*self.engine.capture_snapshot())
+
+class PetService:
+    """
+    사용자 ID별 UserSession을 관리하는 클래스.
+    최근 사용한 사용자 최대 hot_user_limit명을 메모리에 유지하고, 넘치면 사용 중이 아닌 가장 오래된 사용자부터 내립니다.
+    (변경은 명령 그룹마다 저널에 기록되므로 내릴 때는 파이프라인만 멈추면 됩니다.)
+    모든 사용자의 파이프라인과 환생 타이머는 서비스 전용 스레드의 asyncio 루프 하나에서 실행됩니다.
+    메모리에 있는 사용자마다 다음 환생 시각을 예약해 두고, 시각이 되면 다음 응답의 이벤트로 환생 알림을 보냅니다.
+    """
+    def __init__(self, data_dir=config.SERVICE_DATA_DIR, shard_count=config.SERVICE_SHARD_COUNT,
+                 hot_user_limit=config.SERVICE_HOT_USER_LIMIT):
+        self.data_dir = data_dir
+        self.shard_count = shard_count
+        self.hot_user_limit = hot_user_limit
+        self._sessions = OrderedDict() # user_id -> UserSession (최근 사용이 끝쪽).
+        self._closing = {}             # user_id -> 캐시에서 내려 닫히는 중인 UserSession.
+        self._lock = threading.Lock()  # 사용자 캐시 보호.
+        self._loop = asyncio.new_event_loop() # 명령 파이프라인 실행 루프.
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="PetServiceLoop", daemon=True)
+        self._loop_thread.start()
+        self._rebirth_scheduler = RebirthScheduler() # user_id -> 다음 환생 시각. (루프 스레드에서만 사용)
+        self._rebirth_wakeup = asyncio.Event()       # 예약 변경 시 타이머 대기 시간 재계산.
+        self._rebirth_timer = asyncio.run_coroutine_threadsafe(
+            run_rebirth_timer(self._rebirth_scheduler, self._on_rebirth_due, self._rebirth_wakeup), self._loop)
+
+        # 통계.
+        self.loads = 0
+        self.evictions = 0
+
+    def _checkout(self, user_id):
+        """
+        사용자 세션을 캐시에서 꺼내거나 새로 만들어 넣고 사용 중으로 표시합니다.
+        디스크 읽기는 캐시 잠금 밖에서 (run의 세션 잠금 안에서) 하므로, 한 사용자를 불러오는 동안에도
+        다른 사용자의 요청은 기다리지 않습니다.
+        """
+        if not isinstance(user_id, str) or not _USER_ID_PATTERN.match(user_id):
+            raise ServiceError(400, f"잘못된 사용자 ID입니다: {user_id}")
+        with self._lock:
+            session = self._sessions.get(user_id)
+            if session is None:
+                session = UserSession(user_id, self.data_dir, self.shard_count)
+                session.previous = self._closing.get(user_id)
+                self._sessions[user_id] = session
+                self.loads += 1
+            else:
+                self._sessions.move_to_end(user_id)
+            session.active += 1
+            return session
+
+    def _release(self, session):
+        """사용 중 표시를 해제하고, 캐시가 넘치면 사용 중이 아닌 오래된 사용자부터 내립니다."""
+        evicted = []
+        with self._lock:
+            session.active -= 1
+            for user_id in list(self._sessions):
+                if len(self._sessions) <= self.hot_user_limit:
+                    break
+                if self._sessions[user_id].active == 0:
+                    evicted.append(self._sessions.pop(user_id))
+                    self._closing[user_id] = evicted[-1]
+                    self.evictions += 1
+        for old_session in evicted: # 파이프라인 정지는 캐시 잠금 밖에서.
+            self._loop.call_soon_threadsafe(self._rebirth_scheduler.cancel, old_session.user_id)
+            try:
+                with old_session.lock:
+                    old_session.close(self._loop)
+            finally:
+                with self._lock:
+                    if self._closing.get(old_session.user_id) is old_session:
+                        del self._closing[old_session.user_id]
+
+    def run(self, user_id, operation, require_pet=True, state_date=None):
+        """
+        사용자 파이프라인에 operation(engine)을 명령으로 제출하고, 기록이 끝날 때까지 기다립니다.
+        Args:
+            user_id (str): 사용자 ID.
+            operation (callable): PetDoListEngine을 받아 결과를 반환하는 함수.
+            require_pet (bool): 펫이 없는 사용자면 404 오류를 낼지 여부.
+            state_date (datetime.date, optional): 응답 상태에 보여줄 날짜. 없으면 현재 날짜.
+        Returns:
+            dict: {'result', 'events', 'state'}.
+        Raises:
+            ServiceError: 잘못된 사용자 ID, 펫 없음 등.
+        """
+        session = self._checkout(user_id)
+        try:
+            with session.lock:
+                session.ensure_loaded(self._loop)
+            def command(engine): # 파이프라인 루프 스레드에서 실행.
+                if require_pet and engine.pet is None:
+                    raise ServiceError(404, f"사용자 '{user_id}'의 펫이 없습니다. 먼저 펫을 만들어 주세요.")
+                session.events, session.pending_events = session.pending_events, []
+                result = operation(engine)
+                self._update_rebirth_schedule(session)
+                return {'result': result, 'events': session.events, 'state': engine_state(engine, state_date)}
+            return session.pipeline.submit_threadsafe(command).result()
+        finally:
+            self._release(session)
+
+    def _update_rebirth_schedule(self, session):
+        """사용자의 다음 환생 시각이 바뀌었으면 (불러온 뒤, 펫 생성/환생 후) 환생 타이머에 다시 예약합니다. (루프 스레드)"""
+        rebirth_time = session.engine.next_rebirth_time(session.rebirth_after)
+        if rebirth_time == session.rebirth_time:
+            return
+        session.rebirth_time = rebirth_time
+        if rebirth_time is None:
+            self._rebirth_scheduler.cancel(session.user_id)
+        else:
+            self._rebirth_scheduler.schedule(session.user_id, rebirth_time)
+        self._rebirth_wakeup.set()
+
+    def _on_rebirth_due(self, user_id):
+        """환생 시각이 된 사용자에게 다음 응답으로 환생 알림을 보내고, 그 이후의 환생 시각으로 다시 예약합니다. (루프 스레드)"""
+        with self._lock:
+            session = self._sessions.get(user_id)
+        if session is None or not session.loaded:
+            return
+        now = datetime.datetime.now()
+        if session.engine.is_rebirth_due(now):
+            session.pending_events.append({
+                'event': pet_engine.EVENT_NOTICE, 'level': 'info', 'title': "펫 환생 알림",
+                'message': f"이번 주 ({session.engine.pet.last_reset_date} ~ {now.date()})의 여정이 끝났습니다! "
+                           "새로운 펫으로 환생할 수 있어요.",
+            })
+            log.info("사용자 '%s'의 펫 환생 시각 도래", user_id)
+        session.rebirth_after = now
+        session.rebirth_time = None
+        self._update_rebirth_schedule(session)
+
+    def shutdown(self):
+        """모든 사용자의 파이프라인을 멈추고 스냅샷을 저장한 뒤 실행 루프를 끝냅니다. (서비스 종료 시)"""
+        self._rebirth_timer.cancel()
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            with session.lock:
+                session.close(self._loop)
+                session.save()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+
+    def get_stats(self):
+        """
+        사용자 캐시 통계를 반환합니다.
+        Returns:
+            dict: 메모리에 있는 사용자 수, 불러온 횟수, 내린 횟수.
+        """
+        with self._lock:
+            return {'hot_users': len(self._sessions), 'loads': self.loads, 'evictions': self.evictions}
+
+    # --- 동작 ---
+    def get_state(self, user_id, date=None):
+        """
+        사용자 상태를 반환합니다. date를 주면 해당 날짜의 할 일을 보여줍니다.
+        조회만 하므로 현재 날짜(할 일을 추가할 날짜)는 바꾸지 않습니다. (날짜 이동은 change_date)
+        """
+        return self.run(user_id, lambda engine: True, state_date=date)
+
+    def create_pet(self, user_id, name, species):
+        """사용자의 새 펫을 만듭니다. 이미 펫이 있으면 409 오류."""
+        _check_pet_fields(name, species)
+        def operation(engine):
+            if engine.pet is not None:
+                raise ServiceError(409, f"사용자 '{user_id}'의 펫이 이미 있습니다.")
+            engine.create_pet(name, species)
+            return True
+        return self.run(user_id, operation, require_pet=False)
+
+    def add_todo(self, user_id, text):
+        return self.run(user_id, lambda engine: engine.add_todo(text))
+
+    def complete_todo(self, user_id, todo_id):
+        return self.run(user_id, lambda engine: engine.complete_todo(todo_id))
+
+    def edit_todo(self, user_id, todo_id, text):
+        return self.run(user_id, lambda engine: engine.edit_todo(todo_id, text))
+
+    def remove_todo(self, user_id, todo_id):
+        return self.run(user_id, lambda engine: engine.remove_todo(todo_id))
+
+    def search_todos(self, user_id, query):
+        """
+        사용자의 모든 날짜 할 일에서 검색합니다. 결과는 {'date', 'id', 'text'} 리스트 (최근 날짜 순).
+        검색 색인을 아직 만드는 중이면 503 오류 (Retry-After초 뒤 다시 요청).
+        """
+        def operation(engine):
+            results = engine.search_todos(query)
+            if results is None:
+                raise ServiceError(503, "검색 색인을 준비하는 중입니다. 잠시 후 다시 시도해 주세요.",
+                                   retry_after=config.SERVICE_SEARCH_RETRY_AFTER_SECONDS)
+            return [{'date': date.isoformat(), 'id': todo_id, 'text': text} for date, todo_id, text in results]
+        return self.run(user_id, operation)
+
+    def get_month_summaries(self, user_id, year, month):
+        """사용자의 한 달 동안 할 일이 있는 날짜별 요약을 반환합니다."""
+        return self.run(user_id, lambda engine: {
+            date.isoformat(): {'total': total, 'completed': completed, 'pending': pending}
+            for date, (total, completed, pending) in engine.todo_manager.get_month_summaries(year, month).items()})
+
+    def get_todo_stats(self, user_id, date=None):
+        """사용자의 할 일/과거 펫 통계를 반환합니다. (analytics.TodoStats.report, 날짜는 ISO 문자열)"""
+        return self.run(user_id, lambda engine: analytics.jsonable(engine.get_stats(date)))
+
+    def give_snack(self, user_id, snack_name):
+        if not isinstance(snack_name, str):
+            raise ServiceError(400, "간식 이름은 문자열이어야 합니다.")
+        return self.run(user_id, lambda engine: engine.give_snack(snack_name))
+
+    def change_date(self, user_id, delta_days):
+        if (not isinstance(delta_days, int) or isinstance(delta_days, bool)
+                or abs(delta_days) > config.SERVICE_MAX_DELTA_DAYS):
+            raise ServiceError(400, f"이동할 날짜 수는 -{config.SERVICE_MAX_DELTA_DAYS} ~ "
+                                    f"{config.SERVICE_MAX_DELTA_DAYS} 사이의 정수여야 합니다.")
+        def operation(engine):
+            try:
+                return engine.change_date(delta_days)
+            except OverflowError:
+                raise ServiceError(400, f"이동할 수 없는 날짜입니다: {delta_days}일")
+        return self.run(user_id, operation)
+
+    def rebirth(self, user_id, name, species):
+        _check_pet_fields(name, species)
+        return self.run(user_id, lambda engine: engine.rebirth(name, species) is not None)
+
+    def delete_history_record(self, user_id, index):
+        return self.run(user_id, lambda engine: engine.delete_history_record(index))
+
+def _check_pet_fields(name, species):
+    """펫 생성/환생 요청의 이름과 종류를 검사합니다. 잘못되면 400 오류."""
+    if not isinstance(name, str):
+        raise ServiceError(400, "펫 이름은 문자열이어야 합니다.")
+    if not isinstance(species, str) or species not in config.PET_SPECIES_LIST:
+        raise ServiceError(400, f"알 수 없는 펫 종류입니다: {species}")
+
+def engine_state(engine, date=None):
+    """
+    엔진 상태를 JSON으로 보낼 수 있는 딕셔너리로 변환합니다.
+    Args:
+        date (datetime.date, optional): 할 일을 보여줄 날짜. 없으면 현재 날짜. (현재 날짜는 바꾸지 않음)
+    Returns:
+        dict or None: 펫, 날짜와 그 날짜의 할 일, 간식, 과거 펫 기록, 환생 필요 여부. 펫이 없으면 None.
+    """
+    pet = engine.pet
+    if pet is None:
+        return None
+    if date is None:
+        date = engine.todo_manager.get_current_date()
+    return {
+        'pet': {
+            'name': pet.name, 'species': pet.species, 'level': pet.level, 'exp': pet.exp,
+            'required_exp': pet.get_required_exp_for_level_up(),
+            'happiness': pet.happiness, 'fullness': pet.fullness,
+            'last_reset_date': pet.last_reset_date.isoformat(),
+        },
+        'date': date.isoformat(),
+        'todos': [todo.to_dict() for todo in engine.todo_manager.get_day_todos(date)],
+        'snack_counts': dict(engine.todo_manager.get_current_snack_counts()),
+        'historical_pets': [
+            {'species': record['species'], 'level': record['level'],
+             'start_date': record['start_date'].isoformat(), 'end_date': record['end_date'].isoformat()}
+            for record in engine.historical_pets
+        ],
+        'rebirth_due': engine.is_rebirth_due(),
+    }
+
+class PetServiceRequestHandler(BaseHTTPRequestHandler):
+    """PetService 동작을 JSON HTTP API로 제공하는 요청 처리기. (server.service에 PetService 연결)"""
+
+    def _send_json(self, status, body, retry_after=None):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise ServiceError(400, "요청 본문이 올바른 JSON이 아닙니다.")
+        if not isinstance(body, dict):
+            raise ServiceError(400, "요청 본문은 JSON 객체여야 합니다.")
+        return body
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        service = self.server.service
+        try:
+            if len(parts) < 2 or parts[0] != 'users':
+                raise ServiceError(404, "알 수 없는 경로입니다.")
+            user_id, route = parts[1], (method, *parts[2:])
+            if route == ('GET',):
+                dates = parse_qs(url.query).get('date')
+                date = _parse_date(dates[0]) if dates else None
+                response = service.get_state(user_id, date)
+            elif route == ('GET', 'calendar'):
+                months = parse_qs(url.query).get('month')
+                month_date = _parse_date(months[0] + "-01") if months else datetime.date.today()
+                response = service.get_month_summaries(user_id, month_date.year, month_date.month)
+            elif route == ('GET', 'stats'):
+                dates = parse_qs(url.query).get('date')
+                response = service.get_todo_stats(user_id, _parse_date(dates[0]) if dates else None)
+            elif route == ('GET', 'search'):
+                response = service.search_todos(user_id, parse_qs(url.query).get('q', [''])[0])
+            elif route == ('POST', 'pet'):
+                body = self._read_json()
+                response = service.create_pet(user_id, _optional_str(body, 'name'), _required_str(body, 'species'))
+            elif route == ('POST', 'todos'):
+                response = service.add_todo(user_id, _required_str(self._read_json(), 'text'))
+            elif len(route) == 4 and route[:2] == ('POST', 'todos') and route[3] == 'complete':
+                response = service.complete_todo(user_id, _parse_index(route[2]))
+            elif len(route) == 3 and route[:2] == ('POST', 'todos'):
+                text = _required_str(self._read_json(), 'text')
+                response = service.edit_todo(user_id, _parse_index(route[2]), text)
+            elif len(route) == 3 and route[:2] == ('DELETE', 'todos'):
+                response = service.remove_todo(user_id, _parse_index(route[2]))
+            elif route == ('POST', 'snacks'):
+                response = service.give_snack(user_id, _required_str(self._read_json(), 'name'))
+            elif route == ('POST', 'date'):
+                response = service.change_date(user_id, self._read_json().get('delta_days'))
+            elif route == ('POST', 'rebirth'):
+                body = self._read_json()
+                response = service.rebirth(user_id, _optional_str(body, 'name'), _required_str(body, 'species'))
+            elif len(route) == 3 and route[:2] == ('DELETE', 'history'):
+                response = service.delete_history_record(user_id, _parse_index(route[2]))
+            else:
+                raise ServiceError(404, "알 수 없는 경로입니다.")
+        except ServiceError as e:
+            self._send_json(e.status, {'error': str(e)}, e.retry_after)
+            return
+        except Exception:
+            log.exception("요청 처리 중 오류 발생: %s %s", method, self.path)
+            self._send_json(500, {'error': "서버 내부 오류가 발생했습니다."})
+            return
+        self._send_json(200, response)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def log_message(self, format, *args):
+        if config.DEBUG_MODE:
+            super().log_message(format, *args)
+
+def _required_str(body, key):
+    """요청 본문에서 문자열 값을 꺼냅니다. 없거나 문자열이 아니면 400 오류."""
+    value = body.get(key)
+    if not isinstance(value, str):
+        raise ServiceError(400, f"'{key}'(문자열)가 필요합니다.")
+    return value
+
+def _optional_str(body, key):
+    """요청 본문에서 생략 가능한 문자열 값을 꺼냅니다. (없으면 빈 문자열, 문자열이 아니면 400 오류)"""
+    value = body.get(key)
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        raise ServiceError(400, f"'{key}'는 문자열이어야 합니다.")
+    return value
+
+def _parse_index(text):
+    try:
+        return int(text)
+    except ValueError:
+        raise ServiceError(400, f"잘못된 인덱스입니다: {text}")
+
+def _parse_date(text):
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        raise ServiceError(400, f"잘못된 날짜입니다: {text}")
+
+def create_server(service, host=config.SERVICE_HOST, port=config.SERVICE_PORT):
+    """
+    PetService를 제공하는 HTTP 서버를 만듭니다. (요청마다 스레드 하나)
+    Returns:
+        ThreadingHTTPServer: serve_forever()로 실행할 서버.
+    """
+    server = ThreadingHTTPServer((host, port), PetServiceRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+# --- 서비스 실행 ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pet-Do-List 다중 사용자 서비스")
+    parser.add_argument("--host", default=config.SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=config.SERVICE_PORT)
+    parser.add_argument("--data-dir", default=config.SERVICE_DATA_DIR)
+    args = parser.parse_args()
+    configure_logging()
+
+    service = PetService(data_dir=args.data_dir)
+    server = create_server(service, args.host, args.port)
+    print(f"Pet-Do-List 서비스 시작: http://{args.host}:{args.port}/users/<id>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown() # 종료 전 남은 기록을 마치고 모든 사용자 스냅샷 저장.
+        print(f"서비스 종료. {service.get_stats()}")
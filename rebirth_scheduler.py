@@ -0,0 +1,139 @@
+# rebirth_scheduler.py
+
+# 펫 환생 시각을 우선순위 큐(힙)로 관리하는 스케줄러 모듈.
+# 펫마다 다음 환생 시각(pet_engine.next_rebirth_instant)을 등록해 두면, 가장 이른 시각 하나만 타이머로 기다리므로
+# 모든 펫을 주기적으로 검사할 필요가 없습니다. 등록/취소/만기 꺼내기는 펫 하나당 O(log n)이며,
+# 앱이 꺼져 있어 놓친 환생 시각은 다음 확인 때 바로 만기로 처리됩니다.
+# 타이머는 GUI에서는 Tk after(), 화면 없는 환경에서는 asyncio 루프로 구동합니다.
+
+import heapq     # 환생 시각 우선순위 큐.
+import datetime  # 남은 시간 계산.
+import asyncio   # 화면 없는 환경의 타이머.
+
+from config import REBIRTH_TIMER_MAX_DELAY_MS # 최대 대기 시간 (재확인 간격).
+
+class RebirthScheduler:
+    """
+    키(펫 또는 사용자 ID)별 환생 시각을 보관하는 우선순위 큐 클래스.
+    같은 키를 다시 등록하면 이전 항목은 무효가 되며, 무효 항목은 꺼낼 때 버립니다 (지연 삭제).
+    """
+    def __init__(self):
+        self._heap = []     # (환생 시각, 등록 번호, 키)
+        self._entries = {}  # 키 -> 유효한 등록 번호.
+        self._counter = 0   # 등록 번호 (같은 시각의 순서 유지).
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def schedule(self, key, due_time):
+        """
+        키의 환생 시각을 등록(또는 변경)합니다.
+        Args:
+            key (hashable): 펫/사용자 식별자.
+            due_time (datetime.datetime): 환생 시각.
+        """
+        self._counter += 1
+        self._entries[key] = self._counter
+        heapq.heappush(self._heap, (due_time, self._counter, key))
+
+    def cancel(self, key):
+        """키의 등록을 취소합니다. (등록되지 않은 키는 무시)"""
+        self._entries.pop(key, None)
+
+    def _discard_stale(self):
+        """힙 맨 앞의 무효 항목들을 버립니다."""
+        while self._heap and self._entries.get(self._heap[0][2]) != self._heap[0][1]:
+            heapq.heappop(self._heap)
+
+    def next_due_time(self):
+        """
+        가장 이른 환생 시각을 반환합니다.
+        Returns:
+            datetime.datetime or None: 등록된 키가 없으면 None.
+        """
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now=None):
+        """
+        환생 시각이 지난 키들을 이른 순서대로 꺼냅니다. 꺼낸 키는 등록이 해제됩니다.
+        Args:
+            now (datetime.datetime, optional): 기준 시각. 기본값은 현재 시각.
+        Returns:
+            list: 만기된 키 리스트.
+        """
+        now = now if now else datetime.datetime.now()
+        due_keys = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return due_keys
+            _, _, key = heapq.heappop(self._heap)
+            del self._entries[key]
+            due_keys.append(key)
+
+    def delay_ms(self, now=None):
+        """
+        다음 확인까지 기다릴 시간(밀리초)을 반환합니다. 최대 REBIRTH_TIMER_MAX_DELAY_MS.
+        Returns:
+            int or None: 대기 시간. 등록된 키가 없으면 None.
+        """
+        due_time = self.next_due_time()
+        if due_time is None:
+            return None
+        now = now if now else datetime.datetime.now()
+        remaining_ms = (due_time - now).total_seconds() * 1000
+        return int(min(max(remaining_ms, 0), REBIRTH_TIMER_MAX_DELAY_MS))
+
+class TkRebirthTimer:
+    """
+    Tk after()로 RebirthScheduler의 가장 이른 환생 시각에 맞춰 콜백을 호출하는 타이머.
+    키를 등록/취소한 뒤에는 reschedule()을 호출해 대기 시간을 다시 계산합니다.
+    """
+    def __init__(self, master, scheduler, on_due):
+        self.master = master       # after() 예약에 사용할 Tkinter 루트 창.
+        self.scheduler = scheduler # RebirthScheduler.
+        self.on_due = on_due       # 만기된 키 하나마다 호출할 함수 on_due(key).
+        self._after_id = None
+
+    def reschedule(self):
+        """예약된 타이머를 취소하고 가장 이른 환생 시각에 맞춰 다시 예약합니다."""
+        self.cancel()
+        delay = self.scheduler.delay_ms()
+        if delay is not None:
+            self._after_id = self.master.after(delay, self._on_timer)
+
+    def cancel(self):
+        """예약된 타이머를 취소합니다."""
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _on_timer(self):
+        self._after_id = None
+        for key in self.scheduler.pop_due():
+            self.on_due(key)
+        if self._after_id is None: # on_due에서 다시 예약하지 않았다면 남은 키 기준으로 예약.
+            self.reschedule()
+
+async def run_rebirth_timer(scheduler, on_due, wakeup=None):
+    """
+    asyncio 루프에서 RebirthScheduler의 환생 시각마다 on_due(key)를 호출합니다. (취소될 때까지 실행)
+    Args:
+        scheduler (RebirthScheduler): 환생 시각 큐.
+        on_due (callable): 만기된 키 하나마다 호출할 함수.
+        wakeup (asyncio.Event, optional): 키를 등록/취소한 뒤 set()하면 대기 시간을 다시 계산합니다.
+    """
+    wakeup = wakeup if wakeup is not None else asyncio.Event()
+    while True:
+        for key in scheduler.pop_due():
+            on_due(key)
+        delay = scheduler.delay_ms()
+        wakeup.clear()
+        try:
+            await asyncio.wait_for(wakeup.wait(), None if delay is None else delay / 1000)
+        except asyncio.TimeoutError:
+            pass
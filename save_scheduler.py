@@ -0,0 +1,170 @@
+# save_scheduler.py
+
+# 데이터 저장 요청을 모아서(coalescing) 일정 간격마다 한 번만 기록하는 모듈.
+# 변경 요청은 Tk 메인 스레드에서 받고, 실제 파일 쓰기(직렬화, fsync)는 백그라운드 스레드에서 수행합니다.
+
+import threading # 백그라운드 저장 스레드.
+import time      # 쓰기 소요 시간 측정.
+
+from config import SAVE_INTERVAL_MS # 저장 간격 (밀리초).
+
+# 특정 날짜의 할 일을 바꾸는 변경 종류. (data_manager.apply_change 형식, 두 번째 값이 날짜)
+_TODO_CHANGE_KINDS = frozenset({'todo_add', 'todo_update', 'todo_delete', 'todo_move', 'todo_complete', 'todo_remove'})
+
+def _touches_todos(change, date):
+    """변경이 date의 할 일을 바꾸는지 여부. (date가 None이면 아무 날짜든)"""
+    kind = change[0]
+    if kind == 'todos_reset':
+        return True
+    if kind not in _TODO_CHANGE_KINDS:
+        return False
+    return date is None or change[1] == date or (kind == 'todo_move' and change[3] == date)
+
+class SaveScheduler:
+    """
+    저장 요청을 모아 SAVE_INTERVAL_MS마다 한 번씩 백그라운드 스레드에서 기록하는 클래스.
+    - request_changes: 저널에 기록할 변경들을 쌓아 두고 저장을 예약.
+    - request_full_save: 전체 스냅샷 저장을 예약.
+    - flush: 예약된 저장을 즉시 동기적으로 수행 (앱 종료 시, 기록되지 않은 날짜를 저장소에서 다시 읽기 전).
+    - has_pending_todo_changes: 저장소에 아직 기록되지 않은 할 일 변경이 있는지 확인 (flush가 필요한지 판단).
+    한 번에 하나의 쓰기만 진행되며, 스냅샷은 Tk 스레드에서 복사한 일관된 상태로 기록됩니다.
+    """
+    def __init__(self, master, storage, snapshot_func, interval_ms=SAVE_INTERVAL_MS):
+        self.master = master               # after() 예약에 사용할 Tkinter 루트 창.
+        self.storage = storage             # data_manager.create_storage()로 만든 저장소.
+        self.snapshot_func = snapshot_func # 전체 데이터의 일관된 복사본을 반환하는 함수 (Tk 스레드에서 호출).
+        self.interval_ms = interval_ms     # 저장 요청을 모으는 간격.
+
+        self._pending_changes = []        # 아직 기록되지 않은 변경들.
+        self._full_save_requested = False # 전체 스냅샷 저장 요청 여부.
+        self._after_id = None             # 예약된 after() 콜백 ID.
+        self._worker = None               # 진행 중인 저장 스레드.
+        self._worker_job = None           # 진행 중인 저장 스레드가 기록하는 (changes, snapshot).
+        self._stats_lock = threading.Lock()
+
+        # 저장 통계 (요청 대비 실제 저장 횟수, 쓰기 소요 시간).
+        self.saves_requested = 0
+        self.saves_performed = 0
+        self.last_write_seconds = 0.0
+        self.max_write_seconds = 0.0
+        self.total_write_seconds = 0.0
+
+    def request_changes(self, changes):
+        """
+        저널에 기록할 변경들을 추가하고 저장을 예약합니다.
+        Args:
+            changes (iterable): data_manager.apply_change 형식의 변경 튜플들.
+                                이후 객체가 바뀌어도 영향받지 않도록 호출 측에서 복사본을 넘겨야 합니다.
+        """
+        self._pending_changes.extend(changes)
+        self._request()
+
+    def request_full_save(self):
+        """전체 데이터 스냅샷 저장을 예약합니다."""
+        self._full_save_requested = True
+        self._request()
+
+    def _request(self):
+        """저장 요청 횟수를 세고, 예약된 저장이 없으면 interval_ms 뒤로 예약합니다."""
+        self.saves_requested += 1
+        if self._after_id is None:
+            self._after_id = self.master.after(self.interval_ms, self._on_timer)
+
+    def _on_timer(self):
+        """
+        예약 시간이 되면 모인 변경들을 하나의 저장 작업으로 만들어 백그라운드에서 기록합니다.
+        기록을 시작한 뒤에도 한 간격 뒤에 다시 확인하여, 쓰기 중 요청된 전체 저장(저널 기록 실패, 압축 필요)을
+        다음 사용자 동작을 기다리지 않고 기록합니다.
+        """
+        self._after_id = None
+        if self._worker is not None and self._worker.is_alive(): # 이전 쓰기가 아직 진행 중이면 다음 간격으로 미룸.
+            self._after_id = self.master.after(self.interval_ms, self._on_timer)
+            return
+        job = self._take_job()
+        if job is None:
+            return
+        self._worker = threading.Thread(target=self._write_job, args=(job,), daemon=True)
+        self._worker_job = job
+        self._worker.start()
+        self._after_id = self.master.after(self.interval_ms, self._on_timer) # 쓰기 후 남은 작업 확인.
+
+    def _take_job(self):
+        """
+        대기 중인 변경들을 꺼내 저장 작업으로 만듭니다. (Tk 스레드에서 호출)
+        전체 저장이 요청되었거나 이번 기록으로 저널 압축 기준에 도달하면 스냅샷 복사본도 함께 만듭니다.
+        Returns:
+            tuple or None: (changes, snapshot) 또는 저장할 것이 없으면 None.
+        """
+        if not self._pending_changes and not self._full_save_requested:
+            return None
+        changes, self._pending_changes = self._pending_changes, []
+        snapshot = None
+        if self._full_save_requested or self.storage.needs_compaction(additional_records=1 if changes else 0):
+            snapshot = self.snapshot_func()
+        self._full_save_requested = False
+        return changes, snapshot
+
+    def has_pending_todo_changes(self, date=None):
+        """
+        저장소에 아직 기록되지 않은 (대기 중이거나 기록 중인) 변경 중 date의 할 일을 바꾸는 것이 있는지 확인합니다.
+        전체 스냅샷 저장이 대기/진행 중이면 모든 날짜가 바뀌는 것으로 봅니다. (Tk 스레드에서 호출)
+        Args:
+            date (datetime.date, optional): 확인할 날짜. 없으면 아무 날짜.
+        Returns:
+            bool: 저장소에서 읽기 전에 flush가 필요한지 여부.
+        """
+        if self._full_save_requested or any(_touches_todos(change, date) for change in self._pending_changes):
+            return True
+        if self._worker is not None and self._worker.is_alive():
+            changes, snapshot = self._worker_job
+            return snapshot is not None or any(_touches_todos(change, date) for change in changes)
+        return False
+
+    def _write_job(self, job):
+        """저장 작업을 실제로 기록하고 소요 시간을 통계에 반영합니다. (백그라운드 스레드에서 호출)"""
+        changes, snapshot = job
+        start_time = time.perf_counter()
+        if changes and self.storage.append(changes) and snapshot is None:
+            self._full_save_requested = True # 저널 기록 실패 또는 압축 필요 시 다음 저장에서 스냅샷 기록.
+        if snapshot is not None:
+            self.storage.save(*snapshot)
+        elapsed = time.perf_counter() - start_time
+        with self._stats_lock:
+            self.saves_performed += 1
+            self.last_write_seconds = elapsed
+            self.max_write_seconds = max(self.max_write_seconds, elapsed)
+            self.total_write_seconds += elapsed
+
+    def flush(self):
+        """
+        예약된 저장을 취소하고 진행 중인 쓰기를 기다린 뒤, 남은 변경을 즉시 기록합니다.
+        기록 중 전체 저장이 요청되면 (저널 기록 실패 등) 그 스냅샷까지 기록할 때까지 반복합니다.
+        """
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+            self._worker_job = None
+        while True:
+            job = self._take_job()
+            if job is None:
+                break
+            self._write_job(job)
+
+    def get_stats(self):
+        """
+        저장 통계를 반환합니다.
+        Returns:
+            dict: 요청/수행 횟수와 쓰기 소요 시간(초).
+        """
+        with self._stats_lock:
+            average = self.total_write_seconds / self.saves_performed if self.saves_performed else 0.0
+            return {
+                'saves_requested': self.saves_requested,
+                'saves_performed': self.saves_performed,
+                'last_write_seconds': self.last_write_seconds,
+                'max_write_seconds': self.max_write_seconds,
+                'average_write_seconds': average,
+            }
@@ -0,0 +1,220 @@
+# snapshot_format.py
+
+# 스냅샷 본문의 이진 형식 모듈. (data_manager의 스냅샷 형식 버전 3)
+# pickle과 달리 파이썬 객체를 그대로 저장하지 않고, 아래 스키마에 정한 필드만 정해진 순서로 기록하므로
+# 클래스 구조가 바뀌어도 파일 형식은 그대로이며, 읽을 때 코드가 실행되지 않습니다.
+# 필드를 바꾸려면 새 형식 버전을 만들고 data_manager의 마이그레이션에 이전 버전 변환을 추가합니다.
+#
+# 본문 구성 (모든 정수는 리틀 엔디언):
+#   개수 헤더   다음 할 일 id, 문자열/간식/과거 펫/날짜/할 일 개수, 문자열 표 바이트 수, 펫 유무,
+#               할 일 id 열과 내용 번호 열의 array 형식 문자 (값 범위에 맞는 가장 작은 부호 없는 정수형).
+#   문자열 표   문자열마다 글자 수(uint32) 배열 + 모든 문자열을 이어 붙인 UTF-8 바이트.
+#               (Tk가 돌려주는 짝 없는 서로게이트 문자도 그대로 저장되도록 'surrogatepass'로 인코딩)
+#               펫 이름, 간식 이름, 할 일 내용 등은 표의 번호로 기록되어 같은 내용은 한 번만 저장됩니다.
+#   펫          PET_SCHEMA 레코드 하나 (펫이 있을 때만).
+#   간식        SNACK_SCHEMA 레코드들.
+#   과거 펫     HISTORY_SCHEMA 레코드들.
+#   날짜        날짜 서수(int32) 배열, 날짜별 할 일 개수(uint32) 배열.
+#   할 일       id 배열, 내용 번호 배열, 완료 여부(바이트) 배열. (날짜 순서대로 이어 붙임)
+
+import sys        # 바이트 순서, 문자열 인터닝.
+import struct     # 고정 크기 레코드 패킹.
+import datetime   # 날짜 <-> 서수 변환.
+from array import array # 할 일 열 데이터.
+from itertools import accumulate # 문자열 표의 위치 계산.
+
+from pet_manager import Pet       # 저장된 펫 필드로 Pet 객체 복원.
+from todo_manager import TodoItem # 할 일 레코드.
+
+FORMAT_VERSION = 3 # 이 모듈이 읽고 쓰는 스냅샷 형식 버전. (버전 2까지는 pickle)
+
+# 필드 종류 -> struct 형식 문자. 'str'은 문자열 표 번호, 'date'는 날짜 서수.
+_FIELD_FORMATS = {'str': 'I', 'int': 'q', 'date': 'i', 'bool': '?'}
+
+# === 스키마: (필드 이름, 종류) 순서대로 기록 ===
+PET_SCHEMA = (
+    ('name', 'str'), ('species', 'str'), ('level', 'int'), ('exp', 'int'),
+    ('happiness', 'int'), ('max_happiness', 'int'), ('fullness', 'int'), ('max_fullness', 'int'),
+    ('last_reset_date', 'date'), ('has_been_rewarded_for_full_gauges', 'bool'),
+)
+SNACK_SCHEMA = (('name', 'str'), ('count', 'int'))
+HISTORY_SCHEMA = (('species', 'str'), ('level', 'int'), ('start_date', 'date'), ('end_date', 'date'))
+
+_TEXT_ERRORS = 'surrogatepass' # 문자열 표 UTF-8 인코딩/디코딩 오류 처리 방식.
+
+_COUNTS = struct.Struct('<q6I?2s') # 다음 할 일 id, 개수 6개, 펫 유무, id/내용 번호 열 형식 문자.
+
+_UNSIGNED_TYPECODES = ('B', 'H', 'I', 'Q') # 1, 2, 4, 8바이트 부호 없는 정수 array 형식.
+
+def _smallest_typecode(max_value):
+    """0 ~ max_value를 담을 수 있는 가장 작은 부호 없는 정수 array 형식 문자."""
+    for typecode in _UNSIGNED_TYPECODES:
+        if max_value < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise ValueError(f"기록할 수 없는 큰 값입니다: {max_value}")
+
+def _record_struct(schema):
+    """스키마의 레코드 하나를 패킹하는 Struct를 만듭니다."""
+    return struct.Struct('<' + ''.join(_FIELD_FORMATS[kind] for _, kind in schema))
+
+_PET_RECORD = _record_struct(PET_SCHEMA)
+_SNACK_RECORD = _record_struct(SNACK_SCHEMA)
+_HISTORY_RECORD = _record_struct(HISTORY_SCHEMA)
+
+def pet_to_fields(pet):
+    """펫을 PET_SCHEMA 필드 이름 -> 값 딕셔너리로 바꿉니다. (스냅샷, 저널 레코드에 기록할 값)"""
+    return {field: getattr(pet, field) for field, _ in PET_SCHEMA}
+
+def pet_from_fields(fields):
+    """pet_to_fields로 만든 딕셔너리에서 Pet 객체를 복원합니다."""
+    pet = Pet(name=fields['name'], species=fields['species'], level=fields['level'], exp=fields['exp'],
+              happiness=fields['happiness'], fullness=fields['fullness'], last_reset_date=fields['last_reset_date'])
+    pet.max_happiness = fields['max_happiness']
+    pet.max_fullness = fields['max_fullness']
+    pet.has_been_rewarded_for_full_gauges = fields['has_been_rewarded_for_full_gauges']
+    return pet
+
+def _to_little_endian(values):
+    """array를 리틀 엔디언 바이트로 변환합니다."""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _read_array(typecode, payload, offset, count):
+    """payload의 offset부터 count개의 값을 array로 읽고, (array, 다음 위치)를 반환합니다."""
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    if end > len(payload):
+        raise ValueError("스냅샷 본문이 예상보다 짧습니다.")
+    values.frombytes(payload[offset:end])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values, end
+
+class _StringTable:
+    """기록할 문자열에 번호를 붙입니다. 같은 문자열은 같은 번호를 받습니다."""
+    def __init__(self):
+        self.index = {}   # 문자열 -> 번호.
+        self.strings = [] # 번호 순서의 문자열.
+
+    def add(self, text):
+        number = self.index.get(text)
+        if number is None:
+            number = self.index[text] = len(self.strings)
+            self.strings.append(text)
+        return number
+
+def _pack_record(record_struct, schema, get_field, strings):
+    """get_field(필드 이름)으로 값을 읽어 스키마 순서로 패킹합니다."""
+    values = []
+    for field, kind in schema:
+        value = get_field(field)
+        if kind == 'str':
+            value = strings.add(value)
+        elif kind == 'date':
+            value = value.toordinal()
+        values.append(value)
+    return record_struct.pack(*values)
+
+def _unpack_records(record_struct, schema, payload, offset, count, strings):
+    """레코드 count개를 필드 이름 -> 값 딕셔너리 리스트로 읽고, (리스트, 다음 위치)를 반환합니다."""
+    end = offset + record_struct.size * count
+    if end > len(payload):
+        raise ValueError("스냅샷 본문이 예상보다 짧습니다.")
+    records = []
+    for values in record_struct.iter_unpack(payload[offset:end]):
+        record = {}
+        for (field, kind), value in zip(schema, values):
+            if kind == 'str':
+                value = strings[value]
+            elif kind == 'date':
+                value = datetime.date.fromordinal(value)
+            record[field] = value
+        records.append(record)
+    return records, end
+
+def encode(pet, daily_todos, snack_counts, historical_pets, next_todo_id):
+    """
+    스냅샷 데이터를 이진 본문으로 만듭니다.
+    Args:
+        pet (Pet or None): 현재 펫.
+        daily_todos (dict): 날짜 -> TodoItem 리스트.
+        snack_counts (dict): 간식 이름 -> 개수.
+        historical_pets (list): {'species', 'level', 'start_date', 'end_date'} 딕셔너리 리스트.
+        next_todo_id (int): 다음에 부여할 할 일 id.
+    Returns:
+        bytes: 스냅샷 본문.
+    """
+    strings = _StringTable()
+    pet_bytes = _pack_record(_PET_RECORD, PET_SCHEMA, pet_to_fields(pet).__getitem__, strings) if pet else b''
+    snack_bytes = b''.join(_pack_record(_SNACK_RECORD, SNACK_SCHEMA, {'name': name, 'count': count}.__getitem__, strings)
+                           for name, count in snack_counts.items())
+    history_bytes = b''.join(_pack_record(_HISTORY_RECORD, HISTORY_SCHEMA, record.__getitem__, strings)
+                             for record in historical_pets)
+
+    ordinals, day_counts = array('i'), array('I')
+    todo_ids, text_numbers, completed = [], [], bytearray()
+    add_string = strings.add
+    for date, todos in daily_todos.items():
+        ordinals.append(date.toordinal())
+        day_counts.append(len(todos))
+        todo_ids.extend([todo.id for todo in todos])
+        text_numbers.extend([add_string(todo.text) for todo in todos])
+        completed.extend([todo.completed for todo in todos])
+    id_typecode = _smallest_typecode(max(todo_ids, default=0))
+    text_typecode = _smallest_typecode(len(strings.strings))
+    todo_ids, text_numbers = array(id_typecode, todo_ids), array(text_typecode, text_numbers)
+
+    lengths = array('I', map(len, strings.strings))
+    text_bytes = ''.join(strings.strings).encode('utf-8', _TEXT_ERRORS)
+    counts = _COUNTS.pack(next_todo_id, len(lengths), len(snack_counts), len(historical_pets), len(ordinals),
+                          len(todo_ids), len(text_bytes), pet is not None, (id_typecode + text_typecode).encode())
+    return b''.join([counts, _to_little_endian(lengths), text_bytes, pet_bytes, snack_bytes, history_bytes,
+                     _to_little_endian(ordinals), _to_little_endian(day_counts),
+                     _to_little_endian(todo_ids), _to_little_endian(text_numbers), bytes(completed)])
+
+def decode(payload):
+    """
+    encode로 만든 이진 본문을 읽습니다.
+    Returns:
+        dict: 'pet', 'daily_todos', 'snack_counts', 'historical_pets', 'next_todo_id' 키를 가진 딕셔너리.
+    Raises:
+        ValueError: 본문 길이가 형식과 맞지 않을 경우 (파일 손상).
+    """
+    if len(payload) < _COUNTS.size:
+        raise ValueError("스냅샷 본문이 예상보다 짧습니다.")
+    (next_todo_id, string_count, snack_count, history_count, day_count, todo_count, text_size,
+     has_pet, typecodes) = _COUNTS.unpack_from(payload)
+    id_typecode, text_typecode = typecodes.decode('ascii')
+    if id_typecode not in _UNSIGNED_TYPECODES or text_typecode not in _UNSIGNED_TYPECODES:
+        raise ValueError(f"알 수 없는 열 형식입니다: {typecodes!r}")
+    lengths, offset = _read_array('I', payload, _COUNTS.size, string_count)
+    all_text = payload[offset:offset + text_size].decode('utf-8', _TEXT_ERRORS)
+    offset += text_size
+    ends = list(accumulate(lengths))
+    strings = list(map(all_text.__getitem__, map(slice, [0, *ends], ends))) # (할 일 내용은 TodoItem이 인터닝)
+
+    pet = None
+    if has_pet:
+        (pet_fields,), offset = _unpack_records(_PET_RECORD, PET_SCHEMA, payload, offset, 1, strings)
+        pet = pet_from_fields(pet_fields)
+    snacks, offset = _unpack_records(_SNACK_RECORD, SNACK_SCHEMA, payload, offset, snack_count, strings)
+    historical_pets, offset = _unpack_records(_HISTORY_RECORD, HISTORY_SCHEMA, payload, offset, history_count,
+                                              strings)
+
+    ordinals, offset = _read_array('i', payload, offset, day_count)
+    day_counts, offset = _read_array('I', payload, offset, day_count)
+    todo_ids, offset = _read_array(id_typecode, payload, offset, todo_count)
+    text_numbers, offset = _read_array(text_typecode, payload, offset, todo_count)
+    completed = payload[offset:offset + todo_count]
+    if offset + todo_count != len(payload) or sum(day_counts) != todo_count:
+        raise ValueError("스냅샷 본문의 길이가 형식과 일치하지 않습니다.")
+
+    todos = list(map(TodoItem, todo_ids, map(strings.__getitem__, text_numbers), completed))
+    day_ends = list(accumulate(day_counts))
+    daily_todos = dict(zip(map(datetime.date.fromordinal, ordinals),
+                           map(todos.__getitem__, map(slice, [0, *day_ends], day_ends))))
+    return {'pet': pet, 'daily_todos': daily_todos,
+            'snack_counts': {snack['name']: snack['count'] for snack in snacks},
+            'historical_pets': historical_pets, 'next_todo_id': next_todo_id}
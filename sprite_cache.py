@@ -0,0 +1,132 @@
+# sprite_cache.py
+
+# 펫 이미지를 미리 필요한 크기로 리사이즈해 두는 스프라이트 캐시 모듈.
+# 빌드 단계(python sprite_cache.py)에서 PET_SPECIES_LIST x 레벨 1..MAX_PET_LEVEL 이미지를
+# SPRITE_SIZES의 각 크기별 폴더(resources/sprite_cache/300x300/ 등)에 저장하고,
+# 원본 파일의 해시를 담은 manifest.json을 만듭니다.
+# 실행 시에는 원본 해시가 manifest와 일치하는 경우에만 리사이즈된 파일을 사용하므로
+# 원본 이미지가 바뀌면 자동으로 원본 디코딩/리사이즈 경로로 돌아갑니다.
+
+import os         # 파일 경로 처리.
+import json       # manifest 파일 읽기/쓰기.
+import hashlib    # 원본 파일 해시 계산.
+from PIL import Image # 이미지 리사이즈 (빌드 단계).
+
+import config     # 펫 종류, 레벨, 경로, 크기 설정.
+from instrumentation import get_logger, configure_logging # 진단 로그.
+
+log = get_logger("sprite_cache")
+
+MANIFEST_FILE_NAME = "manifest.json" # 스프라이트 캐시 manifest 파일명.
+
+_manifest = None         # 불러온 manifest (처음 사용할 때 한 번만 읽음).
+_verified_sources = {}   # 원본 파일명 -> manifest 해시와 일치 여부 (파일마다 한 번만 해시 계산).
+
+def _cache_dir():
+    """스프라이트 캐시 폴더 경로를 반환합니다."""
+    return os.path.join(config.RESOURCES_PATH, config.SPRITE_CACHE_SUBFOLDER)
+
+def _size_dir_name(size):
+    """크기 튜플을 폴더 이름으로 변환합니다. (예: (300, 300) -> '300x300')"""
+    return f"{size[0]}x{size[1]}"
+
+def _source_path(image_filename):
+    """원본 펫 이미지 파일 경로를 반환합니다."""
+    return os.path.join(config.RESOURCES_PATH, config.PET_IMAGES_SUBFOLDER, image_filename)
+
+def _file_sha256(path):
+    """파일 내용의 SHA-256 해시(16진 문자열)를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _load_manifest():
+    """manifest를 한 번만 읽어 반환합니다. 없거나 손상되었으면 빈 manifest를 반환합니다."""
+    global _manifest
+    if _manifest is None:
+        manifest_path = os.path.join(_cache_dir(), MANIFEST_FILE_NAME)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                _manifest = json.load(f)
+        except FileNotFoundError:
+            _manifest = {'sprites': {}}
+        except Exception as e:
+            log.warning("스프라이트 캐시 manifest '%s'를 읽을 수 없습니다: %s", manifest_path, e)
+            _manifest = {'sprites': {}}
+    return _manifest
+
+def get_sprite_path(image_filename, size):
+    """
+    미리 리사이즈된 스프라이트 파일 경로를 반환합니다.
+    Args:
+        image_filename (str): 원본 이미지 파일명 (예: '사람_level1.png').
+        size (tuple): 필요한 크기 (너비, 높이).
+    Returns:
+        str or None: 사용할 수 있는 스프라이트 경로. 해당 크기가 없거나 원본이 바뀌었으면 None.
+    """
+    entry = _load_manifest()['sprites'].get(image_filename)
+    if entry is None or _size_dir_name(size) not in entry['sizes']:
+        return None
+    if image_filename not in _verified_sources: # 원본이 빌드 이후 바뀌지 않았는지 한 번만 확인.
+        try:
+            _verified_sources[image_filename] = _file_sha256(_source_path(image_filename)) == entry['source_sha256']
+        except OSError:
+            _verified_sources[image_filename] = False
+        if not _verified_sources[image_filename]:
+            log.info("'%s' 원본이 스프라이트 캐시 생성 이후 변경되어 원본에서 리사이즈합니다.", image_filename)
+    if not _verified_sources[image_filename]:
+        return None
+    sprite_path = os.path.join(_cache_dir(), _size_dir_name(size), image_filename)
+    return sprite_path if os.path.exists(sprite_path) else None
+
+def build_sprite_cache(sizes=None):
+    """
+    모든 펫 종류/레벨 이미지를 지정 크기들로 리사이즈하여 캐시 폴더에 저장하고 manifest를 작성합니다.
+    원본 해시와 크기가 이전 manifest와 같은 이미지는 다시 만들지 않습니다.
+    Args:
+        sizes (list, optional): (너비, 높이) 튜플 리스트. 기본값은 config.SPRITE_SIZES.
+    Returns:
+        dict: 작성된 manifest.
+    """
+    global _manifest
+    sizes = sizes if sizes is not None else config.SPRITE_SIZES
+    _manifest = None
+    previous_sprites = _load_manifest()['sprites']
+    sprites = {}
+    built_count = 0
+    for species in config.PET_SPECIES_LIST:
+        for level in range(1, config.MAX_PET_LEVEL + 1):
+            image_filename = f"{species}_level{level}.png"
+            source_path = _source_path(image_filename)
+            if not os.path.exists(source_path):
+                log.warning("원본 이미지 '%s'가 없어 건너뜁니다.", source_path)
+                continue
+            source_sha256 = _file_sha256(source_path)
+            size_names = [_size_dir_name(size) for size in sizes]
+            previous = previous_sprites.get(image_filename)
+            up_to_date = (previous is not None and previous['source_sha256'] == source_sha256 and
+                          all(os.path.exists(os.path.join(_cache_dir(), name, image_filename)) for name in size_names))
+            if not up_to_date:
+                with Image.open(source_path) as original_image:
+                    for size, size_name in zip(sizes, size_names):
+                        os.makedirs(os.path.join(_cache_dir(), size_name), exist_ok=True)
+                        resized_image = original_image.resize(tuple(size), Image.Resampling.LANCZOS)
+                        resized_image.save(os.path.join(_cache_dir(), size_name, image_filename))
+                built_count += 1
+            sprites[image_filename] = {'source_sha256': source_sha256, 'sizes': size_names}
+
+    _manifest = {'sizes': [_size_dir_name(size) for size in sizes], 'sprites': sprites}
+    os.makedirs(_cache_dir(), exist_ok=True)
+    with open(os.path.join(_cache_dir(), MANIFEST_FILE_NAME), 'w', encoding='utf-8') as f:
+        json.dump(_manifest, f, ensure_ascii=False, indent=2)
+    _verified_sources.clear()
+    log.info("스프라이트 캐시 생성 완료: 이미지 %d개 중 %d개 새로 리사이즈 (%s).",
+             len(sprites), built_count, ', '.join(_manifest['sizes']))
+    return _manifest
+
+# --- 빌드 단계 실행 ---
+if __name__ == "__main__":
+    configure_logging()
+    build_sprite_cache()
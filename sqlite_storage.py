@@ -0,0 +1,355 @@
+# sqlite_storage.py
+
+# 애플리케이션 데이터를 SQLite 데이터베이스에 저장하고 불러오는 저장소 모듈.
+# 할 일은 날짜 인덱스가 걸린 테이블에 한 행씩 저장되므로, 특정 날짜만 불러오거나
+# 할 일 하나를 추가/완료/삭제할 때 해당 행만 INSERT/UPDATE/DELETE 합니다.
+# data_manager.JournalStorage와 같은 인터페이스(load, append, save, needs_compaction)를 제공합니다.
+
+import sqlite3    # SQLite 데이터베이스.
+import threading  # 백그라운드 저장 스레드와의 동시 접근 보호.
+import datetime   # 날짜 문자열 변환.
+import os         # 기존 pickle 파일 존재 여부 확인.
+from array import array # 통계용 열 형식 할 일 데이터.
+
+from config import SQLITE_DB_FILE_NAME, DATA_FILE_NAME, JOURNAL_FILE_NAME # DB/기존 데이터 파일명.
+from config import EXCHANGE_BATCH_SIZE # 내보내기/통계 재계산 시 한 번에 읽을 할 일 수.
+from pet_manager import Pet # 저장된 펫 상태로 Pet 객체 복원.
+from todo_manager import TodoItem # 할 일 행 -> 할 일 레코드.
+import data_manager         # 기존 pickle 데이터 마이그레이션.
+from instrumentation import get_logger, traced # 진단 로그, 저장/불러오기 시간 측정.
+
+log = get_logger("sqlite_storage")
+
+SCHEMA_VERSION = 1 # 데이터베이스 스키마 버전.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pet (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    name TEXT NOT NULL,
+    species TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    exp INTEGER NOT NULL,
+    happiness INTEGER NOT NULL,
+    fullness INTEGER NOT NULL,
+    last_reset_date TEXT NOT NULL,
+    rewarded_for_full_gauges INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS todos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    text TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_todos_date ON todos (date, id);
+CREATE TABLE IF NOT EXISTS snack_counts (
+    name TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS historical_pets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    species TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL
+);
+"""
+
+# 날짜별 할 일 목록에서 index번째 행의 id를 찾는 부분 쿼리 (목록 순서 = id 순서, 이전 저널 형식용).
+_TODO_ID_AT_INDEX = "(SELECT id FROM todos WHERE date = ? ORDER BY id LIMIT 1 OFFSET ?)"
+_HISTORY_ID_AT_INDEX = "(SELECT id FROM historical_pets ORDER BY id LIMIT 1 OFFSET ?)"
+
+class SQLiteStorage:
+    """
+    SQLite 데이터베이스에 펫, 할 일, 간식, 과거 펫 기록을 테이블로 저장하는 저장소 클래스.
+    처음 열 때 데이터베이스가 비어 있으면 기존 pickle 데이터(및 저널)를 한 번 옮겨 옵니다.
+    """
+    def __init__(self, db_file_name=SQLITE_DB_FILE_NAME, legacy_data_file_name=DATA_FILE_NAME,
+                 legacy_journal_file_name=JOURNAL_FILE_NAME):
+        self.db_file_name = db_file_name
+        self.legacy_data_file_name = legacy_data_file_name
+        self.legacy_journal_file_name = legacy_journal_file_name
+        self._lock = threading.Lock() # Tk 스레드(날짜 로드)와 저장 스레드의 동시 접근 방지.
+        # 저장 스레드에서도 같은 연결을 사용하므로 스레드 검사를 끄고 잠금으로 보호합니다.
+        self.connection = sqlite3.connect(db_file_name, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute("PRAGMA journal_mode=WAL") # 쓰기 중에도 읽기 가능, 커밋 비용 감소.
+        self.connection.commit()
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self.connection.close()
+
+    def _get_meta(self, key):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def migrate_from_pickle(self):
+        """
+        기존 pickle 스냅샷과 저널의 데이터를 데이터베이스로 한 번 옮깁니다.
+        (이전 'todo_list' 형식 등 호환성 처리는 data_manager의 불러오기 경로를 그대로 사용)
+        Returns:
+            bool: 마이그레이션 수행 여부.
+        """
+        with self._lock:
+            if self._get_meta('schema_version') is not None: # 이미 초기화/마이그레이션된 DB.
+                return False
+        migrated = False
+        if os.path.exists(self.legacy_data_file_name):
+            legacy_storage = data_manager.JournalStorage(self.legacy_data_file_name, self.legacy_journal_file_name)
+            pet, daily_todos, snack_counts, historical_pets = legacy_storage.load()
+            if pet is not None:
+                self.save(pet, daily_todos, snack_counts, historical_pets, legacy_storage.next_todo_id())
+                total_todos = sum(len(todos) for todos in daily_todos.values())
+                log.info("'%s'의 데이터를 '%s'로 옮겼습니다. (할 일 %d개, 과거 펫 기록 %d개)",
+                         self.legacy_data_file_name, self.db_file_name, total_todos, len(historical_pets))
+                migrated = True
+        with self._lock, self.connection:
+            self._set_meta('schema_version', SCHEMA_VERSION)
+        return migrated
+
+    @traced("storage.sqlite.load", "storage")
+    def load(self):
+        """
+        펫, 간식, 과거 펫 기록과 오늘 날짜의 할 일만 불러옵니다. 다른 날짜는 load_day로 필요할 때 불러옵니다.
+        Returns:
+            tuple: (pet_data, daily_todos, snack_counts, historical_pets)
+        """
+        self.migrate_from_pickle()
+        today = datetime.date.today()
+        with self._lock:
+            pet = self._load_pet()
+            snack_counts = dict(self.connection.execute("SELECT name, count FROM snack_counts"))
+            historical_pets = [
+                {'species': species, 'level': level,
+                 'start_date': datetime.date.fromisoformat(start_date),
+                 'end_date': datetime.date.fromisoformat(end_date)}
+                for species, level, start_date, end_date in self.connection.execute(
+                    "SELECT species, level, start_date, end_date FROM historical_pets ORDER BY id")
+            ]
+            daily_todos = {today: self._select_day(today)}
+        log.info("데이터를 '%s'에서 성공적으로 불러왔습니다.", self.db_file_name)
+        return pet, daily_todos, snack_counts, historical_pets
+
+    def _load_pet(self):
+        row = self.connection.execute(
+            "SELECT name, species, level, exp, happiness, fullness, last_reset_date, rewarded_for_full_gauges "
+            "FROM pet WHERE id = 1").fetchone()
+        if row is None:
+            return None
+        name, species, level, exp, happiness, fullness, last_reset_date, rewarded = row
+        pet = Pet(name=name, species=species, level=level, exp=exp, happiness=happiness, fullness=fullness,
+                  last_reset_date=datetime.date.fromisoformat(last_reset_date))
+        pet.has_been_rewarded_for_full_gauges = bool(rewarded)
+        return pet
+
+    def _select_day(self, date):
+        rows = self.connection.execute(
+            "SELECT id, text, completed FROM todos WHERE date = ? ORDER BY id", (date.isoformat(),))
+        return [TodoItem(todo_id, text, completed) for todo_id, text, completed in rows]
+
+    @traced("storage.sqlite.load_day", "storage")
+    def load_day(self, date):
+        """
+        지정한 날짜의 할 일 목록만 불러옵니다. (TodoManager의 day_loader로 사용)
+        Args:
+            date (datetime.date): 불러올 날짜.
+        Returns:
+            list: TodoItem 리스트.
+        """
+        with self._lock:
+            return self._select_day(date)
+
+    def load_all_todos(self):
+        """
+        모든 날짜의 할 일을 불러옵니다. (검색 색인 생성용)
+        Returns:
+            list: (날짜, TodoItem 리스트) 쌍들. 날짜 순.
+        """
+        with self._lock:
+            rows = self.connection.execute("SELECT date, id, text, completed FROM todos ORDER BY date, id").fetchall()
+        daily_todos = []
+        for date_text, todo_id, text, completed in rows:
+            if not daily_todos or daily_todos[-1][0] != date_text:
+                daily_todos.append((date_text, []))
+            daily_todos[-1][1].append(TodoItem(todo_id, text, completed))
+        return [(datetime.date.fromisoformat(date_text), todos) for date_text, todos in daily_todos]
+
+    def iter_todos(self, batch_size=EXCHANGE_BATCH_SIZE):
+        """
+        모든 할 일을 날짜, id 순으로 batch_size개씩 나눠 읽으며 하나씩 내보냅니다. (내보내기용, 메모리 사용량 일정)
+        Yields:
+            tuple: (날짜, TodoItem).
+        """
+        last_key = ("", 0) # 마지막으로 읽은 (날짜, id). 다음 묶음은 그 뒤부터 읽음.
+        while True:
+            with self._lock:
+                rows = self.connection.execute(
+                    "SELECT date, id, text, completed FROM todos WHERE (date, id) > (?, ?) ORDER BY date, id LIMIT ?",
+                    (*last_key, batch_size)).fetchall()
+            if not rows:
+                return
+            for date_text, todo_id, text, completed in rows:
+                yield datetime.date.fromisoformat(date_text), TodoItem(todo_id, text, completed)
+            last_key = rows[-1][:2]
+
+    def load_todo_columns(self):
+        """
+        모든 할 일의 날짜와 완료 여부를 열 형식으로 불러옵니다. (통계 전체 재계산용, analytics.todo_columns와 같은 형식)
+        Returns:
+            tuple: (할 일마다 날짜 서수 배열, 할 일마다 완료 여부(0/1) 배열).
+        """
+        ordinals, completed = array('l'), array('b')
+        with self._lock:
+            # julianday('0001-01-01') = 1721425.5 이므로 date.toordinal()과 같은 서수가 됨.
+            cursor = self.connection.execute(
+                "SELECT CAST(julianday(date) - 1721424.5 AS INTEGER), completed FROM todos")
+            while True:
+                rows = cursor.fetchmany(EXCHANGE_BATCH_SIZE)
+                if not rows:
+                    break
+                ordinals.extend([row[0] for row in rows])
+                completed.extend([row[1] for row in rows])
+        return ordinals, completed
+
+    def load_day_summaries(self):
+        """
+        할 일이 있는 모든 날짜의 요약을 불러옵니다. (할 일 목록 없이 달력 표시용)
+        Returns:
+            dict: 날짜 -> (전체 개수, 완료 개수).
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT date, COUNT(*), SUM(completed) FROM todos GROUP BY date").fetchall()
+        return {datetime.date.fromisoformat(date_text): (total, completed) for date_text, total, completed in rows}
+
+    def next_todo_id(self):
+        """
+        다음에 부여할 할 일 id를 반환합니다. (삭제된 id도 다시 쓰지 않도록 AUTOINCREMENT 순번 기준)
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT MAX(COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'todos'), 0), "
+                "COALESCE((SELECT MAX(id) FROM todos), 0))").fetchone()
+        return row[0] + 1
+
+    @traced("storage.sqlite.append", "storage")
+    def append(self, changes):
+        """
+        변경들을 해당 행에 대한 INSERT/UPDATE/DELETE로 하나의 트랜잭션에서 반영합니다.
+        Args:
+            changes (list): data_manager.apply_change 형식의 변경 튜플 리스트.
+        Returns:
+            bool: 전체 저장이 필요한지 여부 (기록 실패 시 True).
+        """
+        try:
+            with self._lock, self.connection: # 트랜잭션 (예외 시 롤백).
+                for change in changes:
+                    self._apply_change(change)
+        except Exception as e:
+            log.error("데이터베이스 기록 중 오류 발생: %s", e)
+            return True
+        return False
+
+    def _apply_change(self, change):
+        kind = change[0]
+        execute = self.connection.execute
+        if kind == 'pet':
+            self._write_pet(change[1])
+        elif kind == 'snacks':
+            self._write_snack_counts(change[1])
+        elif kind == 'todo_add':
+            if len(change) > 3:
+                _, date, text, todo_id = change
+                execute("INSERT INTO todos (id, date, text, completed) VALUES (?, ?, ?, 0)",
+                        (todo_id, date.isoformat(), text))
+            else: # id 도입 이전 형식.
+                _, date, text = change
+                execute("INSERT INTO todos (date, text, completed) VALUES (?, ?, 0)", (date.isoformat(), text))
+        elif kind == 'todo_update':
+            _, date, todo_id, fields = change
+            for field, value in fields.items():
+                if field not in ('text', 'completed'):
+                    raise ValueError(f"알 수 없는 할 일 필드입니다: {field}")
+                execute(f"UPDATE todos SET {field} = ? WHERE id = ?",
+                        (int(value) if field == 'completed' else value, todo_id))
+        elif kind == 'todo_delete':
+            execute("DELETE FROM todos WHERE id = ?", (change[2],))
+        elif kind == 'todo_move':
+            _, date, todo_id, target_date = change
+            execute("UPDATE todos SET date = ? WHERE id = ?", (target_date.isoformat(), todo_id))
+        elif kind == 'todo_complete':
+            _, date, index = change
+            execute(f"UPDATE todos SET completed = 1 WHERE id = {_TODO_ID_AT_INDEX}", (date.isoformat(), index))
+        elif kind == 'todo_remove':
+            _, date, index = change
+            execute(f"DELETE FROM todos WHERE id = {_TODO_ID_AT_INDEX}", (date.isoformat(), index))
+        elif kind == 'todos_reset':
+            execute("DELETE FROM todos")
+        elif kind == 'history_add':
+            self._insert_history_record(change[1])
+        elif kind == 'history_delete':
+            execute(f"DELETE FROM historical_pets WHERE id = {_HISTORY_ID_AT_INDEX}", (change[1],))
+        else:
+            raise ValueError(f"알 수 없는 변경 종류입니다: {kind}")
+
+    def _write_pet(self, pet):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO pet (id, name, species, level, exp, happiness, fullness, last_reset_date, "
+            "rewarded_for_full_gauges) VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (pet.name, pet.species, pet.level, pet.exp, pet.happiness, pet.fullness,
+             pet.last_reset_date.isoformat(), int(pet.has_been_rewarded_for_full_gauges)))
+
+    def _write_snack_counts(self, snack_counts):
+        self.connection.executemany("INSERT OR REPLACE INTO snack_counts (name, count) VALUES (?, ?)",
+                                    snack_counts.items())
+
+    def _insert_history_record(self, record):
+        self.connection.execute(
+            "INSERT INTO historical_pets (species, level, start_date, end_date) VALUES (?, ?, ?, ?)",
+            (record['species'], record['level'], record['start_date'].isoformat(), record['end_date'].isoformat()))
+
+    def needs_compaction(self, additional_records=0):
+        """SQLite 저장소는 변경이 바로 테이블에 반영되므로 압축이 필요 없습니다."""
+        return False
+
+    @traced("storage.sqlite.save", "storage")
+    def save(self, pet_data, daily_todos, snack_counts, historical_pets, next_todo_id=None):
+        """
+        펫, 간식, 과거 펫 기록 전체와 메모리에 올라와 있는 날짜들의 할 일을 데이터베이스에 씁니다.
+        메모리에 없는 날짜의 할 일은 그대로 유지됩니다.
+        Args:
+            next_todo_id (int): 다음에 부여할 할 일 id. AUTOINCREMENT 순번을 여기까지 올려 둡니다.
+        Returns:
+            bool: 저장 성공 여부.
+        """
+        try:
+            with self._lock, self.connection:
+                self._write_pet(pet_data)
+                self.connection.execute("DELETE FROM snack_counts")
+                self._write_snack_counts(snack_counts)
+                self.connection.execute("DELETE FROM historical_pets")
+                for record in historical_pets:
+                    self._insert_history_record(record)
+                # 다른 날짜로 옮겨진 할 일의 id가 겹치지 않도록 해당 날짜들을 먼저 모두 지운 뒤 씁니다.
+                self.connection.executemany("DELETE FROM todos WHERE date = ?",
+                                            [(date.isoformat(),) for date in daily_todos])
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO todos (id, date, text, completed) VALUES (?, ?, ?, ?)",
+                    [(todo.id, date.isoformat(), todo.text, int(todo.completed))
+                     for date, todos in daily_todos.items() for todo in todos])
+                if next_todo_id is not None:
+                    self.connection.execute(
+                        "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'todos'", (next_todo_id - 1,))
+            log.info("데이터가 '%s'에 성공적으로 저장되었습니다.", self.db_file_name)
+            return True
+        except Exception as e:
+            log.error("데이터 저장 중 오류 발생: %s", e)
+            return False
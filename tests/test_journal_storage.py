@@ -0,0 +1,150 @@
+# tests/test_journal_storage.py
+
+# data_manager의 스냅샷 + 저널 저장소(JournalStorage) 테스트.
+# - 저널 재생: 스냅샷 이후 레코드만, 변경 종류별 적용, 재생할 수 없는 레코드는 통째로 제외하고 저널에서 잘라냄.
+# - 비정상 종료로 잘린 저널 끝부분(레코드, 헤더) 정리.
+# - 압축(save) 후 저널 정리: 보관 중인 이전 스냅샷 세대의 재생에 필요한 레코드는 남김.
+# - 최신 스냅샷이 손상되면 이전 세대 + 저널로 복구.
+# - 기록한 레코드의 fsync.
+#
+# 실행: python -m unittest discover -s tests  (또는 python -m pytest tests)
+
+import os
+import sys
+import datetime
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import data_manager
+from pet_manager import Pet
+from todo_manager import TodoItem
+
+DAY1 = datetime.date(2025, 11, 20)
+DAY2 = datetime.date(2025, 12, 8)
+
+def make_pet(level=1):
+    return Pet(name="저널", species="사람", level=level, last_reset_date=DAY1)
+
+class JournalTestCase(unittest.TestCase):
+    """테스트마다 임시 디렉터리의 스냅샷/저널 파일을 사용합니다."""
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.data_file = os.path.join(self.temp_dir, "data.pkl")
+        self.journal_file = os.path.join(self.temp_dir, "data.journal")
+
+    def make_storage(self):
+        return data_manager.JournalStorage(self.data_file, self.journal_file, compact_threshold=100)
+
+    def journal_seqs(self):
+        return [seq for seq, _ in data_manager._read_journal(self.journal_file)]
+
+class ReplayTest(JournalTestCase):
+    def test_change_kinds(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('pet', make_pet(level=2)), ('snacks', {"기본 간식": 3})])
+        storage.append([('todo_add', DAY1, "하나", 1), ('todo_add', DAY1, "둘", 2), ('todo_add', DAY1, "셋", 3)])
+        storage.append([('todo_update', DAY1, 1, {'completed': True}), ('todo_update', DAY1, 2, {'text': "둘!"})])
+        storage.append([('todo_move', DAY1, 3, DAY2), ('todo_delete', DAY1, 2)])
+        record = {'species': "사람", 'level': 2, 'start_date': DAY1, 'end_date': DAY2}
+        storage.append([('history_add', record), ('history_add', dict(record, level=5)), ('history_delete', 0)])
+
+        reloaded = self.make_storage()
+        pet, daily_todos, snack_counts, historical_pets = reloaded.load()
+        self.assertEqual(pet.level, 2)
+        self.assertEqual(daily_todos, {DAY1: [TodoItem(1, "하나", True)], DAY2: [TodoItem(3, "셋")]})
+        self.assertEqual(snack_counts, {"기본 간식": 3})
+        self.assertEqual(historical_pets, [dict(record, level=5)])
+        self.assertEqual((reloaded.last_seq, reloaded.next_todo_id()), (5, 4))
+
+    def test_failed_record_is_not_partially_applied(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "남음", 1)])
+        storage.append([('todo_add', DAY1, "반쪽", 2), ('todo_delete', DAY1, 99)]) # 두 번째 변경에서 실패.
+        storage.append([('todo_add', DAY1, "뒤", 3)])
+
+        reloaded = self.make_storage()
+        self.assertEqual(reloaded.load()[1], {DAY1: [TodoItem(1, "남음")]})
+        self.assertEqual(reloaded.last_seq, 1)
+        self.assertEqual(self.journal_seqs(), [1]) # 실패한 레코드부터 잘라냄.
+
+        reloaded.append([('todo_add', DAY1, "다음", 2)]) # 같은 번호가 잘못된 레코드 뒤에 붙지 않음.
+        self.assertEqual(self.make_storage().load()[1], {DAY1: [TodoItem(1, "남음"), TodoItem(2, "다음")]})
+
+class TruncationTest(JournalTestCase):
+    def test_torn_record(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "온전함", 1)])
+        size = os.path.getsize(self.journal_file)
+        with open(self.journal_file, 'ab') as f:
+            f.write(pickle.dumps((2, [('todo_add', DAY1, "잘림", 2)]))[:-3])
+
+        self.assertEqual(self.make_storage().load()[1], {DAY1: [TodoItem(1, "온전함")]})
+        self.assertEqual(os.path.getsize(self.journal_file), size)
+
+    def test_torn_header(self):
+        with open(self.journal_file, 'wb') as f: # 새 저널의 헤더를 쓰다 종료됨.
+            f.write(data_manager.JOURNAL_MAGIC[:3])
+        storage = self.make_storage()
+        self.assertEqual(storage.load()[1], {})
+        storage.append([('todo_add', DAY1, "처음", 1)])
+        self.assertEqual(self.make_storage().load()[1], {DAY1: [TodoItem(1, "처음")]})
+
+class CompactionTest(JournalTestCase):
+    def test_trim_keeps_records_for_older_generations(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "하나", 1)])
+        storage.save(make_pet(), {DAY1: [TodoItem(1, "하나")]}, {"기본 간식": 1}, []) # 스냅샷 번호 1.
+        storage.append([('todo_add', DAY1, "둘", 2)])
+        storage.save(make_pet(), {DAY1: [TodoItem(1, "하나"), TodoItem(2, "둘")]}, {"기본 간식": 1}, []) # 번호 2.
+        storage.append([('todo_add', DAY1, "셋", 3)])
+        # 가장 오래된 세대(.1)가 번호 1까지 반영하므로 그 이후 레코드만 남음.
+        self.assertEqual(self.journal_seqs(), [2, 3])
+
+    def test_trim_removes_journal_when_all_generations_cover_it(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "하나", 1)])
+        storage.save(make_pet(), {DAY1: [TodoItem(1, "하나")]}, {"기본 간식": 1}, [])
+        self.assertFalse(os.path.exists(self.journal_file))
+
+    def test_fallback_to_older_generation(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "하나", 1)])
+        storage.save(make_pet(), {DAY1: [TodoItem(1, "하나")]}, {"기본 간식": 1}, [])
+        storage.append([('todo_add', DAY1, "둘", 2)])
+        storage.save(make_pet(level=7), {DAY1: [TodoItem(1, "하나"), TodoItem(2, "둘")]}, {"기본 간식": 1}, [])
+        storage.append([('todo_add', DAY2, "셋", 3)])
+        with open(self.data_file, 'r+b') as f: # 최신 스냅샷 본문 손상 (체크섬 불일치).
+            f.seek(-1, os.SEEK_END)
+            last_byte = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last_byte[0] ^ 0xFF]))
+
+        reloaded = self.make_storage()
+        pet, daily_todos, _, _ = reloaded.load()
+        self.assertEqual(pet.level, 1) # 이전 세대의 펫.
+        self.assertEqual(daily_todos, {DAY1: [TodoItem(1, "하나"), TodoItem(2, "둘")], DAY2: [TodoItem(3, "셋")]})
+        self.assertEqual((reloaded.snapshot_seq, reloaded.last_seq), (1, 3))
+
+class DurabilityTest(JournalTestCase):
+    def test_append_fsyncs_record(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "하나", 1)])
+        with mock.patch.object(data_manager.os, 'fsync', wraps=os.fsync) as fsync:
+            storage.append([('todo_add', DAY1, "둘", 2)])
+        fsync.assert_called_once()
+
+if __name__ == "__main__":
+    unittest.main()
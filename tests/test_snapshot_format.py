@@ -0,0 +1,196 @@
+# tests/test_snapshot_format.py
+
+# 스냅샷 형식(snapshot_format)과 data_manager의 형식 버전 마이그레이션, 저널 재생 테스트.
+# - 이진 형식(버전 3) 쓰기/읽기 왕복: 펫 없음, 빈 데이터, 유니코드(짝 없는 서로게이트 포함).
+# - 이전 형식 읽기: 저장소에 포함된 헤더 없는 pet_do_list_data.pkl (버전 0), 'todo_list' 필드 파일,
+#   열 형식 pickle (버전 2).
+# - JournalStorage: 스냅샷 이후의 저널 레코드만 재생, 저널 형식 (버전 1의 Pet 객체, 버전 2의 필드 딕셔너리).
+#
+# 실행: python -m unittest discover -s tests  (또는 python -m pytest tests)
+
+import os
+import sys
+import datetime
+import pickle
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import data_manager
+import snapshot_format
+from pet_manager import Pet
+from todo_manager import TodoItem
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DAY1 = datetime.date(2025, 11, 20)
+DAY2 = datetime.date(2025, 12, 8)
+
+def make_pet():
+    """모든 필드가 기본값과 다른 펫."""
+    pet = Pet(name="초코 🐶", species="강아지", level=3, exp=42, happiness=70, fullness=30, last_reset_date=DAY2)
+    pet.max_happiness = 120
+    pet.max_fullness = 110
+    pet.has_been_rewarded_for_full_gauges = True
+    return pet
+
+def pet_fields(pet):
+    """비교할 펫 필드 딕셔너리. (Pet은 동등 비교를 정의하지 않음)"""
+    return {field: getattr(pet, field) for field, _ in snapshot_format.PET_SCHEMA}
+
+class TempDirTestCase(unittest.TestCase):
+    """테스트마다 임시 디렉터리를 만들고 지웁니다."""
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def path(self, name):
+        return os.path.join(self.temp_dir, name)
+
+class EncodeDecodeTest(unittest.TestCase):
+    def assert_round_trip(self, pet, daily_todos, snack_counts, historical_pets, next_todo_id):
+        decoded = snapshot_format.decode(
+            snapshot_format.encode(pet, daily_todos, snack_counts, historical_pets, next_todo_id))
+        if pet is None:
+            self.assertIsNone(decoded['pet'])
+        else:
+            self.assertEqual(pet_fields(decoded['pet']), pet_fields(pet))
+        self.assertEqual(decoded['daily_todos'], daily_todos)
+        self.assertEqual(list(decoded['daily_todos']), list(daily_todos)) # 날짜 순서 유지.
+        self.assertEqual(decoded['snack_counts'], snack_counts)
+        self.assertEqual(decoded['historical_pets'], historical_pets)
+        self.assertEqual(decoded['next_todo_id'], next_todo_id)
+
+    def test_empty_without_pet(self):
+        self.assert_round_trip(None, {}, {}, [], 1)
+
+    def test_empty_days(self):
+        self.assert_round_trip(make_pet(), {DAY1: [], DAY2: []}, {"기본 간식": 0}, [], 1)
+
+    def test_full_data(self):
+        daily_todos = {
+            DAY2: [TodoItem(1, "산책하기"), TodoItem(2, "산책하기", True), TodoItem(300, "")],
+            DAY1: [TodoItem(70000, "장보기 🛒", True)],
+        }
+        historical_pets = [{'species': '나무', 'level': 1, 'start_date': DAY1, 'end_date': DAY1},
+                           {'species': '사람', 'level': 2, 'start_date': DAY1, 'end_date': DAY2}]
+        self.assert_round_trip(make_pet(), daily_todos, {"기본 간식": 3, "고급 간식": 1}, historical_pets, 70001)
+
+    def test_unpaired_surrogate(self):
+        # Tk 입력에서 들어올 수 있는 짝 없는 서로게이트 문자.
+        self.assert_round_trip(None, {DAY1: [TodoItem(1, "이모지 \ud83d 반쪽"), TodoItem(2, "\udc00")]}, {}, [], 3)
+
+    def test_truncated_payload(self):
+        payload = snapshot_format.encode(make_pet(), {DAY1: [TodoItem(1, "할 일")]}, {}, [], 2)
+        for length in (0, 10, len(payload) - 1):
+            with self.assertRaises(ValueError):
+                snapshot_format.decode(payload[:length])
+
+class MigrationTest(TempDirTestCase):
+    def test_committed_headerless_file(self):
+        # 저장소에 포함된 파일은 헤더 없는 pickle (형식 버전 0). 원본을 바꾸지 않도록 복사해서 읽음.
+        file_name = self.path("data.pkl")
+        shutil.copyfile(os.path.join(REPO_DIR, "pet_do_list_data.pkl"), file_name)
+        pet, daily_todos, snack_counts, historical_pets = data_manager.load_data(file_name)
+        self.assertEqual(pet.name, "새 친구")
+        self.assertEqual(pet.species, "사람")
+        self.assertEqual(daily_todos, {DAY2: []})
+        self.assertEqual(snack_counts, {"기본 간식": 3, "고급 간식": 1})
+        self.assertEqual([record['species'] for record in historical_pets], ["나무", "사람"])
+
+    def test_todo_list_field(self):
+        # 날짜별 할 일 도입 이전: 'todo_list'의 딕셔너리 할 일이 오늘 날짜의 TodoItem이 되고 id를 받음.
+        file_name = self.path("data.pkl")
+        with open(file_name, 'wb') as f:
+            pickle.dump({'pet': None, 'todo_list': [{'text': "첫 할 일", 'completed': True}, {'text': "둘째"}]}, f)
+        data = data_manager._read_data_file(file_name)
+        self.assertEqual(data['daily_todos'],
+                         {datetime.date.today(): [TodoItem(1, "첫 할 일", True), TodoItem(2, "둘째")]})
+        self.assertEqual(data['next_todo_id'], 3)
+        self.assertEqual((data['snack_counts'], data['historical_pets'], data['journal_seq']), ({}, [], 0))
+
+    def test_columnar_pickle_v2(self):
+        file_name = self.path("data.pkl")
+        daily_todos = {DAY1: [TodoItem(4, "운동", True), TodoItem(9, "독서")], DAY2: []}
+        payload = pickle.dumps({'pet': make_pet(), 'daily_todo_columns': data_manager._pack_daily_todos(daily_todos),
+                                'snack_counts': {"기본 간식": 2}, 'historical_pets': [], 'next_todo_id': 12})
+        data_manager._write_snapshot_file(file_name, payload, journal_seq=5, version=2)
+        data = data_manager._read_data_file(file_name)
+        self.assertEqual(pet_fields(data['pet']), pet_fields(make_pet()))
+        self.assertEqual(data['daily_todos'], daily_todos)
+        self.assertEqual(data['snack_counts'], {"기본 간식": 2})
+        self.assertEqual((data['next_todo_id'], data['journal_seq']), (12, 5))
+
+    def test_unsupported_version(self):
+        file_name = self.path("data.pkl")
+        data_manager._write_snapshot_file(file_name, b"", journal_seq=0, version=snapshot_format.FORMAT_VERSION + 1)
+        self.assertEqual(data_manager.load_data(file_name), (None, {}, {}, []))
+
+class JournalStorageTest(TempDirTestCase):
+    def make_storage(self):
+        return data_manager.JournalStorage(self.path("data.pkl"), self.path("data.journal"), compact_threshold=100)
+
+    def test_replay_after_snapshot(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "스냅샷 전", 1)])
+        self.assertTrue(storage.save(make_pet(), {DAY1: [TodoItem(1, "스냅샷 전")]}, {"기본 간식": 1}, [], 2))
+        storage.append([('todo_add', DAY1, "스냅샷 후", 2), ('snacks', {"기본 간식": 2})])
+        storage.append([('todo_complete', DAY1, 0), ('todo_move', DAY1, 2, DAY2)])
+
+        reloaded = self.make_storage()
+        pet, daily_todos, snack_counts, historical_pets = reloaded.load()
+        self.assertEqual(pet_fields(pet), pet_fields(make_pet()))
+        # 스냅샷에 반영된 첫 레코드는 다시 재생하지 않음 (할 일 1이 두 번 추가되지 않음).
+        self.assertEqual(daily_todos, {DAY1: [TodoItem(1, "스냅샷 전", True)], DAY2: [TodoItem(2, "스냅샷 후")]})
+        self.assertEqual(snack_counts, {"기본 간식": 2})
+        self.assertEqual(historical_pets, [])
+        self.assertEqual((reloaded.snapshot_seq, reloaded.last_seq, reloaded.next_todo_id()), (1, 3, 3))
+
+    def test_truncated_journal_tail(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('todo_add', DAY1, "남는 기록", 1)])
+        with open(self.path("data.journal"), 'ab') as f: # 기록 도중 비정상 종료된 레코드.
+            f.write(pickle.dumps((2, [('todo_add', DAY1, "잘린 기록", 2)]))[:-3])
+
+        reloaded = self.make_storage()
+        _, daily_todos, _, _ = reloaded.load()
+        self.assertEqual(daily_todos, {DAY1: [TodoItem(1, "남는 기록")]})
+        reloaded.append([('todo_add', DAY1, "다음 기록", 2)]) # 잘린 부분 뒤가 아니라 그 자리에 이어서 기록.
+        self.assertEqual(self.make_storage().load()[1], {DAY1: [TodoItem(1, "남는 기록"), TodoItem(2, "다음 기록")]})
+
+    def test_journal_records_hold_pet_fields(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('pet', make_pet())])
+        with open(self.path("data.journal"), 'rb') as f:
+            content = f.read()
+        self.assertTrue(content.startswith(data_manager.JOURNAL_MAGIC + bytes([data_manager.JOURNAL_FORMAT_VERSION])))
+        self.assertNotIn(b"pet_manager", content) # 도메인 클래스를 pickle하지 않음.
+        self.assertEqual(pet_fields(self.make_storage().load()[0]), pet_fields(make_pet()))
+
+    def test_legacy_journal_with_pet_objects(self):
+        # 형식 버전 1 (헤더 없음): 'pet' 변경에 Pet 객체를 그대로 pickle.
+        with open(self.path("data.journal"), 'wb') as f:
+            pickle.dump((1, [('pet', make_pet()), ('snacks', {"기본 간식": 4})]), f)
+            pickle.dump((2, [('todo_add', DAY1, "이전 저널", 1)]), f)
+        storage = self.make_storage()
+        pet, daily_todos, snack_counts, _ = storage.load()
+        self.assertEqual(pet_fields(pet), pet_fields(make_pet()))
+        self.assertEqual((daily_todos, snack_counts), ({DAY1: [TodoItem(1, "이전 저널")]}, {"기본 간식": 4}))
+        self.assertEqual(storage.last_seq, 2)
+
+    def test_journal_rejects_objects(self):
+        storage = self.make_storage()
+        storage.load()
+        storage.append([('snacks', {"기본 간식": 1})])
+        with open(self.path("data.journal"), 'ab') as f: # 버전 2 저널에 Pet 객체가 담긴 레코드.
+            pickle.dump((2, [('pet', make_pet())]), f)
+        with self.assertRaises(ValueError):
+            self.make_storage().load()
+
+if __name__ == "__main__":
+    unittest.main()
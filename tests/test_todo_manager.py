@@ -0,0 +1,50 @@
+# tests/test_todo_manager.py
+
+# TodoManager의 날짜별 캐시(day_loader 사용 시) 테스트.
+# 다른 날짜로 복사/이동할 때 대상 날짜를 불러오며 원래 날짜가 캐시에서 내려가도 할 일을 찾을 수 있어야 합니다.
+#
+# 실행: python -m unittest discover -s tests  (또는 python -m pytest tests)
+
+import os
+import sys
+import datetime
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+from todo_manager import TodoManager, TodoItem
+
+BASE_DATE = datetime.date(2025, 1, 1)
+
+def day(offset):
+    return BASE_DATE + datetime.timedelta(days=offset)
+
+class DayCacheTest(unittest.TestCase):
+    def setUp(self):
+        # 날짜마다 할 일 하나 (id = 날짜 번호 * 10 + 1)가 저장된 저장소.
+        self.stored = {day(offset): [TodoItem(offset * 10 + 1, f"할 일 {offset}")] for offset in range(10)}
+        self.manager = TodoManager(day_loader=self.load_day, day_cache_size=4, next_todo_id=1000)
+        self.manager.set_current_date(day(9))
+        for offset in (1, 2, 3): # 캐시가 가득 참. 원래 날짜(1)가 가장 오래전에 조회한 날짜.
+            self.manager.get_day_todos(day(offset))
+
+    def load_day(self, date):
+        return [todo.copy() for todo in self.stored.get(date, [])]
+
+    def test_move_keeps_source_day_loaded(self):
+        moved = self.manager.move_todos([11], day(5))
+        self.assertEqual(moved, [(day(1), TodoItem(11, "할 일 1"))])
+        self.assertEqual(self.manager.get_day_todos(day(5)), [TodoItem(11, "할 일 1"), TodoItem(51, "할 일 5")])
+        self.assertEqual(self.manager.get_todo_date(11), day(5))
+
+    def test_copy_keeps_source_day_loaded(self):
+        copied = self.manager.copy_todos([11], day(5))
+        self.assertEqual(copied, [TodoItem(1000, "할 일 1")])
+        self.assertEqual(self.manager.get_day_todos(day(5)), [TodoItem(51, "할 일 5"), TodoItem(1000, "할 일 1")])
+
+    def test_unknown_id(self):
+        self.assertIsNone(self.manager.move_todos([11, 999], day(5)))
+        self.assertIsNone(self.manager.copy_todos([999], day(5)))
+
+if __name__ == "__main__":
+    unittest.main()
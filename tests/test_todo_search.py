@@ -0,0 +1,180 @@
+# tests/test_todo_search.py
+
+# 할 일 검색 색인(todo_search) 테스트.
+# 변경 기록으로 갱신한 색인과, 백그라운드에서 만드는 동안 생긴 변경을 반영한 색인이
+# 같은 데이터로 새로 만든 색인(TodoSearchIndex.build)과 같은 검색 결과를 내는지 비교합니다.
+#
+# 실행: python -m unittest discover -s tests  (또는 python -m pytest tests)
+
+import os
+import sys
+import datetime
+import random
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # 저장소 루트의 모듈 사용.
+
+import data_manager
+import pet_engine
+from todo_search import TodoSearchIndex, BackgroundIndexBuild
+
+START_DATE = datetime.date(2025, 1, 25)
+WORDS = ("산책", "장보기", "할 일", "Run", "독서", "운동 30분")
+QUERIES = ("할", "할 일", "산책", "run", "보기 독", "운동 3", "7", "없는 말", "산 책")
+
+def fresh_index(daily_todos):
+    """같은 데이터로 새로 만든 색인."""
+    index = TodoSearchIndex()
+    index.build(daily_todos.items())
+    return index
+
+class RandomChanges:
+    """
+    날짜별 할 일 데이터에 임의의 추가/수정/삭제/이동 변경을 만들어 적용하고 변경 기록을 돌려줍니다.
+    (data_manager.apply_change로 적용하므로 변경 기록 형식은 저장소와 같음)
+    """
+    def __init__(self, seed, days=70):
+        self.random = random.Random(seed)
+        self.dates = [START_DATE + datetime.timedelta(days=offset) for offset in range(days)] # 세 달에 걸침.
+        self.data = {'pet': None, 'daily_todos': {}, 'snack_counts': {}, 'historical_pets': [], 'next_todo_id': 1}
+
+    @property
+    def daily_todos(self):
+        return self.data['daily_todos']
+
+    def _text(self):
+        return f"{self.random.choice(WORDS)} {self.random.choice(WORDS)} {self.random.randrange(100)}"
+
+    def _existing(self):
+        date = self.random.choice(list(self.daily_todos))
+        return date, self.random.choice(self.daily_todos[date]).id
+
+    def make(self, count, add_ratio=0.5):
+        """변경 count개를 적용하고 그 변경 기록 리스트를 반환합니다."""
+        changes = []
+        for _ in range(count):
+            roll = self.random.random()
+            if not self.daily_todos or roll < add_ratio:
+                change = ('todo_add', self.random.choice(self.dates), self._text(), self.data['next_todo_id'])
+            elif roll < add_ratio + (1 - add_ratio) / 3:
+                date, todo_id = self._existing()
+                change = ('todo_update', date, todo_id, {'text': self._text()})
+            elif roll < add_ratio + 2 * (1 - add_ratio) / 3:
+                change = ('todo_delete', *self._existing())
+            else:
+                change = ('todo_move', *self._existing(), self.random.choice(self.dates))
+            data_manager.apply_change(self.data, change)
+            changes.append(change)
+        return changes
+
+    def copy_of_todos(self):
+        """지금 데이터의 (날짜, 할 일 리스트) 쌍 복사본. (이후 변경이 섞이지 않도록 할 일 항목까지 복사)"""
+        return [(date, [todo.copy() for todo in todos]) for date, todos in self.daily_todos.items()]
+
+class SearchTestCase(unittest.TestCase):
+    def assert_same_results(self, index, daily_todos):
+        expected = fresh_index(daily_todos)
+        self.assertEqual(len(index), len(expected))
+        for query in QUERIES:
+            with self.subTest(query=query):
+                self.assertEqual(index.search(query, limit=10 ** 6), expected.search(query, limit=10 ** 6))
+                self.assertEqual(index.search(query, limit=5), expected.search(query, limit=5))
+
+class IncrementalUpdateTest(SearchTestCase):
+    def test_random_changes(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                changes = RandomChanges(seed)
+                index = TodoSearchIndex()
+                for _ in range(6): # 구간 다시 만들기, 정렬되지 않은 구간이 생길 만큼 변경.
+                    for change in changes.make(400, add_ratio=0.6):
+                        index.apply_change(change)
+                    self.assert_same_results(index, changes.daily_todos)
+
+    def test_delete_most_of_a_month(self):
+        changes = RandomChanges(seed=10, days=5)
+        index = TodoSearchIndex()
+        for change in changes.make(300, add_ratio=1.0):
+            index.apply_change(change)
+        for date, todos in list(changes.daily_todos.items()): # 빈 자리가 절반을 넘도록 삭제.
+            for todo in todos[:len(todos) * 3 // 4]:
+                change = ('todo_delete', date, todo.id)
+                data_manager.apply_change(changes.data, change)
+                index.apply_change(change)
+        self.assert_same_results(index, changes.daily_todos)
+
+    def test_todos_reset(self):
+        changes = RandomChanges(seed=11)
+        index = fresh_index(dict(changes.copy_of_todos()))
+        for change in changes.make(200):
+            index.apply_change(change)
+        index.apply_change(('todos_reset',))
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.search("할"), [])
+
+class BackgroundBuildTest(SearchTestCase):
+    def start_blocked_build(self, source):
+        """release를 set하기 전까지 원본을 읽지 않는 백그라운드 생성 작업과 release 이벤트."""
+        release = threading.Event()
+        def blocked_source():
+            release.wait()
+            return source()
+        return BackgroundIndexBuild(blocked_source), release
+
+    def test_changes_after_source_copy(self):
+        changes = RandomChanges(seed=20)
+        changes.make(800, add_ratio=0.9)
+        source = changes.copy_of_todos() # 변경 전 데이터를 읽는 경우.
+        build, release = self.start_blocked_build(lambda: source)
+        for _ in range(3):
+            build.record(changes.make(300))
+        self.assertFalse(build.done())
+        release.set()
+        self.assert_same_results(build.finish(), changes.daily_todos)
+
+    def test_changes_already_in_source(self):
+        # 원본을 늦게 읽어 만드는 동안의 변경이 이미 반영되어 있어도, 다시 반영한 결과가 같아야 함.
+        changes = RandomChanges(seed=21)
+        changes.make(800, add_ratio=0.9)
+        build, release = self.start_blocked_build(changes.copy_of_todos)
+        build.record(changes.make(600))
+        release.set()
+        self.assert_same_results(build.finish(), changes.daily_todos)
+
+    def test_build_error(self):
+        def failing_source():
+            raise OSError("읽기 실패")
+        build = BackgroundIndexBuild(failing_source)
+        with self.assertRaises(OSError):
+            build.finish()
+
+class EngineBackgroundBuildTest(SearchTestCase):
+    def test_engine_changes_during_build(self):
+        engine = pet_engine.PetDoListEngine()
+        engine.create_pet("검색", "사람")
+        todo_ids = engine.add_todos([f"{WORDS[i % len(WORDS)]} {i}" for i in range(200)])
+        source = [(date, [todo.copy() for todo in todos])
+                  for date, todos in engine.todo_manager.get_daily_todos_data().items()]
+        release = threading.Event()
+        engine.start_search_index_build(loader=lambda: (release.wait(), source)[1])
+
+        self.assertIsNone(engine.search_todos("할")) # 만드는 중.
+        engine.add_todos(["새 산책", "새 독서"])
+        engine.edit_todo(todo_ids[0], "고친 장보기")
+        engine.remove_todos(todo_ids[1:40])
+        engine.move_todos(todo_ids[40:80], engine.todo_manager.get_current_date() - datetime.timedelta(days=40))
+        release.set()
+
+        deadline = time.monotonic() + 10
+        while engine.search_todos("할") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIsNotNone(engine.search_index)
+        self.assert_same_results(engine.search_index, engine.todo_manager.get_daily_todos_data())
+        # 완성된 뒤의 변경은 색인에 바로 반영.
+        engine.edit_todo(todo_ids[100], "완성 후 고침")
+        self.assertEqual([todo_id for _, todo_id, _ in engine.search_todos("완성 후")], [todo_ids[100]])
+
+if __name__ == "__main__":
+    unittest.main()
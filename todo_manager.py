@@ -4,21 +4,110 @@
 # 날짜별 할 일 추가, 삭제, 완료 처리 및 간식 획득, 사용 등의 로직을 담당.
 
 import datetime # 날짜 객체 처리에 사용.
+import sys      # 할 일 내용 문자열 인터닝.
+from collections import OrderedDict # 최근 조회한 날짜의 LRU 캐시.
 # config.py에서 간식 관련 상수들을 임포트합니다.
-from config import SNACK_PER_TODO_COMPLETE, INITIAL_SNACK_COUNTS, SNACK_EFFECTS
+from config import SNACK_PER_TODO_COMPLETE, INITIAL_SNACK_COUNTS, SNACK_EFFECTS, TODO_DAY_CACHE_SIZE
+from instrumentation import get_logger # 레벨별 진단 로그.
+
+log = get_logger("todo_manager")
+
+class TodoItem:
+    """
+    할 일 하나를 나타내는 작은 레코드 클래스.
+    __slots__로 인스턴스 딕셔너리를 없애고, 내용 문자열은 인터닝하여 매일 반복되는 같은 할 일이 문자열 하나를 공유합니다.
+    (이전 버전의 {'id', 'text', 'completed'} 딕셔너리는 from_dict로 변환)
+    """
+    __slots__ = ('id', 'text', 'completed')
+
+    def __init__(self, todo_id, text, completed=False):
+        self.id = todo_id              # 변하지 않는 할 일 id.
+        self.text = sys.intern(text)   # 할 일 내용 (인터닝된 문자열).
+        self.completed = bool(completed) # 완료 여부.
+
+    @classmethod
+    def from_dict(cls, record, todo_id=None):
+        """
+        이전 형식의 할 일 딕셔너리를 TodoItem으로 변환합니다.
+        Args:
+            record (dict): {'text', 'completed'[, 'id']} 딕셔너리.
+            todo_id (int, optional): record에 'id'가 없을 때 사용할 id.
+        """
+        return cls(record.get('id', todo_id), record['text'], record.get('completed', False))
+
+    def to_dict(self):
+        """JSON 응답 등에 사용할 딕셔너리로 변환합니다."""
+        return {'id': self.id, 'text': self.text, 'completed': self.completed}
+
+    def copy(self):
+        return TodoItem(self.id, self.text, self.completed)
+
+    def update(self, fields):
+        """
+        저널의 'todo_update' 변경처럼 필드 이름 -> 값 딕셔너리로 내용을 바꿉니다.
+        Raises:
+            ValueError: 알 수 없는 필드일 경우.
+        """
+        for field, value in fields.items():
+            if field == 'text':
+                self.text = sys.intern(value)
+            elif field == 'completed':
+                self.completed = bool(value)
+            else:
+                raise ValueError(f"알 수 없는 할 일 필드입니다: {field}")
+
+    def __eq__(self, other):
+        if not isinstance(other, TodoItem):
+            return NotImplemented
+        return (self.id, self.text, self.completed) == (other.id, other.text, other.completed)
+
+    def __repr__(self):
+        return f"TodoItem({self.id!r}, {self.text!r}, {self.completed!r})"
+
+    def __reduce__(self):
+        # 기본 pickle(슬롯 상태 딕셔너리)보다 작은 (클래스, 인자 튜플) 형태로 직렬화.
+        return (TodoItem, (self.id, self.text, self.completed))
+
+def _record_id(todo):
+    """TodoItem 또는 이전 형식 딕셔너리의 id를 반환합니다. (없으면 0)"""
+    return todo.id if isinstance(todo, TodoItem) else todo.get('id', 0)
 
 class TodoManager:
     """
     할 일 목록과 간식 인벤토리를 관리하는 클래스.
+    각 할 일은 변하지 않는 정수 id를 가진 TodoItem이며, 날짜별 목록은 id -> TodoItem 딕셔너리(id 순서 = 추가 순서)로 보관합니다.
+    id -> 날짜 색인을 함께 유지하므로 id로 완료/삭제/수정할 때 목록을 훑지 않습니다 (O(1)).
+    day_loader가 주어지면 날짜별 할 일 목록을 필요할 때만 불러오고, 최근 조회한 day_cache_size일만 메모리에 유지합니다.
+    day_loader가 없으면 모든 날짜의 할 일이 메모리에 있는 것으로 간주합니다.
+    어느 경우든 할 일이 없는 날짜는 저장 대상 데이터에 만들어지지 않습니다.
+    날짜별 요약(전체/완료 개수)도 할 일이 바뀔 때마다 함께 갱신하므로, 달력은 할 일 목록을 불러오지 않고 요약만으로 그릴 수 있습니다.
     """
-    def __init__(self, initial_daily_todos=None, initial_snack_counts=None):
+    def __init__(self, initial_daily_todos=None, initial_snack_counts=None, day_loader=None,
+                 day_cache_size=TODO_DAY_CACHE_SIZE, next_todo_id=None, day_summaries=None):
+        # 메모리에 없는 날짜의 할 일 목록을 불러오는 함수 (예: SQLiteStorage.load_day). date -> list.
+        self.day_loader = day_loader
+        self.day_cache_size = day_cache_size # day_loader 사용 시 메모리에 유지할 최대 일수.
+        self._todo_dates = {} # 메모리에 있는 할 일의 id -> 날짜 색인.
+        # 할 일이 있는 날짜 -> [전체 개수, 완료 개수]. day_loader 사용 시 메모리에 없는 날짜의 요약은
+        # 저장소에서 받은 day_summaries({날짜: (전체, 완료)}, 예: SQLiteStorage.load_day_summaries())로 시작.
+        self._day_summaries = {date: [total, completed] for date, (total, completed) in (day_summaries or {}).items() if total}
+        # 날짜 요약이 바뀔 때마다 (날짜, 전체 변화량, 완료 변화량)으로 호출할 함수 (예: analytics.TodoStats.apply_day_delta).
+        # 생성 중에 불러온 날짜는 알리지 않으므로, 생성 후 get_day_summaries()로 집계를 만든 다음 연결합니다.
+        self.summary_listener = None
+
         # 날짜별 할 일 딕셔너리 초기화 (기존 데이터 로드 또는 새로 생성).
-        self.daily_todos = initial_daily_todos if initial_daily_todos is not None else {}
+        initial_daily_todos = initial_daily_todos if initial_daily_todos is not None else {}
+        # 다음에 부여할 할 일 id. (day_loader 사용 시 메모리에 없는 날짜의 id와 겹치지 않도록 저장소에서 받아야 함)
+        self.next_todo_id = next_todo_id if next_todo_id is not None else 1 + max(
+            (_record_id(todo) for todos in initial_daily_todos.values() for todo in todos), default=0)
+        # 불러온 날짜들 (day_loader 사용 시 가장 최근에 조회한 날짜가 끝쪽인 LRU 캐시).
+        self.daily_todos = {} if self.day_loader is None else OrderedDict()
+        for date, todos in initial_daily_todos.items():
+            if todos: # 이전 버전에서 만들어진 빈 날짜는 제거.
+                self.daily_todos[date] = self._index_day(date, todos)
         
         self.current_date = datetime.date.today() # 현재 조회 중인 날짜.
-        # 현재 날짜의 할 일 목록이 없으면 빈 리스트로 초기화.
-        if self.current_date not in self.daily_todos:
-            self.daily_todos[self.current_date] = []
+        self._get_day(self.current_date) # 현재 날짜의 할 일 목록을 미리 불러옴.
 
         # 간식 개수 딕셔너리 초기화 (기존 데이터 로드 또는 config의 초기값 사용).
         self.snack_counts = initial_snack_counts if initial_snack_counts else INITIAL_SNACK_COUNTS.copy()
@@ -27,8 +116,45 @@ class TodoManager:
             if snack_name not in self.snack_counts:
                 self.snack_counts[snack_name] = 0
 
-        print(f"TodoManager 초기화됨. 현재 날짜: {self.current_date}, 간식: {self.snack_counts}")
-        
+        log.debug("TodoManager 초기화됨. 현재 날짜: %s, 간식: %s", self.current_date, self.snack_counts)
+
+    def _index_day(self, date, todos):
+        """
+        날짜의 할 일 리스트를 id -> TodoItem 딕셔너리로 바꾸고 id 색인에 등록합니다.
+        이전 형식의 딕셔너리는 TodoItem으로 변환하며, id가 없으면 새 id를 부여합니다.
+        """
+        day = {}
+        for todo in todos:
+            if not isinstance(todo, TodoItem):
+                todo = TodoItem.from_dict(todo, None if 'id' in todo else self._allocate_id())
+            day[todo.id] = todo
+            self._todo_dates[todo.id] = date
+        # 불러온 목록으로 그 날짜의 요약을 다시 계산.
+        old_total, old_completed = self._day_summaries.pop(date, (0, 0))
+        total, completed = len(day), sum(todo.completed for todo in day.values())
+        if day:
+            self._day_summaries[date] = [total, completed]
+        if self.summary_listener is not None and (total, completed) != (old_total, old_completed):
+            self.summary_listener(date, total - old_total, completed - old_completed)
+        return day
+
+    def _adjust_summary(self, date, total_delta, completed_delta):
+        """날짜의 요약(전체/완료 개수)을 바꿉니다. 할 일이 없어진 날짜는 요약에서 뺍니다."""
+        summary = self._day_summaries.get(date)
+        if summary is None:
+            summary = self._day_summaries[date] = [0, 0]
+        summary[0] += total_delta
+        summary[1] += completed_delta
+        if summary[0] <= 0:
+            del self._day_summaries[date]
+        if self.summary_listener is not None:
+            self.summary_listener(date, total_delta, completed_delta)
+
+    def _allocate_id(self):
+        todo_id = self.next_todo_id
+        self.next_todo_id += 1
+        return todo_id
+
     def set_current_date(self, new_date):
         """
         현재 조회 중인 날짜를 변경합니다.
@@ -41,10 +167,93 @@ class TodoManager:
             raise TypeError("날짜는 datetime.date 객체여야 합니다.")
         
         self.current_date = new_date # 날짜 업데이트.
-        # 새 날짜의 할 일 목록이 없으면 빈 리스트로 초기화.
-        if self.current_date not in self.daily_todos:
-            self.daily_todos[self.current_date] = []
-        print(f"현재 할 일 확인 날짜 변경: {self.current_date}")
+        self._get_day(self.current_date) # 새 날짜의 할 일 목록을 불러옴 (빈 날짜는 만들지 않음).
+        log.debug("현재 할 일 확인 날짜 변경: %s", self.current_date)
+
+    def _get_day(self, date, create=False, keep_dates=()):
+        """
+        해당 날짜의 id -> 할 일 딕셔너리를 반환합니다.
+        Args:
+            date (datetime.date): 조회할 날짜.
+            create (bool): 할 일이 없는 날짜일 때 딕셔너리를 만들어 보관할지 여부 (할 일 추가 시 True).
+            keep_dates (collection): 캐시가 넘쳐도 메모리에서 내리지 않을 날짜들 (복사/이동할 할 일의 원래 날짜).
+        Returns:
+            dict: 해당 날짜의 할 일들. 보관되지 않은 빈 날짜라면 새 빈 딕셔너리.
+        """
+        if self.day_loader is None:
+            day = self.daily_todos.get(date)
+            if day is None:
+                day = {}
+                if create:
+                    self.daily_todos[date] = day
+            return day
+
+        if date in self.daily_todos:
+            self.daily_todos.move_to_end(date) # 최근 조회 날짜로 갱신.
+            return self.daily_todos[date]
+        day = self._index_day(date, self.day_loader(date)) # 저장소에서 해당 날짜만 불러옴.
+        self.daily_todos[date] = day
+        # 캐시 크기를 넘으면 가장 오래전에 조회한 날짜부터 메모리에서 내림 (현재 날짜, keep_dates 제외).
+        for cached_date in list(self.daily_todos):
+            if len(self.daily_todos) <= self.day_cache_size:
+                break
+            if cached_date not in (date, self.current_date) and cached_date not in keep_dates:
+                for todo_id in self.daily_todos.pop(cached_date):
+                    del self._todo_dates[todo_id]
+        return day
+
+    def _drop_day_if_empty(self, date):
+        """할 일이 없어진 날짜를 보관하지 않습니다. (day_loader 사용 시 캐시는 유지)"""
+        if self.day_loader is None and date in self.daily_todos and not self.daily_todos[date]:
+            del self.daily_todos[date]
+
+    def _insert_todo(self, date, todo):
+        """할 일을 날짜 목록에 id 순서를 지키며 넣습니다. (가장 큰 id면 끝에 추가, O(1))"""
+        day = self._get_day(date, create=True)
+        if day and next(reversed(day)) > todo.id: # 다른 날짜에서 옮겨 온 예전 할 일.
+            items = sorted([*day.values(), todo], key=lambda item: item.id)
+            day.clear()
+            day.update((item.id, item) for item in items)
+        else:
+            day[todo.id] = todo
+        self._todo_dates[todo.id] = date
+        self._adjust_summary(date, 1, int(todo.completed))
+
+    # --- id로 할 일 찾기 ---
+    def get_todo(self, todo_id):
+        """
+        id로 할 일을 찾습니다. (메모리에 있는 날짜만)
+        Returns:
+            TodoItem or None: 할 일 또는 없으면 None.
+        """
+        date = self._todo_dates.get(todo_id)
+        return None if date is None else self.daily_todos[date][todo_id]
+
+    def get_todo_date(self, todo_id):
+        """id로 할 일이 속한 날짜를 찾습니다. 없으면 None."""
+        return self._todo_dates.get(todo_id)
+
+    def _validate_ids(self, todo_ids):
+        """
+        id들이 모두 메모리에 있는 할 일인지 검사합니다.
+        Returns:
+            list or None: 중복을 제거하고 오름차순 정렬한 id 리스트. 없는 id가 있으면 None.
+        """
+        unique_ids = sorted(set(todo_ids))
+        missing = [todo_id for todo_id in unique_ids if todo_id not in self._todo_dates]
+        if missing:
+            log.warning("존재하지 않는 할 일 id입니다: %s", missing)
+            return None
+        return unique_ids
+
+    # --- 할 일 하나 처리 (현재 날짜의 인덱스 기준, 이전 API) ---
+    def _id_at(self, index):
+        """현재 날짜의 index번째 할 일 id를 반환합니다. 잘못된 인덱스면 None."""
+        current_day = self._get_day(self.current_date)
+        if 0 <= index < len(current_day):
+            return list(current_day)[index]
+        log.warning("잘못된 인덱스입니다 (%s): %s", self.current_date, index)
+        return None
 
     def add_todo(self, todo_text):
         """
@@ -54,14 +263,7 @@ class TodoManager:
         Returns:
             bool: 할 일 추가 성공 여부.
         """
-        if not isinstance(todo_text, str) or not todo_text.strip(): # 유효성 검사.
-            print("유효하지 않은 할 일 내용입니다.")
-            return False
-        
-        # 할 일 추가 (text와 completed 상태 포함).
-        self.daily_todos[self.current_date].append({'text': todo_text.strip(), 'completed': False})
-        print(f"할 일 추가 ({self.current_date}): {todo_text.strip()}")
-        return True
+        return bool(self.add_todos([todo_text]))
 
     def remove_todo(self, index):
         """
@@ -69,15 +271,10 @@ class TodoManager:
         Args:
             index (int): 삭제할 할 일의 인덱스.
         Returns:
-            dict or None: 삭제된 할 일 객체 또는 실패 시 None.
+            TodoItem or None: 삭제된 할 일 또는 실패 시 None.
         """
-        current_day_todos = self.daily_todos.get(self.current_date, [])
-        if 0 <= index < len(current_day_todos): # 유효한 인덱스인지 확인.
-            removed_todo = current_day_todos.pop(index) # 할 일 삭제.
-            print(f"할 일 삭제 ({self.current_date}): {removed_todo['text']}")
-            return removed_todo
-        print(f"잘못된 인덱스입니다 ({self.current_date}): {index}")
-        return None
+        todo_id = self._id_at(index)
+        return None if todo_id is None else self.remove_todos([todo_id])[0]
 
     def complete_todo(self, index):
         """
@@ -88,21 +285,173 @@ class TodoManager:
         Returns:
             int: 지급된 간식의 개수. (이미 완료된 할 일이라면 0).
         """
-        current_day_todos = self.daily_todos.get(self.current_date, [])
-        if 0 <= index < len(current_day_todos): # 유효한 인덱스인지 확인.
-            if not current_day_todos[index]['completed']: # 아직 완료되지 않은 할 일일 경우.
-                current_day_todos[index]['completed'] = True # 완료 상태로 변경.
-                todo_text = current_day_todos[index]['text']
-                
-                self.add_snack("기본 간식", SNACK_PER_TODO_COMPLETE) # 간식 지급.
-                
-                print(f"할 일 완료 ({self.current_date}): {todo_text}, 간식 지급: {SNACK_PER_TODO_COMPLETE}개")
-                return SNACK_PER_TODO_COMPLETE
-            print(f"이미 완료된 할 일입니다 ({self.current_date}): {current_day_todos[index]['text']}")
+        todo_id = self._id_at(index)
+        if todo_id is None:
             return 0
-        print(f"잘못된 인덱스입니다 ({self.current_date}): {index}")
-        return 0
-    
+        return SNACK_PER_TODO_COMPLETE * len(self.complete_todos([todo_id]))
+
+    # --- 여러 할 일 한 번에 처리 (id 기준) ---
+    # 아래 메서드들은 먼저 모든 입력을 검사하고, 하나라도 잘못되었으면 아무것도 바꾸지 않습니다.
+
+    def add_todos(self, todo_texts):
+        """
+        현재 날짜의 할 일 목록에 여러 할 일을 순서대로 추가합니다.
+        Args:
+            todo_texts (iterable): 추가할 할 일 내용들.
+        Returns:
+            list: 추가된 할 일 리스트 (새 id 포함). 내용이 비어 있는 항목이 있으면 빈 리스트.
+        """
+        todo_texts = list(todo_texts)
+        if not todo_texts or any(not isinstance(text, str) or not text.strip() for text in todo_texts): # 유효성 검사.
+            log.warning("유효하지 않은 할 일 내용입니다.")
+            return []
+
+        added = []
+        for text in todo_texts:
+            todo = TodoItem(self._allocate_id(), text.strip())
+            self._insert_todo(self.current_date, todo)
+            added.append(todo)
+            log.debug("할 일 추가 (%s): %s", self.current_date, todo.text)
+        return added
+
+    def complete_todos(self, todo_ids):
+        """
+        여러 할 일을 완료 처리하고, 새로 완료된 개수만큼의 기본 간식을 한 번에 지급합니다.
+        Args:
+            todo_ids (iterable): 완료할 할 일 id들.
+        Returns:
+            list or None: 새로 완료된 id 리스트 (이미 완료된 할 일은 제외). 없는 id가 있으면 None.
+        """
+        valid_ids = self._validate_ids(todo_ids)
+        if valid_ids is None:
+            return None
+        completed_ids = [todo_id for todo_id in valid_ids if not self.get_todo(todo_id).completed]
+        for todo_id in completed_ids:
+            todo = self.get_todo(todo_id)
+            todo.completed = True # 완료 상태로 변경.
+            self._adjust_summary(self._todo_dates[todo_id], 0, 1)
+            log.debug("할 일 완료 (%s): %s", self._todo_dates[todo_id], todo.text)
+        if completed_ids:
+            self.add_snack("기본 간식", SNACK_PER_TODO_COMPLETE * len(completed_ids)) # 간식 일괄 지급.
+        return completed_ids
+
+    def edit_todo(self, todo_id, new_text):
+        """
+        할 일의 내용을 수정합니다.
+        Returns:
+            TodoItem or None: 수정된 할 일. 없는 id이거나 내용이 비어 있으면 None.
+        """
+        todo = self.get_todo(todo_id)
+        if todo is None or not isinstance(new_text, str) or not new_text.strip():
+            log.warning("할 일을 수정할 수 없습니다: %s", todo_id)
+            return None
+        todo.update({'text': new_text.strip()})
+        log.debug("할 일 수정 (%s): %s", self._todo_dates[todo_id], todo.text)
+        return todo
+
+    def remove_todos(self, todo_ids):
+        """
+        여러 할 일을 삭제합니다.
+        Args:
+            todo_ids (iterable): 삭제할 할 일 id들.
+        Returns:
+            list or None: 삭제된 할 일 리스트 (id 오름차순). 없는 id가 있으면 None.
+        """
+        valid_ids = self._validate_ids(todo_ids)
+        if valid_ids is None:
+            return None
+        removed = []
+        for todo_id in valid_ids:
+            date = self._todo_dates.pop(todo_id)
+            removed.append(self.daily_todos[date].pop(todo_id)) # 할 일 삭제 (O(1)).
+            self._adjust_summary(date, -1, -int(removed[-1].completed))
+            self._drop_day_if_empty(date)
+            log.debug("할 일 삭제 (%s): %s", date, removed[-1].text)
+        return removed
+
+    def copy_todos(self, todo_ids, target_date):
+        """
+        여러 할 일을 다른 날짜의 목록 끝에 (완료 상태 그대로, 새 id로) 복사합니다.
+        Args:
+            todo_ids (iterable): 복사할 할 일 id들.
+            target_date (datetime.date): 복사할 날짜.
+        Returns:
+            list or None: 복사로 새로 만들어진 할 일 리스트. 없는 id가 있으면 None.
+        """
+        valid_ids = self._validate_ids(todo_ids) # 대상 날짜를 불러오기 전에 검사 (불러오며 원래 날짜가 내려가지 않도록).
+        if valid_ids is None:
+            return None
+        sources = [self.get_todo(todo_id) for todo_id in valid_ids]
+        self._get_day(target_date, keep_dates={self._todo_dates[todo_id] for todo_id in valid_ids})
+        copied = []
+        for source in sources:
+            todo = TodoItem(self._allocate_id(), source.text, source.completed)
+            self._insert_todo(target_date, todo)
+            copied.append(todo)
+        if copied:
+            log.debug("할 일 %d개 복사 -> %s", len(copied), target_date)
+        return copied
+
+    def move_todos(self, todo_ids, target_date):
+        """
+        여러 할 일을 다른 날짜로 (id와 완료 상태 그대로) 옮깁니다. 대상 날짜에서도 id 순서로 놓입니다.
+        Args:
+            todo_ids (iterable): 옮길 할 일 id들.
+            target_date (datetime.date): 옮길 날짜.
+        Returns:
+            list or None: (원래 날짜, 할 일) 튜플 리스트 (이미 그 날짜에 있는 할 일은 제외). 없는 id가 있으면 None.
+        """
+        valid_ids = self._validate_ids(todo_ids) # 대상 날짜를 불러오기 전에 검사 (불러오며 원래 날짜가 내려가지 않도록).
+        if valid_ids is None:
+            return None
+        self._get_day(target_date, keep_dates={self._todo_dates[todo_id] for todo_id in valid_ids})
+        moved = []
+        for todo_id in valid_ids:
+            date = self._todo_dates[todo_id]
+            if date == target_date:
+                continue
+            todo = self.daily_todos[date].pop(todo_id)
+            self._adjust_summary(date, -1, -int(todo.completed))
+            self._drop_day_if_empty(date)
+            self._insert_todo(target_date, todo)
+            moved.append((date, todo))
+        if moved:
+            log.debug("할 일 %d개 이동 -> %s", len(moved), target_date)
+        return moved
+
+    def merge_todos(self, date, entries):
+        """
+        가져온 할 일들을 날짜의 목록에 합칩니다. (내보낸 파일 가져오기용, 간식은 지급하지 않음)
+        같은 내용의 기존 할 일과 하나씩 짝지어, 짝이 있으면 완료 상태만 합치고(완료 우선) 없으면 새 id로 추가합니다.
+        따라서 같은 파일을 여러 번 가져와도 결과가 같습니다.
+        Args:
+            date (datetime.date): 할 일 날짜.
+            entries (iterable): (내용, 완료 여부) 튜플들.
+        Returns:
+            tuple: (새로 추가된 할 일 리스트, 가져오면서 완료 처리된 기존 할 일 리스트, 짝지어진 할 일 수).
+        """
+        unmatched = {} # 내용 -> 아직 짝지어지지 않은 기존 할 일들 (id 순).
+        for todo in self._get_day(date).values():
+            unmatched.setdefault(todo.text, []).append(todo)
+        added, completed, matched = [], [], 0
+        for text, done in entries:
+            text = text.strip()
+            if not text:
+                continue
+            candidates = unmatched.get(text)
+            if candidates:
+                todo = candidates.pop(0)
+                matched += 1
+                if done and not todo.completed:
+                    todo.completed = True
+                    self._adjust_summary(date, 0, 1)
+                    completed.append(todo)
+            else:
+                todo = TodoItem(self._allocate_id(), text, bool(done))
+                self._insert_todo(date, todo)
+                added.append(todo)
+        return added, completed, matched
+
     def add_snack(self, snack_name, count):
         """
         지정된 이름의 간식을 지정된 개수만큼 추가합니다.
@@ -115,9 +464,9 @@ class TodoManager:
         if snack_name in SNACK_EFFECTS: # 유효한 간식 종류인지 확인.
             # 간식 개수 증가. (처음 추가하는 간식일 경우 0 + count로 처리).
             self.snack_counts[snack_name] = self.snack_counts.get(snack_name, 0) + count
-            print(f"'{snack_name}' {count}개 획득! 현재 {snack_name} 개수: {self.snack_counts[snack_name]}")
+            log.debug("'%s' %d개 획득! 현재 %s 개수: %d", snack_name, count, snack_name, self.snack_counts[snack_name])
             return True
-        print(f"알 수 없는 간식 종류여서 추가할 수 없습니다: {snack_name}")
+        log.warning("알 수 없는 간식 종류여서 추가할 수 없습니다: %s", snack_name)
         return False
 
     def use_snack(self, snack_name):
@@ -132,18 +481,58 @@ class TodoManager:
         if snack_name in self.snack_counts and self.snack_counts[snack_name] > 0:
             self.snack_counts[snack_name] -= 1 # 간식 개수 감소.
             effect = SNACK_EFFECTS[snack_name] # 간식 효과 가져오기.
-            print(f"'{snack_name}' 1개 사용! 현재 {snack_name} 개수: {self.snack_counts[snack_name]}, 효과: {effect}")
+            log.debug("'%s' 1개 사용! 현재 %s 개수: %d, 효과: %s", snack_name, snack_name, self.snack_counts[snack_name], effect)
             return effect
-        print(f"'{snack_name}' 간식이 없거나 부족합니다.")
+        log.info("'%s' 간식이 없거나 부족합니다.", snack_name)
         return None
 
     def get_current_date_todos(self):
-        """현재 조회 중인 날짜의 할 일 목록을 반환합니다."""
-        return self.daily_todos.get(self.current_date, [])
-    
+        """현재 조회 중인 날짜의 할 일 목록(id 순서)을 반환합니다."""
+        return list(self._get_day(self.current_date).values())
+
+    def get_current_date_todo_ids(self):
+        """현재 조회 중인 날짜의 할 일 id 목록(표시 순서)을 반환합니다."""
+        return list(self._get_day(self.current_date))
+
+    def get_day_todos(self, date):
+        """지정한 날짜의 할 일 목록을 반환합니다. (필요하면 저장소에서 불러옴)"""
+        return list(self._get_day(date).values())
+
+    # --- 날짜별 요약 ---
+    def get_day_summary(self, date):
+        """
+        날짜의 할 일 요약을 반환합니다. (할 일 목록을 불러오지 않음)
+        Returns:
+            tuple: (전체 개수, 완료 개수, 남은 개수). 할 일이 없는 날짜면 (0, 0, 0).
+        """
+        total, completed = self._day_summaries.get(date, (0, 0))
+        return total, completed, total - completed
+
+    def get_day_summaries(self):
+        """할 일이 있는 모든 날짜의 요약 복사본 {날짜: (전체 개수, 완료 개수)}을 반환합니다. (통계 집계용)"""
+        return {date: (total, completed) for date, (total, completed) in self._day_summaries.items()}
+
+    def get_month_summaries(self, year, month):
+        """
+        한 달 동안 할 일이 있는 날짜들의 요약을 반환합니다. (달력 표시용, 해당 달의 날짜 수만큼만 조회)
+        Returns:
+            dict: 날짜 -> (전체 개수, 완료 개수, 남은 개수).
+        """
+        date = datetime.date(year, month, 1)
+        summaries = {}
+        while date.month == month:
+            summary = self._day_summaries.get(date)
+            if summary is not None:
+                summaries[date] = (summary[0], summary[1], summary[0] - summary[1])
+            date += datetime.timedelta(days=1)
+        return summaries
+
     def get_daily_todos_data(self):
-        """전체 날짜별 할 일 데이터(딕셔너리)를 반환합니다."""
-        return self.daily_todos
+        """
+        날짜별 할 일 데이터(날짜 -> 할 일 리스트 딕셔너리)를 반환합니다. 할 일이 없는 날짜는 포함하지 않습니다.
+        day_loader 사용 시에는 현재 메모리에 올라와 있는 날짜들만 포함됩니다.
+        """
+        return {date: list(day.values()) for date, day in self.daily_todos.items() if day}
 
     def get_current_snack_counts(self):
         """현재 간식 인벤토리(간식 개수 딕셔너리)를 반환합니다."""
@@ -0,0 +1,312 @@
+# todo_search.py
+
+# 모든 날짜의 할 일 내용을 검색하는 역색인(inverted index) 모듈.
+# 한국어처럼 띄어쓰기 단위가 검색어와 맞지 않는 문장도 찾을 수 있도록, 단어를 글자 단위 n-gram
+# (연속한 두 글자, 한 글자 단어는 그 글자)으로 나누어 월 구간별로 n-gram -> 할 일 자리 비트마스크를 유지합니다.
+# 할 일이 추가/삭제/수정/이동될 때 엔진의 변경 기록(data_manager.apply_change 형식)을 그대로 받아 색인을 갱신합니다.
+
+import bisect     # 할 일이 있는 월 구간들의 정렬된 목록 유지.
+import threading  # 백그라운드 색인 생성.
+
+from config import SEARCH_RESULT_LIMIT # 검색 결과 최대 개수.
+
+_MIN_REBUILD_SLOTS = 64 # 빈 자리 정리를 시작할 최소 자리 수.
+_UNORDERED_SORT_LIMIT = 256 # 순서가 어긋난 구간에서 다시 만들지 않고 정렬해서 확인할 최대 후보 수.
+
+def normalize(text):
+    """검색 비교용으로 대소문자를 통일하고 공백을 하나로 합칩니다."""
+    return " ".join(text.casefold().split())
+
+def ngrams(text):
+    """
+    정규화된 문자열의 검색용 n-gram 집합을 반환합니다. (단어마다 연속한 두 글자, 한 글자 단어는 그 글자)
+    예: "영어 공부 책" -> {'영어', '공부', '책'}
+    """
+    grams = set()
+    for word in text.split():
+        if len(word) == 1:
+            grams.add(word)
+        else:
+            grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+def _bucket_of(date):
+    """날짜가 속한 월 구간 번호."""
+    return date.year * 12 + date.month - 1
+
+class _Bucket:
+    """
+    한 달 구간의 색인.
+    할 일마다 자리(slot) 번호를 주고, n-gram마다 그 n-gram을 가진 자리들의 비트마스크(int)를 둡니다.
+    자리는 (날짜, id) 순서로 주어지므로, 비트마스크의 높은 자리부터 읽으면 최근 할 일부터 나옵니다.
+    (과거 날짜에 추가/이동되어 순서가 어긋나면 ordered가 False가 되고, 다시 만들 때 정렬됩니다)
+    """
+    __slots__ = ('ids', 'slots', 'postings', 'live', 'last_key', 'ordered')
+
+    def __init__(self):
+        self.ids = []         # 자리 -> 할 일 id (삭제된 자리는 None).
+        self.slots = {}       # 할 일 id -> 자리.
+        self.postings = {}    # n-gram -> 자리 비트마스크.
+        self.live = 0         # 할 일이 있는 자리 비트마스크.
+        self.last_key = None  # 지금까지 넣은 가장 큰 (날짜, id).
+        self.ordered = True   # 자리 순서가 (날짜, id) 순서와 같은지 여부.
+
+    def link(self, todo_id, date, normalized):
+        """할 일을 새 자리에 넣습니다."""
+        key = (date, todo_id)
+        if self.last_key is None or key > self.last_key:
+            self.last_key = key
+        else:
+            self.ordered = False
+        slot = len(self.ids)
+        self.ids.append(todo_id)
+        self.slots[todo_id] = slot
+        bit = 1 << slot
+        postings = self.postings
+        for gram in ngrams(normalized):
+            postings[gram] = postings.get(gram, 0) | bit
+        self.live |= bit
+
+    def unlink(self, todo_id, normalized):
+        """할 일의 자리를 비웁니다. 빈 n-gram은 지웁니다."""
+        slot = self.slots.pop(todo_id)
+        self.ids[slot] = None
+        mask = ~(1 << slot)
+        postings = self.postings
+        for gram in ngrams(normalized):
+            posting = postings[gram] & mask
+            if posting:
+                postings[gram] = posting
+            else:
+                del postings[gram]
+        self.live &= mask
+
+    def needs_rebuild(self):
+        """빈 자리가 절반을 넘어 비트마스크가 불필요하게 길어졌는지 여부."""
+        return len(self.ids) > _MIN_REBUILD_SLOTS and len(self.ids) > 2 * len(self.slots)
+
+    def candidates(self, grams):
+        """n-gram을 모두 가진 자리들의 비트마스크. (n-gram이 없으면 모든 할 일)"""
+        mask = self.live
+        postings = self.postings
+        for gram in grams:
+            mask &= postings.get(gram, 0)
+            if not mask:
+                break
+        return mask
+
+def _slot_ids(ids, mask):
+    """비트마스크의 자리들에 있는 할 일 id를 높은 자리부터 하나씩 내놓습니다."""
+    bits = bin(mask) # '0b' 뒤로 높은 자리부터 적힌 문자열 (자리 = 길이 - 1 - 위치).
+    top = len(bits) - 1
+    position = bits.find('1', 2)
+    while position >= 0:
+        yield ids[top - position]
+        position = bits.find('1', position + 1)
+
+class TodoSearchIndex:
+    """
+    할 일 내용 역색인 클래스.
+    색인은 월 단위 구간으로 나뉘어 있어, 검색은 최근 구간부터 차례로 후보를 구하고 결과를 다 채우면 멈춥니다.
+    구간 안에서는 n-gram 비트마스크의 AND로 후보를 구하고, 최근 할 일부터 필요한 만큼만 내용을 확인합니다.
+    - add/remove/update_text/move: 할 일 하나 반영 (apply_change로 변경 기록을 그대로 반영할 수 있음).
+    - search: 검색어의 모든 단어를 포함하는 할 일을 최근 날짜 순으로 반환.
+    """
+    def __init__(self):
+        self._documents = {}    # 할 일 id -> (날짜, 원래 내용, 정규화된 내용).
+        self._buckets = {}      # 월 구간 -> _Bucket.
+        self._bucket_keys = []  # 할 일이 있는 월 구간들 (오름차순).
+
+    def __len__(self):
+        return len(self._documents)
+
+    # --- 색인 갱신 ---
+    def clear(self):
+        """색인을 비웁니다."""
+        self._documents.clear()
+        self._buckets.clear()
+        self._bucket_keys.clear()
+
+    def build(self, daily_todos):
+        """
+        날짜별 할 일 데이터로 색인을 새로 만듭니다. (날짜, id 순으로 넣어 구간의 자리 순서를 맞춤)
+        Args:
+            daily_todos: (날짜, 할 일 리스트) 쌍들. (예: dict.items())
+        """
+        self.clear()
+        for date, todos in sorted(daily_todos, key=lambda item: item[0]):
+            for todo in sorted(todos, key=lambda todo: todo.id):
+                self.add(todo.id, date, todo.text)
+
+    def add(self, todo_id, date, text):
+        """할 일 하나를 색인에 추가합니다. (같은 id가 이미 있으면 교체)"""
+        if todo_id in self._documents:
+            self.remove(todo_id)
+        normalized = normalize(text)
+        if normalized == text:
+            normalized = text # 같은 내용이면 문자열 하나만 보관.
+        self._documents[todo_id] = (date, text, normalized)
+        self._link(todo_id, date, normalized)
+
+    def remove(self, todo_id):
+        """할 일 하나를 색인에서 삭제합니다. 없는 id면 무시합니다."""
+        document = self._documents.pop(todo_id, None)
+        if document is not None:
+            self._unlink(todo_id, document[0], document[2])
+
+    def update_text(self, todo_id, text):
+        """할 일의 내용이 바뀌었을 때 색인을 갱신합니다."""
+        document = self._documents.get(todo_id)
+        if document is not None:
+            self.add(todo_id, document[0], text)
+
+    def move(self, todo_id, date):
+        """할 일이 다른 날짜로 옮겨졌을 때 색인을 갱신합니다."""
+        document = self._documents.get(todo_id)
+        if document is None:
+            return
+        old_date, text, normalized = document
+        self._unlink(todo_id, old_date, normalized)
+        self._documents[todo_id] = (date, text, normalized)
+        self._link(todo_id, date, normalized)
+
+    def _link(self, todo_id, date, normalized):
+        """할 일을 날짜가 속한 구간에 넣습니다."""
+        key = _bucket_of(date)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = bucket = _Bucket()
+            bisect.insort(self._bucket_keys, key)
+        bucket.link(todo_id, date, normalized)
+
+    def _unlink(self, todo_id, date, normalized):
+        """할 일을 구간에서 뺍니다. 빈 구간은 지우고, 빈 자리가 많아진 구간은 다시 만듭니다."""
+        key = _bucket_of(date)
+        bucket = self._buckets[key]
+        bucket.unlink(todo_id, normalized)
+        if not bucket.slots:
+            del self._buckets[key]
+            del self._bucket_keys[bisect.bisect_left(self._bucket_keys, key)]
+        elif bucket.needs_rebuild():
+            self._rebuild_bucket(key)
+
+    def _rebuild_bucket(self, key):
+        """구간을 (날짜, id) 순서의 빈 자리 없는 새 구간으로 다시 만듭니다."""
+        documents = self._documents
+        todo_ids = sorted(self._buckets[key].slots, key=lambda todo_id: (documents[todo_id][0], todo_id))
+        self._buckets[key] = bucket = _Bucket()
+        for todo_id in todo_ids:
+            date, _, normalized = documents[todo_id]
+            bucket.link(todo_id, date, normalized)
+        return bucket
+
+    def apply_change(self, change):
+        """
+        data_manager.apply_change 형식의 변경 하나를 색인에 반영합니다. (할 일 내용과 무관한 변경은 무시)
+        """
+        kind = change[0]
+        if kind == 'todo_add' and len(change) > 3:
+            _, date, text, todo_id = change
+            self.add(todo_id, date, text)
+        elif kind == 'todo_update' and 'text' in change[3]:
+            self.update_text(change[2], change[3]['text'])
+        elif kind == 'todo_delete':
+            self.remove(change[2])
+        elif kind == 'todo_move':
+            self.move(change[2], change[3])
+        elif kind == 'todos_reset':
+            self.clear()
+
+    # --- 검색 ---
+    def _recent_candidates(self, key, grams):
+        """구간에서 n-gram을 모두 가진 할 일 id를 최근(날짜, id가 큰) 순서로 하나씩 내놓습니다."""
+        bucket = self._buckets[key]
+        mask = bucket.candidates(grams)
+        if mask and not bucket.ordered:
+            if mask.bit_count() <= _UNORDERED_SORT_LIMIT: # 후보가 적으면 정렬해서 확인.
+                documents = self._documents
+                yield from sorted(_slot_ids(bucket.ids, mask), key=lambda todo_id: (documents[todo_id][0], todo_id),
+                                  reverse=True)
+                return
+            bucket = self._rebuild_bucket(key) # 후보가 많으면 구간을 정렬해 다시 만든 뒤 차례로 확인.
+            mask = bucket.candidates(grams)
+        yield from _slot_ids(bucket.ids, mask)
+
+    def search(self, query, limit=SEARCH_RESULT_LIMIT):
+        """
+        검색어의 모든 단어를 (부분 문자열로) 포함하는 할 일을 찾습니다.
+        Args:
+            query (str): 검색어. 공백으로 나뉜 단어들은 모두 포함되어야 합니다.
+            limit (int): 최대 결과 개수.
+        Returns:
+            list: (날짜, 할 일 id, 내용) 튜플 리스트. 최근 날짜(같은 날짜면 나중에 만든 할 일) 순.
+        """
+        words = normalize(query).split()
+        if not words or limit <= 0:
+            return []
+        # 두 글자 이상인 단어의 n-gram으로 후보를 거르고, 한 글자 단어는 내용 확인으로만 찾습니다.
+        grams = ngrams(" ".join(word for word in words if len(word) > 1))
+        documents = self._documents
+
+        hits = []
+        for key in reversed(self._bucket_keys):
+            # n-gram이 모두 있어도 단어가 연속으로 나오지 않을 수 있으므로 최근 순으로 필요한 만큼만 실제 내용을 확인.
+            for todo_id in self._recent_candidates(key, grams):
+                normalized = documents[todo_id][2]
+                for word in words:
+                    if word not in normalized:
+                        break
+                else:
+                    hits.append(todo_id)
+                    if len(hits) == limit:
+                        break
+            if len(hits) == limit:
+                break
+        return [(documents[todo_id][0], todo_id, documents[todo_id][1]) for todo_id in hits]
+
+class BackgroundIndexBuild:
+    """
+    TodoSearchIndex를 백그라운드 스레드에서 만드는 작업.
+    만드는 동안 생긴 변경 기록은 record로 모아 두었다가, finish에서 완성된 색인에 순서대로 반영합니다.
+    (원본을 읽은 시점과 변경 시점이 겹쳐도 같은 변경을 다시 반영하면 결과가 같으므로 안전합니다)
+    """
+    def __init__(self, source):
+        """
+        Args:
+            source: (날짜, 할 일 리스트) 쌍들, 또는 백그라운드 스레드에서 호출해 그 쌍들을 받을 함수.
+        """
+        self._changes = []  # 만드는 동안 생긴 변경 기록.
+        self._index = None  # 완성된 색인.
+        self._error = None  # 만드는 중 발생한 예외.
+        self._thread = threading.Thread(target=self._run, args=(source,), name="SearchIndexBuild", daemon=True)
+        self._thread.start()
+
+    def _run(self, source):
+        try:
+            index = TodoSearchIndex()
+            index.build(source() if callable(source) else source)
+            self._index = index
+        except Exception as e:
+            self._error = e
+
+    def record(self, changes):
+        """완성된 색인에 반영할 변경 기록을 모읍니다. (변경을 만드는 스레드에서 호출)"""
+        self._changes.extend(changes)
+
+    def done(self):
+        """색인 생성이 끝났는지 여부."""
+        return not self._thread.is_alive()
+
+    def finish(self):
+        """
+        생성이 끝나길 기다린 뒤, 모아 둔 변경을 반영한 색인을 반환합니다. (record를 호출하는 스레드에서 호출)
+        Raises:
+            Exception: 색인을 만드는 중 발생한 예외.
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        for change in self._changes:
+            self._index.apply_change(change)
+        self._changes = []
+        return self._index